@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: kelvin -> xy / RGB (formula vs integer-kelvin tables).
+
+Converts a spread of integer kelvin values the way delivery does (the
+same few hundred values over and over), comparing the formulas with the
+lazily filled lookup tables in brain.py.
+
+Example usage:
+    python benchmarks/bench_color.py --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+ADDON_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from brain import CircadianLight  # noqa: E402
+
+
+def _time(fn, kelvins):
+    t0 = time.perf_counter()
+    for kelvin in kelvins:
+        fn(kelvin)
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    pool = [rng.randint(1800, 6500) for _ in range(args.distinct)]
+    kelvins = [rng.choice(pool) for _ in range(args.calls)]
+
+    rows = [
+        ("xy formula", CircadianLight._compute_xy),
+        ("xy table", CircadianLight.color_temperature_to_xy),
+        ("rgb formula", CircadianLight._compute_rgb),
+        ("rgb table", CircadianLight.color_temperature_to_rgb),
+    ]
+    print(f"calls={args.calls} distinct={args.distinct}")
+    results = {}
+    for label, fn in rows:
+        results[label] = _time(fn, kelvins)
+        print(
+            f"  {label:<11} : {results[label] * 1000:8.1f} ms  "
+            f"({results[label] / args.calls * 1e9:6.0f} ns/call)"
+        )
+    for kind in ("xy", "rgb"):
+        table_s = results[f"{kind} table"]
+        if table_s > 0:
+            print(f"  {kind + ' speedup':<11} : {results[f'{kind} formula'] / table_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: whole-day curve generation (per-sample vs curve_engine).
+
+Times the 240-sample designer curve three ways: the old per-sample
+get_circadian_lighting() call (Config built per sample, RGB/xy computed
+and discarded), curve_engine's scalar fallback, and its NumPy path
+(skipped when NumPy isn't installed).
+
+Example usage:
+    python benchmarks/bench_curve.py --samples 240 --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+
+ADDON_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+import curve_engine  # noqa: E402
+from brain import Config, get_circadian_lighting  # noqa: E402
+
+_BOUNDS = {
+    "min_color_temp": 500,
+    "max_color_temp": 6500,
+    "min_brightness": 1,
+    "max_brightness": 100,
+}
+
+
+def _run_per_sample(hours):
+    bri = []
+    cct = []
+    for hour in hours:
+        values = get_circadian_lighting(current_time=hour, **_BOUNDS)
+        bri.append(values["brightness"])
+        cct.append(values["kelvin"])
+    return bri, cct
+
+
+def _time(fn, runs):
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - t0) / runs, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=240)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    hours = [i * 24.0 / args.samples for i in range(args.samples)]
+    config = Config.from_dict(_BOUNDS)
+    weekday = time.localtime().tm_wday
+
+    legacy_s, expected = _time(lambda: _run_per_sample(hours), args.runs)
+    scalar_s, scalar = _time(
+        lambda: curve_engine.day_curve(config, hours, weekday, use_numpy=False),
+        args.runs,
+    )
+
+    print(f"samples={args.samples} runs={args.runs}")
+    print(f"  per-sample : {legacy_s * 1000:8.2f} ms/curve")
+    print(
+        f"  scalar     : {scalar_s * 1000:8.2f} ms/curve  "
+        f"({legacy_s / scalar_s:.1f}x, match={scalar == expected})"
+    )
+    if curve_engine.HAVE_NUMPY:
+        numpy_s, vector = _time(
+            lambda: curve_engine.day_curve(config, hours, weekday, use_numpy=True),
+            args.runs,
+        )
+        print(
+            f"  numpy      : {numpy_s * 1000:8.2f} ms/curve  "
+            f"({legacy_s / numpy_s:.1f}x, match={vector == expected})"
+        )
+    else:
+        print("  numpy      : not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-area state reads (dict merge vs AreaRuntime records).
+
+Simulates the state reads one periodic tick does per area
+(is_circadian, get_is_on, is_fading, get_last_sent_kelvin, ...) for N areas,
+comparing the old "fresh defaults dict + update()" read against the slotted
+record read now used by state.py.
+
+Example usage:
+    python benchmarks/bench_state.py --areas 100 --ticks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ADDON_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+import state  # noqa: E402
+
+# Keys a periodic update reads per area through the state helpers
+_READ_KEYS = (
+    "is_circadian",
+    "is_on",
+    "frozen_at",
+    "fade_start",
+    "last_sent_kelvin",
+    "last_sent_brightness",
+    "boost_expires_at",
+    "motion_warning_at",
+    "off_enforced",
+)
+
+
+def _legacy_get_area_dict_store(stored_dicts, area_id):
+    """The pre-record read: merge stored dict over a fresh defaults dict."""
+    default = state._get_default_area_state()
+    default.update(stored_dicts[area_id])
+    return default
+
+
+def _run_legacy(stored_dicts, area_ids, ticks):
+    for _ in range(ticks):
+        for area_id in area_ids:
+            for key in _READ_KEYS:
+                _legacy_get_area_dict_store(stored_dicts, area_id).get(key)
+
+
+def _run_records(area_ids, ticks):
+    for _ in range(ticks):
+        for area_id in area_ids:
+            for key in _READ_KEYS:
+                state.get_area_record(area_id).get(key)
+
+
+def _peak_bytes(fn):
+    """Peak traced bytes allocated during one call of fn."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--areas", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state.init(os.path.join(tmp, "circadian_state.json"))
+        area_ids = [f"area_{i}" for i in range(args.areas)]
+        for i, area_id in enumerate(area_ids):
+            state._state[area_id] = state.AreaRuntime.from_dict(
+                {"is_circadian": True, "is_on": i % 2 == 0, "last_sent_kelvin": 2700}
+            )
+        stored_dicts = {a: state._state[a].to_dict() for a in area_ids}
+        reads = args.areas * args.ticks * len(_READ_KEYS)
+
+        t0 = time.perf_counter()
+        _run_legacy(stored_dicts, area_ids, args.ticks)
+        legacy_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _run_records(area_ids, args.ticks)
+        record_s = time.perf_counter() - t0
+
+        # Allocation per read: the legacy read builds one ~30-key dict each time
+        legacy_bytes = _peak_bytes(
+            lambda: _legacy_get_area_dict_store(stored_dicts, area_ids[0])
+        )
+        record_bytes = _peak_bytes(lambda: state.get_area_record(area_ids[0]))
+
+    print(f"areas={args.areas} ticks={args.ticks} reads={reads}")
+    print(
+        f"  dict merge : {legacy_s * 1000:8.1f} ms  "
+        f"({legacy_s / reads * 1e9:6.0f} ns/read, ~{legacy_bytes} B allocated/read, "
+        f"~{legacy_bytes * args.areas * len(_READ_KEYS) / 1024:.0f} KiB churn/tick)"
+    )
+    print(
+        f"  records    : {record_s * 1000:8.1f} ms  "
+        f"({record_s / reads * 1e9:6.0f} ns/read, ~{record_bytes} B allocated/read)"
+    )
+    if record_s > 0:
+        print(f"  speedup    : {legacy_s / record_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""Benchmark suite: brain.py, pipeline.py, JSON and the delivery path, by area count.
+
+Runs offline. Home Assistant is never contacted: delivery uses the real
+HomeAssistantWebSocketClient with call_service stubbed (as in
+tools/circadian_light_harness.py), and timed state writes go to a temp file.
+
+Each case is timed for every area count (and filter count, where purposes
+matter); results are printed and can be saved as JSON. --compare loads a
+saved run and flags cases whose median got slower than --threshold.
+
+The JSON cases decode a Home Assistant entity registry result the way the
+websocket client receives it (one text frame) and also record peak memory
+per decode. Pass --registry with a recorded config/entity_registry/list
+frame (or just its result list) to measure a real install; otherwise a
+synthetic registry of REGISTRY_ENTITIES_PER_AREA entities per area is used.
+
+Example usage:
+    python benchmarks/run.py --output baseline.json
+    python benchmarks/run.py --areas 1,10 --only pipeline.compute
+    python benchmarks/run.py --compare baseline.json --threshold 0.4
+    python benchmarks/run.py --only loads --registry entity_registry.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ADDON_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+import glozone  # noqa: E402
+import glozone_state  # noqa: E402
+import jsoncodec  # noqa: E402
+import pipeline  # noqa: E402
+import primitives  # noqa: E402
+import state  # noqa: E402
+import switches  # noqa: E402
+from brain import AreaState, CircadianLight, Config, SunTimes  # noqa: E402
+
+PURPOSES = ["Standard", "Overhead", "Lamp", "Accent", "Nightlight"]
+LIGHTS_PER_PURPOSE = 2
+SUN = SunTimes(sunrise=6.2, sunset=19.8, solar_noon=13.0, solar_mid=1.0,
+               outdoor_normalized=0.4)
+CURVE_CONFIG = {
+    "latitude": 35.0,
+    "longitude": -78.6,
+    "timezone": "America/New_York",
+    "min_color_temp": 500,
+    "max_color_temp": 6500,
+    "min_brightness": 1,
+    "max_brightness": 100,
+    "warm_night_enabled": True,
+    "daylight_enabled": True,
+}
+
+REGISTRY_ENTITIES_PER_AREA = 25
+
+_data_dir = None  # Temp dir for state/config files, set by run_suite
+_registry_path = None  # Recorded registry frame (--registry), else synthetic
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@contextlib.contextmanager
+def _isolated_data_dir(tmp):
+    """Point every module's data directory at tmp, so addon/.data is untouched."""
+    patches = [
+        (mod, "_get_data_directory", lambda: tmp)
+        for mod in (state, glozone, switches, primitives)
+    ] + [
+        (switches, "_LAST_ACTION_FILE", pathlib.Path(tmp, "switch_last_actions.json")),
+        (glozone_state, "_STATE_FILE", pathlib.Path(tmp, "glozone_runtime_state.json")),
+    ]
+    saved = [(mod, attr, getattr(mod, attr)) for mod, attr, _ in patches]
+    for mod, attr, value in patches:
+        setattr(mod, attr, value)
+    try:
+        yield
+    finally:
+        for mod, attr, value in saved:
+            setattr(mod, attr, value)
+
+
+def _area_ids(areas):
+    return [f"area_{i}" for i in range(areas)]
+
+
+def _area_state(i):
+    """Mix of plain, stepped and overridden areas, like a real home."""
+    if i % 3 == 1:
+        return AreaState(is_circadian=True, is_on=True, brightness_mid=9.0 + i % 5)
+    if i % 3 == 2:
+        return AreaState(is_circadian=True, is_on=True, color_override=-300)
+    return AreaState(is_circadian=True, is_on=True)
+
+
+def _light_filters(area_id, filters):
+    return {
+        f"light.{area_id}_{p}_{n}": PURPOSES[p]
+        for p in range(filters)
+        for n in range(LIGHTS_PER_PURPOSE)
+    }
+
+
+def _install_glozone(areas, filters):
+    """One zone holding every area, each with `filters` purposes."""
+    glozone.set_config(
+        {
+            **CURVE_CONFIG,
+            "glozones": {
+                "Main": {
+                    "is_default": True,
+                    "areas": [
+                        {"id": a, "name": a, "light_filters": _light_filters(a, filters)}
+                        for a in _area_ids(areas)
+                    ],
+                }
+            },
+        }
+    )
+    glozone.invalidate_compiled_configs()
+
+
+def _contexts(areas, filters, config, hour):
+    presets = glozone.get_light_filter_presets()
+    return [
+        pipeline.PipelineContext(
+            area_id=area_id,
+            hour=hour,
+            config=config,
+            area_state=_area_state(i),
+            sun_times=SUN,
+            area_filters=_light_filters(area_id, filters),
+            filter_presets=presets,
+            off_threshold=3,
+            sun_exposure=0.3,
+            sun_intensity=0.5,
+            ct_comp_enabled=True,
+            weekday=2,
+        )
+        for i, area_id in enumerate(_area_ids(areas))
+    ]
+
+
+def _registry_frame(areas):
+    """An entity registry result frame, recorded or shaped like config/entity_registry/list."""
+    if _registry_path:
+        return pathlib.Path(_registry_path).read_text(encoding="utf-8")
+    result = [
+        {
+            "area_id": f"area_{i % max(areas, 1)}",
+            "config_entry_id": f"{i:032x}",
+            "device_id": f"{i // 4:032x}",
+            "disabled_by": None,
+            "entity_category": "diagnostic" if i % 5 == 0 else None,
+            "entity_id": f"{('light', 'sensor', 'binary_sensor', 'switch')[i % 4]}.entity_{i}",
+            "has_entity_name": True,
+            "hidden_by": None,
+            "icon": None,
+            "id": f"{i * 7919:032x}",
+            "labels": [],
+            "name": None,
+            "options": {"conversation": {"should_expose": i % 2 == 0}},
+            "original_name": f"Entity {i} étage",
+            "platform": "zha" if i % 3 else "hue",
+            "translation_key": None,
+            "unique_id": f"00:17:88:01:{i:08x}-0b",
+            "created_at": 1717000000.123456 + i,
+            "modified_at": 1717100000.654321 + i,
+        }
+        for i in range(areas * REGISTRY_ENTITIES_PER_AREA)
+    ]
+    return json.dumps({"id": 7, "type": "result", "success": True, "result": result})
+
+
+def _bench_client(areas, filters):
+    """Real websocket client with network calls stubbed out."""
+    from main import HomeAssistantWebSocketClient
+
+    class BenchClient(HomeAssistantWebSocketClient):
+        def __init__(self):
+            super().__init__(host="stub", port=0, access_token="bench", use_ssl=False)
+            self.websocket = None
+            self.calls = 0
+
+        def _get_data_directory(self):
+            return _data_dir
+
+        async def call_service(self, domain, service, service_data, target=None):
+            self.calls += 1
+
+    # The client (re)loads state and switches from the data dir, which
+    # run_suite has pointed at its temp dir; install the bench zone after
+    client = BenchClient()
+    _install_glozone(areas, filters)
+    for area_id in _area_ids(areas):
+        lights = list(_light_filters(area_id, filters))
+        client.area_lights[area_id] = lights
+        for n, entity_id in enumerate(lights):
+            client.light_color_modes[entity_id] = {"xy"} if n % 2 else {"color_temp"}
+    return client
+
+
+# ---------------------------------------------------------------------------
+# Cases: each returns a callable that performs one full run over all areas
+# ---------------------------------------------------------------------------
+
+
+def case_calculate_lighting(areas, filters):
+    config = Config.from_dict(CURVE_CONFIG)
+    states = [_area_state(i) for i in range(areas)]
+
+    def run():
+        for st in states:
+            CircadianLight.calculate_lighting(14.5, config, st, sun_times=SUN, weekday=2)
+
+    return run
+
+
+def case_calculate_color_step(areas, filters):
+    config = Config.from_dict(CURVE_CONFIG)
+    states = [_area_state(i) for i in range(areas)]
+
+    def run():
+        for i, st in enumerate(states):
+            CircadianLight.calculate_color_step(
+                14.5, "up" if i % 2 else "down", config, st, sun_times=SUN, weekday=2
+            )
+
+    return run
+
+
+def case_calculate_set_position(areas, filters):
+    config = Config.from_dict(CURVE_CONFIG)
+    states = [_area_state(i) for i in range(areas)]
+
+    def run():
+        for i, st in enumerate(states):
+            CircadianLight.calculate_set_position(
+                14.5, (i * 37) % 100, "step", config, st, sun_times=SUN, weekday=2
+            )
+
+    return run
+
+
+def case_pipeline_compute(areas, filters):
+    _install_glozone(areas, filters)
+    config = Config.from_dict(CURVE_CONFIG).freeze()
+
+    def run():
+        for ctx in _contexts(areas, filters, config, 14.5):
+            pipeline.compute(ctx)
+
+    return run
+
+
+def case_pipeline_compute_many(areas, filters):
+    _install_glozone(areas, filters)
+    config = Config.from_dict(CURVE_CONFIG).freeze()
+
+    def run():
+        pipeline.compute_many(_contexts(areas, filters, config, 14.5))
+
+    return run
+
+
+def case_generate_curve_data(areas, filters):
+    from webserver import generate_curve_data
+
+    return lambda: generate_curve_data(dict(CURVE_CONFIG))
+
+
+def case_calculate_step_sequence(areas, filters):
+    from webserver import calculate_step_sequence
+
+    config = dict(CURVE_CONFIG)
+    return lambda: calculate_step_sequence(14.5, "dim", 10, config)
+
+
+def case_state_update_area(areas, filters):
+    area_ids = _area_ids(areas)
+
+    async def run():
+        # Inside the event loop, like a tick: writes coalesce into one flush
+        for i, area_id in enumerate(area_ids):
+            state.update_area(
+                area_id, {"last_sent_kelvin": 2700 + i, "last_sent_brightness": 40}
+            )
+        state.flush()
+
+    return run
+
+
+def case_deliver_filtered(areas, filters):
+    client = _bench_client(areas, filters)
+    config = Config.from_dict(CURVE_CONFIG).freeze()
+    deliveries = []
+    for ctx in _contexts(areas, filters, config, 14.5):
+        result = pipeline.compute(ctx)
+        deliveries.append((ctx.area_id, result, ctx.area_filters))
+
+    async def run():
+        for area_id, result, area_filters in deliveries:
+            await client._deliver_filtered(
+                area_id,
+                result.area_brightness,
+                result.area_kelvin,
+                result.area_xy,
+                1.0,
+                True,
+                False,
+                area_filters,
+                1.0,
+                skip_two_step=True,
+                precomputed_purposes=result.purposes,
+            )
+
+    return run
+
+
+def case_json_loads_registry(areas, filters):
+    frame = _registry_frame(areas)
+    return lambda: json.loads(frame)
+
+
+def case_jsoncodec_loads_registry(areas, filters):
+    frame = _registry_frame(areas)
+    return lambda: jsoncodec.loads(frame)
+
+
+def case_jsoncodec_dumps_call_service(areas, filters):
+    # The message the client sends most often
+    frame = {
+        "id": 1234,
+        "type": "call_service",
+        "domain": "light",
+        "service": "turn_on",
+        "service_data": {"brightness_pct": 42, "color_temp_kelvin": 2700, "transition": 0.5},
+        "target": {"entity_id": "light.circadian_kitchen_standard"},
+    }
+    return lambda: jsoncodec.dumps(frame)
+
+
+# name -> (factory, depends on filter count, depends on area count, records peak memory)
+CASES = {
+    "brain.calculate_lighting": (case_calculate_lighting, False, True, False),
+    "brain.calculate_color_step": (case_calculate_color_step, False, True, False),
+    "brain.calculate_set_position": (case_calculate_set_position, False, True, False),
+    "pipeline.compute": (case_pipeline_compute, True, True, False),
+    "pipeline.compute_many": (case_pipeline_compute_many, True, True, False),
+    "webserver.generate_curve_data": (case_generate_curve_data, False, False, False),
+    "webserver.calculate_step_sequence": (case_calculate_step_sequence, False, False, False),
+    "state.update_area": (case_state_update_area, False, True, False),
+    "main._deliver_filtered": (case_deliver_filtered, True, True, False),
+    "json.loads_registry": (case_json_loads_registry, False, True, True),
+    "jsoncodec.loads_registry": (case_jsoncodec_loads_registry, False, True, True),
+    "jsoncodec.dumps_call_service": (case_jsoncodec_dumps_call_service, False, False, False),
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+MIN_SAMPLE_SECONDS = 0.01  # Fast cases are looped so timer jitter stays small
+
+
+def _time_case(run, repeat):
+    """Seconds per run, sampled `repeat` times (after one warm-up).
+
+    Each sample loops the run enough times to last MIN_SAMPLE_SECONDS, so
+    sub-millisecond cases aren't dominated by scheduler noise. The garbage
+    collector is paused while timing, as timeit does.
+    """
+    if asyncio.iscoroutinefunction(run):
+        loop = asyncio.new_event_loop()
+        call = lambda: loop.run_until_complete(run())  # noqa: E731
+    else:
+        loop = None
+        call = run
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        call()
+        warmup = time.perf_counter() - t0
+        number = max(1, int(MIN_SAMPLE_SECONDS / warmup) if warmup > 0 else 1)
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(number):
+                call()
+            samples.append((time.perf_counter() - t0) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if loop is not None:
+            loop.close()
+    return samples
+
+
+def _peak_bytes(run):
+    """Peak traced bytes allocated during one (synchronous) run."""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def run_suite(area_counts, filter_counts, repeat, only=None):
+    global _data_dir
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, _isolated_data_dir(tmp):
+        _data_dir = tmp
+        state.init(os.path.join(tmp, "circadian_state.json"))
+        old_config = glozone.get_config()
+        try:
+            for name, (factory, by_filters, by_areas, by_memory) in CASES.items():
+                if only and not any(o in name for o in only):
+                    continue
+                for areas in area_counts if by_areas else [1]:
+                    for filters in filter_counts if by_filters else [1]:
+                        run = factory(areas, filters)
+                        samples = _time_case(run, repeat)
+                        best = min(samples)
+                        row = {
+                            "name": name,
+                            "areas": areas,
+                            "filters": filters,
+                            "ms_min": round(best * 1000, 4),
+                            "ms_median": round(statistics.median(samples) * 1000, 4),
+                            "us_per_area": round(best * 1e6 / areas, 2),
+                        }
+                        if by_memory:
+                            row["peak_mb"] = round(_peak_bytes(run) / 1e6, 3)
+                        results.append(row)
+                        _print_row(row)
+        finally:
+            state.flush()
+            glozone.set_config(old_config)
+            glozone.invalidate_compiled_configs()
+    return results
+
+
+def _key(row):
+    return (row["name"], row["areas"], row["filters"])
+
+
+def _print_row(row, baseline=None, threshold=0.0):
+    line = (
+        f"  {row['name']:<34} areas={row['areas']:<4} filters={row['filters']:<2} "
+        f"{row['ms_min']:10.3f} ms  ({row['us_per_area']:9.1f} us/area)"
+    )
+    if "peak_mb" in row:
+        line += f"  peak {row['peak_mb']:.2f} MB"
+    if baseline is not None:
+        ratio = _ratio(row, baseline)
+        flag = "  REGRESSION" if ratio > 1.0 + threshold else ""
+        line += (
+            f"  median {row['ms_median']:.3f} vs {baseline['ms_median']:.3f} ms: "
+            f"{ratio:5.2f}x{flag}"
+        )
+    print(line)
+
+
+def _ratio(row, baseline):
+    """Median slowdown against the baseline (the minimum is too noisy)."""
+    return row["ms_median"] / baseline["ms_median"] if baseline["ms_median"] else 1.0
+
+
+def compare(results, baseline_path, threshold):
+    """Print results against a saved run. Returns the number of regressions."""
+    with open(baseline_path) as f:
+        baseline = {_key(r): r for r in json.load(f)["results"]}
+    print(f"\ncompared with {baseline_path} (threshold +{threshold:.0%}):")
+    regressions = 0
+    for row in results:
+        base = baseline.get(_key(row))
+        if base is None:
+            _print_row(row)
+            continue
+        _print_row(row, base, threshold)
+        if _ratio(row, base) > 1.0 + threshold:
+            regressions += 1
+    print(f"{regressions} regression(s)")
+    return regressions
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--areas", type=_int_list, default=[1, 10, 50, 200])
+    parser.add_argument("--filters", type=_int_list, default=[1, 3, 5])
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--only", type=lambda v: v.split(","), default=None,
+                        help="Comma-separated substrings of case names to run")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON from a previous --output")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Median slowdown flagged as a regression (default 0.25)")
+    parser.add_argument("--registry",
+                        help="Recorded entity registry frame or result (JSON file) "
+                             "for the JSON cases, decoded at every area count")
+    args = parser.parse_args(argv)
+    if max(args.filters) > len(PURPOSES):
+        parser.error(f"--filters supports at most {len(PURPOSES)} purposes")
+
+    global _registry_path
+    _registry_path = args.registry
+    codec = "orjson" if jsoncodec.HAVE_ORJSON else "json"
+    print(f"areas={args.areas} filters={args.filters} repeat={args.repeat} codec={codec}")
+    results = run_suite(args.areas, args.filters, args.repeat, args.only)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "created": datetime.now().isoformat(timespec="seconds"),
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "repeat": args.repeat,
+                        "json_codec": codec,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"wrote {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
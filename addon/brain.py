@@ -20,7 +20,7 @@ from __future__ import annotations
 import math
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -180,6 +180,32 @@ class Config:
             bed_brightness=d.get("bed_brightness", 50),
         )
 
+    def freeze(self) -> "FrozenConfig":
+        """Return a read-only copy that can be shared between areas.
+
+        Alt-day lists become tuples so nothing reachable from the copy is
+        mutable.
+        """
+        frozen = object.__new__(FrozenConfig)
+        values = dict(self.__dict__)
+        values["wake_alt_days"] = tuple(values["wake_alt_days"])
+        values["bed_alt_days"] = tuple(values["bed_alt_days"])
+        frozen.__dict__.update(values)
+        return frozen
+
+
+class FrozenConfig(Config):
+    """Read-only Config shared across areas (see Config.freeze()).
+
+    Use Config.from_dict() when a mutable copy is needed.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
 
 @dataclass
 class SunTimes:
@@ -192,6 +218,11 @@ class SunTimes:
     outdoor_normalized: float = 0.0  # 0-1 from lux sensor or angle estimate
     outdoor_source: str = "none"  # Diagnostics: "lux", "weather", "angle", "none"
     is_fallback: bool = False  # True when sunrise/sunset are defaults, not real solar values
+    # Compiled SolarWindows per frozen config: {id(config): (config, windows)}.
+    # Same-day SunTimes can share one dict (sunrise/sunset/mid are static).
+    solar_windows: Dict[int, Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @property
     def sun_factor(self) -> float:
@@ -400,6 +431,102 @@ def compute_daylight_fade_weight(
     return weight
 
 
+@dataclass(frozen=True)
+class SolarWindows:
+    """Warm-night and daylight windows for one day and config, in hours.
+
+    Window edges only move when the sun times or the config change, so they
+    are compiled once (see for_day) and each solar-rule call is reduced to a
+    few comparisons. Weights match _get_window_weight and
+    compute_daylight_fade_weight exactly.
+    """
+
+    night_enabled: bool
+    night_start: float
+    night_end: float
+    night_fade: float  # hours
+    daylight_enabled: bool  # daylight_enabled and daylight_cct > 0
+    daylight_start: float
+    daylight_end: float
+    daylight_fade: float  # hours (0 = no fade)
+
+    @classmethod
+    def compile(cls, config: Config, sun_times: SunTimes) -> "SolarWindows":
+        """Resolve the window edges for a config and day."""
+        sunrise = sun_times.sunrise
+        sunset = sun_times.sunset
+        solar_mid = sun_times.solar_mid
+
+        start_offset_hrs = config.warm_night_start / 60.0
+        end_offset_hrs = config.warm_night_end / 60.0
+        mode = config.warm_night_mode
+        if mode == "sunrise":
+            ns, ne = solar_mid % 24, (sunrise + end_offset_hrs) % 24
+        elif mode == "sunset":
+            ns, ne = (sunset + start_offset_hrs) % 24, solar_mid % 24
+        else:  # "all"
+            ns, ne = (sunset + start_offset_hrs) % 24, (sunrise + end_offset_hrs) % 24
+
+        return cls(
+            night_enabled=config.warm_night_enabled,
+            night_start=ns,
+            night_end=ne,
+            night_fade=config.warm_night_fade / 60.0,
+            daylight_enabled=config.daylight_enabled and config.daylight_cct > 0,
+            daylight_start=(sunrise + config.daylight_start / 60.0) % 24,
+            daylight_end=(sunset + config.daylight_end / 60.0) % 24,
+            daylight_fade=(
+                config.daylight_fade / 60.0 if config.daylight_fade > 0 else 0.0
+            ),
+        )
+
+    @classmethod
+    def for_day(cls, config: Config, sun_times: SunTimes) -> "SolarWindows":
+        """Compiled windows, cached on sun_times for frozen (shared) configs.
+
+        Mutable configs can change under us, so they are compiled per call.
+        """
+        if not isinstance(config, FrozenConfig):
+            return cls.compile(config, sun_times)
+        entry = sun_times.solar_windows.get(id(config))
+        if entry is None or entry[0] is not config:
+            entry = (config, cls.compile(config, sun_times))
+            sun_times.solar_windows[id(config)] = entry
+        return entry[1]
+
+    def night_strength(self, hour: float) -> float:
+        """Warm-night strength (0-1) at an hour."""
+        if not self.night_enabled:
+            return 0.0
+        in_window, weight = CircadianLight._get_window_weight(
+            hour, self.night_start, self.night_end, self.night_fade
+        )
+        return weight if in_window else 0.0
+
+    def daylight_weight(self, hour: float) -> float:
+        """Daylight window + fade weight (0-1) at an hour."""
+        ws = self.daylight_start
+        we = self.daylight_end
+        h = hour % 24
+        if ws < we:
+            if not ws <= h <= we:
+                return 0.0
+        elif not (h >= ws or h <= we):
+            return 0.0
+
+        fade_hrs = self.daylight_fade
+        if fade_hrs <= 0:
+            return 1.0
+        weight = 1.0
+        dist_from_start = (h - ws) % 24
+        if dist_from_start < fade_hrs:
+            weight = min(weight, dist_from_start / fade_hrs)
+        dist_to_end = (we - h) % 24
+        if dist_to_end < fade_hrs:
+            weight = min(weight, dist_to_end / fade_hrs)
+        return weight
+
+
 def calculate_curve_position(
     brightness: int, min_brightness: int, max_brightness: int
 ) -> float:
@@ -472,6 +599,7 @@ def compute_sun_cooling_strength(
     config: "Config",
     hour: float,
     weekday: Optional[int] = None,
+    natural_brightness: Optional[int] = None,
 ) -> float:
     """Sun-cooling strength scaled down by how far below the natural curve a
     user has stepped (via brightness_mid). 1.0 = full sun-cooling effect; as
@@ -479,12 +607,15 @@ def compute_sun_cooling_strength(
     natural warmth comes through and warming can overcome the day's cooling.
     Used by the runtime pipeline (pipeline.py) and by the home-page zone
     header rendering (webserver.py:get_zone_states) so the two stay in sync.
+    `natural_brightness` lets batch callers share the plain-curve evaluation.
     """
     if state.brightness_mid is None:
         return 1.0
-    natural_bri = CircadianLight.calculate_brightness_at_hour(
-        hour, config, AreaState(is_circadian=True, is_on=True), weekday=weekday
-    )
+    natural_bri = natural_brightness
+    if natural_bri is None:
+        natural_bri = CircadianLight.calculate_brightness_at_hour(
+            hour, config, AreaState(is_circadian=True, is_on=True), weekday=weekday
+        )
     stepped_bri = CircadianLight.calculate_brightness_at_hour(
         hour, config, state, weekday=weekday
     )
@@ -587,6 +718,7 @@ def _converge_override(
     base_cct: float,
     tolerance: float,
     render_fn,
+    first_attempt: Optional[Tuple[float, float]] = None,
 ) -> Optional[float]:
     """Find the color_override that makes render_fn produce desired CCT.
 
@@ -599,6 +731,8 @@ def _converge_override(
         base_cct: Rendered CCT with no override (solar rules applied)
         tolerance: Acceptable error in Kelvin
         render_fn: Callable(override) -> rendered CCT
+        first_attempt: (override, rendered CCT) already tried, used instead
+            of rendering the initial estimate
 
     Returns:
         Override value, or None if no override needed.
@@ -607,9 +741,11 @@ def _converge_override(
         return None
 
     desired_shift = desired - base_cct
-    override = desired_shift  # Initial estimate
-
-    test_cct = render_fn(override)
+    if first_attempt is not None:
+        override, test_cct = first_attempt
+    else:
+        override = desired_shift  # Initial estimate
+        test_cct = render_fn(override)
     error = test_cct - desired
     if abs(error) <= tolerance:
         return override
@@ -636,6 +772,70 @@ def _converge_override(
     return override
 
 
+def solve_color_override(
+    desired: float,
+    base_cct: float,
+    tolerance: float,
+    render_fn,
+    hour: float,
+    config: Config,
+    sun_times: Optional[SunTimes] = None,
+    slider: bool = False,
+    sun_cooling_strength: float = 1.0,
+) -> Optional[float]:
+    """Solve for the color_override that makes render_fn produce desired CCT.
+
+    Closed-form inverse of the override terms in _apply_solar_rules. For a
+    fixed curve kelvin the rendered CCT is piecewise-linear in the override:
+      - slider override (color_override_set_at set): added directly, slope 1
+      - positive step override: raises the warm-night ceiling, slope
+        night_strength (until the ceiling clears the curve)
+      - negative step override: lowers the daylight target, slope
+        daylight_blend × sun_cooling_strength (until the target drops
+        below the curve)
+    The solution is checked with one render; if it misses (saturated
+    segment, clamped bounds) the iterative _converge_override() continues
+    from that render, and with no sensitivity at all it runs on its own.
+
+    Args:
+        desired: Target rendered CCT
+        base_cct: Rendered CCT with no override (solar rules applied)
+        tolerance: Acceptable error in Kelvin
+        render_fn: Callable(override) -> rendered CCT
+        hour: Hour being rendered
+        config: Global configuration
+        sun_times: Sun times render_fn uses (None = defaults)
+        slider: Whether render_fn applies the override as a slider override
+        sun_cooling_strength: Sun cooling strength render_fn uses
+
+    Returns:
+        Override value, or None if no override needed.
+    """
+    if abs(base_cct - desired) <= tolerance:
+        return None
+
+    shift = desired - base_cct
+    if slider:
+        slope = 1.0
+    else:
+        night_strength, daylight_blend = CircadianLight.solar_rule_weights(
+            hour, config, sun_times or SunTimes()
+        )
+        slope = night_strength if shift > 0 else daylight_blend * sun_cooling_strength
+
+    if slope <= 0.01:
+        return _converge_override(desired, base_cct, tolerance, render_fn)
+
+    override = shift / slope
+    rendered = render_fn(override)
+    if abs(rendered - desired) <= tolerance:
+        return override
+    # Missed (target beyond the linear segment): iterate from this attempt
+    return _converge_override(
+        desired, base_cct, tolerance, render_fn, first_attempt=(override, rendered)
+    )
+
+
 def inverse_midpoint(
     x: float, target_value: float, slope: float, y0: float, y1: float
 ) -> float:
@@ -1105,6 +1305,35 @@ class CircadianLight:
 
         return (True, weight)
 
+    @staticmethod
+    def solar_rule_weights(
+        hour: float, config: Config, sun_times: SunTimes
+    ) -> Tuple[float, float]:
+        """Warm-night strength and daylight blend at an hour.
+
+        Args:
+            hour: Current hour
+            config: Global configuration
+            sun_times: Sun position times
+
+        Returns:
+            (night_strength, daylight_blend), each 0.0-1.0. daylight_blend
+            includes outdoor intensity and the daylight window fade, but not
+            sun_cooling_strength.
+        """
+        windows = SolarWindows.for_day(config, sun_times)
+        night_strength = windows.night_strength(hour)
+
+        daylight_blend = 0.0
+        if windows.daylight_enabled and sun_times.outdoor_normalized > 0:
+            daylight_blend = min(
+                1.0, sun_times.outdoor_normalized * config.color_sensitivity
+            )
+            # Apply daylight window + fade
+            daylight_blend *= windows.daylight_weight(hour)
+
+        return night_strength, daylight_blend
+
     @staticmethod
     def _apply_solar_rules(
         kelvin: float,
@@ -1136,33 +1365,9 @@ class CircadianLight:
         if sun_times is None:
             sun_times = SunTimes()  # Use defaults
 
-        sunrise = sun_times.sunrise
-        sunset = sun_times.sunset
-        solar_mid = sun_times.solar_mid
-        wrap24 = CircadianLight._wrap24
-
-        # Compute night_strength from warm_night window
-        night_strength = 0.0
-        if config.warm_night_enabled:
-            fade_hrs = config.warm_night_fade / 60.0
-            start_offset_hrs = config.warm_night_start / 60.0
-            end_offset_hrs = config.warm_night_end / 60.0
-            mode = config.warm_night_mode
-
-            if mode == "sunrise":
-                ws, we = wrap24(solar_mid), wrap24(sunrise + end_offset_hrs)
-            elif mode == "sunset":
-                ws, we = wrap24(sunset + start_offset_hrs), wrap24(solar_mid)
-            else:  # "all"
-                ws, we = wrap24(sunset + start_offset_hrs), wrap24(
-                    sunrise + end_offset_hrs
-                )
-
-            in_window, weight = CircadianLight._get_window_weight(
-                hour, ws, we, fade_hrs
-            )
-            if in_window:
-                night_strength = weight
+        night_strength, daylight_blend = CircadianLight.solar_rule_weights(
+            hour, config, sun_times
+        )
 
         # Slider-originated overrides (set_at present) are direct additive CCT offsets
         # applied AFTER solar rules.  Step-originated overrides (no set_at) modify
@@ -1183,20 +1388,9 @@ class CircadianLight:
             and config.daylight_cct > 0
             and sun_times.outdoor_normalized > 0
         ):
-            outdoor_norm = sun_times.outdoor_normalized
-            blend = min(1.0, outdoor_norm * config.color_sensitivity)
-            # Apply daylight window + fade
-            blend *= compute_daylight_fade_weight(
-                hour,
-                sunrise,
-                sunset,
-                config.daylight_fade,
-                config.daylight_start,
-                config.daylight_end,
-            )
             # Sun cooling strength: 1.0 = full effect, < 1.0 when user has
             # stepped down (allows curve's natural warmth to come through).
-            blend *= sun_cooling_strength
+            blend = daylight_blend * sun_cooling_strength
             daylight_target = config.daylight_cct
             if state.color_override and state.color_override < 0 and not slider_color:
                 daylight_target += state.color_override
@@ -1238,33 +1432,8 @@ class CircadianLight:
         if sun_times is None:
             sun_times = SunTimes()
 
-        sunrise = sun_times.sunrise
-        sunset = sun_times.sunset
-        solar_mid = sun_times.solar_mid
-        wrap24 = CircadianLight._wrap24
-
-        # Compute night_strength from warm_night window
-        night_strength = 0.0
-        if config.warm_night_enabled:
-            fade_hrs = config.warm_night_fade / 60.0
-            start_offset_hrs = config.warm_night_start / 60.0
-            end_offset_hrs = config.warm_night_end / 60.0
-            mode = config.warm_night_mode
-
-            if mode == "sunrise":
-                ws, we = wrap24(solar_mid), wrap24(sunrise + end_offset_hrs)
-            elif mode == "sunset":
-                ws, we = wrap24(sunset + start_offset_hrs), wrap24(solar_mid)
-            else:  # "all"
-                ws, we = wrap24(sunset + start_offset_hrs), wrap24(
-                    sunrise + end_offset_hrs
-                )
-
-            in_window, weight = CircadianLight._get_window_weight(
-                hour, ws, we, fade_hrs
-            )
-            if in_window:
-                night_strength = weight
+        windows = SolarWindows.for_day(config, sun_times)
+        night_strength = windows.night_strength(hour)
 
         slider_color = state.color_override_set_at is not None
 
@@ -1289,14 +1458,7 @@ class CircadianLight:
             outdoor_norm = sun_times.outdoor_normalized
             blend = min(1.0, outdoor_norm * config.color_sensitivity)
             # Apply daylight window + fade
-            daylight_fade_weight = compute_daylight_fade_weight(
-                hour,
-                sunrise,
-                sunset,
-                config.daylight_fade,
-                config.daylight_start,
-                config.daylight_end,
-            )
+            daylight_fade_weight = windows.daylight_weight(hour)
             blend *= daylight_fade_weight
             if state.color_override and state.color_override < 0 and not slider_color:
                 daylight_target += state.color_override
@@ -1478,8 +1640,8 @@ class CircadianLight:
                 weekday=weekday,
             )
 
-        new_override = _converge_override(
-            target, base_rendered, tolerance, _render_color
+        new_override = solve_color_override(
+            target, base_rendered, tolerance, _render_color, hour, config, sun_times
         )
 
         # 8. Verify final rendered output changed meaningfully
@@ -1629,7 +1791,7 @@ class CircadianLight:
 
         elif dimension == "color":
             # Color slider: set color_override directly, don't change color_mid.
-            # The override targets the desired CCT via _converge_override.
+            # The override targets the desired CCT via solve_color_override.
 
             # Render with current color_mid, no override
             test_state = AreaState(
@@ -1674,11 +1836,15 @@ class CircadianLight:
                     weekday=weekday,
                 )
 
-            state_updates["color_override"] = _converge_override(
+            state_updates["color_override"] = solve_color_override(
                 target_natural_cct,
                 test_rendered,
                 tolerance,
                 _render_color_pos,
+                hour,
+                config,
+                sun_times,
+                slider=True,
             )
             # Mark as slider-originated for direct additive mode in verification
             state_updates["color_override_set_at"] = hour
@@ -1816,7 +1982,21 @@ class CircadianLight:
 
     @staticmethod
     def color_temperature_to_rgb(kelvin: int) -> Tuple[int, int, int]:
-        """Convert color temperature to RGB."""
+        """Convert color temperature to RGB.
+
+        Integer kelvin in the table range is served from _RGB_TABLE.
+        """
+        if type(kelvin) is int and KELVIN_TABLE_MIN <= kelvin <= KELVIN_TABLE_MAX:
+            i = kelvin - KELVIN_TABLE_MIN
+            rgb = _RGB_TABLE[i]
+            if rgb is None:
+                rgb = _RGB_TABLE[i] = CircadianLight._compute_rgb(kelvin)
+            return rgb
+        return CircadianLight._compute_rgb(kelvin)
+
+    @staticmethod
+    def _compute_rgb(kelvin: float) -> Tuple[int, int, int]:
+        """RGB formula behind color_temperature_to_rgb (no table)."""
         x, y = CircadianLight.color_temperature_to_xy(kelvin)
 
         Y = 1.0
@@ -1901,12 +2081,26 @@ class CircadianLight:
             point (at 500K). This creates a smooth orange → red gradient
             for very warm/night lighting scenarios.
 
+        Integer kelvin in the table range is served from _XY_TABLE (filled
+        on first use, same tuples as the formula).
+
         Args:
             cct: Color temperature in Kelvin (500-25000 supported)
 
         Returns:
             Tuple of (x, y) CIE 1931 chromaticity coordinates
         """
+        if type(cct) is int and KELVIN_TABLE_MIN <= cct <= KELVIN_TABLE_MAX:
+            i = cct - KELVIN_TABLE_MIN
+            xy = _XY_TABLE[i]
+            if xy is None:
+                xy = _XY_TABLE[i] = CircadianLight._compute_xy(cct)
+            return xy
+        return CircadianLight._compute_xy(cct)
+
+    @staticmethod
+    def _compute_xy(cct: float) -> Tuple[float, float]:
+        """Planckian/extended-red formula behind color_temperature_to_xy (no table)."""
         # Extended warm range: interpolate towards red below Planckian limit
         if cct < CircadianLight.PLANCKIAN_WARM_LIMIT:
             # Clamp to our minimum
@@ -1949,6 +2143,18 @@ class CircadianLight:
         return (x, y)
 
 
+# Integer-kelvin color lookup tables, one slot per kelvin, filled lazily by
+# CircadianLight.color_temperature_to_xy / color_temperature_to_rgb
+KELVIN_TABLE_MIN = CircadianLight.EXTENDED_RED_LIMIT
+KELVIN_TABLE_MAX = 25000
+_XY_TABLE: List[Optional[Tuple[float, float]]] = [None] * (
+    KELVIN_TABLE_MAX - KELVIN_TABLE_MIN + 1
+)
+_RGB_TABLE: List[Optional[Tuple[int, int, int]]] = [None] * (
+    KELVIN_TABLE_MAX - KELVIN_TABLE_MIN + 1
+)
+
+
 # ---------------------------------------------------------------------------
 # Convenience function for current time calculations
 # ---------------------------------------------------------------------------
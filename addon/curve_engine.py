@@ -0,0 +1,765 @@
+"""Whole-day curve evaluation for the designer/visualization endpoints.
+
+`day_curve()` evaluates brightness and color temperature at many hours in
+one pass. With NumPy installed it runs array versions of the brain.py
+math (logistic, window weights, daylight fade, kelvin → xy); without it,
+it falls back to the scalar brain.py functions with a single Config. Both
+paths produce the same integers as CircadianLight.calculate_lighting().
+
+Only the phase midpoints are resolved per phase group with the scalar
+helpers - there are at most three distinct ones in a day.
+
+DailyCurveTable builds on day_curve(): a per-zone, per-day minute table
+the circadian tick can interpolate instead of re-running the curve math
+(opt-in via the curve_table_enabled setting).
+
+step_sequence() walks step up/down from the default curve for the step
+visualization, and StepSequenceCache memoizes those walks.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from brain import (
+    DEFAULT_MAX_DIM_STEPS,
+    SPEED_TO_SLOPE,
+    AreaState,
+    CircadianLight,
+    Config,
+    SolarWindows,
+    SunTimes,
+    compute_shifted_midpoint,
+    midpoint_to_time,
+    resolve_effective_timing,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the scalar path is used instead
+    np = None
+
+HAVE_NUMPY = np is not None
+
+
+def day_curve(
+    config: Config,
+    hours: Sequence[float],
+    weekday: int,
+    state: Optional[AreaState] = None,
+    sun_times: Optional[SunTimes] = None,
+    sun_cooling_strength: float = 1.0,
+    use_numpy: Optional[bool] = None,
+    apply_solar_rules: bool = True,
+) -> Tuple[list, list]:
+    """Evaluate the curve at every hour.
+
+    Args:
+        config: Rhythm configuration
+        hours: Hours (0-24) to evaluate
+        weekday: Python weekday (0=Mon..6=Sun) for alt timing
+        state: Area state (None = default curve)
+        sun_times: Sun times for solar rules (None = defaults)
+        sun_cooling_strength: 0.0-1.0 modifier on sun cooling
+        use_numpy: Force a path (None = NumPy when available)
+        apply_solar_rules: Whether to apply warm night/sun cooling rules
+
+    Returns:
+        (brightness list, kelvin list) of ints, one per hour
+    """
+    state = state or AreaState()
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    if use_numpy:
+        return _day_curve_numpy(
+            config, hours, weekday, state, sun_times or SunTimes(),
+            sun_cooling_strength, apply_solar_rules,
+        )
+    return _day_curve_scalar(
+        config, hours, weekday, state, sun_times, sun_cooling_strength,
+        apply_solar_rules,
+    )
+
+
+def _day_curve_scalar(
+    config, hours, weekday, state, sun_times, sun_cooling_strength, apply_solar_rules
+):
+    brightness = []
+    kelvin = []
+    for hour in hours:
+        brightness.append(
+            CircadianLight.calculate_brightness_at_hour(
+                hour, config, state, weekday=weekday
+            )
+        )
+        kelvin.append(
+            CircadianLight.calculate_color_at_hour(
+                hour,
+                config,
+                state,
+                apply_solar_rules=apply_solar_rules,
+                sun_times=sun_times,
+                weekday=weekday,
+                sun_cooling_strength=sun_cooling_strength,
+            )
+        )
+    return brightness, kelvin
+
+
+# ---------------------------------------------------------------------------
+# NumPy path
+# ---------------------------------------------------------------------------
+
+
+def _phase_mid48(config, mid, stepped, in_ascend, t_ascend, t_descend, slope):
+    """Scalar midpoint for one phase group (mirrors calculate_*_at_hour)."""
+    if in_ascend:
+        phase_start, phase_end = t_ascend, t_descend
+    else:
+        phase_start, phase_end = t_descend, t_ascend + 24
+    if not stepped:
+        brightness_pct = config.wake_brightness if in_ascend else config.bed_brightness
+        if brightness_pct != 50:
+            mid48_raw = CircadianLight.lift_midpoint_to_phase(mid, phase_start, phase_end)
+            shifted = compute_shifted_midpoint(
+                mid48_raw,
+                brightness_pct,
+                slope,
+                config.min_brightness / 100.0,
+                config.max_brightness / 100.0,
+            )
+            mid = shifted % 24
+    return CircadianLight.lift_midpoint_to_phase(mid, phase_start, phase_end)
+
+
+def logistic_array(x, midpoint, slope, y0, y1):
+    """Array version of brain.logistic (overflow saturates to y0/y1)."""
+    with np.errstate(over="ignore"):
+        exp_val = np.exp(-slope * (x - midpoint))
+    return y0 + (y1 - y0) / (1 + exp_val)
+
+
+def window_weight_array(h, window_start, window_end, fade_hrs):
+    """Array version of CircadianLight._get_window_weight (weight 0 outside)."""
+    h = np.remainder(h, 24)
+    if window_start > window_end:
+        in_window = (h >= window_start) | (h <= window_end)
+        dist_from_start = np.where(h >= window_start, h - window_start, h + 24 - window_start)
+        dist_to_end = np.where(h <= window_end, window_end - h, window_end + 24 - h)
+    else:
+        in_window = (h >= window_start) & (h <= window_end)
+        dist_from_start = h - window_start
+        dist_to_end = window_end - h
+
+    weight = np.ones_like(h)
+    if fade_hrs > 0.01:
+        weight = np.where(dist_from_start < fade_hrs, np.minimum(weight, dist_from_start / fade_hrs), weight)
+        weight = np.where(dist_to_end < fade_hrs, np.minimum(weight, dist_to_end / fade_hrs), weight)
+    return np.where(in_window, weight, 0.0)
+
+
+def daylight_fade_weight_array(h, sunrise, sunset, daylight_fade, daylight_start, daylight_end):
+    """Array version of brain.compute_daylight_fade_weight."""
+    fade_hrs = daylight_fade / 60.0 if daylight_fade > 0 else 0.0
+    ws = (sunrise + daylight_start / 60.0) % 24
+    we = (sunset + daylight_end / 60.0) % 24
+    h = np.remainder(h, 24)
+    if ws < we:
+        in_window = (ws <= h) & (h <= we)
+    else:
+        in_window = (h >= ws) | (h <= we)
+    if fade_hrs <= 0:
+        return np.where(in_window, 1.0, 0.0)
+
+    dist_from_start = np.remainder(h - ws, 24)
+    dist_to_end = np.remainder(we - h, 24)
+    weight = np.ones_like(h)
+    weight = np.where(dist_from_start < fade_hrs, np.minimum(weight, dist_from_start / fade_hrs), weight)
+    weight = np.where(dist_to_end < fade_hrs, np.minimum(weight, dist_to_end / fade_hrs), weight)
+    return np.where(in_window, weight, 0.0)
+
+
+def color_temperature_to_xy_array(cct):
+    """Array version of CircadianLight.color_temperature_to_xy.
+
+    Returns:
+        (x array, y array)
+    """
+    cct = np.asarray(cct, dtype=float)
+    warm_limit = CircadianLight.PLANCKIAN_WARM_LIMIT
+    red_limit = CircadianLight.EXTENDED_RED_LIMIT
+    warm_x, warm_y = CircadianLight.PLANCKIAN_WARM_XY
+    red_x, red_y = CircadianLight.TARGET_RED_XY
+
+    # Extended warm range below the Planckian limit
+    t = (warm_limit - np.maximum(red_limit, cct)) / (warm_limit - red_limit)
+    ext_x = warm_x + t * (red_x - warm_x)
+    ext_y = warm_y + t * (red_y - warm_y)
+
+    T = np.minimum(cct, 25000)
+    invT = 1000.0 / np.maximum(T, warm_limit)
+    x = np.where(
+        T <= 4000,
+        -0.2661239 * invT**3 - 0.2343589 * invT**2 + 0.8776956 * invT + 0.179910,
+        -3.0258469 * invT**3 + 2.1070379 * invT**2 + 0.2226347 * invT + 0.240390,
+    )
+    y = np.where(
+        T <= 2222,
+        -1.1063814 * x**3 - 1.34811020 * x**2 + 2.18555832 * x - 0.20219683,
+        np.where(
+            T <= 4000,
+            -0.9549476 * x**3 - 1.37418593 * x**2 + 2.09137015 * x - 0.16748867,
+            3.0817580 * x**3 - 5.87338670 * x**2 + 3.75112997 * x - 0.37001483,
+        ),
+    )
+    below = cct < warm_limit
+    return np.where(below, ext_x, x), np.where(below, ext_y, y)
+
+
+def _day_curve_numpy(
+    config, hours, weekday, state, sun_times, sun_cooling_strength, apply_solar_rules
+):
+    hour = np.asarray(hours, dtype=float)
+    if hour.size == 0:
+        return [], []
+
+    # Phase info (CircadianLight.get_phase_info)
+    t_ascend = config.ascend_start
+    t_descend = config.descend_start
+    if t_descend <= t_ascend:
+        t_descend += 24
+    h48 = np.where(hour < t_ascend, hour + 24, hour)
+    in_ascend = (t_ascend <= h48) & (h48 < t_descend)
+    k_ascend = SPEED_TO_SLOPE[max(1, min(12, config.wake_speed))]
+    k_descend = SPEED_TO_SLOPE[max(1, min(12, config.bed_speed))]
+    slope = np.where(in_ascend, k_ascend, -k_descend)
+
+    # Effective timing (resolve_effective_timing): bed alt uses yesterday
+    # before ascend_start
+    wake = config.wake_time
+    if config.wake_alt_time is not None and weekday in config.wake_alt_days:
+        wake = config.wake_alt_time
+
+    def bed_for(bed_weekday):
+        if config.bed_alt_time is not None and bed_weekday in config.bed_alt_days:
+            return config.bed_alt_time
+        return config.bed_time
+
+    early = hour < config.ascend_start
+    groups = [
+        (True, None, in_ascend),
+        (False, bed_for(weekday), ~in_ascend & ~early),
+        (False, bed_for((weekday - 1) % 7), ~in_ascend & early),
+    ]
+
+    bri_mid = np.zeros_like(hour)
+    color_mid = np.zeros_like(hour)
+    for ascend, bed, mask in groups:
+        if not mask.any():
+            continue
+        k = k_ascend if ascend else -k_descend
+        default_mid = wake if ascend else bed
+        if state.brightness_mid is not None:
+            b = _phase_mid48(config, state.brightness_mid, True, ascend, t_ascend, t_descend, k)
+        else:
+            b = _phase_mid48(config, default_mid, False, ascend, t_ascend, t_descend, k)
+        if state.color_mid is not None:
+            c = _phase_mid48(config, state.color_mid, True, ascend, t_ascend, t_descend, k)
+        else:
+            c = _phase_mid48(config, default_mid, False, ascend, t_ascend, t_descend, k)
+        bri_mid[mask] = b
+        color_mid[mask] = c
+
+    calc_h = np.where(~in_ascend & (h48 < t_descend), h48 + 24, h48)
+
+    # Brightness
+    b_min = config.min_brightness
+    b_max = config.max_brightness
+    value = logistic_array(calc_h, bri_mid, slope, b_min / 100.0, b_max / 100.0)
+    brightness = np.clip(np.round(value * 100), b_min, b_max)
+
+    # Color
+    c_min = config.min_color_temp
+    c_max = config.max_color_temp
+    norm = logistic_array(calc_h, color_mid, slope, 0, 1)
+    kelvin = c_min + (c_max - c_min) * norm
+    if not apply_solar_rules:
+        kelvin = np.clip(np.round(kelvin), c_min, c_max)
+        return brightness.astype(int).tolist(), kelvin.astype(int).tolist()
+
+    kelvin = _apply_solar_rules_array(
+        kelvin, hour, config, state, sun_times, sun_cooling_strength
+    )
+    lower = min(c_min, config.warm_night_target) if config.warm_night_enabled else c_min
+    upper = (
+        max(c_max, config.daylight_cct)
+        if config.daylight_enabled and config.daylight_cct > 0
+        else c_max
+    )
+    kelvin = np.clip(np.round(kelvin), lower, upper)
+
+    return brightness.astype(int).tolist(), kelvin.astype(int).tolist()
+
+
+def _apply_solar_rules_array(kelvin, hour, config, state, sun_times, sun_cooling_strength):
+    """Array version of CircadianLight._apply_solar_rules."""
+    sunrise = sun_times.sunrise
+    sunset = sun_times.sunset
+    solar_mid = sun_times.solar_mid
+
+    night_strength = np.zeros_like(hour)
+    if config.warm_night_enabled:
+        fade_hrs = config.warm_night_fade / 60.0
+        start_offset_hrs = config.warm_night_start / 60.0
+        end_offset_hrs = config.warm_night_end / 60.0
+        mode = config.warm_night_mode
+        if mode == "sunrise":
+            ws, we = solar_mid % 24, (sunrise + end_offset_hrs) % 24
+        elif mode == "sunset":
+            ws, we = (sunset + start_offset_hrs) % 24, solar_mid % 24
+        else:  # "all"
+            ws, we = (sunset + start_offset_hrs) % 24, (sunrise + end_offset_hrs) % 24
+        night_strength = window_weight_array(hour, ws, we, fade_hrs)
+
+    slider_color = state.color_override_set_at is not None
+
+    warm_target = config.warm_night_target
+    if state.color_override and state.color_override > 0 and not slider_color:
+        warm_target += state.color_override
+
+    night_effect = np.where(night_strength > 0, np.maximum(0, kelvin - warm_target), 0)
+
+    day_shift = np.zeros_like(hour)
+    if (
+        config.daylight_enabled
+        and config.daylight_cct > 0
+        and sun_times.outdoor_normalized > 0
+    ):
+        blend = min(1.0, sun_times.outdoor_normalized * config.color_sensitivity)
+        blend = blend * daylight_fade_weight_array(
+            hour,
+            sunrise,
+            sunset,
+            config.daylight_fade,
+            config.daylight_start,
+            config.daylight_end,
+        )
+        blend = blend * sun_cooling_strength
+        daylight_target = config.daylight_cct
+        if state.color_override and state.color_override < 0 and not slider_color:
+            daylight_target += state.color_override
+        day_shift = np.where(daylight_target > kelvin, (daylight_target - kelvin) * blend, 0)
+
+    kelvin = kelvin - night_effect * night_strength + day_shift
+
+    if slider_color and state.color_override:
+        kelvin = kelvin + state.color_override
+
+    return kelvin
+
+
+# ---------------------------------------------------------------------------
+# Daily lookup table
+# ---------------------------------------------------------------------------
+
+MINUTES_PER_DAY = 1440
+
+# Adjacent minute samples further apart than this are a jump (phase
+# boundary, zero-fade warm-night edge, very steep speed) - interpolating
+# across one would be wrong, so those minutes are evaluated exactly
+JUMP_BRIGHTNESS = 2  # brightness %
+JUMP_KELVIN = 50  # kelvin
+
+
+class DailyCurveTable:
+    """One zone's default-state curve for one day, sampled every minute.
+
+    Holds exact brain.py brightness, curve kelvin (before solar rules) and
+    warm-night kelvin (solar rules with no daylight) at each minute 0-1440.
+    lookup() interpolates between minutes and applies the daylight blend
+    live, so changing outdoor light doesn't invalidate the table. Minutes
+    where the curve jumps are left to exact evaluation.
+
+    Only valid for areas on the plain curve: no stepped midpoints, color
+    override or freeze. Those are evaluated exactly by the pipeline.
+    """
+
+    __slots__ = (
+        "config",
+        "day",
+        "weekday",
+        "sun_key",
+        "sun_times",
+        "windows",
+        "brightness",
+        "curve_kelvin",
+        "kelvin",
+        "xy",
+        "jumps",
+        "lower",
+        "upper",
+    )
+
+    def __init__(self, config: Config, day, sun_times: SunTimes):
+        """Evaluate the table for a calendar day.
+
+        Args:
+            config: Compiled (shared) zone config
+            day: datetime.date the table is for
+            sun_times: That day's sun times (outdoor level is ignored)
+        """
+        self.config = config
+        self.day = day
+        self.weekday = day.weekday()
+        self.sun_key = sun_times_key(sun_times)
+        self.sun_times = replace(sun_times, outdoor_normalized=0.0)
+        self.windows = SolarWindows.compile(config, sun_times)
+
+        hours = [m / 60.0 for m in range(MINUTES_PER_DAY + 1)]
+        state = AreaState(is_circadian=True, is_on=True)
+        self.brightness, self.kelvin = day_curve(
+            config, hours, self.weekday, state=state, sun_times=self.sun_times
+        )
+        _, self.curve_kelvin = day_curve(
+            config, hours, self.weekday, state=state, apply_solar_rules=False
+        )
+        self.xy = [CircadianLight.color_temperature_to_xy(k) for k in self.kelvin]
+        self.jumps = bytearray(
+            abs(self.brightness[m + 1] - self.brightness[m]) > JUMP_BRIGHTNESS
+            or abs(self.kelvin[m + 1] - self.kelvin[m]) > JUMP_KELVIN
+            or abs(self.curve_kelvin[m + 1] - self.curve_kelvin[m]) > JUMP_KELVIN
+            for m in range(MINUTES_PER_DAY)
+        )
+
+        self.lower = (
+            min(config.min_color_temp, config.warm_night_target)
+            if config.warm_night_enabled
+            else config.min_color_temp
+        )
+        self.upper = (
+            max(config.max_color_temp, config.daylight_cct)
+            if config.daylight_enabled and config.daylight_cct > 0
+            else config.max_color_temp
+        )
+
+    def covers(self, ctx) -> bool:
+        """Whether a PipelineContext can be served from this table.
+
+        Requires the same config, day and sun times, and an area on the
+        plain curve (no freeze, stepped midpoints or color override).
+        """
+        if ctx.config is not self.config:
+            return False
+        if ctx.weekday is not None and ctx.weekday != self.weekday:
+            return False
+        if sun_times_key(ctx.sun_times) != self.sun_key:
+            return False
+        st = ctx.area_state
+        return (
+            st.frozen_at is None
+            and st.brightness_mid is None
+            and st.color_mid is None
+            and not st.color_override
+        )
+
+    def lookup(self, hour: float, outdoor_normalized: float = 0.0):
+        """Base curve at an hour, interpolated between minute samples.
+
+        Args:
+            hour: Hour (0-24) on this table's day
+            outdoor_normalized: Current outdoor level for the daylight blend
+
+        Returns:
+            pipeline.BaseCurve, or None when the curve jumps within this
+            minute and the caller should evaluate it exactly
+        """
+        from pipeline import BaseCurve
+
+        pos = max(0.0, min(float(MINUTES_PER_DAY), hour * 60.0))
+        i = min(int(pos), MINUTES_PER_DAY - 1)
+        frac = pos - i
+        if frac and self.jumps[i]:
+            return None
+
+        bri = self.brightness
+        brightness = int(round(bri[i] + (bri[i + 1] - bri[i]) * frac))
+
+        kel = self.kelvin
+        kelvin = kel[i] + (kel[i + 1] - kel[i]) * frac
+
+        config = self.config
+        if (
+            config.daylight_enabled
+            and config.daylight_cct > 0
+            and outdoor_normalized > 0
+        ):
+            curve = self.curve_kelvin[i] + (
+                self.curve_kelvin[i + 1] - self.curve_kelvin[i]
+            ) * frac
+            if config.daylight_cct > curve:
+                blend = min(1.0, outdoor_normalized * config.color_sensitivity)
+                blend *= self.windows.daylight_weight(hour)
+                kelvin += (config.daylight_cct - curve) * blend
+
+        kelvin = int(max(self.lower, min(self.upper, round(kelvin))))
+        if kelvin == kel[i]:
+            xy = self.xy[i]
+        elif kelvin == kel[i + 1]:
+            xy = self.xy[i + 1]
+        else:
+            xy = CircadianLight.color_temperature_to_xy(kelvin)
+
+        in_ascend = CircadianLight.get_phase_info(hour, config)[0]
+        return BaseCurve(
+            brightness=brightness,
+            kelvin=kelvin,
+            xy=xy,
+            phase="ascend" if in_ascend else "descend",
+        )
+
+
+def sun_times_key(sun_times: SunTimes) -> tuple:
+    """The sun times a DailyCurveTable depends on (outdoor level excluded)."""
+    return (
+        sun_times.sunrise,
+        sun_times.sunset,
+        sun_times.solar_noon,
+        sun_times.solar_mid,
+    )
+
+
+class CurveTableStore:
+    """Lazily built DailyCurveTable per zone.
+
+    A zone's table is rebuilt when its compiled config changes (config
+    version bump or schedule override), when sun times change, or on a new
+    day; tables from earlier days are dropped at rollover.
+    """
+
+    def __init__(self):
+        self._tables: Dict[Optional[str], DailyCurveTable] = {}
+        self._builds = 0
+        self._build_seconds = 0.0
+        self._lookups = 0
+
+    def get(
+        self, zone_name: Optional[str], config: Config, day, sun_times: SunTimes
+    ) -> DailyCurveTable:
+        """Return the zone's table for a day, building it if stale."""
+        table = self._tables.get(zone_name)
+        if (
+            table is None
+            or table.config is not config
+            or table.day != day
+            or table.sun_key != sun_times_key(sun_times)
+        ):
+            if table is not None and table.day != day:
+                self.evict_before(day)
+            start = time.perf_counter()
+            table = DailyCurveTable(config, day, sun_times)
+            self._build_seconds += time.perf_counter() - start
+            self._builds += 1
+            self._tables[zone_name] = table
+        return table
+
+    def evict_before(self, day) -> None:
+        """Drop tables for days before `day`."""
+        for zone_name in [z for z, t in self._tables.items() if t.day < day]:
+            del self._tables[zone_name]
+
+    def record_lookups(self, count: int) -> None:
+        """Count curve evaluations served from tables."""
+        self._lookups += count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Table count, builds, build time and lookups served."""
+        return {
+            "tables": len(self._tables),
+            "builds": self._builds,
+            "build_ms": round(self._build_seconds * 1000, 1),
+            "lookups": self._lookups,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Step sequences
+# ---------------------------------------------------------------------------
+
+STEP_HOUR_BUCKET = 1 / 60  # Sequences are computed per clock minute
+STEP_CACHE_SIZE = 64
+
+
+def step_sequence(
+    config: Config,
+    hour: float,
+    action: str,
+    max_steps: int,
+    weekday: int,
+    sun_times: Optional[SunTimes] = None,
+) -> List[Dict[str, Any]]:
+    """Walk step up/down from the default curve position.
+
+    Each step does what a step_up/step_down button press does
+    (primitives._step_circadian): move brightness one step_size along the
+    curve via calculate_set_position(), which shifts the midpoint. The
+    walk carries the stepped midpoint forward instead of starting over, and
+    stops once a step no longer changes brightness.
+
+    Each step's "hour" is where the unstepped curve reaches that
+    brightness (midpoint_to_time on the default midpoint), clamped to the
+    current phase.
+
+    Args:
+        config: Rhythm configuration
+        hour: Clock hour (0-24)
+        action: "brighten" or "dim"
+        max_steps: Number of steps across the brightness range (and the
+            maximum sequence length, current position included)
+        weekday: Python weekday (0=Mon..6=Sun) for alt timing
+        sun_times: Sun times for solar rules (None = defaults)
+
+    Returns:
+        List of dicts with hour, brightness, kelvin, rgb for each step
+    """
+    max_steps = max_steps or DEFAULT_MAX_DIM_STEPS
+    state = AreaState(is_circadian=True, is_on=True)
+    current = CircadianLight.calculate_lighting(
+        hour, config, state, sun_times=sun_times, weekday=weekday
+    )
+    steps = [
+        {
+            "hour": hour,
+            "brightness": current.brightness,
+            "kelvin": current.color_temp,
+            "rgb": list(current.rgb),
+        }
+    ]
+
+    in_ascend, _, t_ascend, t_descend, slope = CircadianLight.get_phase_info(
+        hour, config
+    )
+    phase_start, phase_end = (
+        (t_ascend, t_descend) if in_ascend else (t_descend, t_ascend + 24)
+    )
+    eff_wake, eff_bed = resolve_effective_timing(config, hour, weekday)
+    default_mid48 = _phase_mid48(
+        config,
+        eff_wake if in_ascend else eff_bed,
+        False,
+        in_ascend,
+        t_ascend,
+        t_descend,
+        slope,
+    )
+
+    b_min = config.min_brightness
+    b_max = config.max_brightness
+    b_range = b_max - b_min
+    step_size = b_range / max_steps
+    sign = 1 if action == "brighten" else -1
+
+    for _ in range(max_steps - 1):
+        current_bri = CircadianLight.calculate_brightness_at_hour(
+            hour, config, state, weekday=weekday
+        )
+        target_bri = max(b_min, min(b_max, current_bri + sign * step_size))
+        if abs(target_bri - current_bri) < 0.5:
+            break
+
+        position = (target_bri - b_min) / b_range * 100 if b_range > 0 else 50
+        result = CircadianLight.calculate_set_position(
+            hour,
+            max(0, min(100, round(position, 1))),
+            "step",
+            config,
+            state,
+            sun_times=sun_times,
+            weekday=weekday,
+        )
+        if result.brightness == steps[-1]["brightness"]:
+            break  # Pinned against the curve's safe margin
+        state = replace(state, **result.state_updates)
+
+        pct = (result.brightness - b_min) / b_range * 100 if b_range > 0 else 50
+        step_h48 = midpoint_to_time(
+            default_mid48, pct, slope, b_min / 100.0, b_max / 100.0
+        )
+        steps.append(
+            {
+                "hour": max(phase_start, min(phase_end, step_h48)) % 24,
+                "brightness": result.brightness,
+                "kelvin": result.color_temp,
+                "rgb": list(result.rgb),
+            }
+        )
+
+    return steps
+
+
+def config_key(config: Config) -> tuple:
+    """Hashable snapshot of every Config field (a content-based version)."""
+    return tuple(
+        tuple(v) if isinstance(v, list) else v for v in config.__dict__.values()
+    )
+
+
+class StepSequenceCache:
+    """LRU memo of step_sequence() results.
+
+    Keyed by (config_key, sun times, weekday, minute bucket, action,
+    max_steps), so an edited or live-previewed config is simply a new key;
+    the least recently used sequences are evicted past `size` entries.
+    """
+
+    def __init__(self, size: int = STEP_CACHE_SIZE):
+        self._size = size
+        self._entries: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        config: Config,
+        hour: float,
+        action: str,
+        max_steps: int,
+        weekday: int,
+        sun_times: Optional[SunTimes] = None,
+    ) -> List[Dict[str, Any]]:
+        """step_sequence() at the hour's minute bucket, memoized."""
+        bucket = int(round(hour / STEP_HOUR_BUCKET)) % MINUTES_PER_DAY
+        key = (
+            config_key(config),
+            sun_times_key(sun_times) if sun_times is not None else None,
+            weekday,
+            bucket,
+            action,
+            max_steps,
+        )
+        steps = self._entries.get(key)
+        if steps is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+        else:
+            self._misses += 1
+            steps = step_sequence(
+                config, bucket * STEP_HOUR_BUCKET, action, max_steps, weekday, sun_times
+            )
+            self._entries[key] = steps
+            if len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+        # Callers get their own dicts; the cached ones stay pristine
+        return [dict(step) for step in steps]
+
+    def clear(self) -> None:
+        """Drop all cached sequences."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cached sequences, hits and misses."""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
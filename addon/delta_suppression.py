@@ -0,0 +1,128 @@
+"""Delta suppression for periodic delivery.
+
+The periodic tick re-commands every circadian area each circadian_refresh
+seconds, even when the curve is flat and nothing visible would change.
+With suppression enabled, each purpose's computed brightness/kelvin is
+compared against what was last sent (state.get_last_sent_purposes()); a
+purpose is skipped when both differ by less than a perceptual threshold
+(brightness points, mireds for color). Because the comparison is against
+the last *sent* values, slow drift still goes out once it adds up to a
+threshold. A per-area staleness ceiling forces a full resend every few
+minutes to repair bulbs that missed a command.
+
+Pure computation - no I/O, no async. main.py does the sending.
+"""
+
+import time
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Set
+
+DEFAULT_BRIGHTNESS_DELTA = 1  # brightness points; 1 = only identical is skipped
+DEFAULT_MIRED_DELTA = 2.0  # mireds (1e6 / kelvin)
+DEFAULT_MAX_STALE_MINUTES = 10
+
+
+class SuppressionSettings(NamedTuple):
+    """Thresholds for skipping unchanged purposes."""
+
+    brightness_delta: float = DEFAULT_BRIGHTNESS_DELTA
+    mired_delta: float = DEFAULT_MIRED_DELTA
+    max_stale_seconds: float = DEFAULT_MAX_STALE_MINUTES * 60
+
+
+def settings_from_config(raw_config: Mapping[str, Any]) -> Optional[SuppressionSettings]:
+    """Read suppression settings from the global config (None = disabled)."""
+    if not raw_config.get("periodic_suppress_enabled", False):
+        return None
+    return SuppressionSettings(
+        brightness_delta=float(
+            raw_config.get("periodic_suppress_brightness", DEFAULT_BRIGHTNESS_DELTA)
+        ),
+        mired_delta=float(
+            raw_config.get("periodic_suppress_mired", DEFAULT_MIRED_DELTA)
+        ),
+        max_stale_seconds=60.0
+        * max(
+            1.0,
+            float(
+                raw_config.get(
+                    "periodic_suppress_max_stale", DEFAULT_MAX_STALE_MINUTES
+                )
+            ),
+        ),
+    )
+
+
+def _mireds(kelvin: Optional[float]) -> float:
+    return 1e6 / kelvin if kelvin else 0.0
+
+
+class DeltaSuppressor:
+    """Decides which purposes a periodic tick can skip, and counts them."""
+
+    def __init__(self):
+        self._last_full_send: Dict[str, float] = {}  # area_id -> monotonic time
+        self._suppressed = 0
+        self._sent = 0
+        self._forced = 0
+
+    def unchanged_purposes(
+        self,
+        area_id: str,
+        purposes: Iterable,
+        last_sent: Mapping[str, dict],
+        settings: SuppressionSettings,
+        now: Optional[float] = None,
+    ) -> Set[str]:
+        """Names of purposes whose values match what was last sent.
+
+        Args:
+            area_id: The area ID
+            purposes: PurposeResults from the pipeline
+            last_sent: state.get_last_sent_purposes(area_id)
+            settings: Thresholds
+            now: Monotonic time (None = now)
+
+        Returns:
+            Purpose names to skip. Empty when the area is due a full resend.
+        """
+        now = time.monotonic() if now is None else now
+        purposes = list(purposes)
+
+        last_full = self._last_full_send.get(area_id)
+        if last_full is None or now - last_full >= settings.max_stale_seconds:
+            if last_full is not None:
+                self._forced += 1
+            self._last_full_send[area_id] = now
+            self._sent += len(purposes)
+            return set()
+
+        unchanged = set()
+        for p in purposes:
+            last = last_sent.get(p.name)
+            if last is None:
+                continue
+            if p.should_off or last.get("is_off", False):
+                if p.should_off and last.get("is_off", False):
+                    unchanged.add(p.name)
+                continue
+            if abs(p.brightness - last.get("brightness", 0)) >= settings.brightness_delta:
+                continue
+            if abs(_mireds(p.kelvin) - _mireds(last.get("kelvin"))) >= settings.mired_delta:
+                continue
+            unchanged.add(p.name)
+
+        self._suppressed += len(unchanged)
+        self._sent += len(purposes) - len(unchanged)
+        return unchanged
+
+    def forget(self, area_id: str) -> None:
+        """Drop an area's staleness timer (its next tick sends everything)."""
+        self._last_full_send.pop(area_id, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Purpose commands suppressed/sent and forced staleness resends."""
+        return {
+            "suppressed": self._suppressed,
+            "sent": self._sent,
+            "forced_resends": self._forced,
+        }
@@ -0,0 +1,164 @@
+"""Per-key ordered, concurrent dispatch for websocket events.
+
+The listen() loop used to await each event handler before reading the next
+frame, so one slow handler (a motion event turning lights on, a feedback
+cue with sleeps, a switch press) held up every frame behind it - unrelated
+button presses, state updates, even the responses other handlers were
+waiting on.
+
+KeyedDispatcher runs handlers as tasks instead. Work is submitted under one
+or more keys (a switch, a sensor, each area it acts on): it starts only
+after all earlier work sharing any of its keys has finished, so work with a
+common key runs one at a time in submission order; unrelated work runs
+concurrently, up to a global cap. A key is tracked only while it has work
+queued or running.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Set, Tuple, Union
+
+import perf
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8  # Handlers running at once, across all keys
+SLOW_HANDLER_SECONDS = 2.0  # Handlers slower than this are logged
+
+
+class KeyedDispatcher:
+    """Runs submitted coroutines in order per key, concurrently across keys."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self._semaphore = None  # Created on first submit, inside the event loop
+        self._max_concurrency = max(1, max_concurrency)
+        # key -> (task of the latest work under it, work queued or running)
+        self._keys: Dict[str, List[Any]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending = 0
+        self._running = 0
+        self._max_pending = 0
+        self._max_key_depth = 0
+        self._dispatched = 0
+        self._errors = 0
+        self._wait_seconds = 0.0
+        self._handler_seconds = 0.0
+        self._max_handler_seconds = 0.0
+
+    def submit(
+        self,
+        key: Union[str, Iterable[str]],
+        factory: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Queue work under one or more keys.
+
+        Args:
+            key: Ordering key, or several - work runs after all earlier work
+                sharing any of its keys
+            factory: Called with no arguments when the work starts; returns
+                the coroutine to await
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        keys = (key,) if isinstance(key, str) else tuple(dict.fromkeys(key))
+        before = []
+        for k in keys:
+            entry = self._keys.get(k)
+            if entry is not None and entry[0] not in before:
+                before.append(entry[0])
+        task = asyncio.ensure_future(
+            self._run(keys, factory, before, time.monotonic())
+        )
+        for k in keys:
+            entry = self._keys.setdefault(k, [None, 0])
+            entry[0] = task
+            entry[1] += 1
+            self._max_key_depth = max(self._max_key_depth, entry[1])
+        self._tasks.add(task)
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+
+    async def _run(
+        self,
+        keys: Tuple[str, ...],
+        factory: Callable[[], Awaitable[Any]],
+        before: List[asyncio.Task],
+        submitted_at: float,
+    ) -> None:
+        label = ",".join(keys)
+        started = False
+        try:
+            if before:
+                # Wait for earlier work on our keys (their failures are theirs)
+                await asyncio.wait(before)
+            async with self._semaphore:
+                self._pending -= 1
+                self._running += 1
+                started = True
+                start = time.monotonic()
+                self._wait_seconds += start - submitted_at
+                try:
+                    await factory()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._errors += 1
+                    logger.error(f"Error handling event [{label}]: {e}")
+                finally:
+                    self._running -= 1
+                    elapsed = time.monotonic() - start
+                    self._dispatched += 1
+                    self._handler_seconds += elapsed
+                    self._max_handler_seconds = max(
+                        self._max_handler_seconds, elapsed
+                    )
+                    if perf.enabled:
+                        perf.record("dispatch.handler", elapsed)
+                        perf.record("dispatch.wait", start - submitted_at)
+                    if elapsed > SLOW_HANDLER_SECONDS:
+                        queued = max(self._keys[k][1] for k in keys) - 1
+                        logger.info(
+                            f"Slow event handler [{label}]: {elapsed:.1f}s "
+                            f"({queued} queued behind it)"
+                        )
+        finally:
+            if not started:
+                self._pending -= 1
+            self._tasks.discard(asyncio.current_task())
+            for k in keys:
+                entry = self._keys.get(k)
+                if entry is None:
+                    continue
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self._keys[k]
+
+    async def cancel(self) -> None:
+        """Cancel running handlers and drop queued work (on disconnect)."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        # Tasks cancelled before their first step never reached _run's cleanup
+        self._tasks.clear()
+        self._keys.clear()
+        self._pending = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and handler latency counters."""
+        done = self._dispatched or 1
+        return {
+            "pending": self._pending,
+            "running": self._running,
+            "active_keys": len(self._keys),
+            "max_pending": self._max_pending,
+            "max_key_depth": self._max_key_depth,
+            "max_concurrency": self._max_concurrency,
+            "dispatched": self._dispatched,
+            "errors": self._errors,
+            "avg_wait_ms": round(self._wait_seconds * 1000 / done, 2),
+            "avg_handler_ms": round(self._handler_seconds * 1000 / done, 2),
+            "max_handler_ms": round(self._max_handler_seconds * 1000, 1),
+        }
@@ -0,0 +1,242 @@
+"""Fade engine: precomputed fade trajectories with adaptive frame pacing.
+
+An auto on/off fade lerps an area from the brightness/kelvin captured at
+fade start to a target preset. Instead of rebuilding the pipeline and the
+target every few seconds, each fade gets a FadeTrajectory built once (and
+refreshed occasionally so a circadian target can track the curve). Frames
+are spaced so that each one moves brightness/kelvin by roughly a fixed
+perceptual step, and every frame hands the lights a transition as long as
+the gap to the next frame, so the bulbs interpolate between frames.
+
+Pure computation - no I/O, no async. main.py owns the loop that sends frames.
+"""
+
+import time
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from brain import CircadianLight
+
+# Frame spacing bounds (seconds)
+MIN_FRAME_INTERVAL = 1.0
+MAX_FRAME_INTERVAL = 30.0
+
+# Largest change a single frame should make before frames get closer together
+BRIGHTNESS_STEP = 2.0  # brightness %
+KELVIN_STEP = 100.0  # kelvin
+
+# Rebuild a trajectory this often so a live (circadian) target keeps up
+TARGET_REFRESH_INTERVAL = 60.0
+
+
+class FadeTrajectory:
+    """Start/target endpoints of one fade, precomputed for cheap frames.
+
+    Attributes:
+        token: fade_start of the fade this was built for (identifies the fade)
+        template: PipelineResult captured at build time; frames are copies of
+            it with brightness/kelvin/xy replaced
+        ratios: Per-purpose brightness ratios from the target result (None
+            when fading to off or the target is dark)
+    """
+
+    __slots__ = (
+        "area_id",
+        "token",
+        "direction",
+        "target_preset",
+        "start_brightness",
+        "start_kelvin",
+        "target_brightness",
+        "target_kelvin",
+        "duration",
+        "start_mono",
+        "built_at",
+        "ratios",
+        "template",
+    )
+
+    def __init__(
+        self,
+        area_id: str,
+        fade_state: Dict,
+        progress: float,
+        template,
+        target_result=None,
+        now: Optional[float] = None,
+    ):
+        """Build a trajectory from state.get_fade_state() and pipeline results.
+
+        Args:
+            area_id: The area ID
+            fade_state: Dict from state.get_fade_state()
+            progress: Current fade progress (state.get_fade_progress())
+            template: PipelineResult for the area as it stands now
+            target_result: compute_fade_target() result (None for "off")
+            now: Monotonic time the progress was read at
+        """
+        now = time.monotonic() if now is None else now
+        self.area_id = area_id
+        self.token = fade_state.get("fade_start")
+        self.direction = fade_state.get("fade_direction") or "in"
+        self.target_preset = fade_state.get("fade_target_preset") or "circadian"
+        self.start_brightness = fade_state.get("fade_start_brightness") or 0
+        self.start_kelvin = fade_state.get("fade_start_kelvin") or 2000
+        self.duration = float(fade_state.get("fade_duration") or 1)
+        self.start_mono = now - progress * self.duration
+        self.built_at = now
+        self.template = template
+
+        if target_result is not None:
+            self.target_brightness = target_result.area_brightness
+            self.target_kelvin = target_result.area_kelvin
+        else:
+            # fade-out: target is off
+            self.target_brightness = 0
+            self.target_kelvin = self.start_kelvin
+
+        self.ratios: Optional[Dict[str, float]] = None
+        if target_result is not None and target_result.area_brightness > 0:
+            self.ratios = {
+                t.name: t.brightness / target_result.area_brightness
+                for t in target_result.purposes
+            }
+
+    def progress_at(self, now: float) -> float:
+        """Fade progress 0.0-1.0 at a monotonic time."""
+        return max(0.0, min(1.0, (now - self.start_mono) / self.duration))
+
+    def values_at(self, progress: float) -> Tuple[int, int]:
+        """Lerped (brightness, kelvin) at a progress value."""
+        if self.target_preset == "off":
+            return max(1, round(self.start_brightness * (1.0 - progress))), self.start_kelvin
+        bri = max(
+            1,
+            round(
+                self.start_brightness
+                + (self.target_brightness - self.start_brightness) * progress
+            ),
+        )
+        kelvin = round(
+            self.start_kelvin + (self.target_kelvin - self.start_kelvin) * progress
+        )
+        return bri, kelvin
+
+    def frame_interval(self, now: float) -> float:
+        """Seconds until the next frame should be sent.
+
+        Chosen so one frame changes brightness by at most BRIGHTNESS_STEP and
+        kelvin by at most KELVIN_STEP, clamped to the frame bounds and to the
+        time left in the fade.
+        """
+        bri_delta = abs(self.target_brightness - self.start_brightness)
+        kelvin_delta = abs(self.target_kelvin - self.start_kelvin)
+        interval = MAX_FRAME_INTERVAL
+        if bri_delta > 0:
+            interval = min(interval, self.duration * BRIGHTNESS_STEP / bri_delta)
+        if kelvin_delta > 0:
+            interval = min(interval, self.duration * KELVIN_STEP / kelvin_delta)
+        interval = max(MIN_FRAME_INTERVAL, interval)
+        remaining = self.start_mono + self.duration - now
+        return max(0.0, min(interval, remaining))
+
+    def render(self, progress: float):
+        """Build the PipelineResult for a frame at a progress value.
+
+        Uses the target's purpose ratios so there's no snap at completion.
+        """
+        bri, kelvin = self.values_at(progress)
+        xy = CircadianLight.color_temperature_to_xy(kelvin)
+        purposes = []
+        for p in self.template.purposes:
+            if self.ratios is not None:
+                p_bri = max(1, round(bri * self.ratios.get(p.name, 1.0)))
+            else:
+                p_bri = max(1, round(bri))
+            purposes.append(replace(p, brightness=p_bri, kelvin=kelvin, xy=xy))
+        return replace(
+            self.template,
+            purposes=purposes,
+            area_brightness=bri,
+            area_kelvin=kelvin,
+            area_xy=xy,
+        )
+
+
+class FadeEngine:
+    """Holds active fade trajectories and decides when each needs a frame."""
+
+    def __init__(self):
+        self._trajectories: Dict[str, FadeTrajectory] = {}
+        self._next_frame: Dict[str, float] = {}  # area_id -> monotonic time
+        self._frames_sent = 0
+        self._trajectories_built = 0
+
+    def get_trajectory(
+        self, area_id: str, token: Optional[str], now: Optional[float] = None
+    ) -> Optional[FadeTrajectory]:
+        """Return the cached trajectory for a fade, or None if it must be (re)built."""
+        traj = self._trajectories.get(area_id)
+        if traj is None or traj.token != token:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - traj.built_at >= TARGET_REFRESH_INTERVAL:
+            return None
+        return traj
+
+    def set_trajectory(self, traj: FadeTrajectory) -> None:
+        """Store a freshly built trajectory."""
+        old = self._trajectories.get(traj.area_id)
+        if old is not None and old.token != traj.token:
+            # A new fade replaced the old one - frame it right away
+            self._next_frame.pop(traj.area_id, None)
+        self._trajectories[traj.area_id] = traj
+        self._trajectories_built += 1
+
+    def is_active(self, area_id: str) -> bool:
+        """Whether the engine is currently driving a fade for this area."""
+        return area_id in self._trajectories
+
+    def prune(self, active_areas: Iterable[str]) -> None:
+        """Drop trajectories for areas that are no longer fading."""
+        active = set(active_areas)
+        for area_id in list(self._trajectories):
+            if area_id not in active:
+                self._trajectories.pop(area_id, None)
+        for area_id in list(self._next_frame):
+            if area_id not in active:
+                self._next_frame.pop(area_id, None)
+
+    def record_frame(self, area_id: str, interval: float, now: Optional[float] = None) -> None:
+        """Note that a frame was sent; the next one is due after interval.
+
+        Never sooner than MIN_FRAME_INTERVAL, so the last frame of a fade
+        doesn't spin while the completion deadline is pending.
+        """
+        now = time.monotonic() if now is None else now
+        self._next_frame[area_id] = now + max(interval, MIN_FRAME_INTERVAL)
+        self._frames_sent += 1
+
+    def due_areas(self, active_areas: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """Areas whose next frame is due (areas never framed are due at once)."""
+        now = time.monotonic() if now is None else now
+        return [
+            area_id
+            for area_id in active_areas
+            if self._next_frame.get(area_id, now) <= now
+        ]
+
+    def seconds_until_next_frame(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest scheduled frame, or None if none are."""
+        if not self._next_frame:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(self._next_frame.values()) - now)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Active fade count and frame counters."""
+        return {
+            "active_fades": len(self._trajectories),
+            "frames_sent": self._frames_sent,
+            "trajectories_built": self._trajectories_built,
+        }
@@ -8,6 +8,9 @@ This module handles GloZone configuration operations:
 - Managing zone membership
 
 Zone configuration is stored in designer_config.json and cached in memory.
+Hot paths read it through get_config_snapshot(), which only re-reads disk when
+a config file changes (or after reload()) and carries a version number that
+callers can use as a memo key.
 """
 
 import json
@@ -15,7 +18,10 @@ import logging
 import os
 import re
 import tempfile
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,50 @@ INITIAL_ZONE_NAME = "Main"
 # Cached config reference
 _config: Optional[Dict[str, Any]] = None
 
+# Config version - bumped whenever the in-memory config may have changed
+_config_version: int = 0
+
+# Snapshot cache for get_config_snapshot()
+_CONFIG_FILES = ("options.json", "designer_config.json")
+_snapshot: Optional["ConfigSnapshot"] = None
+_snapshot_sig: Optional[Tuple] = None
+_snapshot_data_dir: Optional[str] = None
+_snapshot_stats: Dict[str, int] = {"hits": 0, "misses": 0, "disk_reads": 0}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, versioned view of the loaded config.
+
+    The top-level mapping is read-only; nested dicts are shared with the
+    loaded config and must be treated as read-only too. Use
+    load_config_from_files() when you need a dict to edit and save.
+    """
+
+    version: int
+    config: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.config.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.config[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.config
+
+
+def _bump_config_version() -> None:
+    """Record that the in-memory config changed.
+
+    Drops the cached snapshot and compiled zone configs; they are rebuilt on
+    next use.
+    """
+    global _config_version, _snapshot
+    _config_version += 1
+    _snapshot = None
+    _compiled_configs.clear()
+
 
 def init(config: Optional[Dict[str, Any]] = None) -> None:
     """Initialize the glozone module with config.
@@ -34,6 +84,7 @@ def init(config: Optional[Dict[str, Any]] = None) -> None:
     """
     global _config
     _config = config
+    _bump_config_version()
     if config:
         logger.info("GloZone config initialized")
     else:
@@ -48,6 +99,7 @@ def set_config(config: Dict[str, Any]) -> None:
     """
     global _config
     _config = config
+    _bump_config_version()
     logger.debug("GloZone config updated")
 
 
@@ -66,7 +118,9 @@ def reload() -> None:
     This should be called when we need fresh glozone data, since the webserver
     may have updated the config file in a separate process.
     """
-    global _config
+    global _config, _snapshot_data_dir, _snapshot_sig
+    _snapshot_data_dir = None
+    _snapshot_sig = None
     try:
         _config = load_config_from_files()
         logger.debug("GloZone config reloaded from disk")
@@ -74,6 +128,71 @@ def reload() -> None:
         logger.warning(f"Failed to reload glozone config from disk: {e}")
 
 
+def _config_files_signature(data_dir: str) -> Tuple:
+    """Return (mtime_ns, inode, size) per config file, None for missing files."""
+    sig = []
+    for filename in _CONFIG_FILES:
+        try:
+            st = os.stat(os.path.join(data_dir, filename))
+            sig.append((st.st_mtime_ns, st.st_ino, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """Get the current config as an immutable, versioned snapshot.
+
+    Only re-reads disk (via load_config_from_files) when options.json or
+    designer_config.json changed mtime/inode/size, or after reload(). An
+    in-memory change (set_config, add_area_to_zone, ...) bumps the version and
+    re-wraps the cached config without touching disk. Otherwise this is two
+    stat() calls.
+
+    Returns:
+        ConfigSnapshot with .version (memo key) and read-only .config
+    """
+    global _snapshot, _snapshot_sig, _snapshot_data_dir
+
+    if _snapshot_data_dir is None:
+        _snapshot_data_dir = _get_data_directory()
+
+    sig = _config_files_signature(_snapshot_data_dir)
+    if _snapshot is not None and sig == _snapshot_sig:
+        _snapshot_stats["hits"] += 1
+        return _snapshot
+
+    _snapshot_stats["misses"] += 1
+    if _config is not None and sig == _snapshot_sig:
+        # Files unchanged since we last read them - only the in-memory config
+        # changed (set_config, add_area_to_zone, ...), so wrap it as-is
+        config = _config
+    else:
+        _snapshot_stats["disk_reads"] += 1
+        config = load_config_from_files(_snapshot_data_dir)
+        # Loading may have rewritten designer_config.json (migration) - re-stat
+        _snapshot_sig = _config_files_signature(_snapshot_data_dir)
+    _snapshot = ConfigSnapshot(
+        version=_config_version, config=MappingProxyType(config)
+    )
+    return _snapshot
+
+
+def get_config_version() -> int:
+    """Get the current config version (changes whenever config may have changed)."""
+    return _config_version
+
+
+def get_config_stats() -> Dict[str, int]:
+    """Get snapshot cache counters (hits, misses, disk_reads) and the current version."""
+    return {
+        "hits": _snapshot_stats["hits"],
+        "misses": _snapshot_stats["misses"],
+        "disk_reads": _snapshot_stats["disk_reads"],
+        "version": _config_version,
+    }
+
+
 def get_glozones() -> Dict[str, Dict[str, Any]]:
     """Get all GloZone definitions from config.
 
@@ -148,6 +267,7 @@ def set_default_zone(zone_name: str, save: bool = True) -> bool:
     for zn, zone_config in glozones.items():
         zone_config["is_default"] = zn == zone_name
 
+    _bump_config_version()
     logger.info(f"Set default zone to '{zone_name}'")
 
     if save:
@@ -195,6 +315,7 @@ def add_area_to_zone(
     # Add to target zone
     area_entry = {"id": area_id, "name": area_name} if area_name else area_id
     glozones[zone_name].setdefault("areas", []).append(area_entry)
+    _bump_config_version()
 
     logger.info(f"Added area '{area_id}' to zone '{zone_name}'")
     return True
@@ -245,6 +366,7 @@ def save_config() -> bool:
             except OSError:
                 pass
             raise
+        _bump_config_version()
         logger.debug(f"Saved config to {designer_path}")
         return True
     except Exception as e:
@@ -252,6 +374,86 @@ def save_config() -> bool:
         return False
 
 
+@dataclass(frozen=True)
+class _AreaIndexEntry:
+    """Normalized per-area data pulled out of the glozones structure."""
+
+    zone_name: str
+    entry: Optional[Dict[str, Any]]
+    brightness_factor: float
+    natural_light_exposure: float
+    light_filters: Optional[Dict[str, str]]
+    feedback_target: Optional[str]
+
+
+# area_id -> _AreaIndexEntry and zone_name -> area ids, rebuilt per config version
+_area_index: Dict[str, _AreaIndexEntry] = {}
+_zone_areas_index: Dict[str, Tuple[str, ...]] = {}
+_area_index_key: Optional[Tuple[int, int]] = None
+
+
+def _entry_float(entry: Optional[Dict[str, Any]], key: str, default: float) -> float:
+    """Read a float field from an area entry, falling back on bad values."""
+    if entry is None:
+        return default
+    try:
+        return float(entry.get(key, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {key} for area '{entry.get('id')}': {entry.get(key)!r}")
+        return default
+
+
+def _get_area_index() -> Dict[str, _AreaIndexEntry]:
+    """Get the area index, rebuilding it if the config changed.
+
+    Areas can be stored as {"id": "xxx", "name": "xxx"} or just "xxx". The
+    first zone listing an area wins, and the first dict entry supplies its
+    per-area settings - the same precedence the old linear scans had.
+    """
+    global _area_index, _zone_areas_index, _area_index_key
+
+    key = (id(_config), _config_version)
+    if key == _area_index_key:
+        return _area_index
+
+    zones: Dict[str, str] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    zone_areas: Dict[str, Tuple[str, ...]] = {}
+    for zone_name, zone_config in get_glozones().items():
+        ids = []
+        for area in zone_config.get("areas", []):
+            if isinstance(area, dict):
+                area_id = area.get("id")
+                if area_id is not None and area_id not in entries:
+                    entries[area_id] = area
+            else:
+                area_id = area
+            if area_id is None:
+                continue
+            zones.setdefault(area_id, zone_name)
+            if area_id:
+                ids.append(area_id)
+        zone_areas[zone_name] = tuple(ids)
+
+    index = {}
+    for area_id, zone_name in zones.items():
+        entry = entries.get(area_id)
+        filters = entry.get("light_filters") if entry is not None else None
+        index[area_id] = _AreaIndexEntry(
+            zone_name=zone_name,
+            entry=entry,
+            brightness_factor=_entry_float(entry, "brightness_factor", 1.0),
+            natural_light_exposure=_entry_float(entry, "natural_light_exposure", 0.0),
+            light_filters=filters if filters and isinstance(filters, dict) else None,
+            feedback_target=entry.get("feedback_target") if entry is not None else None,
+        )
+
+    _area_index = index
+    _zone_areas_index = zone_areas
+    _area_index_key = key
+    return _area_index
+
+
 def is_area_in_any_zone(area_id: str) -> bool:
     """Check if an area is explicitly in any zone.
 
@@ -261,18 +463,7 @@ def is_area_in_any_zone(area_id: str) -> bool:
     Returns:
         True if area is in a zone
     """
-    glozones = get_glozones()
-
-    for zone_config in glozones.values():
-        areas = zone_config.get("areas", [])
-        for area in areas:
-            if isinstance(area, dict):
-                if area.get("id") == area_id:
-                    return True
-            elif area == area_id:
-                return True
-
-    return False
+    return area_id in _get_area_index()
 
 
 def get_zone_for_area(area_id: str) -> str:
@@ -284,17 +475,9 @@ def get_zone_for_area(area_id: str) -> str:
     Returns:
         Zone name, or the default zone if area is not explicitly assigned
     """
-    glozones = get_glozones()
-
-    for zone_name, zone_config in glozones.items():
-        areas = zone_config.get("areas", [])
-        for area in areas:
-            # Areas can be stored as {"id": "xxx", "name": "xxx"} or just "xxx"
-            if isinstance(area, dict):
-                if area.get("id") == area_id:
-                    return zone_name
-            elif area == area_id:
-                return zone_name
+    indexed = _get_area_index().get(area_id)
+    if indexed is not None:
+        return indexed.zone_name
 
     # Area not found in any zone - return the default zone
     return get_default_zone()
@@ -309,18 +492,8 @@ def get_areas_in_zone(zone_name: str) -> List[str]:
     Returns:
         List of area IDs
     """
-    glozones = get_glozones()
-    zone_config = glozones.get(zone_name, {})
-    areas = zone_config.get("areas", [])
-
-    result = []
-    for area in areas:
-        if isinstance(area, dict):
-            result.append(area.get("id"))
-        else:
-            result.append(area)
-
-    return [a for a in result if a]  # Filter out None
+    _get_area_index()
+    return list(_zone_areas_index.get(zone_name, ()))
 
 
 def get_zone_config(zone_name: str) -> Dict[str, Any]:
@@ -516,12 +689,8 @@ def get_area_entry(area_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         The area dict entry, or None if not found
     """
-    glozones = get_glozones()
-    for zone_config in glozones.values():
-        for area in zone_config.get("areas", []):
-            if isinstance(area, dict) and area.get("id") == area_id:
-                return area
-    return None
+    indexed = _get_area_index().get(area_id)
+    return indexed.entry if indexed is not None else None
 
 
 def get_area_brightness_factor(area_id: str) -> float:
@@ -533,10 +702,8 @@ def get_area_brightness_factor(area_id: str) -> float:
     Returns:
         Brightness factor (default 1.0)
     """
-    entry = get_area_entry(area_id)
-    if entry is None:
-        return 1.0
-    return float(entry.get("brightness_factor", 1.0))
+    indexed = _get_area_index().get(area_id)
+    return indexed.brightness_factor if indexed is not None else 1.0
 
 
 def get_area_natural_light_exposure(area_id: str) -> float:
@@ -552,10 +719,8 @@ def get_area_natural_light_exposure(area_id: str) -> float:
     Returns:
         Exposure value 0.0–1.0 (default 0.0, meaning no natural light adjustment)
     """
-    entry = get_area_entry(area_id)
-    if entry is None:
-        return 0.0
-    return float(entry.get("natural_light_exposure", 0.0))
+    indexed = _get_area_index().get(area_id)
+    return indexed.natural_light_exposure if indexed is not None else 0.0
 
 
 def get_area_light_filters(area_id: str) -> Dict[str, str]:
@@ -567,13 +732,10 @@ def get_area_light_filters(area_id: str) -> Dict[str, str]:
     Returns:
         Dict of entity_id -> filter_preset_name (empty dict if none)
     """
-    entry = get_area_entry(area_id)
-    if entry is None:
+    indexed = _get_area_index().get(area_id)
+    if indexed is None or indexed.light_filters is None:
         return {}
-    filters = entry.get("light_filters")
-    if filters and isinstance(filters, dict):
-        return filters
-    return {}
+    return indexed.light_filters
 
 
 def get_area_feedback_target(area_id: str) -> Optional[str]:
@@ -582,10 +744,8 @@ def get_area_feedback_target(area_id: str) -> Optional[str]:
     Returns a purpose name (e.g., 'Standard') or entity_id (e.g., 'light.foo').
     Returns None if not set (caller should default to most-popular purpose).
     """
-    entry = get_area_entry(area_id)
-    if entry is None:
-        return None
-    return entry.get("feedback_target")
+    indexed = _get_area_index().get(area_id)
+    return indexed.feedback_target if indexed is not None else None
 
 
 # Settings that are per-zone rhythm settings (not global)
@@ -951,8 +1111,15 @@ def load_config_from_files(data_dir: Optional[str] = None) -> Dict[str, Any]:
             f"[load_config] Top-level RHYTHM_SETTINGS still present: {leftover}"
         )
 
-    # Cache the config first so ensure_default_zone_exists can use it
-    _config = config
+    # Cache the config first so ensure_default_zone_exists can use it. If
+    # nothing changed since the last load (reload() runs on every zone
+    # action), keep the cached object and version so caches keyed on them
+    # survive.
+    if _config is not None and config == _config:
+        config = _config
+    else:
+        _config = config
+        _bump_config_version()
 
     # Ensure at least one zone has is_default=True (handles existing configs)
     had_default = any(
@@ -1270,6 +1437,101 @@ def get_effective_config_for_zone(
     return result
 
 
+# ============================================================================
+# Compiled per-zone config
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class CompiledZoneConfig:
+    """Effective config for a zone, built once and shared by all its areas.
+
+    config is a brain.FrozenConfig; flat is the read-only effective config
+    dict (what get_effective_config_for_zone() returns).
+    """
+
+    zone_name: str
+    config: Any
+    flat: Mapping[str, Any]
+
+
+# (zone_name, include_global, config version, id(_config), override) -> compiled
+_compiled_configs: Dict[Tuple, CompiledZoneConfig] = {}
+_compiled_date: Optional[date] = None
+
+
+def _schedule_override_fingerprint(zone_name: str) -> Any:
+    """Hashable fingerprint of a zone's schedule override (None if unset)."""
+    override = get_glozones().get(zone_name, {}).get("schedule_override")
+    if not override:
+        return None
+    if isinstance(override, dict):
+        return tuple(sorted((k, repr(v)) for k, v in override.items()))
+    return repr(override)
+
+
+def get_compiled_config_for_zone(
+    zone_name: str, include_global: bool = True
+) -> CompiledZoneConfig:
+    """Get the compiled (shared, frozen) effective config for a zone.
+
+    Rebuilt only when the config version changes (save, set_config, reload,
+    file change picked up by get_config_snapshot), when the zone's schedule
+    override changes, or when the date rolls over.
+
+    Args:
+        zone_name: The zone name
+        include_global: Whether to include global settings (latitude, etc.)
+
+    Returns:
+        CompiledZoneConfig - treat as read-only
+    """
+    global _compiled_date
+    from brain import Config
+
+    if _config is None:
+        load_config_from_files()
+
+    today = date.today()
+    if today != _compiled_date:
+        _compiled_configs.clear()
+        _compiled_date = today
+
+    key = (
+        zone_name,
+        include_global,
+        _config_version,
+        id(_config),
+        _schedule_override_fingerprint(zone_name),
+    )
+    compiled = _compiled_configs.get(key)
+    if compiled is None:
+        flat = get_effective_config_for_zone(zone_name, include_global)
+        compiled = CompiledZoneConfig(
+            zone_name=zone_name,
+            config=Config.from_dict(flat).freeze(),
+            flat=MappingProxyType(flat),
+        )
+        _compiled_configs[key] = compiled
+    return compiled
+
+
+def get_compiled_config_for_area(
+    area_id: str, include_global: bool = True
+) -> CompiledZoneConfig:
+    """Get the compiled effective config for an area's zone.
+
+    Same values as get_effective_config_for_area(), shared between every
+    area in the zone.
+    """
+    return get_compiled_config_for_zone(get_zone_for_area(area_id), include_global)
+
+
+def invalidate_compiled_configs() -> None:
+    """Drop all compiled zone configs (e.g. after editing _config in place)."""
+    _compiled_configs.clear()
+
+
 def reload_config() -> Dict[str, Any]:
     """Reload config from files.
 
@@ -1280,4 +1542,5 @@ def reload_config() -> Dict[str, Any]:
     """
     global _config
     _config = None
+    _bump_config_version()
     return load_config_from_files()
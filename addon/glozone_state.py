@@ -4,17 +4,23 @@
 This module manages runtime state for GloZones, persisted to a JSON file
 so it can be shared between the main process and webserver process.
 
+An in-memory copy is authoritative for reads; the file is only re-read when
+its mtime/size changes (someone else wrote it). Writes are debounced and
+atomic (temp file + os.replace).
+
 Runtime state includes:
 - brightness_mid: Hour (0-24) or None (use preset default)
 - color_mid: Hour (0-24) or None (use preset default)
 - frozen_at: Hour (0-24) or None (not frozen)
 """
 
+import asyncio
 import json
 import logging
 import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,16 @@ _zone_solar_cache: Dict[str, Dict[str, Any]] = {}
 # State file path - shared between main.py and webserver.py processes
 _STATE_FILE: Optional[Path] = None
 
+# In-memory copy of the state file. None = not loaded yet.
+_state_cache: Optional[Dict[str, Dict[str, Any]]] = None
+# (mtime_ns, size) of the file as last read or written by us
+_state_file_sig: Optional[Tuple[int, int]] = None
+
+# Debounced write-behind
+FLUSH_DELAY = 0.5
+_flush_handle: Optional[asyncio.TimerHandle] = None
+_dirty: bool = False
+
 
 def _get_state_file() -> Path:
     """Get the path to the state file."""
@@ -48,26 +64,108 @@ def _get_state_file() -> Path:
     return _STATE_FILE
 
 
+def _file_signature(state_file: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for the state file, or None if missing."""
+    try:
+        st = os.stat(state_file)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _load_all_state() -> Dict[str, Dict[str, Any]]:
-    """Load all zone state from file."""
+    """Return all zone state (the in-memory cache, not a copy).
+
+    Re-reads the file only when its signature changed since we last read or
+    wrote it. Pending (unflushed) local writes always win.
+    """
+    global _state_cache, _state_file_sig
+
+    if _dirty and _state_cache is not None:
+        return _state_cache
+
     state_file = _get_state_file()
-    if state_file.exists():
+    sig = _file_signature(state_file)
+    if _state_cache is not None and sig == _state_file_sig:
+        return _state_cache
+
+    data: Dict[str, Dict[str, Any]] = {}
+    if sig is not None:
         try:
             with open(state_file, "r") as f:
-                return json.load(f)
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load zone state file: {e}")
-    return {}
+    _state_cache = data
+    _state_file_sig = sig
+    return _state_cache
 
 
 def _save_all_state(state: Dict[str, Dict[str, Any]]) -> None:
-    """Save all zone state to file."""
+    """Replace all zone state and schedule a debounced write.
+
+    Outside an event loop the write happens immediately.
+    """
+    global _state_cache, _dirty, _flush_handle
+
+    _state_cache = state
+    _dirty = True
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush()
+        return
+
+    if _flush_handle is None:
+        _flush_handle = loop.call_later(FLUSH_DELAY, _flush_from_timer)
+
+
+def _flush_from_timer() -> None:
+    """Timer callback for the debounced write."""
+    global _flush_handle
+    _flush_handle = None
+    flush()
+
+
+def flush() -> bool:
+    """Write pending zone state to disk now (atomic temp file + rename).
+
+    Returns:
+        True if a write happened
+    """
+    global _dirty, _flush_handle, _state_file_sig
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    if not _dirty or _state_cache is None:
+        return False
+
     state_file = _get_state_file()
     try:
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
-    except IOError as e:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(state_file.parent), suffix=".tmp", prefix=".glozone_state_"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(_state_cache, f, indent=2)
+            os.replace(tmp_path, state_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _dirty = False
+        _state_file_sig = _file_signature(state_file)
+        return True
+    except (IOError, OSError) as e:
         logger.error(f"Failed to save zone state file: {e}")
+        return False
 
 
 def _get_default_zone_state() -> Dict[str, Any]:
@@ -88,9 +186,18 @@ def init() -> None:
 
     Clears any existing state. Called on addon startup.
     """
+    global _state_cache, _state_file_sig, _dirty, _flush_handle
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    _dirty = False
+
     state_file = _get_state_file()
     if state_file.exists():
         state_file.unlink()
+    _state_cache = {}
+    _state_file_sig = None
     logger.info(f"GloZone runtime state initialized (file: {state_file})")
 
 
@@ -108,7 +215,8 @@ def get_zone_state(zone_name: str) -> Dict[str, Any]:
         result = _get_default_zone_state()
         logger.debug(f"[ZoneState] GET '{zone_name}': default (not in file)")
     else:
-        result = all_state[zone_name]
+        # Copy so callers can't mutate the cache behind our back
+        result = dict(all_state[zone_name])
         logger.debug(f"[ZoneState] GET '{zone_name}': {result}")
     return result
 
@@ -160,6 +268,8 @@ def reset_all_zones() -> None:
             logger.debug(f"Zone '{zone_name}' preserved (frozen)")
 
     _save_all_state(all_state)
+    # Phase reset is a checkpoint - persist it now rather than next window
+    flush()
     logger.info(f"Reset {len(all_state)} zone(s) (frozen zones preserved)")
 
 
@@ -0,0 +1,49 @@
+"""JSON encode/decode for the HA websocket and the webserver.
+
+Uses orjson when it is installed (several times faster on the multi-MB
+registry payloads and the per-frame event stream) and the stdlib json
+module otherwise. Both paths take and return the same types: dumps()
+returns str, since Home Assistant only accepts text websocket frames.
+
+orjson is stricter than json about a few inputs (integers beyond 64 bits,
+for one); dumps() falls back to json for anything orjson refuses, so
+callers never see a difference beyond speed.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a JSON string."""
+        try:
+            return orjson.dumps(obj, option=_OPTIONS).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse a JSON string or bytes (raises ValueError if invalid)."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a JSON string."""
+        return json.dumps(obj)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse a JSON string or bytes (raises ValueError if invalid)."""
+        return json.loads(data)
+
+
+# Both json.JSONDecodeError and orjson.JSONDecodeError subclass ValueError
+DecodeError = ValueError
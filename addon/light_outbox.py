@@ -0,0 +1,381 @@
+"""Per-target coalescing of light commands before they hit the websocket.
+
+call_service used to write every light.turn_on straight to the socket.
+During hold-repeat, dial rotation, fades and periodic ticks, several
+commands for the same ZHA group often go out within a few milliseconds of
+each other; the coordinator works through all of them although only the
+last one matters.
+
+With light_outbox_enabled, LightOutbox holds light.turn_on/turn_off per
+target for a short window (DEFAULT_FLUSH_INTERVAL) and sends only the
+merged result:
+
+- turn_off replaces whatever was pending; turn_on replaces a pending
+  turn_off (last write wins)
+- turn_on over turn_on merges field groups: a newer brightness replaces
+  the pending brightness, a newer color (any color mode) replaces the
+  pending color, and the newer transition always wins. Fields the newer
+  command doesn't set carry over.
+- relative commands (brightness_step*, flash, effect) never merge; they
+  queue behind the pending command.
+- barrier commands (2-step phase 1, feedback cue phases) skip the
+  window, never get merged away, and submit() returns once they are
+  sent; they mark states the lights must actually pass through.
+
+Commands go out in the order they were last written. Targets can overlap
+(an area, the ZHA group for one of its purposes, a list of its lights):
+`covers` maps a target to the lights it reaches, and once a newer command
+overlaps a pending one, that pending command takes no further merges, so a
+later write for it queues behind the overlapping command instead of
+jumping ahead of it.
+
+With a RateLimiter, the outbox takes the tokens itself: it always waits
+for the most urgent pending command (the rate limiter class it was queued
+under, the most urgent one when merged), and if a more urgent command
+arrives while it waits, it picks again. A command that an urgent one has
+to follow (an overlapping target, see below) is promoted to that class,
+so periodic traffic never holds up a button press.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 0.03  # Seconds a command waits for a newer one
+
+BRIGHTNESS_KEYS = frozenset({"brightness", "brightness_pct"})
+COLOR_KEYS = frozenset(
+    {
+        "xy_color",
+        "hs_color",
+        "rgb_color",
+        "rgbw_color",
+        "rgbww_color",
+        "color_temp",
+        "color_temp_kelvin",
+        "kelvin",
+        "color_name",
+        "white",
+    }
+)
+UNMERGEABLE_KEYS = frozenset(
+    {"brightness_step", "brightness_step_pct", "flash", "effect"}
+)
+COALESCED_SERVICES = frozenset({"turn_on", "turn_off"})
+
+# send(service, service_data, target) -> message id
+SendFn = Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[int]]
+# covers(target) -> lights the target reaches (None: unknown, overlaps all)
+CoversFn = Callable[[Dict[str, Any]], Optional[FrozenSet[str]]]
+
+
+def target_key(target: Dict[str, Any]) -> Hashable:
+    """Hashable key for a call_service target (entity lists are order-free)."""
+    return tuple(
+        sorted(
+            (k, tuple(sorted(v)) if isinstance(v, (list, tuple)) else v)
+            for k, v in target.items()
+        )
+    )
+
+
+def entity_covers(target: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+    """Default covers(): a plain entity_id target reaches just those
+    entities; anything else (area_id, ...) is treated as reaching all."""
+    if set(target) != {"entity_id"}:
+        return None
+    entity_ids = target["entity_id"]
+    if isinstance(entity_ids, str):
+        return frozenset((entity_ids,))
+    return frozenset(entity_ids)
+
+
+def _overlaps(a: Optional[FrozenSet[str]], b: Optional[FrozenSet[str]]) -> bool:
+    return a is None or b is None or not a.isdisjoint(b)
+
+
+def merge_commands(
+    pending: Tuple[str, Dict[str, Any]], new: Tuple[str, Dict[str, Any]]
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Combine a pending (service, service_data) with a newer one.
+
+    Returns:
+        The single command equivalent to sending both in order, or None if
+        they can't be combined
+    """
+    old_service, old_data = pending
+    new_service, new_data = new
+    if UNMERGEABLE_KEYS.intersection(old_data) or UNMERGEABLE_KEYS.intersection(
+        new_data
+    ):
+        return None
+    if new_service == "turn_off" or old_service == "turn_off":
+        return new_service, dict(new_data)
+    merged = {k: v for k, v in old_data.items() if k != "transition"}
+    if BRIGHTNESS_KEYS.intersection(new_data):
+        for key in BRIGHTNESS_KEYS:
+            merged.pop(key, None)
+    if COLOR_KEYS.intersection(new_data):
+        for key in COLOR_KEYS:
+            merged.pop(key, None)
+    merged.update(new_data)
+    return new_service, merged
+
+
+@dataclass
+class _Pending:
+    """A queued command."""
+
+    service: str
+    service_data: Dict[str, Any]
+    target: Dict[str, Any]
+    priority: str  # rate_limiter class
+    covers: Optional[FrozenSet[str]]
+    sent: Optional[asyncio.Future] = None  # Barriers: resolved once sent
+
+
+def _rank(priority: str) -> int:
+    return rate_limiter.PRIORITIES.index(priority)
+
+
+class LightOutbox:
+    """Holds light commands per target and sends the latest on a short cadence.
+
+    `send` does the actual websocket write (unpaced when a `limiter` is
+    given - the outbox takes the tokens); `covers` resolves which lights a
+    target reaches (see entity_covers). Pending commands die with the
+    connection: call clear() on disconnect.
+    """
+
+    def __init__(
+        self,
+        send: SendFn,
+        interval: float = DEFAULT_FLUSH_INTERVAL,
+        covers: CoversFn = entity_covers,
+        limiter: Optional[rate_limiter.RateLimiter] = None,
+    ):
+        self.enabled = False
+        self._send = send
+        self._interval = interval
+        self._covers = covers
+        self._limiter = limiter
+        self._pending: Dict[int, _Pending] = {}  # seq (write order) -> command
+        # target key -> seq of the pending command newer writes merge into
+        # (entries whose command was already sent are ignored)
+        self._open: Dict[Hashable, int] = {}
+        self._seq = 0
+        self._drain_task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None  # Created inside the event loop
+        self._in_window = False
+        self._waiting_for: Optional[str] = None  # Class the drain holds a place for
+        self._submitted = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._barriers = 0
+        self._unmergeable = 0
+        self._preempted = 0
+        self._flushes = 0
+        self._errors = 0
+        self._max_pending = 0
+
+    async def submit(
+        self,
+        service: str,
+        service_data: Dict[str, Any],
+        target: Dict[str, Any],
+        barrier: bool = False,
+    ) -> None:
+        """Queue a light.turn_on/turn_off, superseding any pending command
+        for the same target.
+
+        Args:
+            service: "turn_on" or "turn_off"
+            service_data: Service parameters (without target)
+            target: call_service target (entity_id/area_id)
+            barrier: Send without waiting out the window and without
+                merging; returns once sent
+        """
+        self._submitted += 1
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        key = target_key(target)
+        command = _Pending(
+            service,
+            dict(service_data),
+            dict(target),
+            rate_limiter.current_priority(),
+            self._covers(target),
+        )
+        if barrier:
+            self._barriers += 1
+            command.sent = asyncio.get_running_loop().create_future()
+            self._open.pop(key, None)
+        else:
+            open_seq = self._open.pop(key, None)
+            pending = self._pending.get(open_seq)
+            if pending is not None:
+                merged = merge_commands(
+                    (pending.service, pending.service_data), (service, service_data)
+                )
+                if merged is None:
+                    self._unmergeable += 1
+                else:
+                    # The merged command is as new as its latest write
+                    self._coalesced += 1
+                    del self._pending[open_seq]
+                    command.service, command.service_data = merged
+                    command.priority = rate_limiter.more_urgent(
+                        pending.priority, command.priority
+                    )
+        # Pending commands this one overlaps must go out before it: close
+        # them to further merges
+        for other_key, seq in list(self._open.items()):
+            other = self._pending.get(seq)
+            if other is None or _overlaps(command.covers, other.covers):
+                del self._open[other_key]
+        self._seq += 1
+        self._pending[self._seq] = command
+        if not barrier and not UNMERGEABLE_KEYS.intersection(command.service_data):
+            self._open[key] = self._seq
+        self._max_pending = max(self._max_pending, len(self._pending))
+        self._promote(self._seq, command.priority)
+
+        if barrier and self._in_window:
+            self._wake.set()
+        elif self._waiting_for is not None and _rank(command.priority) < _rank(
+            self._waiting_for
+        ):
+            self._wake.set()
+        if self._drain_task is None or self._drain_task.done():
+            self._wake.clear()
+            self._in_window = not barrier
+            self._drain_task = asyncio.create_task(self._drain())
+        if command.sent is not None:
+            await command.sent
+
+    def _promote(self, seq: int, priority: str) -> None:
+        """Raise older pending commands that `seq` overlaps to `priority`
+        (and theirs in turn), so they never hold it up."""
+        stack = [seq]
+        while stack:
+            current_seq = stack.pop()
+            current = self._pending[current_seq]
+            for other_seq, other in self._pending.items():
+                if other_seq >= current_seq:
+                    continue
+                if _rank(other.priority) > _rank(priority) and _overlaps(
+                    current.covers, other.covers
+                ):
+                    other.priority = priority
+                    stack.append(other_seq)
+
+    def _next(self) -> int:
+        """Seq of the command to send next: most urgent, then oldest."""
+        return min(
+            self._pending, key=lambda seq: (_rank(self._pending[seq].priority), seq)
+        )
+
+    async def _drain(self) -> None:
+        if self._in_window:
+            # Coalescing window; a barrier ends it early
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._interval)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._in_window = False
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything pending now, most urgent first, else in write order."""
+        if not self._pending:
+            return
+        self._flushes += 1
+        while self._pending:
+            if not await self._acquire(self._pending[self._next()].priority):
+                self._preempted += 1
+                continue
+            if not self._pending:
+                break  # Cleared while waiting
+            command = self._pending.pop(self._next())
+            await self._deliver(command)
+
+    async def _acquire(self, priority: str) -> bool:
+        """Take a rate limiter token for a `priority` command.
+
+        Returns:
+            False if a more urgent command arrived first (no token taken)
+        """
+        if self._limiter is None or not self._limiter.enabled:
+            return True
+        self._wake.clear()
+        self._waiting_for = priority
+        acquire = asyncio.ensure_future(self._limiter.acquire(priority))
+        woken = asyncio.ensure_future(self._wake.wait())
+        try:
+            await asyncio.wait({acquire, woken}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._waiting_for = None
+            woken.cancel()
+            if not acquire.done():
+                acquire.cancel()
+        try:
+            await acquire
+        except asyncio.CancelledError:
+            return False
+        return True
+
+    async def _deliver(self, command: _Pending) -> None:
+        try:
+            await self._send(command.service, command.service_data, command.target)
+            self._sent += 1
+        except Exception as e:
+            self._errors += 1
+            logger.error(
+                f"Light outbox failed to send light.{command.service} "
+                f"to {command.target}: {e}"
+            )
+        finally:
+            if command.sent is not None and not command.sent.done():
+                command.sent.set_result(None)
+
+    def clear(self) -> None:
+        """Drop pending commands (the connection they were meant for closed)."""
+        if self._drain_task is not None and not self._drain_task.done():
+            self._drain_task.cancel()
+        self._drain_task = None
+        for command in self._pending.values():
+            if command.sent is not None and not command.sent.done():
+                command.sent.set_result(None)
+        self._pending.clear()
+        self._open.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Submitted/sent/coalesced command counts."""
+        return {
+            "enabled": self.enabled,
+            "pending": len(self._pending),
+            "max_pending": self._max_pending,
+            "submitted": self._submitted,
+            "sent": self._sent,
+            "coalesced": self._coalesced,
+            "barriers": self._barriers,
+            "unmergeable": self._unmergeable,
+            "preempted": self._preempted,
+            "flushes": self._flushes,
+            "errors": self._errors,
+        }
@@ -2,14 +2,14 @@
 """Home Assistant WebSocket client - listens for events."""
 
 import asyncio
-import json
+import functools
 import logging
 import math
 import os
 import sys
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Sequence, Set, Tuple, Union
+from typing import Dict, Any, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 import websockets
 from websockets.client import WebSocketClientProtocol
@@ -18,6 +18,15 @@ import state
 import switches
 import glozone
 import lux_tracker
+from curve_engine import CurveTableStore
+import delta_suppression
+import event_dispatch
+import jsoncodec
+import light_outbox
+import perf
+import rate_limiter
+import subscriptions
+from fade_engine import FadeEngine, FadeTrajectory
 from primitives import CircadianLightPrimitives
 from brain import (
     CircadianLight,
@@ -112,6 +121,11 @@ class HomeAssistantWebSocketClient:
         self._sun_warn_log: dict = {}
         self.periodic_update_task = None  # Task for periodic light updates
         self.refresh_event = None  # Will be created lazily in the running event loop
+        self._deadline_event = None  # Wakes _deadline_loop when a timer is scheduled
+        self._fade_event = None  # Wakes _fade_loop when a fade starts
+        self.fade_engine = FadeEngine()  # Fade trajectories and frame pacing
+        self.curve_tables = CurveTableStore()  # Per-zone daily curve tables (opt-in)
+        self.delta_suppressor = delta_suppression.DeltaSuppressor()  # Periodic delta suppression (opt-in)
         self._log_periodic = False  # Updated by circadian tick from config
         # State is managed by state.py module (per-area midpoints, bounds, etc.)
         self.cached_states = {}  # Cache of entity states
@@ -153,6 +167,18 @@ class HomeAssistantWebSocketClient:
         # Pending response futures for async message routing (used when message loop is running)
         self._pending_responses: Dict[int, asyncio.Future] = {}
         self._message_loop_active = False  # Set True once main message loop starts
+        # Slow events run off the message loop, ordered per switch/area/sensor
+        self.event_dispatcher = event_dispatch.KeyedDispatcher()
+        # Targeted subscriptions (opt-in; otherwise subscribe to all events)
+        self.subscription_planner = subscriptions.SubscriptionPlanner()
+        # Token bucket pacing light commands by priority class (opt-in)
+        self.rate_limiter = rate_limiter.RateLimiter()
+        # Per-target light command coalescing (opt-in); takes its own tokens
+        self.light_outbox = light_outbox.LightOutbox(
+            functools.partial(self._send_service_call, "light", paced=False),
+            covers=self._light_target_covers,
+            limiter=self.rate_limiter,
+        )
         self._sensor_grace_until = 0.0  # Ignore motion/contact events until this time
 
         # Motion sensor cache for event handling
@@ -269,7 +295,7 @@ class HomeAssistantWebSocketClient:
             Transition time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("turn_on_transition", 3)
             return tenths / 10.0  # Convert tenths to seconds
         except Exception:
@@ -278,7 +304,7 @@ class HomeAssistantWebSocketClient:
     def _is_multi_click_enabled(self) -> bool:
         """Check if multi-click detection is enabled for Hue Hub switches."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("multi_click_enabled", True)
         except Exception:
             return True
@@ -293,7 +319,7 @@ class HomeAssistantWebSocketClient:
             Multi-click window in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("multi_click_speed", 15)
             return tenths / 10.0  # Convert tenths to seconds
         except Exception:
@@ -1243,9 +1269,10 @@ class HomeAssistantWebSocketClient:
             motion_config = switches.get_motion_sensor_by_device_id(device_id)
             if motion_config:
                 if command == "on_with_timed_off":
-                    await self._handle_zha_motion_event(
-                        motion_config, command, args, device_id
-                    )
+                    with rate_limiter.priority("motion"):
+                        await self._handle_zha_motion_event(
+                            motion_config, command, args, device_id
+                        )
                 return
 
         # Check if this switch is configured
@@ -1878,14 +1905,14 @@ class HomeAssistantWebSocketClient:
 
         # Build pipeline results for valid areas via shared builder
         # (applies sun_cooling_strength, brightness_sensitivity, etc.)
-        area_pipeline_results = {}
-        for area_id, result in zip(areas, results):
-            if result is None or not state.get_is_on(area_id):
-                continue
-            area_pipeline_results[area_id] = self.primitives.compute_pipeline_for_area(
-                area_id,
-                transition=transition,
-            )
+        area_pipeline_results = self.primitives.compute_pipeline_for_areas(
+            [
+                area_id
+                for area_id, result in zip(areas, results)
+                if result is not None and state.get_is_on(area_id)
+            ],
+            transition=transition,
+        )
 
         if not area_pipeline_results:
             return
@@ -2519,7 +2546,7 @@ class HomeAssistantWebSocketClient:
             Dict of moment_id -> moment config
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("moments", {})
         except Exception:
             return {}
@@ -2527,7 +2554,7 @@ class HomeAssistantWebSocketClient:
     def _get_motion_blink_threshold(self) -> int:
         """Get the motion blink threshold as brightness 0-255."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             pct = raw_config.get("motion_blink_threshold", 15)
             return int(pct / 100.0 * 255)
         except Exception:
@@ -2536,7 +2563,7 @@ class HomeAssistantWebSocketClient:
     def _is_reach_feedback_enabled(self) -> bool:
         """Check if reach feedback is enabled globally."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("reach_feedback_enabled", True)
         except Exception:
             return True
@@ -2544,7 +2571,7 @@ class HomeAssistantWebSocketClient:
     def _is_freeze_feedback_enabled(self) -> bool:
         """Check if freeze feedback is enabled globally."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("freeze_feedback_enabled", True)
         except Exception:
             return True
@@ -2552,7 +2579,7 @@ class HomeAssistantWebSocketClient:
     def _is_feedback_restrict_to_primary(self) -> bool:
         """Check if feedback should be restricted to the primary (starred) area."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("feedback_restrict_to_primary", False)
         except Exception:
             return False
@@ -2574,7 +2601,7 @@ class HomeAssistantWebSocketClient:
             Compensated brightness percentage (0-100, clamped)
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             enabled = raw_config.get("ct_comp_enabled", False)
             if not enabled:
                 return brightness
@@ -2864,16 +2891,20 @@ class HomeAssistantWebSocketClient:
                                 service,
                                 sdata,
                                 {"entity_id": entity_id},
+                                barrier=True,
                             )
                         )
                         for aid in aids:
                             handled.add(aid)
 
-        # Fallback: per-area for unhandled
+        # Fallback: per-area for unhandled (cue phases are barriers: each must
+        # reach the lights, not be coalesced into the next)
         for aid, (ha_target, sdata) in area_phase.items():
             if aid not in handled:
                 tasks.append(
-                    self.call_service("light", service, sdata, target=ha_target)
+                    self.call_service(
+                        "light", service, sdata, target=ha_target, barrier=True
+                    )
                 )
 
         if tasks:
@@ -3052,6 +3083,7 @@ class HomeAssistantWebSocketClient:
                                     "turn_on",
                                     {"brightness": 255, "transition": 0},
                                     target=t["ha_target"],
+                                    barrier=True,
                                 )
                             )
                         else:
@@ -3062,6 +3094,7 @@ class HomeAssistantWebSocketClient:
                                     "turn_off",
                                     {"transition": 0},
                                     target=t["ha_target"],
+                                    barrier=True,
                                 )
                             )
                         # Restore to cached
@@ -3082,6 +3115,7 @@ class HomeAssistantWebSocketClient:
                                     "turn_on",
                                     {"brightness": 255, "transition": 0},
                                     target=t["ha_target"],
+                                    barrier=True,
                                 )
                             )
                         else:
@@ -3112,6 +3146,7 @@ class HomeAssistantWebSocketClient:
                                     "turn_on",
                                     data,
                                     target=t["ha_target"],
+                                    barrier=True,
                                 )
                             )
                         # Restore: off
@@ -3391,7 +3426,7 @@ class HomeAssistantWebSocketClient:
         try:
             # Wait for auth_required message
             auth_required = await self.websocket.recv()
-            auth_msg = json.loads(auth_required)
+            auth_msg = jsoncodec.loads(auth_required)
 
             if auth_msg["type"] != "auth_required":
                 logger.error(f"Unexpected message type: {auth_msg['type']}")
@@ -3399,12 +3434,12 @@ class HomeAssistantWebSocketClient:
 
             # Send authentication
             await self.websocket.send(
-                json.dumps({"type": "auth", "access_token": self.access_token})
+                jsoncodec.dumps({"type": "auth", "access_token": self.access_token})
             )
 
             # Wait for auth result
             auth_result = await self.websocket.recv()
-            result_msg = json.loads(auth_result)
+            result_msg = jsoncodec.loads(auth_result)
 
             if result_msg["type"] == "auth_ok":
                 logger.info("Successfully authenticated with Home Assistant")
@@ -3433,7 +3468,7 @@ class HomeAssistantWebSocketClient:
         if event_type:
             subscribe_msg["event_type"] = event_type
 
-        await self.websocket.send(json.dumps(subscribe_msg))
+        await self.websocket.send(jsoncodec.dumps(subscribe_msg))
         # Grace period: ignore motion/contact sensor events for 5 seconds after
         # subscribing to avoid processing the initial state flood as real events.
         # The flood sends 15+ light commands in <1 second, overwhelming the
@@ -3448,25 +3483,68 @@ class HomeAssistantWebSocketClient:
 
         return message_id
 
+    async def _send_subscription_message(self, message: Dict[str, Any]) -> int:
+        """Send a (un)subscribe message without waiting for its result."""
+        message["id"] = self._get_next_message_id()
+        await self.websocket.send(jsoncodec.dumps(message))
+        return message["id"]
+
+    async def replan_subscriptions(self) -> None:
+        """Bring targeted subscriptions in line with the tracked entities.
+
+        No-op unless targeted subscriptions are active on this connection.
+        """
+        if not self.subscription_planner.active or not self.websocket:
+            return
+        tracked_devices = set(self.motion_sensor_ids.values())
+        tracked_devices.update(self.contact_sensor_ids.values())
+        for config in (
+            list(switches.get_all_switches().values())
+            + list(switches.get_all_motion_sensors().values())
+            + list(switches.get_all_contact_sensors().values())
+        ):
+            if config.device_id:
+                tracked_devices.add(config.device_id)
+        plan = subscriptions.plan_subscriptions(
+            cached_states=self.cached_states,
+            area_lights=self.area_lights,
+            sensor_entities=list(self.motion_sensor_ids)
+            + list(self.contact_sensor_ids),
+            device_ids=tracked_devices,
+            entity_registry=self.entity_registry,
+            extra_entities=(
+                lux_tracker.get_sensor_entity(),
+                lux_tracker.get_weather_entity(),
+            ),
+        )
+        try:
+            await self.subscription_planner.apply(
+                plan, self._send_subscription_message
+            )
+        except Exception as e:
+            logger.error(f"Failed to update event subscriptions: {e}")
+
     async def call_service(
         self,
         domain: str,
         service: str,
         service_data: Dict[str, Any],
         target: Optional[Dict[str, Any]] = None,
-    ) -> int:
+        *,
+        barrier: bool = False,
+    ) -> Optional[int]:
         """Call a Home Assistant service.
 
         Args:
             domain: Service domain (e.g., 'light')
             service: Service name (e.g., 'turn_on')
             service_data: Service parameters
+            barrier: Light commands only - a state the lights must actually
+                reach (2-step phase 1, feedback cues); never coalesced away
 
         Returns:
-            Message ID of the service call
+            Message ID of the service call (None if queued in the light outbox)
         """
-        message_id = self._get_next_message_id()
-
         # Handle target parameter separately from service_data
         final_target = target or {}
         final_service_data = service_data.copy() if service_data else {}
@@ -3481,6 +3559,112 @@ class HomeAssistantWebSocketClient:
         # based on whether the area has ZHA parity (all lights are ZHA)
         # This call_service method remains generic and doesn't auto-substitute
 
+        if (
+            self.light_outbox.enabled
+            and domain == "light"
+            and service in light_outbox.COALESCED_SERVICES
+            and final_target
+        ):
+            await self.light_outbox.submit(
+                service, final_service_data, final_target, barrier=barrier
+            )
+            return None
+
+        return await self._send_service_call(
+            domain, service, final_service_data, final_target
+        )
+
+    def _purpose_lights(
+        self, area_id: str, purpose_norm: Optional[str], cap: Optional[str]
+    ) -> List[str]:
+        """Lights of an area, optionally only one purpose and/or capability."""
+        color_lights, ct_lights, brightness_lights, onoff_lights = (
+            self.get_lights_by_capability(area_id)
+        )
+        if cap == "color":
+            lights = color_lights
+        elif cap == "ct":
+            lights = ct_lights
+        else:
+            lights = color_lights + ct_lights + brightness_lights + onoff_lights
+        if purpose_norm:
+            filters = glozone.get_area_light_filters(area_id)
+            lights = [
+                e
+                for e in lights
+                if filters.get(e, "Standard").replace(" ", "_").lower() == purpose_norm
+            ]
+        return lights
+
+    def _light_target_covers(
+        self, target: Dict[str, Any]
+    ) -> Optional[FrozenSet[str]]:
+        """Physical lights a light call_service target reaches (light outbox).
+
+        Areas expand to their lights, purpose/area groups to the lights of
+        their area, purpose and capability, batch groups to those across
+        their areas. Returns None if any part of the target is unknown.
+        """
+        lights: Set[str] = set()
+        for key, value in target.items():
+            values = [value] if isinstance(value, str) else list(value or [])
+            if key == "area_id":
+                for area_id in values:
+                    if area_id not in self.area_lights:
+                        return None
+                    lights.update(self.area_lights[area_id])
+                continue
+            if key != "entity_id":
+                return None
+            for entity_id in values:
+                info = self.group_entity_info.get(entity_id)
+                if info is not None:
+                    area_id = info.get("area_id")
+                    if not area_id:
+                        return None
+                    group_type = info.get("type", "")
+                    purpose, cap = None, None
+                    if group_type.startswith("zha_group_"):
+                        rest = group_type[len("zha_group_") :]
+                        purpose, _, cap = rest.rpartition("_")
+                        if cap not in ("color", "ct"):
+                            purpose, cap = None, None
+                    lights.update(self._purpose_lights(area_id, purpose or None, cap))
+                    continue
+                batch = next(
+                    (
+                        (bg, slot)
+                        for bg in self.batch_groups
+                        for slot, eid in bg.filter_groups.items()
+                        if eid == entity_id
+                    ),
+                    None,
+                )
+                if batch is not None:
+                    bg, (purpose, cap) = batch
+                    for area_id in bg.areas:
+                        lights.update(self._purpose_lights(area_id, purpose, cap))
+                    continue
+                lights.add(entity_id)
+        return frozenset(lights)
+
+    async def _send_service_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: Dict[str, Any],
+        target: Dict[str, Any],
+        *,
+        paced: bool = True,
+    ) -> int:
+        """Write a call_service message to the websocket; returns its id.
+
+        Light commands first take a rate limiter token unless `paced` is
+        False (the light outbox takes its own).
+        """
+        if paced and domain == "light":
+            await self.rate_limiter.acquire()
+        message_id = self._get_next_message_id()
         service_msg = {
             "id": message_id,
             "type": "call_service",
@@ -3488,13 +3672,13 @@ class HomeAssistantWebSocketClient:
             "service": service,
         }
 
-        if final_service_data:
-            service_msg["service_data"] = final_service_data
-        if final_target:
-            service_msg["target"] = final_target
+        if service_data:
+            service_msg["service_data"] = service_data
+        if target:
+            service_msg["target"] = target
 
         logger.debug(f"Sending service call: {domain}.{service} (id: {message_id})")
-        await self.websocket.send(json.dumps(service_msg))
+        await self.websocket.send(jsoncodec.dumps(service_msg))
         logger.debug(f"Called service: {domain}.{service} (id: {message_id})")
 
         return message_id
@@ -3612,7 +3796,7 @@ class HomeAssistantWebSocketClient:
         """
         self._last_light_action_time = time.time()
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             burst_count = int(raw_config.get("post_action_burst_count", 1))
             burst_count = max(0, min(3, burst_count))
         except Exception:
@@ -3627,7 +3811,7 @@ class HomeAssistantWebSocketClient:
             self._pending_post_action_delay.cancel()
 
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("post_switch_refresh", 30)
             delay = tenths / 10.0
         except Exception:
@@ -3662,6 +3846,7 @@ class HomeAssistantWebSocketClient:
         log_periodic: bool = True,
         pipeline_result=None,
         skip_if_identical: bool = False,
+        unchanged_purposes: set = None,
     ) -> None:
         """Turn on lights with circadian values - the single source of truth for light control.
 
@@ -3691,10 +3876,14 @@ class HomeAssistantWebSocketClient:
                 area_kelvin match last-sent values. Used for user actions (step/bright/color)
                 where the periodic tick will catch any missed deliveries within ~3s.
                 NEVER set for periodic tick calls.
+            unchanged_purposes: Purpose names to leave alone (pipeline path only).
+                Set by the periodic tick's delta suppression.
         """
         # Record non-periodic light action for defer + refresh
         if not self._in_periodic_tick:
             self.record_light_action()
+            # Restart delta suppression: the next tick resends every purpose
+            self.delta_suppressor.forget(area_id)
 
         # --- Pipeline-driven path: all computation already done ---
         if pipeline_result is not None:
@@ -3733,6 +3922,7 @@ class HomeAssistantWebSocketClient:
                 area_factor,
                 prev_kelvin=_prev_kelvin,
                 precomputed_purposes=pipeline_result.purposes,
+                unchanged_purposes=unchanged_purposes,
             )
             return
 
@@ -3767,14 +3957,14 @@ class HomeAssistantWebSocketClient:
         from pipeline import PipelineContext
         import pipeline as pipeline_mod
 
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         outdoor_norm = lux_tracker.get_outdoor_normalized()
-        zone_cfg = glozone.get_effective_config_for_area(area_id)
+        zone_cfg = glozone.get_compiled_config_for_area(area_id).config
 
         ctx = PipelineContext(
             area_id=area_id,
             hour=0.0,  # Not used when precomputed
-            config=Config.from_dict(zone_cfg),
+            config=zone_cfg,
             area_state=AreaState(is_circadian=True, is_on=True),
             sun_times=SunTimes(),
             area_factor=glozone.get_area_brightness_factor(area_id),
@@ -3841,6 +4031,7 @@ class HomeAssistantWebSocketClient:
         skip_off_threshold: bool = False,
         prev_kelvin: int = None,
         precomputed_purposes: list = None,
+        unchanged_purposes: set = None,
     ) -> None:
         """Filtered light dispatch: routes precomputed purpose brightnesses to sub-groups.
 
@@ -3849,6 +4040,9 @@ class HomeAssistantWebSocketClient:
 
         precomputed_purposes (from pipeline) provides pre-computed brightness/should_off
         values for each purpose — no filter/CT computation needed here.
+
+        unchanged_purposes (purpose names, from periodic delta suppression) are not
+        sent at all — their lights already hold these values.
         """
         off_threshold = glozone.get_off_threshold()
 
@@ -3906,7 +4100,7 @@ class HomeAssistantWebSocketClient:
         two_step_filters = set()
         two_step_dimming = set()  # filters where 2-step is dimming (swap phase order)
         is_all_hue = self.is_all_hue_area(area_id)
-        raw_cfg = glozone.load_config_from_files()
+        raw_cfg = glozone.get_config_snapshot()
         ct_threshold = raw_cfg.get("two_step_ct_threshold", 200)
         _two_step_gate = (
             not skip_two_step
@@ -3920,6 +4114,8 @@ class HomeAssistantWebSocketClient:
                 filt_norm = filter_name.replace(" ", "_").lower()
                 if skip_filters and filt_norm in skip_filters:
                     continue
+                if unchanged_purposes and filter_name in unchanged_purposes:
+                    continue
                 _pp = _purpose_map.get(filter_name)
                 if not _pp:
                     continue
@@ -3992,7 +4188,11 @@ class HomeAssistantWebSocketClient:
                             p1["color_temp_kelvin"] = max(2000, kelvin)
                         phase1_tasks.append(
                             self.call_service(
-                                "light", "turn_on", p1, {"entity_id": entity_id}
+                                "light",
+                                "turn_on",
+                                p1,
+                                {"entity_id": entity_id},
+                                barrier=True,
                             )
                         )
 
@@ -4011,7 +4211,11 @@ class HomeAssistantWebSocketClient:
                         # No color data — keep current color during dim
                         phase1_tasks.append(
                             self.call_service(
-                                "light", "turn_on", p1, {"entity_id": entity_id}
+                                "light",
+                                "turn_on",
+                                p1,
+                                {"entity_id": entity_id},
+                                barrier=True,
                             )
                         )
 
@@ -4050,6 +4254,12 @@ class HomeAssistantWebSocketClient:
                         f"Purpose '{filter_name}': skipped (handled by reach group)"
                     )
                 continue
+            if unchanged_purposes and filter_name in unchanged_purposes:
+                if log_periodic:
+                    logger.info(
+                        f"Purpose '{filter_name}': skipped (unchanged since last send)"
+                    )
+                continue
 
             # Skip 2-step purposes in main loop — handled by phase 2 after delay
             if filt_norm_check in two_step_filters:
@@ -4078,6 +4288,18 @@ class HomeAssistantWebSocketClient:
                     # Fall through to normal turn-on path below with filtered_bri=1
 
             if should_off:
+                if raw_cfg.get("periodic_suppress_enabled", False):
+                    # Cache as off so delta suppression doesn't skip the
+                    # purpose's next turn-on as unchanged
+                    _last = state.get_last_sent_purpose(area_id, filter_name)
+                    state.set_last_sent_purpose(
+                        area_id,
+                        filter_name,
+                        _last.get("brightness", 0) if _last else 0,
+                        kelvin or 4000,
+                        is_off=True,
+                    )
+
                 # Send OFF to these lights
                 off_entities = (
                     lights_by_cap["color"]
@@ -4431,6 +4653,7 @@ class HomeAssistantWebSocketClient:
         # Record non-periodic light action for defer + refresh
         if not self._in_periodic_tick:
             self.record_light_action()
+        self.delta_suppressor.forget(area_id)
 
         color_lights, ct_lights, brightness_lights, onoff_lights = (
             self.get_lights_by_capability(area_id)
@@ -4721,7 +4944,7 @@ class HomeAssistantWebSocketClient:
 
         states_msg = {"id": message_id, "type": "get_states"}
 
-        await self.websocket.send(json.dumps(states_msg))
+        await self.websocket.send(jsoncodec.dumps(states_msg))
         logger.info(f"Requested states (id: {message_id})")
 
         return message_id
@@ -4733,7 +4956,7 @@ class HomeAssistantWebSocketClient:
         recovery mode ("On" for bright, "PreviousValue" for last_state).
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             recovery = raw_config.get("power_recovery", "last_state")
 
             count = 0
@@ -5396,6 +5619,7 @@ class HomeAssistantWebSocketClient:
             return
 
         state.set_is_circadian(area_id, False)
+        self.delta_suppressor.forget(area_id)
         logger.info(f"Circadian Light disabled for area {area_id}")
 
     def get_brightness_step_pct(self) -> float:
@@ -5591,6 +5815,7 @@ class HomeAssistantWebSocketClient:
                 outdoor_normalized=outdoor_norm,
                 outdoor_source=outdoor_source,
                 is_fallback=False,
+                solar_windows=cached["solar_windows"],
             )
 
         # Resolve lat/lon — instance attrs first, env-var fallback
@@ -5654,6 +5879,8 @@ class HomeAssistantWebSocketClient:
                     "sunset": sunset,
                     "solar_noon": solar_noon,
                     "solar_mid": solar_mid,
+                    # Compiled solar-rule windows, shared by today's SunTimes
+                    "solar_windows": {},
                 }
             }
             logger.info(
@@ -5669,6 +5896,7 @@ class HomeAssistantWebSocketClient:
                 outdoor_normalized=outdoor_norm,
                 outdoor_source=outdoor_source,
                 is_fallback=False,
+                solar_windows=self._sun_times_cache[date_str]["solar_windows"],
             )
         except Exception as e:
             self._warn_sun_fallback_once(
@@ -5813,7 +6041,7 @@ class HomeAssistantWebSocketClient:
             if state.is_boosted(area_id):
                 await self.primitives.end_boost(area_id, source="webserver")
             else:
-                raw_config = glozone.load_config_from_files()
+                raw_config = glozone.get_config_snapshot()
                 boost_amount = raw_config.get("boost_default", 30)
                 await self.primitives.bright_boost(
                     area_id,
@@ -5953,6 +6181,9 @@ class HomeAssistantWebSocketClient:
         area_id: str,
         log_periodic: bool = False,
         periodic_transition: float = 0.5,
+        curve_cache=None,
+        hour: Optional[float] = None,
+        suppression=None,
     ):
         """Update lights in an area with circadian lighting if Circadian Light is enabled.
 
@@ -5965,6 +6196,12 @@ class HomeAssistantWebSocketClient:
         Args:
             area_id: The area ID to update
             log_periodic: Whether to log periodic update details (controlled by settings toggle)
+            periodic_transition: Transition time for the light command
+            curve_cache: Optional pipeline.BaseCurveCache shared across a batched
+                tick so areas with identical curve inputs evaluate the curve once
+            hour: Hour to evaluate unfrozen areas at (None = now)
+            suppression: Optional delta_suppression.SuppressionSettings; purposes
+                whose values match what was last sent are skipped
         """
         try:
             # Only update if area is under circadian control
@@ -5980,8 +6217,7 @@ class HomeAssistantWebSocketClient:
                     )
 
             # Get area state (includes stepped midpoints, pushed bounds, and frozen_at)
-            area_state_dict = state.get_area(area_id)
-            area_state = AreaState.from_dict(area_state_dict)
+            area_state = AreaState.from_dict(state.get_area_record(area_id))
 
             # Check target power state - enforce is_on with off_enforced optimization
             # Send redundant off commands for a few periods to catch missed turn-offs
@@ -6040,6 +6276,12 @@ class HomeAssistantWebSocketClient:
                         )
                 return
 
+            # Fading areas are rendered from their precomputed trajectory
+            if state.is_fading(area_id):
+                with rate_limiter.priority("fade"):
+                    await self._send_fade_frame(area_id, log_periodic=log_periodic)
+                return
+
             # Warning factor: pipeline dims brightness when motion warning active
             dim_factor = state.get_dim_factor(area_id)
 
@@ -6060,84 +6302,26 @@ class HomeAssistantWebSocketClient:
                 boost_note = f" (boosted +{boost_amount}%)"
 
             # --- Build context via shared builder + compute pipeline ---
+            timer = perf.stage_timer("area_update")
+            compute_start = time.perf_counter()
             ctx = self.primitives.build_pipeline_context_for_area(
                 area_id,
                 dim_factor=dim_factor,
                 transition=periodic_transition,
                 log_decay=log_periodic,
+                hour=hour,
             )
             import pipeline as pipeline_mod
 
+            if timer is not None:
+                timer.mark("context_build")
+            if curve_cache is not None:
+                curve_cache.apply(ctx)
             pipeline_result = pipeline_mod.compute(ctx)
-
-            # --- Fade: lerp between captured start state and live target ---
-            fade_note = ""
-            if state.is_fading(area_id):
-                progress = state.get_fade_progress(area_id)
-                fade_state = state.get_fade_state(area_id)
-                if progress is not None and fade_state:
-                    target_preset = fade_state.get("fade_target_preset", "circadian")
-                    start_bri = fade_state.get("fade_start_brightness") or 0
-                    start_kelvin = fade_state.get("fade_start_kelvin") or 2000
-                    direction = fade_state.get("fade_direction", "in")
-
-                    # Compute target pipeline result for the target preset
-                    target_result = self.primitives.compute_fade_target(
-                        area_id, target_preset
-                    )
-
-                    if target_result is not None:
-                        target_bri = target_result.area_brightness
-                        target_kelvin = target_result.area_kelvin
-                    else:
-                        # fade-out: target is off
-                        target_bri = 0
-                        target_kelvin = start_kelvin
-
-                    # Lerp brightness and kelvin
-                    if target_preset == "off":
-                        lerped_bri = max(1, round(start_bri * (1.0 - progress)))
-                        lerped_kelvin = start_kelvin
-                    else:
-                        lerped_bri = max(
-                            1, round(start_bri + (target_bri - start_bri) * progress)
-                        )
-                        lerped_kelvin = round(
-                            start_kelvin + (target_kelvin - start_kelvin) * progress
-                        )
-                    lerped_xy = CircadianLight.color_temperature_to_xy(lerped_kelvin)
-
-                    # Override pipeline result with lerped values.
-                    # Use TARGET purpose ratios so there's no snap at completion.
-                    if target_result is not None and target_result.area_brightness > 0:
-                        for p in pipeline_result.purposes:
-                            # Find matching target purpose for ratio
-                            tp = next(
-                                (t for t in target_result.purposes if t.name == p.name),
-                                None,
-                            )
-                            if tp and target_result.area_brightness > 0:
-                                ratio = tp.brightness / target_result.area_brightness
-                            else:
-                                ratio = 1.0
-                            p.brightness = max(1, round(lerped_bri * ratio))
-                            p.kelvin = lerped_kelvin
-                            p.xy = lerped_xy
-                    else:
-                        for p in pipeline_result.purposes:
-                            p.brightness = (
-                                max(1, round(lerped_bri)) if lerped_bri > 0 else 1
-                            )
-                            p.kelvin = lerped_kelvin
-                            p.xy = lerped_xy
-                    pipeline_result.area_brightness = lerped_bri
-                    pipeline_result.area_kelvin = lerped_kelvin
-                    pipeline_result.area_xy = lerped_xy
-
-                    remaining = max(
-                        0, (fade_state.get("fade_duration") or 0) * (1 - progress)
-                    )
-                    fade_note = f" (fade {'↑' if direction == 'in' else '↓'} → {target_preset} {remaining:.0f}s)"
+            if curve_cache is not None:
+                curve_cache.compute_seconds += time.perf_counter() - compute_start
+            if timer is not None:
+                timer.mark("compute")
 
             # Log the calculation
             hour = ctx.hour
@@ -6148,21 +6332,111 @@ class HomeAssistantWebSocketClient:
             )
             if log_periodic:
                 logger.info(
-                    f"Periodic update for area {area_id}{frozen_note}{boost_note}{fade_note}: "
+                    f"Periodic update for area {area_id}{frozen_note}{boost_note}: "
                     f"{pipeline_result.area_kelvin}K, {pipeline_result.area_brightness}%"
                 )
 
+            unchanged = None
+            if suppression is not None:
+                unchanged = self.delta_suppressor.unchanged_purposes(
+                    area_id,
+                    pipeline_result.purposes,
+                    state.get_last_sent_purposes(area_id),
+                    suppression,
+                )
+                if unchanged and len(unchanged) == len(pipeline_result.purposes):
+                    if log_periodic:
+                        logger.info(
+                            f"Periodic update for area {area_id}: unchanged, not sent"
+                        )
+                    return
+
             # Deliver via pipeline-aware path
             await self.send_light(
                 area_id,
                 transition=periodic_transition,
                 log_periodic=log_periodic,
                 pipeline_result=pipeline_result,
+                unchanged_purposes=unchanged,
             )
+            if timer is not None:
+                timer.mark("delivery")
+                timer.done()
 
         except Exception as e:
             logger.error(f"Error updating lights in area {area_id}: {e}")
 
+    def _get_fade_trajectory(self, area_id: str) -> Optional[FadeTrajectory]:
+        """Return the fade trajectory for an area, building it if needed.
+
+        The current pipeline result (template) and the target preset result are
+        computed only when the fade starts and every TARGET_REFRESH_INTERVAL,
+        not on every frame.
+        """
+        fade_state = state.get_fade_state(area_id)
+        progress = state.get_fade_progress(area_id)
+        if fade_state is None or progress is None:
+            return None
+
+        now = time.monotonic()
+        traj = self.fade_engine.get_trajectory(area_id, fade_state["fade_start"], now)
+        if traj is not None:
+            return traj
+
+        import pipeline as pipeline_mod
+
+        ctx = self.primitives.build_pipeline_context_for_area(
+            area_id, dim_factor=state.get_dim_factor(area_id)
+        )
+        template = pipeline_mod.compute(ctx)
+        target_result = self.primitives.compute_fade_target(
+            area_id, fade_state.get("fade_target_preset") or "circadian"
+        )
+        traj = FadeTrajectory(
+            area_id, fade_state, progress, template, target_result, now=now
+        )
+        self.fade_engine.set_trajectory(traj)
+        return traj
+
+    async def _send_fade_frame(self, area_id: str, log_periodic: bool = False):
+        """Send one fade frame for an area.
+
+        The frame targets where the fade will be at the next frame and uses
+        the gap as its transition, so the lights glide along the trajectory
+        instead of stepping.
+        """
+        traj = self._get_fade_trajectory(area_id)
+        if traj is None:
+            return
+
+        timer = perf.stage_timer("area_update")
+        now = time.monotonic()
+        interval = traj.frame_interval(now)
+        progress = traj.progress_at(now + interval)
+        result = traj.render(progress)
+        if timer is not None:
+            timer.mark("fade_lerp")
+
+        if log_periodic:
+            remaining = max(0.0, traj.start_mono + traj.duration - now)
+            arrow = "↑" if traj.direction == "in" else "↓"
+            logger.info(
+                f"Fade frame for area {area_id} ({arrow} → {traj.target_preset} "
+                f"{remaining:.0f}s): {result.area_kelvin}K, {result.area_brightness}% "
+                f"over {interval:.1f}s"
+            )
+
+        self.fade_engine.record_frame(area_id, interval, now)
+        await self.send_light(
+            area_id,
+            transition=interval,
+            log_periodic=log_periodic,
+            pipeline_result=result,
+        )
+        if timer is not None:
+            timer.mark("delivery")
+            timer.done()
+
     async def reset_state_at_phase_change(
         self, last_check: Optional[datetime]
     ) -> Optional[datetime]:
@@ -6193,7 +6467,7 @@ class HomeAssistantWebSocketClient:
 
         # Load config (uses first zone for phase times)
         # Future: could check per-zone phase times
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         zones = raw_config.get("glozones", {})
 
         if not zones:
@@ -6254,28 +6528,126 @@ class HomeAssistantWebSocketClient:
         # Create the Event lazily in the running event loop to avoid "different loop" errors
         if self.refresh_event is None:
             self.refresh_event = asyncio.Event()
+        if self._deadline_event is None:
+            self._deadline_event = asyncio.Event()
+        if self._fade_event is None:
+            self._fade_event = asyncio.Event()
+        state.set_deadline_listener(self._on_deadline_scheduled)
 
         try:
             await asyncio.gather(
                 self._fast_tick_loop(),
+                self._deadline_loop(),
+                self._fade_loop(),
                 self._circadian_tick_loop(),
                 self._daily_sync_loop(),
             )
         except asyncio.CancelledError:
             logger.info("Periodic light updater cancelled")
+        finally:
+            state.set_deadline_listener(None)
+
+    def _on_deadline_scheduled(self):
+        """State listener: a timer changed, so wake the deadline and fade loops."""
+        self._deadline_event.set()
+        self._fade_event.set()
+
+    async def _deadline_loop(self):
+        """Sleep until the next boost/motion/warning/fade deadline, then act.
+
+        Deadlines come from state's deadline heap (fed by set_boost,
+        set_motion_expires, extend_motion_expires, set_fade, ...), so only
+        the areas that are due are touched and an idle install does no work.
+        """
+        # Upper bound on a single sleep so a changed motion_warning_time is
+        # picked up even when nothing new gets scheduled
+        MAX_DEADLINE_SLEEP = 30.0
+
+        while True:
+            try:
+                warning_time, _ = self.primitives._get_motion_warning_config()
+                wait = state.seconds_until_next_deadline(max(0, warning_time))
+                wait = MAX_DEADLINE_SLEEP if wait is None else min(wait, MAX_DEADLINE_SLEEP)
+                if wait > 0:
+                    self._deadline_event.clear()
+                    try:
+                        await asyncio.wait_for(self._deadline_event.wait(), timeout=wait)
+                        continue  # New deadline scheduled - recompute the wait
+                    except asyncio.TimeoutError:
+                        pass
+
+                due = state.pop_due_deadlines(max(0, warning_time))
+                log_periodic = self._log_periodic
+
+                # Warnings before expiries (same order as the old fast tick)
+                if due["warning"]:
+                    await self.primitives.check_motion_warnings(
+                        log_periodic=log_periodic, areas=due["warning"]
+                    )
+                if due["boost"]:
+                    await self.primitives.check_expired_boosts(
+                        log_periodic=log_periodic, areas=due["boost"]
+                    )
+                if due["motion"]:
+                    await self.primitives.check_expired_motion(
+                        log_periodic=log_periodic, areas=due["motion"]
+                    )
+                if due["fade"]:
+                    await self.primitives.check_fade_completions(areas=due["fade"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in deadline loop: {e}")
+                await asyncio.sleep(1)
+
+    async def _fade_loop(self):
+        """Send fade frames when they are due, sleeping in between.
+
+        The fade engine paces each fade adaptively (see fade_engine), so a
+        slow fade sends a frame every ~30s with a matching transition while
+        a steep one sends them every second or two. Woken early when a new
+        fade starts.
+        """
+        # Upper bound on a single sleep when no fade is active
+        MAX_FADE_IDLE = 30.0
+
+        while True:
+            try:
+                fading_areas = [
+                    area_id
+                    for area_id in state.get_fading_areas()
+                    if state.is_circadian(area_id) and state.get_is_on(area_id)
+                ]
+                self.fade_engine.prune(fading_areas)
+
+                for area_id in self.fade_engine.due_areas(fading_areas):
+                    await self.update_lights_in_circadian_mode(
+                        area_id, log_periodic=self._log_periodic
+                    )
+
+                wait = self.fade_engine.seconds_until_next_frame()
+                wait = MAX_FADE_IDLE if wait is None else min(wait, MAX_FADE_IDLE)
+                self._fade_event.clear()
+                try:
+                    await asyncio.wait_for(self._fade_event.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in fade loop: {e}")
+                await asyncio.sleep(1)
 
     async def _fast_tick_loop(self):
-        """Fast tick (1 second): in-memory state checks and timer expiry.
+        """Fast tick (1 second): in-memory state checks (phase, switch scope, auto schedules).
 
         All operations here are in-memory (microseconds, zero API calls)
-        unless something actually expires and needs action.
-
-        Exception: during active fades, sends light updates every 5 seconds
-        for smooth transitions.
+        unless something actually expires and needs action. Fade frames
+        are sent by _fade_loop.
         """
         last_phase_check = None
-        _fade_last_update: Dict[str, float] = {}  # area_id -> last update timestamp
-        FADE_TICK_INTERVAL = 5.0  # seconds between fade light updates
 
         while True:
             try:
@@ -6293,52 +6665,12 @@ class HomeAssistantWebSocketClient:
                         f"Reset {len(reset_switches)} switch(es) to scope 1 due to inactivity"
                     )
 
-                # Use log_periodic from circadian tick (updated every circadian_refresh seconds)
-                log_periodic = self._log_periodic
-
-                # Check for motion warnings (before expiry check)
-                await self.primitives.check_motion_warnings(log_periodic=log_periodic)
-
-                # Check for expired boosts and motion timers
-                await self.primitives.check_expired_boosts(log_periodic=log_periodic)
-                await self.primitives.check_expired_motion(log_periodic=log_periodic)
+                # Boost/motion/warning expiry and fade completion are handled
+                # by _deadline_loop, which sleeps until the next deadline.
 
                 # Check for auto on/off schedules
                 await self.primitives.check_auto_schedules()
 
-                # Check for completed fades
-                await self.primitives.check_fade_completions()
-
-                # Drive fade updates every FADE_TICK_INTERVAL seconds
-                # Smooth fades need frequent updates; the normal circadian tick
-                # is too slow (20s default).
-                now = time.time()
-                fading_areas = [
-                    aid for aid in state.get_all_areas().keys() if state.is_fading(aid)
-                ]
-                for area_id in fading_areas:
-                    if not state.is_circadian(area_id) or not state.get_is_on(area_id):
-                        logger.debug(
-                            f"[fade_tick] {area_id}: skipping (circadian={state.is_circadian(area_id)}, on={state.get_is_on(area_id)})"
-                        )
-                        continue
-                    last = _fade_last_update.get(area_id, 0)
-                    if now - last >= FADE_TICK_INTERVAL:
-                        progress = state.get_fade_progress(area_id)
-                        logger.debug(
-                            f"[fade_tick] {area_id}: progress={progress:.2f}, sending update"
-                        )
-                        _fade_last_update[area_id] = now
-                        await self.update_lights_in_circadian_mode(
-                            area_id,
-                            log_periodic=True,
-                            periodic_transition=FADE_TICK_INTERVAL,
-                        )
-                # Clean up stale entries
-                for aid in list(_fade_last_update.keys()):
-                    if aid not in fading_areas:
-                        _fade_last_update.pop(aid, None)
-
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -6347,14 +6679,18 @@ class HomeAssistantWebSocketClient:
     async def _circadian_tick_loop(self):
         """Circadian tick (configurable 5-120s): update all circadian areas with current lighting."""
         import glozone_state
+        import pipeline as pipeline_mod
 
         while True:
             try:
                 # Get refresh interval, logging, and transition config
                 try:
-                    raw_config = glozone.load_config_from_files()
+                    raw_config = glozone.get_config_snapshot()
                     refresh_interval = raw_config.get("circadian_refresh", 20)
                     refresh_interval = max(5, min(120, refresh_interval))
+                    state.set_flush_delay(
+                        raw_config.get("state_flush_delay", state.DEFAULT_FLUSH_DELAY)
+                    )
                     # Advanced logging with auto-expiry
                     logging_until = raw_config.get("advanced_logging_until")
                     if logging_until == "forever":
@@ -6384,10 +6720,34 @@ class HomeAssistantWebSocketClient:
                         if sun_elev > 0
                         else periodic_transition_night
                     )
+                    # Interpolate plain-curve areas from a daily minute table
+                    use_curve_tables = bool(
+                        raw_config.get("curve_table_enabled", False)
+                    )
+                    suppression = delta_suppression.settings_from_config(raw_config)
+                    perf.set_enabled(
+                        raw_config.get("perf_instrumentation_enabled", False)
+                    )
+                    self.light_outbox.enabled = bool(
+                        raw_config.get("light_outbox_enabled", False)
+                    )
+                    self.rate_limiter.enabled = bool(
+                        raw_config.get("rate_limit_enabled", False)
+                    )
+                    self.rate_limiter.configure(
+                        raw_config.get(
+                            "rate_limit_per_second", rate_limiter.DEFAULT_RATE
+                        ),
+                        raw_config.get(
+                            "rate_limit_burst", rate_limiter.DEFAULT_BURST
+                        ),
+                    )
                 except Exception:
                     refresh_interval = 30
                     log_periodic = False
                     periodic_transition = 2.0
+                    use_curve_tables = False
+                    suppression = None
                 self._log_periodic = log_periodic
 
                 # Choose wait timeout: short during burst, normal otherwise
@@ -6453,31 +6813,53 @@ class HomeAssistantWebSocketClient:
                         if triggered_by_event
                         else f"periodic ({refresh_interval}s)"
                     )
+                    # Refresh signals and post-action bursts exist to catch
+                    # missed deliveries — never suppress those
+                    if triggered_by_event or self._post_action_refreshes_remaining > 0:
+                        suppression = None
+                    # Fading areas get their frames from _fade_loop
+                    circadian_areas = [
+                        a for a in circadian_areas if not self.fade_engine.is_active(a)
+                    ]
+
                     if circadian_areas:
                         if log_periodic:
                             logger.info(
                                 f"Running light update ({trigger_source}) for {len(circadian_areas)} Circadian areas"
                             )
                         self._in_periodic_tick = True
-                        _solar_cached_zones = set()
+                        _priority = rate_limiter.set_priority("periodic")
+                        tick_start = time.perf_counter()
                         try:
+                            # Batch by zone: one curve evaluation per distinct
+                            # curve input (zone config, midpoints, frozen_at,
+                            # color override), all at the same tick hour
+                            tick_now = datetime.now()
+                            tick_hour = (
+                                tick_now.hour
+                                + tick_now.minute / 60
+                                + tick_now.second / 3600
+                            )
+                            zone_areas: Dict[Optional[str], List[str]] = {}
                             for area_id in circadian_areas:
+                                zone_areas.setdefault(
+                                    glozone.get_zone_for_area(area_id), []
+                                ).append(area_id)
+
+                            for _zone, _areas in zone_areas.items():
                                 # Cache zone-level solar breakdown (once per zone)
-                                _zone = glozone.get_zone_for_area(area_id)
-                                if _zone and _zone not in _solar_cached_zones:
-                                    _solar_cached_zones.add(_zone)
+                                if _zone:
                                     try:
-                                        _zcfg = Config.from_dict(
-                                            glozone.get_effective_config_for_zone(_zone)
-                                        )
-                                        _zhour = get_current_hour()
+                                        _zcfg = glozone.get_compiled_config_for_zone(
+                                            _zone
+                                        ).config
                                         _zsun = self._get_sun_times()
                                         _zbase_state = AreaState(
                                             is_circadian=True, is_on=True
                                         )
                                         _zbase_k = (
                                             CircadianLight.calculate_color_at_hour(
-                                                _zhour,
+                                                tick_hour,
                                                 _zcfg,
                                                 _zbase_state,
                                                 apply_solar_rules=False,
@@ -6487,7 +6869,7 @@ class HomeAssistantWebSocketClient:
                                         _zbreakdown = (
                                             CircadianLight.get_solar_rule_breakdown(
                                                 _zbase_k,
-                                                _zhour,
+                                                tick_hour,
                                                 _zcfg,
                                                 _zbase_state,
                                                 _zsun,
@@ -6504,16 +6886,56 @@ class HomeAssistantWebSocketClient:
                                         logger.debug(
                                             f"Solar cache error for zone {_zone}: {_e}"
                                         )
-                                logger.debug(
-                                    f"Updating lights in Circadian area: {area_id}"
+
+                                curve_table = None
+                                if use_curve_tables:
+                                    try:
+                                        # Areas in _areas share the zone's config
+                                        curve_table = self.curve_tables.get(
+                                            _zone,
+                                            glozone.get_compiled_config_for_area(
+                                                _areas[0]
+                                            ).config,
+                                            tick_now.date(),
+                                            self._get_sun_times(),
+                                        )
+                                    except Exception as _e:
+                                        logger.debug(
+                                            f"Curve table error for zone {_zone}: {_e}"
+                                        )
+                                curve_cache = pipeline_mod.BaseCurveCache(
+                                    table=curve_table
                                 )
-                                await self.update_lights_in_circadian_mode(
-                                    area_id,
-                                    log_periodic=log_periodic,
-                                    periodic_transition=periodic_transition,
+                                for area_id in _areas:
+                                    logger.debug(
+                                        f"Updating lights in Circadian area: {area_id}"
+                                    )
+                                    await self.update_lights_in_circadian_mode(
+                                        area_id,
+                                        log_periodic=log_periodic,
+                                        periodic_transition=periodic_transition,
+                                        curve_cache=curve_cache,
+                                        hour=tick_hour,
+                                        suppression=suppression,
+                                    )
+                                zone_msg = (
+                                    f"[tick] Zone {_zone}: {len(_areas)} area(s), "
+                                    f"{curve_cache.misses} curve eval(s), "
+                                    f"{curve_cache.table_lookups} table lookup(s), "
+                                    f"compute {curve_cache.compute_seconds * 1000:.1f} ms"
+                                )
+                                self.curve_tables.record_lookups(
+                                    curve_cache.table_lookups
                                 )
+                                if log_periodic:
+                                    logger.info(zone_msg)
+                                else:
+                                    logger.debug(zone_msg)
                         finally:
                             self._in_periodic_tick = False
+                            rate_limiter.reset_priority(_priority)
+                        if perf.enabled:
+                            perf.record("tick", time.perf_counter() - tick_start)
                         # Decrement burst counter after processing
                         if self._post_action_refreshes_remaining > 0:
                             self._post_action_refreshes_remaining -= 1
@@ -6537,7 +6959,7 @@ class HomeAssistantWebSocketClient:
 
         while True:
             try:
-                raw_config = glozone.load_config_from_files()
+                raw_config = glozone.get_config_snapshot()
                 sync_hour = raw_config.get("daily_sync_hour", 4)
                 sync_minute = raw_config.get("daily_sync_minute", 0)
 
@@ -6604,6 +7026,9 @@ class HomeAssistantWebSocketClient:
             # 5. Apply power recovery setting (picks up newly discovered lights)
             await self.apply_power_recovery_setting()
 
+            # 6. Track new/moved lights and sensors (targeted subscriptions)
+            await self.replan_subscriptions()
+
             logger.info("[sync] Area/group sync complete")
         except Exception as e:
             logger.error(f"[sync] Error during sync: {e}")
@@ -6870,6 +7295,56 @@ class HomeAssistantWebSocketClient:
         except Exception as e:
             logger.error(f"Failed to sync batch groups: {e}")
 
+    def _dispatch_key(self, message: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+        """Ordering keys for events whose handlers can be slow, else None.
+
+        Keyed events run on the event dispatcher: an event waits for earlier
+        events sharing any of its keys, and runs concurrently with the rest.
+        Switch and sensor events carry their device plus every area it acts
+        on, so a press, a motion event and a service call for the same area
+        never interleave. Everything else (state cache updates, config
+        reloads, results) is handled inline by the message loop.
+        """
+        if message.get("type") != "event":
+            return None
+        event = message.get("event") or {}
+        event_type = event.get("event_type")
+        data = event.get("data") or {}
+
+        if event_type == "zha_event":
+            device = data.get("device_ieee") or data.get("device_id")
+            return (f"switch:{device}", *self._area_keys(device))
+        if event_type == "hue_event":
+            device = data.get("device_id") or data.get("id")
+            return (f"switch:{device}", *self._area_keys(device))
+        if event_type == "call_service" and data.get("domain") == "circadian":
+            area_id = (data.get("service_data") or {}).get("area_id")
+            if isinstance(area_id, list):
+                return tuple(f"area:{a}" for a in area_id) or ("area:None",)
+            return (f"area:{area_id}",)
+        if event_type == "state_changed":
+            entity_id = data.get("entity_id")
+            if entity_id in self.motion_sensor_ids or entity_id in self.contact_sensor_ids:
+                device_id = self.motion_sensor_ids.get(
+                    entity_id
+                ) or self.contact_sensor_ids.get(entity_id)
+                return (f"sensor:{entity_id}", *self._area_keys(device_id))
+            return None
+        if event_type in (
+            "circadian_light_sync_devices",
+            "circadian_light_sync_reach_groups",
+            "circadian_light_sync_batch_groups",
+        ):
+            return ("sync",)
+        return None
+
+    @staticmethod
+    def _area_keys(device_id: Optional[str]) -> Tuple[str, ...]:
+        """Dispatch keys for the areas a switch or sensor acts on."""
+        if not device_id:
+            return ()
+        return tuple(f"area:{a}" for a in switches.get_controlled_areas(device_id))
+
     async def handle_message(self, message: Dict[str, Any]):
         """Handle incoming messages."""
         msg_type = message.get("type")
@@ -7143,6 +7618,9 @@ class HomeAssistantWebSocketClient:
                                 pass
                             break
 
+                # Lux/weather entity or sensor config may have changed
+                await self.replan_subscriptions()
+
                 if self.refresh_event is not None:
                     self.refresh_event.set()
                 else:
@@ -7178,6 +7656,8 @@ class HomeAssistantWebSocketClient:
             ):
                 logger.info(f"{event_type} event received - syncing batch groups")
                 await self.sync_batch_groups()
+                # Switch config changed: track its devices
+                await self.replan_subscriptions()
 
             # Handle circadian_light_live_design event (fired by webserver when Live Design starts/stops)
             elif event_type == "circadian_light_live_design":
@@ -7293,9 +7773,10 @@ class HomeAssistantWebSocketClient:
                         and old_state_val not in _NON_REAL_STATES
                         and new_state_val != old_state_val
                     ):
-                        await self._handle_motion_event(
-                            entity_id, new_state_val, old_state_val
-                        )
+                        with rate_limiter.priority("motion"):
+                            await self._handle_motion_event(
+                                entity_id, new_state_val, old_state_val
+                            )
 
                 # Handle contact sensor state changes
                 if entity_id and entity_id in self.contact_sensor_ids and not _in_grace:
@@ -7311,9 +7792,10 @@ class HomeAssistantWebSocketClient:
                         and old_state_val not in _NON_REAL_STATES
                         and new_state_val != old_state_val
                     ):
-                        await self._handle_contact_event(
-                            entity_id, new_state_val, old_state_val
-                        )
+                        with rate_limiter.priority("motion"):
+                            await self._handle_contact_event(
+                                entity_id, new_state_val, old_state_val
+                            )
                 # Debug: Log contact-looking sensors that aren't cached
                 elif (
                     entity_id
@@ -7475,7 +7957,7 @@ class HomeAssistantWebSocketClient:
         msg_id = message["id"]
 
         try:
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(jsoncodec.dumps(message))
         except Exception as e:
             logger.error(f"WebSocket send failed for id={msg_id}: {e}")
             return None
@@ -7501,7 +7983,7 @@ class HomeAssistantWebSocketClient:
                 return None
 
             try:
-                data = json.loads(frame)
+                data = jsoncodec.loads(frame)
             except Exception:
                 logger.debug(
                     f"Ignoring non-JSON frame while waiting for id={msg_id}: {frame!r}"
@@ -7573,7 +8055,7 @@ class HomeAssistantWebSocketClient:
         self._pending_responses[msg_id] = future
 
         try:
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(jsoncodec.dumps(message))
         except Exception as e:
             self._pending_responses.pop(msg_id, None)
             logger.error(f"WebSocket send failed for id={msg_id}: {e}")
@@ -7766,8 +8248,14 @@ class HomeAssistantWebSocketClient:
                         f"Refreshed group mappings after ZHA sync: {len(self.group_entity_info)} grouped lights"
                     )
 
-                # Subscribe to all events
-                await self.subscribe_events()
+                # Subscribe to the events we handle (targeted, opt-in) or
+                # to all events
+                if glozone.get_config().get("targeted_subscriptions_enabled", False):
+                    self.subscription_planner.active = True
+                    await self.replan_subscriptions()
+                    self._sensor_grace_until = time.monotonic() + 5.0
+                else:
+                    await self.subscribe_events()
 
                 # Clean up orphaned state entries (areas in state but not in any glozone)
                 all_zone_areas = set()
@@ -7796,12 +8284,24 @@ class HomeAssistantWebSocketClient:
                 self._message_loop_active = True
                 async for message in websocket:
                     try:
-                        msg = json.loads(message)
+                        msg = jsoncodec.loads(message)
+                    except jsoncodec.DecodeError:
+                        logger.error(f"Failed to decode message: {message}")
+                        continue
+                    try:
                         # Route responses to pending futures before general handling
-                        if not self._resolve_pending_response(msg):
+                        if self._resolve_pending_response(msg):
+                            continue
+                        msg = self.subscription_planner.translate(msg)
+                        if msg is None:
+                            continue
+                        key = self._dispatch_key(msg)
+                        if key is None:
                             await self.handle_message(msg)
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to decode message: {message}")
+                        else:
+                            self.event_dispatcher.submit(
+                                key, functools.partial(self.handle_message, msg)
+                            )
                     except Exception as e:
                         logger.error(f"Error handling message: {e}")
 
@@ -7817,8 +8317,18 @@ class HomeAssistantWebSocketClient:
                     await self.periodic_update_task
                 except asyncio.CancelledError:
                     pass
+            # Drop event handlers still running/queued for the closed connection
+            await self.event_dispatcher.cancel()
+            self.subscription_planner.reset()
+            self.light_outbox.clear()
+            self.rate_limiter.clear()
             self._message_loop_active = False
             self.websocket = None
+            # Persist any write-behind area/zone state before reconnect/shutdown
+            state.flush()
+            import glozone_state
+
+            glozone_state.flush()
 
     async def run(self):
         """Run the client with automatic reconnection."""
@@ -7874,6 +8384,10 @@ async def async_main():
     try:
         await client.run()
     finally:
+        import glozone_state
+
+        state.flush()
+        glozone_state.flush()
         if webserver_runner:
             await webserver_runner.cleanup()
 
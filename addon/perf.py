@@ -0,0 +1,93 @@
+"""Optional per-stage timing for the pipeline and the periodic tick.
+
+Off by default (perf_instrumentation_enabled). While off, call sites pay a
+single check (stage_timer() returns None, `enabled` is False) and nothing
+is timed or stored. While on, each stage keeps a rolling window of its most
+recent durations; get_stats() summarises them as p50/p95/max for the
+webserver's /api/perf endpoint.
+
+Stage names are dotted: "pipeline.base_curve", "area_update.delivery",
+"tick", ...
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+WINDOW = 1000  # Samples kept per stage
+
+enabled = False
+_samples: Dict[str, Deque[float]] = {}
+_counts: Dict[str, int] = {}
+
+
+def set_enabled(on: bool) -> None:
+    """Turn instrumentation on/off (samples are kept until reset())."""
+    global enabled
+    enabled = bool(on)
+
+
+def record(stage: str, seconds: float) -> None:
+    """Add one duration sample for a stage."""
+    samples = _samples.get(stage)
+    if samples is None:
+        samples = _samples[stage] = deque(maxlen=WINDOW)
+    samples.append(seconds)
+    _counts[stage] = _counts.get(stage, 0) + 1
+
+
+class StageTimer:
+    """Splits one run into stages; mark() charges the time since the last mark.
+
+    Marks with the same name accumulate (e.g. per-purpose work in a loop)
+    and are recorded as one sample each when done() is called.
+    """
+
+    __slots__ = ("_prefix", "_last", "_totals")
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+        self._totals: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._totals[stage] = self._totals.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def done(self) -> None:
+        for stage, seconds in self._totals.items():
+            record(f"{self._prefix}.{stage}", seconds)
+
+
+def stage_timer(prefix: str) -> Optional[StageTimer]:
+    """A StageTimer when instrumentation is on, else None."""
+    return StageTimer(prefix) if enabled else None
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def get_stats() -> Dict[str, Any]:
+    """Rolling p50/p95/max (ms) per stage, plus lifetime sample counts."""
+    stages = {}
+    for stage in sorted(_samples):
+        ordered = sorted(_samples[stage])
+        if not ordered:
+            continue
+        stages[stage] = {
+            "count": _counts[stage],
+            "window": len(ordered),
+            "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+    return {"enabled": enabled, "window": WINDOW, "stages": stages}
+
+
+def reset() -> None:
+    """Drop all samples."""
+    _samples.clear()
+    _counts.clear()
@@ -2,6 +2,8 @@
 
 Single pipeline that computes final brightness and color per purpose for an area.
 All entry points funnel through `compute()` which returns a `PipelineResult`.
+Multi-area callers use `compute_many()`, which returns the same results while
+sharing base curves and purpose presets between areas.
 
 Pipeline steps (in order):
   1. Base curve (time + midpoint → rhythm_brightness, rhythm_kelvin)
@@ -23,6 +25,7 @@ Pipeline steps (in order):
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+import perf
 from brain import (
     AreaState,
     CircadianLight,
@@ -92,6 +95,21 @@ class PipelineContext:
     precomputed_xy: Optional[Tuple[float, float]] = None
     precomputed_rhythm_brightness: Optional[int] = None
 
+    # Shared base curve (step 1 incl. solar rules) from a BaseCurveCache.
+    # Unlike precomputed_*, this is the full curve result for identical
+    # inputs, so it is safe for curve-driven delivery.
+    base_curve: Optional["BaseCurve"] = None
+
+
+@dataclass(frozen=True)
+class BaseCurve:
+    """Step 1 output: base curve + solar rules, before any per-area step."""
+
+    brightness: int
+    kelvin: int
+    xy: Tuple[float, float]
+    phase: str
+
 
 @dataclass
 class PurposeResult:
@@ -131,6 +149,44 @@ def compute(ctx: PipelineContext) -> PipelineResult:
 
     Pure computation — no I/O, no async, no side effects.
     """
+    return _compute(ctx, _group_by_purpose(ctx))
+
+
+def compute_many(
+    ctxs: List[PipelineContext],
+    curve_cache: Optional["BaseCurveCache"] = None,
+    preset_version: Optional[int] = None,
+) -> List[PipelineResult]:
+    """Run the pipeline for several areas, sharing work between them.
+
+    Results are identical to [compute(ctx) for ctx in ctxs]. Areas with
+    identical curve inputs share one base curve evaluation (give them the
+    same hour), and the natural-curve brightness behind sun-cooling strength
+    is evaluated once per (config, hour, weekday). With a preset_version,
+    purpose presets are resolved once per purpose name.
+
+    Args:
+        ctxs: Contexts to compute (ctx.base_curve is set as a side effect)
+        curve_cache: BaseCurveCache to share with other batches (None = a
+            cache for this call only)
+        preset_version: Version of ctx.filter_presets (glozone config
+            version). When given, resolved presets are reused across calls
+            until the version changes.
+    """
+    cache = curve_cache if curve_cache is not None else BaseCurveCache()
+    presets = _preset_resolver(preset_version)
+    results = []
+    for ctx in ctxs:
+        if ctx.precomputed_brightness is None and ctx.base_curve is None:
+            cache.apply(ctx)
+        results.append(_compute(ctx, _group_by_purpose(ctx, presets)))
+    return results
+
+
+def _compute(ctx: PipelineContext, purpose_groups: Dict[str, dict]) -> PipelineResult:
+    """compute() with the purpose presets already resolved."""
+    timer = perf.stage_timer("pipeline")
+
     # --- Step 1: Base curve ---
     if ctx.precomputed_brightness is not None:
         # Caller already computed the curve (primitives path)
@@ -142,27 +198,16 @@ def compute(ctx: PipelineContext) -> PipelineResult:
         xy = ctx.precomputed_xy or CircadianLight.color_temperature_to_xy(kelvin)
         phase = "precomputed"
     else:
-        # Compute from scratch (periodic tick / step / toggle paths).
-        # Sun-cooling-strength shared with webserver.get_zone_states via the
-        # `compute_sun_cooling_strength` helper so home-page zone-header tint
-        # and runtime bulb output stay in sync.
-        sun_cooling_strength = compute_sun_cooling_strength(
-            ctx.area_state, ctx.config, ctx.hour, weekday=ctx.weekday
-        )
-
-        result = CircadianLight.calculate_lighting(
-            ctx.hour,
-            ctx.config,
-            ctx.area_state,
-            sun_times=ctx.sun_times,
-            weekday=ctx.weekday,
-            sun_cooling_strength=sun_cooling_strength,
-        )
-        rhythm_brightness = result.brightness
-        rhythm_kelvin = result.color_temp
-        kelvin = result.color_temp
-        xy = result.xy
-        phase = result.phase
+        # Compute from scratch (periodic tick / step / toggle paths), unless
+        # a batched tick already evaluated the curve for identical inputs
+        base = ctx.base_curve or compute_base_curve(ctx)
+        rhythm_brightness = base.brightness
+        rhythm_kelvin = base.kelvin
+        kelvin = base.kelvin
+        xy = base.xy
+        phase = base.phase
+    if timer is not None:
+        timer.mark("base_curve")
 
     # --- Step 5: Sun bright adjustment ---
     brightness = rhythm_brightness
@@ -173,6 +218,8 @@ def compute(ctx: PipelineContext) -> PipelineResult:
     )
     if sun_bright_factor < 1.0:
         brightness = max(1, int(round(brightness * sun_bright_factor)))
+    if timer is not None:
+        timer.mark("sun_bright")
 
     # --- Steps 6-8: Area brightness (area_factor + override + boost) ---
     area_brightness = brightness * ctx.area_factor
@@ -186,9 +233,10 @@ def compute(ctx: PipelineContext) -> PipelineResult:
     post_factor = ctx.fade_factor * ctx.dim_factor
     if post_factor < 1.0:
         area_brightness = max(1, int(round(area_brightness * post_factor)))
+    if timer is not None:
+        timer.mark("area_factor")
 
     # --- Steps 10-12: Per-purpose pipeline ---
-    purpose_groups = _group_by_purpose(ctx)
     purposes = []
     for purpose_name, preset in purpose_groups.items():
         purpose_bri, should_off = _apply_purpose_filter(
@@ -200,6 +248,8 @@ def compute(ctx: PipelineContext) -> PipelineResult:
             off_threshold=ctx.off_threshold,
             brightness_override=ctx.brightness_override,
         )
+        if timer is not None:
+            timer.mark("purpose_filters")
 
         # CT brightness compensation
         if not should_off and purpose_bri > 0:
@@ -211,6 +261,8 @@ def compute(ctx: PipelineContext) -> PipelineResult:
                 end=ctx.ct_comp_end,
                 factor=ctx.ct_comp_factor,
             )
+        if timer is not None:
+            timer.mark("ct_comp")
 
         purposes.append(
             PurposeResult(
@@ -221,6 +273,8 @@ def compute(ctx: PipelineContext) -> PipelineResult:
                 should_off=should_off,
             )
         )
+    if timer is not None:
+        timer.done()
 
     return PipelineResult(
         purposes=purposes,
@@ -234,12 +288,139 @@ def compute(ctx: PipelineContext) -> PipelineResult:
     )
 
 
+def compute_base_curve(
+    ctx: PipelineContext, natural_brightness: Optional[int] = None
+) -> BaseCurve:
+    """Evaluate pipeline step 1 (base curve + solar rules) for a context.
+
+    natural_brightness: the plain-curve brightness at ctx.hour, if the
+    caller already has it (see compute_sun_cooling_strength).
+    """
+    # Sun-cooling-strength shared with webserver.get_zone_states via the
+    # `compute_sun_cooling_strength` helper so home-page zone-header tint
+    # and runtime bulb output stay in sync.
+    sun_cooling_strength = compute_sun_cooling_strength(
+        ctx.area_state,
+        ctx.config,
+        ctx.hour,
+        weekday=ctx.weekday,
+        natural_brightness=natural_brightness,
+    )
+
+    result = CircadianLight.calculate_lighting(
+        ctx.hour,
+        ctx.config,
+        ctx.area_state,
+        sun_times=ctx.sun_times,
+        weekday=ctx.weekday,
+        sun_cooling_strength=sun_cooling_strength,
+    )
+    return BaseCurve(
+        brightness=result.brightness,
+        kelvin=result.color_temp,
+        xy=result.xy,
+        phase=result.phase,
+    )
+
+
+def base_curve_key(ctx: PipelineContext) -> tuple:
+    """The inputs step 1 reads, as a hashable key.
+
+    Two contexts with equal keys produce the same BaseCurve. The config is
+    keyed by identity: compiled zone configs are shared per zone. Only the
+    presence of color_override_set_at matters here: it marks a slider
+    override (added after the solar rules) versus a step override (which
+    moves the warm-night ceiling or daylight target).
+    """
+    st = ctx.area_state
+    sun = ctx.sun_times
+    return (
+        id(ctx.config),
+        ctx.hour,
+        ctx.weekday,
+        st.frozen_at,
+        st.brightness_mid,
+        st.color_mid,
+        st.color_override,
+        st.color_override_set_at is not None,
+        sun.sunrise,
+        sun.sunset,
+        sun.solar_noon,
+        sun.solar_mid,
+        sun.outdoor_normalized,
+    )
+
+
+class BaseCurveCache:
+    """Per-tick memo of base curves, shared by areas with identical curve inputs.
+
+    Typical use: one cache per zone per circadian tick. Areas in the zone
+    with no midpoint/override/frozen state share a single curve evaluation;
+    per-area steps (factor, overrides, boost, filters, CT comp) still run
+    per area in compute().
+
+    With a curve_engine.DailyCurveTable for the zone, misses for areas on
+    the plain curve are interpolated from the table instead of evaluated
+    (except where the table defers to exact evaluation).
+    """
+
+    def __init__(self, table=None):
+        self.table = table
+        self._curves: Dict[tuple, BaseCurve] = {}
+        # (config id, hour, weekday) -> plain-curve brightness, for areas
+        # stepped off the curve (sun-cooling strength compares against it)
+        self._natural: Dict[tuple, int] = {}
+        # Keeps keyed configs alive so their id() can't be reused mid-tick
+        self._configs: List[Config] = []
+        self.hits = 0
+        self.misses = 0
+        self.table_lookups = 0
+        # Context build + compute time, accumulated by the caller for logging
+        self.compute_seconds = 0.0
+
+    def apply(self, ctx: PipelineContext) -> None:
+        """Set ctx.base_curve from the cache, evaluating it on a miss."""
+        key = base_curve_key(ctx)
+        curve = self._curves.get(key)
+        if curve is None:
+            if self.table is not None and self.table.covers(ctx):
+                curve = self.table.lookup(ctx.hour, ctx.sun_times.outdoor_normalized)
+            if curve is not None:
+                self.table_lookups += 1
+            else:
+                curve = compute_base_curve(ctx, self._natural_brightness(ctx))
+                self.misses += 1
+            self._curves[key] = curve
+            self._configs.append(ctx.config)
+        else:
+            self.hits += 1
+        ctx.base_curve = curve
+
+    def _natural_brightness(self, ctx: PipelineContext) -> Optional[int]:
+        if ctx.area_state.brightness_mid is None:
+            return None  # strength is 1.0 without evaluating the curve
+        key = (id(ctx.config), ctx.hour, ctx.weekday)
+        natural = self._natural.get(key)
+        if natural is None:
+            natural = CircadianLight.calculate_brightness_at_hour(
+                ctx.hour,
+                ctx.config,
+                AreaState(is_circadian=True, is_on=True),
+                weekday=ctx.weekday,
+            )
+            self._natural[key] = natural
+            self._configs.append(ctx.config)
+        return natural
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _group_by_purpose(ctx: PipelineContext) -> Dict[str, dict]:
+def _group_by_purpose(
+    ctx: PipelineContext, resolver: Optional["_PresetResolver"] = None
+) -> Dict[str, dict]:
     """Build {purpose_name: filter_preset} from context.
 
     Always returns at least Standard with a passthrough preset.
@@ -254,15 +435,56 @@ def _group_by_purpose(ctx: PipelineContext) -> Dict[str, dict]:
     purpose_names.add("Standard")
     result = {}
     for name in purpose_names:
-        normalized = name.replace(" ", "_").lower()
-        # Look up the preset; fall back to pass-through
-        preset = ctx.filter_presets.get(name) or ctx.filter_presets.get(normalized)
-        if preset is None:
-            preset = {"at_dim": 100, "at_bright": 100}
-        result[name] = preset
+        if resolver is not None:
+            result[name] = resolver.resolve(ctx.filter_presets, name)
+        else:
+            result[name] = _resolve_preset(ctx.filter_presets, name)
     return result
 
 
+def _resolve_preset(filter_presets: Dict[str, dict], name: str) -> dict:
+    normalized = name.replace(" ", "_").lower()
+    # Look up the preset; fall back to pass-through
+    preset = filter_presets.get(name) or filter_presets.get(normalized)
+    if preset is None:
+        preset = {"at_dim": 100, "at_bright": 100}
+    return preset
+
+
+class _PresetResolver:
+    """Memo of _resolve_preset for one version of the filter presets.
+
+    Keyed by purpose name only: every context computed under a version
+    carries that version's presets (glozone hands out a fresh dict per
+    call, so the dict itself can't be the key).
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self._resolved: Dict[str, dict] = {}
+
+    def resolve(self, filter_presets: Dict[str, dict], name: str) -> dict:
+        preset = self._resolved.get(name)
+        if preset is None:
+            preset = _resolve_preset(filter_presets, name)
+            self._resolved[name] = preset
+        return preset
+
+
+_shared_resolver: Optional[_PresetResolver] = None
+
+
+def _preset_resolver(version: Optional[int]) -> Optional[_PresetResolver]:
+    """Resolver shared across compute_many calls for one presets version
+    (None without a version: presets are resolved per context)."""
+    global _shared_resolver
+    if version is None:
+        return None
+    if _shared_resolver is None or _shared_resolver.version != version:
+        _shared_resolver = _PresetResolver(version)
+    return _shared_resolver
+
+
 def _apply_purpose_filter(
     area_brightness: int,
     rhythm_brightness: int,
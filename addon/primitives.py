@@ -7,7 +7,7 @@ import logging
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import glozone
 import glozone_state
@@ -27,6 +27,19 @@ from brain import (
 
 logger = logging.getLogger(__name__)
 
+# Rebuild interval for the auto schedule table while sun times are fallback
+AUTO_SCHEDULE_RETRY_SECONDS = 60.0
+
+
+class AutoScheduleEntry(NamedTuple):
+    """One compiled auto-on/auto-off firing for today."""
+
+    fire_time: float  # Decimal local hour
+    area_id: str
+    kind: str  # "auto_on" or "auto_off"
+    fade: int  # Fade minutes (0 = instant)
+    preset: str  # auto_on light preset, "off" for auto_off
+
 
 def _get_data_directory() -> str:
     """Get the appropriate data directory based on environment."""
@@ -60,6 +73,11 @@ class CircadianLightPrimitives:
             {}
         )  # area_id -> {auto_on: {date, time}, auto_off: {date, time}}
         self._load_auto_fired()
+        # Today's compiled auto-on/off firing table (see _get_auto_schedule)
+        self._auto_table: List[AutoScheduleEntry] = []
+        self._auto_table_key: Optional[tuple] = None  # (date, config version)
+        self._auto_table_next = 0  # Index of the next entry to fire
+        self._auto_table_retry_at: Optional[float] = None  # Rebuild while sun is fallback
 
     def _get_config(self, area_id: Optional[str] = None) -> Config:
         """Load config, optionally zone-aware for a specific area.
@@ -73,9 +91,8 @@ class CircadianLightPrimitives:
         # If area_id provided, use zone-aware config
         if area_id:
             try:
-                config_dict = glozone.get_effective_config_for_area(area_id)
-                if config_dict:
-                    return Config.from_dict(config_dict)
+                # Shared, frozen per-zone Config (rebuilt only on config change)
+                return glozone.get_compiled_config_for_area(area_id).config
             except Exception as e:
                 logger.warning(f"Zone-aware config failed for {area_id}: {e}")
 
@@ -116,7 +133,7 @@ class CircadianLightPrimitives:
             Transition time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("turn_on_transition", 3)
             return tenths / 10.0  # Convert tenths to seconds
         except Exception:
@@ -132,7 +149,7 @@ class CircadianLightPrimitives:
             Transition time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("turn_off_transition", 3)
             return tenths / 10.0  # Convert tenths to seconds
         except Exception:
@@ -145,7 +162,7 @@ class CircadianLightPrimitives:
         The setting is stored as tenths of seconds in config.
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("boost_return_transition", 60)
             return tenths / 10.0
         except Exception:
@@ -165,7 +182,7 @@ class CircadianLightPrimitives:
             Delay time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("two_step_delay", 5)
             return tenths / 10.0  # Convert tenths to seconds
         except Exception:
@@ -181,7 +198,7 @@ class CircadianLightPrimitives:
             Transition time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("freeze_off_rise", 10)
             return tenths / 10.0
         except Exception:
@@ -190,7 +207,7 @@ class CircadianLightPrimitives:
     def _is_limit_bounce_enabled(self) -> bool:
         """Check if limit bounce visual feedback is enabled."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("limit_bounce_enabled", True)
         except Exception:
             return True
@@ -205,7 +222,7 @@ class CircadianLightPrimitives:
             Transition time in seconds
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("limit_warning_speed", 3)
             return tenths / 10.0
         except Exception:
@@ -221,7 +238,7 @@ class CircadianLightPrimitives:
             Bounce percentage (0-100)
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("limit_bounce_max_percent", 25)
         except Exception:
             return 25
@@ -236,7 +253,7 @@ class CircadianLightPrimitives:
             Bounce percentage (0-100)
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("limit_bounce_min_percent", 13)
         except Exception:
             return 13
@@ -244,7 +261,7 @@ class CircadianLightPrimitives:
     def _get_alert_bounce_speed(self) -> float:
         """Get the alert bounce animation speed in seconds."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             tenths = raw_config.get("alert_bounce_speed", 10)
             return tenths / 10.0
         except Exception:
@@ -260,7 +277,7 @@ class CircadianLightPrimitives:
             Threshold percentage (0-100)
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("reach_daytime_threshold", 50)
         except Exception:
             return 50
@@ -272,7 +289,7 @@ class CircadianLightPrimitives:
             Dict of moment_id -> moment config
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             return raw_config.get("moments", {})
         except Exception:
             return {}
@@ -388,8 +405,7 @@ class CircadianLightPrimitives:
 
     def _get_area_state(self, area_id: str) -> AreaState:
         """Get area state from state module."""
-        state_dict = state.get_area(area_id)
-        return AreaState.from_dict(state_dict)
+        return AreaState.from_dict(state.get_area_record(area_id))
 
     def _update_area_state(self, area_id: str, updates: Dict[str, Any]) -> None:
         """Update area state in state module."""
@@ -702,6 +718,7 @@ class CircadianLightPrimitives:
         transition: float = 0.5,
         weekday: Optional[int] = None,
         log_decay: bool = False,
+        hour: Optional[float] = None,
     ):
         """Build a PipelineContext for an area from current state.
 
@@ -720,6 +737,8 @@ class CircadianLightPrimitives:
             transition: Light command transition time
             weekday: Optional weekday override (None = today)
             log_decay: Whether to log override decay calculations
+            hour: Current hour to use for unfrozen areas (None = now). A
+                batched tick passes one hour so areas can share a curve.
 
         Returns:
             PipelineContext ready for pipeline.compute(). Never None
@@ -728,19 +747,18 @@ class CircadianLightPrimitives:
         import lux_tracker
         from pipeline import PipelineContext
 
-        # Config (effective = zone rhythm settings + globals like latitude/longitude)
-        config_dict = glozone.get_effective_config_for_area(area_id)
-        config = Config.from_dict(config_dict)
+        # Config (effective = zone rhythm settings + globals like latitude/longitude),
+        # compiled once per zone and shared by its areas
+        config = glozone.get_compiled_config_for_area(area_id).config
 
         # Area state (includes stepped midpoints, overrides, frozen_at)
         area_state = self._get_area_state(area_id)
 
         # Hour (frozen_at if set, else current)
-        hour = (
-            area_state.frozen_at
-            if area_state.frozen_at is not None
-            else get_current_hour()
-        )
+        if area_state.frozen_at is not None:
+            hour = area_state.frozen_at
+        elif hour is None:
+            hour = get_current_hour()
 
         # Sun times for solar rules
         sun_times = (
@@ -829,7 +847,7 @@ class CircadianLightPrimitives:
         outdoor_norm = lux_tracker.get_outdoor_normalized()
 
         # Raw config for CT comp
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
 
         return PipelineContext(
             area_id=area_id,
@@ -866,6 +884,28 @@ class CircadianLightPrimitives:
         ctx = self.build_pipeline_context_for_area(area_id, **builder_kwargs)
         return pipeline_mod.compute(ctx)
 
+    def compute_pipeline_for_areas(self, area_ids: List[str], **builder_kwargs):
+        """Build contexts and compute pipeline results for several areas.
+
+        Multi-area counterpart of compute_pipeline_for_area: all areas are
+        evaluated at one hour via pipeline.compute_many, so areas sharing a
+        zone and curve state share one curve evaluation.
+
+        Returns:
+            Dict of area_id -> PipelineResult, in area_ids order
+        """
+        import pipeline as pipeline_mod
+
+        builder_kwargs.setdefault("hour", get_current_hour())
+        ctxs = [
+            self.build_pipeline_context_for_area(area_id, **builder_kwargs)
+            for area_id in area_ids
+        ]
+        results = pipeline_mod.compute_many(
+            ctxs, preset_version=glozone.get_config_version()
+        )
+        return dict(zip(area_ids, results))
+
     def compute_fade_target(self, area_id: str, target_preset: str):
         """Compute what the pipeline would produce for a target preset.
 
@@ -956,7 +996,7 @@ class CircadianLightPrimitives:
         from pipeline import PipelineContext
         import pipeline as pipeline_mod
 
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         outdoor_norm = lux_tracker.get_outdoor_normalized()
         effective_override = self._get_decayed_brightness_override(area_id)
         boost_brightness = None
@@ -964,7 +1004,7 @@ class CircadianLightPrimitives:
             boost_state = state.get_boost_state(area_id)
             boost_brightness = boost_state.get("boost_brightness")
 
-        dim_factor = state.get_area(area_id).get("dim_factor", 1.0)
+        dim_factor = state.get_area_record(area_id).get("dim_factor", 1.0)
 
         ctx = PipelineContext(
             area_id=area_id,
@@ -1021,7 +1061,7 @@ class CircadianLightPrimitives:
 
         For step mode: walks the curve via midpoints (inverse_midpoint).
         For brightness mode: sets an additive override delta with time-based decay.
-        For color mode: sets color_override directly via _converge_override (no color_mid change).
+        For color mode: sets color_override directly via solve_color_override (no color_mid change).
 
         Args:
             area_id: The area ID to control
@@ -1721,6 +1761,7 @@ class CircadianLightPrimitives:
             return
 
         state.set_is_circadian(area_id, False)
+        self.client.delta_suppressor.forget(area_id)
         logger.info(f"Circadian Light disabled for area {area_id}, lights unchanged")
 
     async def circadian_on(self, area_id: str, source: str = "service_call"):
@@ -1911,19 +1952,19 @@ class CircadianLightPrimitives:
                 self.cancel_fade(area_id, source=source or "toggle_on")
                 state.mark_user_action(area_id)
 
-            # Compute pipeline results for all areas via shared builder
-            # (applies sun_cooling_strength, brightness_sensitivity, etc.)
-            area_pipeline_results = {}
             for area_id in area_ids:
                 if not glozone.is_area_in_any_zone(area_id):
                     glozone.add_area_to_default_zone(area_id)
                     logger.info(f"Added area {area_id} to default zone")
 
                 state.enable_circadian_and_set_on(area_id, True)
-                area_pipeline_results[area_id] = self.compute_pipeline_for_area(
-                    area_id,
-                    transition=transition,
-                )
+
+            # Compute pipeline results for all areas via shared builder
+            # (applies sun_cooling_strength, brightness_sensitivity, etc.)
+            area_pipeline_results = self.compute_pipeline_for_areas(
+                area_ids,
+                transition=transition,
+            )
 
             # Try batch groups (greedy largest-first)
             batch_handled = await self._send_via_batch(
@@ -2276,12 +2317,15 @@ class CircadianLightPrimitives:
             )
             return False
 
-    async def check_expired_boosts(self, log_periodic: bool = False):
+    async def check_expired_boosts(
+        self, log_periodic: bool = False, areas: Optional[List[str]] = None
+    ):
         """Check for and handle any expired boosts.
 
-        Called every second from the fast tick loop.
+        Called from the deadline loop with the areas whose boost deadline
+        fired; with areas=None, scans all areas.
         """
-        expired = state.get_expired_boosts()
+        expired = state.get_expired_boosts() if areas is None else areas
         for area_id in expired:
             await self.end_boost(area_id, source="timer_expired")
 
@@ -2534,12 +2578,15 @@ class CircadianLightPrimitives:
             f"[{source}] Motion on_off timer expired for area {area_id}, turned off"
         )
 
-    async def check_expired_motion(self, log_periodic: bool = False):
+    async def check_expired_motion(
+        self, log_periodic: bool = False, areas: Optional[List[str]] = None
+    ):
         """Check for and handle any expired motion on_off timers.
 
-        Called every second from the fast tick loop.
+        Called from the deadline loop with the areas whose motion deadline
+        fired; with areas=None, scans all areas.
         """
-        expired = state.get_expired_motion()
+        expired = state.get_expired_motion() if areas is None else areas
         for area_id in expired:
             # Clear any warning state before turning off
             state.clear_motion_warning(area_id)
@@ -2624,227 +2671,323 @@ class CircadianLightPrimitives:
 
         return None
 
-    async def check_auto_schedules(self):
-        """Check and fire any due auto-on or auto-off schedules.
+    def _build_auto_schedule(self, now: datetime) -> List[AutoScheduleEntry]:
+        """Compile today's auto-on/auto-off firing table.
 
-        Called every second from the fast tick loop.
+        Resolves every enabled schedule once (including sunrise/sunset
+        lookups and per-area overrides) and returns the entries sorted by
+        fire time. Schedules that don't fire today are left out.
         """
-        from datetime import date
-
-        try:
-            config = glozone.get_config()
-        except Exception:
-            return
-
+        config = glozone.get_config() or {}
         area_settings = config.get("area_settings", {})
-        now = datetime.now()
-        current_hour = now.hour + now.minute / 60.0 + now.second / 3600.0
         current_weekday = now.weekday()
-        today_str = date.today().isoformat()
 
+        entries: List[AutoScheduleEntry] = []
         for area_id, settings in area_settings.items():
-            # Check auto_on
-            if settings.get("auto_on_enabled"):
+            for prefix in ("auto_on", "auto_off"):
+                if not settings.get(f"{prefix}_enabled"):
+                    continue
                 trigger_time = self._resolve_auto_time(
-                    settings, "auto_on", current_weekday
+                    settings, prefix, current_weekday
                 )
-                if trigger_time is not None and current_hour >= trigger_time:
-                    # Check if already fired today at this time
-                    fired = self._auto_fired.get(area_id, {}).get("auto_on", {})
-                    if (
-                        fired.get("date") == today_str
-                        and fired.get("time") == trigger_time
-                    ):
-                        pass  # Already fired
-                    else:
-                        # Trigger mode check
-                        skip = False
-                        trigger_mode = settings.get("auto_on_trigger_mode", "always")
-                        # Backward compat: old boolean overrides if new field absent
-                        if trigger_mode == "always" and settings.get(
-                            "auto_on_skip_if_brighter", False
-                        ):
-                            trigger_mode = "skip_brighter"
-
-                        if trigger_mode == "skip_on":
-                            if state.is_circadian(area_id) and state.get_is_on(area_id):
-                                skip = True
-                                logger.info(
-                                    f"[auto_on] Skipping {area_id}: already on (skip_on mode)"
-                                )
-                        elif trigger_mode == "skip_brighter":
-                            if state.is_circadian(area_id) and state.get_is_on(area_id):
-                                current_bri = state.get_area(area_id).get(
-                                    "last_sent_brightness"
-                                )
-                                if current_bri is not None:
-                                    area_config = self._get_config(area_id)
-                                    area_state = self._get_area_state(area_id)
-                                    result = CircadianLight.calculate_lighting(
-                                        current_hour, area_config, area_state
-                                    )
-                                    if current_bri > result.brightness:
-                                        skip = True
-                                        logger.info(
-                                            f"[auto_on] Skipping {area_id}: current {current_bri}% > target {result.brightness}%"
-                                        )
-
-                        if not skip:
-                            fade_minutes = settings.get("auto_on_fade", 0)
-                            light_preset = settings.get("auto_on_light", "circadian")
-                            if fade_minutes > 0:
-                                # Capture current state BEFORE any changes.
-                                # If lights are off, start from 0/warm (not stale last_sent).
-                                is_currently_on = state.is_circadian(
-                                    area_id
-                                ) and state.get_is_on(area_id)
-                                if is_currently_on:
-                                    start_bri = (
-                                        state.get_last_sent_brightness(area_id) or 0
-                                    )
-                                    start_kelvin = (
-                                        state.get_last_sent_kelvin(area_id) or 2000
-                                    )
-                                else:
-                                    start_bri = 0
-                                    start_kelvin = 2000
-                                # Enable circadian + is_on (but DON'T set target preset state
-                                # — that happens at fade completion for clean cancel behavior)
-                                state.enable_circadian_and_set_on(area_id, True)
-                                state.set_fade(
-                                    area_id,
-                                    "in",
-                                    fade_minutes * 60,
-                                    target_preset=light_preset,
-                                    start_brightness=start_bri,
-                                    start_kelvin=start_kelvin,
-                                )
-                                # Send initial fade command immediately (don't wait for tick)
-                                await self.client.update_lights_in_circadian_mode(
-                                    area_id,
-                                    log_periodic=True,
-                                    periodic_transition=5.0,
-                                )
-                                logger.info(
-                                    f"[auto_on] Starting {fade_minutes}min fade-in for {area_id} ({light_preset})"
-                                )
-                            else:
-                                if light_preset in ("nitelite", "britelite"):
-                                    await self.set(
-                                        area_id,
-                                        source="auto_on",
-                                        preset=light_preset,
-                                        is_on=True,
-                                    )
-                                else:
-                                    await self.glo_reset(area_id, source="auto_on")
-                                    await self.lights_on(area_id, source="auto_on")
-                                logger.info(
-                                    f"[auto_on] Fired for {area_id} ({light_preset})"
-                                )
+                if trigger_time is None:
+                    continue
+                if prefix == "auto_on":
+                    preset = settings.get("auto_on_light", "circadian")
+                else:
+                    preset = "off"
+                entries.append(
+                    AutoScheduleEntry(
+                        fire_time=trigger_time,
+                        area_id=area_id,
+                        kind=prefix,
+                        fade=settings.get(f"{prefix}_fade", 0),
+                        preset=preset,
+                    )
+                )
+        # Stable sort: same-time entries keep area order, auto_on before auto_off
+        entries.sort(key=lambda e: e.fire_time)
+        return entries
 
-                        # Mark as fired (even if skipped)
-                        if area_id not in self._auto_fired:
-                            self._auto_fired[area_id] = {}
-                        self._auto_fired[area_id]["auto_on"] = {
-                            "date": today_str,
-                            "time": trigger_time,
-                        }
-                        self._save_auto_fired()
+    def _get_auto_schedule(self, now: datetime) -> List[AutoScheduleEntry]:
+        """Return today's firing table, rebuilding it when stale.
 
-            # Check auto_off
-            if settings.get("auto_off_enabled"):
-                trigger_time = self._resolve_auto_time(
-                    settings, "auto_off", current_weekday
+        Rebuilt at date rollover and on any config version bump (area
+        settings saves and auto overrides go through glozone.set_config).
+        While sun times are still fallback defaults, sunrise/sunset
+        schedules are left out and the table is retried every minute.
+        """
+        key = (now.date(), glozone.get_config_version())
+        mono = time.monotonic()
+        if key != self._auto_table_key or (
+            self._auto_table_retry_at is not None and mono >= self._auto_table_retry_at
+        ):
+            self._auto_table = self._build_auto_schedule(now)
+            self._auto_table_key = key
+            self._auto_table_next = 0
+            self._auto_table_retry_at = (
+                mono + AUTO_SCHEDULE_RETRY_SECONDS
+                if self._auto_schedule_sun_pending()
+                else None
+            )
+            logger.debug(
+                f"[auto] Compiled {len(self._auto_table)} schedule(s) for {now.date()}"
+            )
+        return self._auto_table
+
+    def _auto_schedule_sun_pending(self) -> bool:
+        """Whether sun-based schedules may be missing because sun times are fallback."""
+        config = glozone.get_config() or {}
+        uses_sun = any(
+            settings.get(f"{prefix}_enabled")
+            and settings.get(f"{prefix}_source", "sunrise") in ("sunrise", "sunset")
+            for settings in config.get("area_settings", {}).values()
+            for prefix in ("auto_on", "auto_off")
+        )
+        if not uses_sun or not hasattr(self.client, "_get_sun_times"):
+            return False
+        sun_times = self.client._get_sun_times()
+        return sun_times is None or getattr(sun_times, "is_fallback", False)
+
+    async def check_auto_schedules(self, now: Optional[datetime] = None):
+        """Check and fire any due auto-on or auto-off schedules.
+
+        Called every second from the fast tick loop. Schedules come from a
+        firing table compiled once per day / config change, so a tick with
+        nothing due is a single comparison against the next entry.
+
+        Args:
+            now: Current local time (defaults to datetime.now(); for tests)
+        """
+        if glozone.get_config() is None:
+            return
+
+        now = now or datetime.now()
+        table = self._get_auto_schedule(now)
+        if self._auto_table_next >= len(table):
+            return
+        current_hour = now.hour + now.minute / 60.0 + now.second / 3600.0
+        if current_hour < table[self._auto_table_next].fire_time:
+            return
+
+        area_settings = glozone.get_config().get("area_settings", {})
+        today_str = now.date().isoformat()
+        while (
+            self._auto_table is table
+            and self._auto_table_next < len(table)
+            and current_hour >= table[self._auto_table_next].fire_time
+        ):
+            entry = table[self._auto_table_next]
+
+            # Check if already fired today at this time
+            fired = self._auto_fired.get(entry.area_id, {}).get(entry.kind, {})
+            if not (
+                fired.get("date") == today_str
+                and fired.get("time") == entry.fire_time
+            ):
+                settings = area_settings.get(entry.area_id, {})
+                if entry.kind == "auto_on":
+                    await self._fire_auto_on(entry, settings, current_hour, today_str)
+                else:
+                    await self._fire_auto_off(entry, settings, today_str)
+
+            # Advance only after firing, so an error retries on the next tick
+            if self._auto_table is table:
+                self._auto_table_next += 1
+
+    async def _fire_auto_on(
+        self,
+        entry: AutoScheduleEntry,
+        settings: dict,
+        current_hour: float,
+        today_str: str,
+    ):
+        """Fire one due auto-on entry (honoring its trigger mode)."""
+        area_id = entry.area_id
+        trigger_time = entry.fire_time
+
+        # Trigger mode check
+        skip = False
+        trigger_mode = settings.get("auto_on_trigger_mode", "always")
+        # Backward compat: old boolean overrides if new field absent
+        if trigger_mode == "always" and settings.get(
+            "auto_on_skip_if_brighter", False
+        ):
+            trigger_mode = "skip_brighter"
+
+        if trigger_mode == "skip_on":
+            if state.is_circadian(area_id) and state.get_is_on(area_id):
+                skip = True
+                logger.info(
+                    f"[auto_on] Skipping {area_id}: already on (skip_on mode)"
                 )
-                if trigger_time is not None and current_hour >= trigger_time:
-                    fired = self._auto_fired.get(area_id, {}).get("auto_off", {})
-                    if (
-                        fired.get("date") == today_str
-                        and fired.get("time") == trigger_time
-                    ):
-                        pass  # Already fired
-                    else:
-                        # "Only if untouched" check — auto-off only fires if
-                        # lights haven't been touched since the last auto-on
-                        if settings.get("auto_off_only_untouched", False):
-                            auto_on_fired = self._auto_fired.get(area_id, {}).get(
-                                "auto_on", {}
-                            )
-                            auto_on_date = auto_on_fired.get("date")
-
-                            should_skip = False
-                            if not auto_on_date:
-                                # Auto-on has never fired — no valid trigger
-                                logger.info(
-                                    f"[auto_off] Skipping {area_id}: untouched guard active "
-                                    f"but auto_on has never fired"
-                                )
-                                should_skip = True
-                            else:
-                                last_action = state.get_last_user_action(area_id)
-                                if last_action:
-                                    try:
-                                        from datetime import datetime as dt_cls
-
-                                        action_dt = dt_cls.fromisoformat(last_action)
-                                        auto_on_time = auto_on_fired.get("time", 0)
-                                        auto_on_h = int(auto_on_time)
-                                        auto_on_m = int((auto_on_time - auto_on_h) * 60)
-                                        auto_on_dt = dt_cls.fromisoformat(
-                                            f"{auto_on_date}T{auto_on_h:02d}:{auto_on_m:02d}:00"
-                                        )
-                                        if action_dt > auto_on_dt:
-                                            logger.info(
-                                                f"[auto_off] Skipping {area_id}: user action at "
-                                                f"{last_action} after auto_on at {auto_on_date} {auto_on_time}"
-                                            )
-                                            should_skip = True
-                                    except Exception:
-                                        pass  # On parse error, don't skip
-
-                            if should_skip:
-                                if area_id not in self._auto_fired:
-                                    self._auto_fired[area_id] = {}
-                                self._auto_fired[area_id]["auto_off"] = {
-                                    "date": today_str,
-                                    "time": trigger_time,
-                                }
-                                self._save_auto_fired()
-                                continue
-
-                        fade_minutes = settings.get("auto_off_fade", 0)
-                        if fade_minutes > 0:
-                            start_bri = state.get_last_sent_brightness(area_id) or 50
-                            start_kelvin = state.get_last_sent_kelvin(area_id) or 2700
-                            state.set_fade(
-                                area_id,
-                                "out",
-                                fade_minutes * 60,
-                                target_preset="off",
-                                start_brightness=start_bri,
-                                start_kelvin=start_kelvin,
-                            )
-                            # Send initial fade command immediately
-                            await self.client.update_lights_in_circadian_mode(
-                                area_id,
-                                log_periodic=True,
-                                periodic_transition=5.0,
-                            )
+        elif trigger_mode == "skip_brighter":
+            if state.is_circadian(area_id) and state.get_is_on(area_id):
+                current_bri = state.get_area(area_id).get(
+                    "last_sent_brightness"
+                )
+                if current_bri is not None:
+                    area_config = self._get_config(area_id)
+                    area_state = self._get_area_state(area_id)
+                    result = CircadianLight.calculate_lighting(
+                        current_hour, area_config, area_state
+                    )
+                    if current_bri > result.brightness:
+                        skip = True
+                        logger.info(
+                            f"[auto_on] Skipping {area_id}: current {current_bri}% > target {result.brightness}%"
+                        )
+
+        if not skip:
+            fade_minutes = entry.fade
+            light_preset = entry.preset
+            if fade_minutes > 0:
+                # Capture current state BEFORE any changes.
+                # If lights are off, start from 0/warm (not stale last_sent).
+                is_currently_on = state.is_circadian(
+                    area_id
+                ) and state.get_is_on(area_id)
+                if is_currently_on:
+                    start_bri = (
+                        state.get_last_sent_brightness(area_id) or 0
+                    )
+                    start_kelvin = (
+                        state.get_last_sent_kelvin(area_id) or 2000
+                    )
+                else:
+                    start_bri = 0
+                    start_kelvin = 2000
+                # Enable circadian + is_on (but DON'T set target preset state
+                # — that happens at fade completion for clean cancel behavior)
+                state.enable_circadian_and_set_on(area_id, True)
+                state.set_fade(
+                    area_id,
+                    "in",
+                    fade_minutes * 60,
+                    target_preset=light_preset,
+                    start_brightness=start_bri,
+                    start_kelvin=start_kelvin,
+                )
+                # Send initial fade command immediately (don't wait for tick)
+                await self.client.update_lights_in_circadian_mode(
+                    area_id,
+                    log_periodic=True,
+                    periodic_transition=5.0,
+                )
+                logger.info(
+                    f"[auto_on] Starting {fade_minutes}min fade-in for {area_id} ({light_preset})"
+                )
+            else:
+                if light_preset in ("nitelite", "britelite"):
+                    await self.set(
+                        area_id,
+                        source="auto_on",
+                        preset=light_preset,
+                        is_on=True,
+                    )
+                else:
+                    await self.glo_reset(area_id, source="auto_on")
+                    await self.lights_on(area_id, source="auto_on")
+                logger.info(
+                    f"[auto_on] Fired for {area_id} ({light_preset})"
+                )
+
+        # Mark as fired (even if skipped)
+        if area_id not in self._auto_fired:
+            self._auto_fired[area_id] = {}
+        self._auto_fired[area_id]["auto_on"] = {
+            "date": today_str,
+            "time": trigger_time,
+        }
+        self._save_auto_fired()
+
+    async def _fire_auto_off(
+        self, entry: AutoScheduleEntry, settings: dict, today_str: str
+    ):
+        """Fire one due auto-off entry (honoring the untouched guard)."""
+        area_id = entry.area_id
+        trigger_time = entry.fire_time
+
+        # "Only if untouched" check — auto-off only fires if
+        # lights haven't been touched since the last auto-on
+        if settings.get("auto_off_only_untouched", False):
+            auto_on_fired = self._auto_fired.get(area_id, {}).get(
+                "auto_on", {}
+            )
+            auto_on_date = auto_on_fired.get("date")
+
+            should_skip = False
+            if not auto_on_date:
+                # Auto-on has never fired — no valid trigger
+                logger.info(
+                    f"[auto_off] Skipping {area_id}: untouched guard active "
+                    f"but auto_on has never fired"
+                )
+                should_skip = True
+            else:
+                last_action = state.get_last_user_action(area_id)
+                if last_action:
+                    try:
+                        from datetime import datetime as dt_cls
+
+                        action_dt = dt_cls.fromisoformat(last_action)
+                        auto_on_time = auto_on_fired.get("time", 0)
+                        auto_on_h = int(auto_on_time)
+                        auto_on_m = int((auto_on_time - auto_on_h) * 60)
+                        auto_on_dt = dt_cls.fromisoformat(
+                            f"{auto_on_date}T{auto_on_h:02d}:{auto_on_m:02d}:00"
+                        )
+                        if action_dt > auto_on_dt:
                             logger.info(
-                                f"[auto_off] Starting {fade_minutes}min fade-out for {area_id}"
+                                f"[auto_off] Skipping {area_id}: user action at "
+                                f"{last_action} after auto_on at {auto_on_date} {auto_on_time}"
                             )
-                        else:
-                            await self.lights_off(area_id, source="auto_off")
-                            logger.info(f"[auto_off] Fired for {area_id}")
+                            should_skip = True
+                    except Exception:
+                        pass  # On parse error, don't skip
+
+            if should_skip:
+                if area_id not in self._auto_fired:
+                    self._auto_fired[area_id] = {}
+                self._auto_fired[area_id]["auto_off"] = {
+                    "date": today_str,
+                    "time": trigger_time,
+                }
+                self._save_auto_fired()
+                return
 
-                        if area_id not in self._auto_fired:
-                            self._auto_fired[area_id] = {}
-                        self._auto_fired[area_id]["auto_off"] = {
-                            "date": today_str,
-                            "time": trigger_time,
-                        }
-                        self._save_auto_fired()
+        fade_minutes = entry.fade
+        if fade_minutes > 0:
+            start_bri = state.get_last_sent_brightness(area_id) or 50
+            start_kelvin = state.get_last_sent_kelvin(area_id) or 2700
+            state.set_fade(
+                area_id,
+                "out",
+                fade_minutes * 60,
+                target_preset="off",
+                start_brightness=start_bri,
+                start_kelvin=start_kelvin,
+            )
+            # Send initial fade command immediately
+            await self.client.update_lights_in_circadian_mode(
+                area_id,
+                log_periodic=True,
+                periodic_transition=5.0,
+            )
+            logger.info(
+                f"[auto_off] Starting {fade_minutes}min fade-out for {area_id}"
+            )
+        else:
+            await self.lights_off(area_id, source="auto_off")
+            logger.info(f"[auto_off] Fired for {area_id}")
+
+        if area_id not in self._auto_fired:
+            self._auto_fired[area_id] = {}
+        self._auto_fired[area_id]["auto_off"] = {
+            "date": today_str,
+            "time": trigger_time,
+        }
+        self._save_auto_fired()
 
     def clear_auto_fired(self):
         """Clear auto schedule fired tracking (called at phase change).
@@ -3046,14 +3189,17 @@ class CircadianLightPrimitives:
             f"(progress={progress:.0%}, target={target_preset})"
         )
 
-    async def check_fade_completions(self):
+    async def check_fade_completions(self, areas: Optional[List[str]] = None):
         """Check for completed fades and finalize them.
 
         On completion, applies the target preset state for real (the fade
         was running with synthetic target computation, not modifying actual
         state). This is the atomic state transition.
+
+        Args:
+            areas: Areas whose fade deadline fired (None = all fading areas)
         """
-        for area_id in list(state.get_all_areas().keys()):
+        for area_id in list(state.get_fading_areas() if areas is None else areas):
             if not state.is_fading(area_id):
                 continue
             progress = state.get_fade_progress(area_id)
@@ -3093,24 +3239,29 @@ class CircadianLightPrimitives:
             Tuple of (warning_time_seconds, blink_threshold_percent)
         """
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             warning_time = raw_config.get("motion_warning_time", 20)
             blink_threshold = raw_config.get("motion_blink_threshold", 15)
             return (warning_time, blink_threshold)
         except Exception:
             return (20, 15)  # Defaults: 20s warning, 15%
 
-    async def check_motion_warnings(self, log_periodic: bool = False):
+    async def check_motion_warnings(
+        self, log_periodic: bool = False, areas: Optional[List[str]] = None
+    ):
         """Check for areas that need motion warnings and trigger them.
 
-        Called every second from the fast tick loop.
+        Called from the deadline loop with the areas whose warning is due;
+        with areas=None, scans all areas.
         """
         warning_time, blink_threshold = self._get_motion_warning_config()
 
         if warning_time <= 0:
             return  # Warnings disabled
 
-        needs_warning = state.get_areas_needing_warning(warning_time)
+        needs_warning = (
+            state.get_areas_needing_warning(warning_time) if areas is None else areas
+        )
         for area_id in needs_warning:
             await self.trigger_motion_warning(area_id, blink_threshold)
 
@@ -3577,7 +3728,7 @@ class CircadianLightPrimitives:
             area_id: The area ID
             source: Source of the action
         """
-        from brain import inverse_midpoint, _converge_override
+        from brain import inverse_midpoint, solve_color_override
 
         frozen_at = state.get_frozen_at(area_id)
         if frozen_at is None:
@@ -3665,11 +3816,14 @@ class CircadianLightPrimitives:
                     sun_times=sun_times,
                 )
 
-            override = _converge_override(
+            override = solve_color_override(
                 frozen_rendered,
                 current_rendered,
                 tolerance,
                 _render_unfreeze,
+                current_hour,
+                config,
+                sun_times,
             )
             if override is not None:
                 state.update_area(area_id, {"color_override": override})
@@ -3978,9 +4132,13 @@ class CircadianLightPrimitives:
             # Apply lighting if the target area is circadian and is_on
             if state.is_circadian(target_area_id) and state.get_is_on(target_area_id):
                 affected_areas.append(target_area_id)
-                if send_command:
-                    await self.client.update_lights_in_circadian_mode(target_area_id)
-                    logger.debug(f"Triggered lighting update for {target_area_id}")
+
+        if send_command and affected_areas:
+            # One pipeline batch for the zone (same path as the switch action)
+            await self.client._send_via_batch_or_fallback(
+                affected_areas, [True for _ in affected_areas]
+            )
+            logger.debug(f"Triggered lighting update for {affected_areas}")
 
         logger.info(
             f"glozone_down complete: synced {len(zone_areas)} area(s) in zone '{zone_name}'"
@@ -4284,7 +4442,7 @@ class CircadianLightPrimitives:
         candidate_batches.sort(key=lambda x: len(x.areas), reverse=True)
 
         # 2-step config
-        raw_cfg = glozone.load_config_from_files()
+        raw_cfg = glozone.get_config_snapshot()
         ct_threshold = raw_cfg.get("two_step_ct_threshold", 200)
         bri_delta_threshold = raw_cfg.get("two_step_bri_threshold", 15)
         # CT brightness compensation config — used in phase 1 to preserve
@@ -4451,7 +4609,11 @@ class CircadianLightPrimitives:
                     sdata["color_temp_kelvin"] = max(2000, cmd["ct"])
             wave1.append(
                 self.client.call_service(
-                    "light", "turn_on", sdata, {"entity_id": cmd["entity_id"]}
+                    "light",
+                    "turn_on",
+                    sdata,
+                    {"entity_id": cmd["entity_id"]},
+                    barrier=True,
                 )
             )
 
@@ -4656,7 +4818,9 @@ class CircadianLightPrimitives:
                 if phase1_xy:
                     sdata["xy_color"] = phase1_xy
                 phase1_tasks.append(
-                    self.client.call_service("light", "turn_on", sdata, target=target)
+                    self.client.call_service(
+                        "light", "turn_on", sdata, target=target, barrier=True
+                    )
                 )
             await asyncio.gather(*phase1_tasks)
             await asyncio.sleep(limit_speed + two_step_delay)
@@ -4798,6 +4962,7 @@ class CircadianLightPrimitives:
                         "turn_on",
                         sdata,
                         target=target,
+                        barrier=True,
                     )
                 await asyncio.sleep(speed + two_step_delay)
 
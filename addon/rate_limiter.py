@@ -0,0 +1,213 @@
+"""Priority-aware token bucket for light commands sent to the coordinator.
+
+The periodic tick, fades, motion handlers, switch feedback cues and
+multi-area batches all fire light commands concurrently, and a burst of
+15+ in under a second is enough to overwhelm the ZigBee coordinator (see
+the sensor grace period in subscribe_events). With rate_limit_enabled,
+every light call_service first takes a token from a bucket refilled at
+rate_limit_per_second, holding up to rate_limit_burst.
+
+When the bucket is empty, commands wait in one queue per priority class
+and are released most urgent first, so periodic traffic yields to button
+presses:
+
+    user > motion > fade > periodic
+
+The class comes from the calling context: code paths mark themselves with
+priority()/set_priority() (a ContextVar, so tasks spawned from there
+inherit it); anything unmarked - switch handlers, the web UI - is "user".
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+import perf
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("user", "motion", "fade", "periodic")  # Most urgent first
+DEFAULT_PRIORITY = "user"
+DEFAULT_RATE = 10.0  # Commands per second
+DEFAULT_BURST = 10  # Commands sent back-to-back before pacing starts
+
+_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "light_command_priority", default=DEFAULT_PRIORITY
+)
+
+
+def current_priority() -> str:
+    """Priority class of the running context."""
+    return _priority.get()
+
+
+def set_priority(name: str) -> contextvars.Token:
+    """Mark the running context (and tasks it spawns) with a priority class."""
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority class: {name}")
+    return _priority.set(name)
+
+
+def reset_priority(token: contextvars.Token) -> None:
+    """Undo a set_priority()."""
+    _priority.reset(token)
+
+
+@contextlib.contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run a block with the given priority class."""
+    token = set_priority(name)
+    try:
+        yield
+    finally:
+        reset_priority(token)
+
+
+def more_urgent(a: str, b: str) -> str:
+    """The more urgent of two priority classes."""
+    return a if PRIORITIES.index(a) <= PRIORITIES.index(b) else b
+
+
+class RateLimiter:
+    """Token bucket with per-priority wait queues."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.enabled = False
+        self.rate = DEFAULT_RATE
+        self.burst = DEFAULT_BURST
+        self.configure(rate, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._queues: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {
+            name: deque() for name in PRIORITIES
+        }
+        self._release_handle: Optional[asyncio.TimerHandle] = None
+        self._stats = {name: _ClassStats(name) for name in PRIORITIES}
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Set the refill rate (per second) and bucket size (min 1 each)."""
+        try:
+            rate, burst = max(1.0, float(rate)), max(1, int(burst))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid rate limit ({rate}/s, burst {burst}); keeping previous")
+            return
+        self.rate, self.burst = rate, burst
+
+    async def acquire(self, name: Optional[str] = None) -> None:
+        """Wait for a token. Returns at once when the limiter is disabled.
+
+        Args:
+            name: Priority class (default: the calling context's)
+        """
+        if not self.enabled:
+            return
+        name = name or current_priority()
+        stats = self._stats[name]
+        self._refill()
+        if self._tokens >= 1 and not self._waiting():
+            self._tokens -= 1
+            stats.record(0.0)
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues[name]
+        queue.append((future, time.monotonic()))
+        stats.max_depth = max(stats.max_depth, len(queue))
+        self._schedule_release(loop)
+        try:
+            await future  # A cancelled waiter is skipped by _release()
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._tokens += 1  # Granted, but cancelled before it could run
+            raise
+
+    def _waiting(self) -> bool:
+        return any(self._queues.values())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _schedule_release(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._release_handle is not None:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._release_handle = loop.call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Hand tokens to waiters, most urgent class first."""
+        self._release_handle = None
+        self._refill()
+        now = time.monotonic()
+        for name in PRIORITIES:
+            queue = self._queues[name]
+            while queue and self._tokens >= 1:
+                future, queued_at = queue.popleft()
+                if future.done():
+                    continue  # Waiter was cancelled
+                future.set_result(None)
+                self._tokens -= 1
+                self._stats[name].record(now - queued_at)
+        if self._waiting():
+            self._schedule_release(asyncio.get_running_loop())
+
+    def clear(self) -> None:
+        """Release every waiter at once (on disconnect their sends fail fast)."""
+        if self._release_handle is not None:
+            self._release_handle.cancel()
+            self._release_handle = None
+        for queue in self._queues.values():
+            while queue:
+                future, _ = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bucket settings plus per-class queue depth and wait times."""
+        return {
+            "enabled": self.enabled,
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "classes": {
+                name: self._stats[name].as_dict(len(self._queues[name]))
+                for name in PRIORITIES
+            },
+        }
+
+
+class _ClassStats:
+    """Wait-time counters for one priority class."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.sent = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.max_depth = 0
+
+    def record(self, waited: float) -> None:
+        self.sent += 1
+        if waited > 0:
+            self.delayed += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        if perf.enabled:
+            perf.record(f"rate_limit.wait.{self.name}", waited)
+
+    def as_dict(self, queued: int) -> Dict[str, Any]:
+        return {
+            "queued": queued,
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "delayed": self.delayed,
+            "avg_wait_ms": round(self.wait_seconds * 1000 / (self.sent or 1), 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+        }
@@ -6,70 +6,170 @@ config through button presses (step up/down, bright up/down, etc.).
 
 State is:
 - Loaded from JSON at startup
-- Held in memory for fast access
-- Written to JSON immediately after changes
+- Held in memory as one slotted AreaRuntime record per area (reads don't
+  allocate); plain dicts only exist at the JSON boundary and in get_area()
+- Written to JSON write-behind: mutations mark the state dirty and one atomic
+  snapshot is flushed per debounce window (see flush() / set_flush_delay())
 - Reset on phase changes (ascend/descend) and on config save
 """
 
+import asyncio
+import heapq
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# In-memory state dict
-_state: Dict[str, Dict[str, Any]] = {}
+# In-memory state: area_id -> AreaRuntime
+_state: Dict[str, "AreaRuntime"] = {}
 
 # Path to state file (set during init)
 _state_file_path: Optional[str] = None
 
+# Write-behind persistence: mutations set _dirty and arm a single timer;
+# the timer writes one snapshot for every mutation in the window.
+DEFAULT_FLUSH_DELAY = 1.0
+MIN_FLUSH_DELAY = 0.25
+MAX_FLUSH_DELAY = 2.0
+_flush_delay: float = DEFAULT_FLUSH_DELAY
+_flush_handle: Optional[asyncio.TimerHandle] = None
+_dirty: bool = False
+_persist_stats: Dict[str, int] = {"writes": 0, "writes_avoided": 0}
 
-def _get_default_area_state() -> Dict[str, Any]:
-    """Return default state for a new area.
+
+class AreaRuntime:
+    """Runtime state for one area.
 
     Only one phase (Ascend/Descend) is active at a time, so we only need
     one midpoint per axis rather than separate wake/bed values.
+
+    Keys that aren't fields (e.g. dim_factor, legacy keys from older state
+    files) live in ``extra`` so they round-trip through JSON unchanged. The
+    dict-style get()/[]/update() let existing dict-based code read records
+    directly.
     """
-    return {
-        "is_circadian": False,  # Whether Circadian Light controls this area
-        "is_on": False,  # Target light power state (only meaningful when is_circadian is True)
+
+    __slots__ = (
+        "is_circadian",
+        "is_on",
+        "frozen_at",
+        "brightness_mid",
+        "color_mid",
+        "color_override",
+        "brightness_override",
+        "brightness_override_set_at",
+        "color_override_set_at",
+        "last_sent_kelvin",
+        "last_sent_brightness",
+        "boost_started_from_off",
+        "boost_expires_at",
+        "boost_brightness",
+        "motion_expires_at",
+        "motion_warning_at",
+        "motion_pre_warning_brightness",
+        "off_enforced",
+        "off_confirm_count",
+        "fade_start",
+        "fade_duration",
+        "fade_direction",
+        "fade_target_preset",
+        "fade_start_brightness",
+        "fade_start_kelvin",
+        "last_user_action_at",
+        "extra",
+    )
+
+    def __init__(self) -> None:
+        self.is_circadian: bool = False  # Whether Circadian Light controls this area
+        self.is_on: bool = False  # Target light power state (only meaningful when is_circadian is True)
         # frozen_at: None = unfrozen, float = frozen at that hour (0-24)
-        "frozen_at": None,
+        self.frozen_at: Optional[float] = None
         # Midpoints (None = use config wake_time/bed_time based on phase)
-        "brightness_mid": None,
-        "color_mid": None,
+        self.brightness_mid: Optional[float] = None
+        self.color_mid: Optional[float] = None
         # Solar rule target offset (Kelvin) from color stepping/slider
-        "color_override": None,
+        self.color_override: Optional[float] = None
         # Per-axis overrides with time-based decay (additive deltas)
-        "brightness_override": None,  # Brightness delta in % points
-        "brightness_override_set_at": None,  # Hour when set (for decay calc)
-        "color_override_set_at": None,  # Hour when color override set (for decay)
+        self.brightness_override: Optional[float] = None  # Brightness delta in % points
+        self.brightness_override_set_at: Optional[float] = None  # Hour when set (for decay calc)
+        self.color_override_set_at: Optional[float] = None  # Hour when color override set (for decay)
         # Last-sent values (for 2-step detection and state tracking)
-        "last_sent_kelvin": None,  # Kelvin we last sent (persists through on/off)
-        "last_sent_brightness": None,  # Area-level brightness % (post curve+boost+sun_bright+area_factor+override, pre-filter)
+        self.last_sent_kelvin: Optional[int] = None  # Kelvin we last sent (persists through on/off)
+        self.last_sent_brightness: Optional[int] = None  # Area-level brightness % (post curve+boost+sun_bright+area_factor+override, pre-filter)
         # Boost state
-        "boost_started_from_off": False,  # If true, turn off when boost ends; else restore circadian
-        "boost_expires_at": None,  # ISO timestamp string when boost expires (None = not boosted, 0 = forever)
-        "boost_brightness": None,  # Current boost brightness percentage (None = not boosted)
+        self.boost_started_from_off: bool = False  # If true, turn off when boost ends; else restore circadian
+        self.boost_expires_at: Optional[str] = None  # ISO timestamp string when boost expires (None = not boosted, 0 = forever)
+        self.boost_brightness: Optional[int] = None  # Current boost brightness percentage (None = not boosted)
         # Motion on_off state (on_only has no timer, so doesn't need state)
-        "motion_expires_at": None,  # ISO timestamp when on_off motion timer expires (None = not from motion)
+        self.motion_expires_at: Optional[str] = None  # ISO timestamp when on_off motion timer expires (None = not from motion)
         # Motion warning state
-        "motion_warning_at": None,  # ISO timestamp when warning was triggered (None = not warned)
-        "motion_pre_warning_brightness": None,  # Brightness % before warning (to restore if motion detected)
+        self.motion_warning_at: Optional[str] = None  # ISO timestamp when warning was triggered (None = not warned)
+        self.motion_pre_warning_brightness: Optional[int] = None  # Brightness % before warning (to restore if motion detected)
         # Off enforcement (periodic loop optimization)
-        "off_enforced": False,  # True once we've verified all lights are off; skip re-sending off commands
-        "off_confirm_count": 0,  # Counter for consecutive off confirmations before setting off_enforced
+        self.off_enforced: bool = False  # True once we've verified all lights are off; skip re-sending off commands
+        self.off_confirm_count: int = 0  # Counter for consecutive off confirmations before setting off_enforced
         # Fade state (smooth transitions between any lighting states)
-        "fade_start": None,  # ISO timestamp when fade began
-        "fade_duration": None,  # Duration in seconds
-        "fade_direction": None,  # "in" or "out"
-        "fade_target_preset": None,  # "circadian", "nitelite", "britelite", or "off"
-        "fade_start_brightness": None,  # Brightness % at fade start (0 if off)
-        "fade_start_kelvin": None,  # Kelvin at fade start (warm default if off)
+        self.fade_start: Optional[str] = None  # ISO timestamp when fade began
+        self.fade_duration: Optional[float] = None  # Duration in seconds
+        self.fade_direction: Optional[str] = None  # "in" or "out"
+        self.fade_target_preset: Optional[str] = None  # "circadian", "nitelite", "britelite", or "off"
+        self.fade_start_brightness: Optional[int] = None  # Brightness % at fade start (0 if off)
+        self.fade_start_kelvin: Optional[int] = None  # Kelvin at fade start (warm default if off)
         # User interaction tracking (for auto-off "only if untouched" guard)
-        "last_user_action_at": None,  # ISO timestamp of last user-initiated action
-    }
+        self.last_user_action_at: Optional[str] = None  # ISO timestamp of last user-initiated action
+        # Non-field keys (dim_factor, legacy keys) preserved for round-tripping
+        self.extra: Dict[str, Any] = {}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "AreaRuntime":
+        """Build a record from a stored dict (missing keys get defaults)."""
+        record = cls()
+        record.update(d)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict (all fields plus extra keys) for JSON/compat."""
+        d = {name: getattr(self, name) for name in _AREA_FIELDS}
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _AREA_FIELD_SET:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _AREA_FIELD_SET:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _AREA_FIELD_SET:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def update(self, updates: Dict[str, Any]) -> None:
+        for key, value in updates.items():
+            self[key] = value
+
+
+_AREA_FIELDS = tuple(name for name in AreaRuntime.__slots__ if name != "extra")
+_AREA_FIELD_SET = frozenset(_AREA_FIELDS)
+
+# Returned by get_area_record() for unknown areas. Never mutated.
+_DEFAULT_RECORD = AreaRuntime()
+
+
+def _get_default_area_state() -> Dict[str, Any]:
+    """Return default state for a new area as a plain dict."""
+    return AreaRuntime().to_dict()
 
 
 def _get_data_directory() -> str:
@@ -95,7 +195,11 @@ def init(state_file: Optional[str] = None) -> None:
     Args:
         state_file: Optional path to state file. If not provided, uses default location.
     """
-    global _state_file_path, _state
+    global _state_file_path, _state, _dirty
+
+    # Don't lose pending writes for a previous file, then start clean
+    flush()
+    _dirty = False
 
     if state_file:
         _state_file_path = state_file
@@ -110,7 +214,11 @@ def init(state_file: Optional[str] = None) -> None:
                 data = json.load(f)
 
             if isinstance(data, dict) and "areas" in data:
-                _state = data.get("areas", {})
+                _state = {
+                    area_id: AreaRuntime.from_dict(area)
+                    for area_id, area in data.get("areas", {}).items()
+                    if isinstance(area, dict)
+                }
                 logger.info(f"Loaded state for {len(_state)} area(s) from {_state_file_path}")
             else:
                 logger.warning(f"Invalid state file format at {_state_file_path}, starting fresh")
@@ -120,24 +228,128 @@ def init(state_file: Optional[str] = None) -> None:
     else:
         logger.info(f"No state file found at {_state_file_path}, starting fresh")
 
+    # Rebuild timer deadlines for anything that survived the restart
+    _deadline_heap.clear()
+    _warning_heap.clear()
+    _fading_areas.clear()
+    for area_id in _state:
+        _schedule_area_deadlines(area_id)
+
 
 def _save() -> None:
-    """Save current state to disk."""
+    """Mark state dirty and schedule a write-behind flush.
+
+    Inside a running event loop the write is deferred by the flush delay so a
+    burst of mutations (e.g. one periodic tick over every area) costs a single
+    file write. Outside an event loop (startup, tests, scripts) the write
+    happens immediately.
+    """
+    global _dirty, _flush_handle
+
     if not _state_file_path:
         logger.error("State module not initialized, cannot save")
         return
 
+    if _dirty:
+        _persist_stats["writes_avoided"] += 1
+    _dirty = True
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush()
+        return
+
+    if _flush_handle is None:
+        _flush_handle = loop.call_later(_flush_delay, _flush_from_timer)
+
+
+def _flush_from_timer() -> None:
+    """Timer callback for the write-behind flush."""
+    global _flush_handle
+    _flush_handle = None
+    flush()
+
+
+def flush() -> bool:
+    """Write pending state to disk now (atomic temp file + rename).
+
+    Called by the debounce timer, and directly on shutdown and phase reset
+    so nothing is lost between windows.
+
+    Returns:
+        True if a write happened, False if there was nothing to write or it failed.
+    """
+    global _dirty, _flush_handle
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    if not _dirty or not _state_file_path:
+        return False
+
+    data_dir = os.path.dirname(_state_file_path) or "."
     try:
-        data = {"areas": _state}
-        with open(_state_file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Unique temp file + os.replace so a crash never leaves a truncated file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=data_dir, suffix=".tmp", prefix=".circadian_state_"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"areas": {a: r.to_dict() for a, r in _state.items()}},
+                    f,
+                    indent=2,
+                )
+            os.replace(tmp_path, _state_file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _dirty = False
+        _persist_stats["writes"] += 1
         logger.debug(f"Saved state to {_state_file_path}")
+        return True
     except Exception as e:
         logger.error(f"Failed to save state to {_state_file_path}: {e}")
+        return False
+
+
+def set_flush_delay(seconds: float) -> None:
+    """Set the write-behind debounce window (clamped to 0.25-2.0 seconds).
+
+    Takes effect for the next scheduled flush.
+    """
+    global _flush_delay
+    try:
+        seconds = float(seconds)
+    except (TypeError, ValueError):
+        seconds = DEFAULT_FLUSH_DELAY
+    _flush_delay = max(MIN_FLUSH_DELAY, min(MAX_FLUSH_DELAY, seconds))
+
+
+def get_persistence_stats() -> Dict[str, Any]:
+    """Return write-behind counters.
+
+    Returns:
+        Dict with writes (files written), writes_avoided (mutations coalesced
+        into an already-pending write), pending and flush_delay.
+    """
+    return {
+        "writes": _persist_stats["writes"],
+        "writes_avoided": _persist_stats["writes_avoided"],
+        "pending": _dirty,
+        "flush_delay": _flush_delay,
+    }
 
 
 def get_area(area_id: str) -> Dict[str, Any]:
-    """Get state for an area.
+    """Get state for an area as a dict (compatibility view).
+
+    Prefer get_area_record() on hot paths; this builds a new dict per call.
 
     Args:
         area_id: The area ID
@@ -145,13 +357,25 @@ def get_area(area_id: str) -> Dict[str, Any]:
     Returns:
         Dict with area state. If area doesn't exist, returns default state.
     """
-    if area_id not in _state:
+    record = _state.get(area_id)
+    if record is None:
         return _get_default_area_state()
+    return record.to_dict()
+
+
+def get_area_record(area_id: str) -> AreaRuntime:
+    """Get the live state record for an area, by reference.
 
-    # Merge with defaults to ensure all fields exist
-    default = _get_default_area_state()
-    default.update(_state[area_id])
-    return default
+    Read-only for callers - mutate through update_area() and the setters so
+    changes are persisted. Unknown areas get a shared default record.
+
+    Args:
+        area_id: The area ID
+
+    Returns:
+        AreaRuntime (supports .get(key, default) like the dict view)
+    """
+    return _state.get(area_id, _DEFAULT_RECORD)
 
 
 def update_area(area_id: str, updates: Dict[str, Any]) -> None:
@@ -161,10 +385,13 @@ def update_area(area_id: str, updates: Dict[str, Any]) -> None:
         area_id: The area ID
         updates: Dict of fields to update
     """
-    if area_id not in _state:
-        _state[area_id] = _get_default_area_state()
+    record = _state.get(area_id)
+    if record is None:
+        record = _state[area_id] = AreaRuntime()
 
-    _state[area_id].update(updates)
+    record.update(updates)
+    if not _TIMER_FIELDS.isdisjoint(updates):
+        _schedule_area_deadlines(area_id)
     _save()
     logger.debug(f"Updated state for area {area_id}: {updates}")
 
@@ -183,7 +410,7 @@ def set_is_circadian(area_id: str, is_circadian_val: bool) -> None:
 
     # Ensure area exists in state
     if area_id not in _state:
-        _state[area_id] = _get_default_area_state()
+        _state[area_id] = AreaRuntime()
 
     update_area(area_id, {"is_circadian": is_circadian_val})
 
@@ -216,12 +443,12 @@ def get_frozen_at(area_id: str) -> Optional[float]:
     Returns:
         The frozen hour (0-24), or None if not frozen.
     """
-    return get_area(area_id).get("frozen_at")
+    return get_area_record(area_id).get("frozen_at")
 
 
 def is_circadian(area_id: str) -> bool:
     """Check if Circadian Light controls an area."""
-    return get_area(area_id).get("is_circadian", False)
+    return get_area_record(area_id).get("is_circadian", False)
 
 
 def set_is_on(area_id: str, is_on: bool) -> None:
@@ -245,7 +472,7 @@ def set_is_on(area_id: str, is_on: bool) -> None:
 
 def get_is_on(area_id: str) -> bool:
     """Get the target light power state for an area."""
-    return get_area(area_id).get("is_on", False)
+    return get_area_record(area_id).get("is_on", False)
 
 
 def enable_circadian_and_set_on(area_id: str, is_on: bool) -> bool:
@@ -274,7 +501,7 @@ def enable_circadian_and_set_on(area_id: str, is_on: bool) -> bool:
 
 def is_frozen(area_id: str) -> bool:
     """Check if an area is frozen."""
-    return get_area(area_id).get("frozen_at") is not None
+    return get_area_record(area_id).get("frozen_at") is not None
 
 
 def set_last_sent_kelvin(area_id: str, kelvin: int) -> None:
@@ -284,7 +511,7 @@ def set_last_sent_kelvin(area_id: str, kelvin: int) -> None:
 
 def get_last_sent_kelvin(area_id: str) -> Optional[int]:
     """Get the kelvin we last sent to this area."""
-    return get_area(area_id).get("last_sent_kelvin")
+    return get_area_record(area_id).get("last_sent_kelvin")
 
 
 def set_last_sent_brightness(area_id: str, brightness: int) -> None:
@@ -294,7 +521,7 @@ def set_last_sent_brightness(area_id: str, brightness: int) -> None:
 
 def get_last_sent_brightness(area_id: str) -> Optional[int]:
     """Get area-level brightness we last sent."""
-    return get_area(area_id).get("last_sent_brightness")
+    return get_area_record(area_id).get("last_sent_brightness")
 
 
 # Per-purpose last-sent cache (in-memory only, not persisted to disk)
@@ -367,8 +594,7 @@ def reset_area(area_id: str) -> None:
         "last_sent_kelvin": current.get("last_sent_kelvin"),
     }
 
-    _state[area_id] = _get_default_area_state()
-    _state[area_id].update(preserved)
+    _state[area_id] = AreaRuntime.from_dict(preserved)
     _save()
     logger.info(f"Reset runtime state for area {area_id}")
 
@@ -387,9 +613,10 @@ def reset_all_areas() -> None:
             "frozen_at": current.get("frozen_at"),  # Preserve frozen state
             "last_sent_kelvin": current.get("last_sent_kelvin"),  # Physical bulb fact
         }
-        _state[area_id] = _get_default_area_state()
-        _state[area_id].update(preserved)
+        _state[area_id] = AreaRuntime.from_dict(preserved)
     _save()
+    # Phase reset is a checkpoint - persist it now rather than next window
+    flush()
     logger.info(f"Reset midpoints for all {len(_state)} area(s) (frozen state preserved)")
 
 
@@ -411,7 +638,7 @@ def get_all_areas() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict mapping area_id to state dict
     """
-    return {area_id: get_area(area_id) for area_id in _state}
+    return {area_id: record.to_dict() for area_id, record in _state.items()}
 
 
 def get_all_area_ids() -> List[str]:
@@ -430,7 +657,7 @@ def get_runtime_state(area_id: str) -> Dict[str, Any]:
     Returns:
         Dict with brightness_mid, color_mid, frozen_at
     """
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     return {
         "brightness_mid": area.get("brightness_mid"),
         "color_mid": area.get("color_mid"),
@@ -490,9 +717,7 @@ def reset_area_to_defaults(area_id: str) -> None:
 
     is_circ = _state[area_id].get("is_circadian", False)
     is_on = _state[area_id].get("is_on", False)
-    _state[area_id] = _get_default_area_state()
-    _state[area_id]["is_circadian"] = is_circ
-    _state[area_id]["is_on"] = is_on
+    _state[area_id] = AreaRuntime.from_dict({"is_circadian": is_circ, "is_on": is_on})
     _save()
     logger.info(f"Reset area {area_id} runtime state to defaults (preserving is_circadian={is_circ}, is_on={is_on})")
 
@@ -537,13 +762,13 @@ def is_boosted(area_id: str) -> bool:
 
     Returns True if boost_expires_at is set (either a timestamp or "forever").
     """
-    expires_at = get_area(area_id).get("boost_expires_at")
+    expires_at = get_area_record(area_id).get("boost_expires_at")
     return expires_at is not None
 
 
 def is_boost_forever(area_id: str) -> bool:
     """Check if an area has a forever (non-timed) boost."""
-    return get_area(area_id).get("boost_expires_at") == "forever"
+    return get_area_record(area_id).get("boost_expires_at") == "forever"
 
 
 def is_boost_motion_coupled(area_id: str) -> bool:
@@ -553,7 +778,7 @@ def is_boost_motion_coupled(area_id: str) -> bool:
     to "motion" instead of a timestamp. The boost ends only when the motion
     timer ends (via end_motion_on_off), not independently.
     """
-    return get_area(area_id).get("boost_expires_at") == "motion"
+    return get_area_record(area_id).get("boost_expires_at") == "motion"
 
 
 def get_boost_state(area_id: str) -> Dict[str, Any]:
@@ -562,7 +787,7 @@ def get_boost_state(area_id: str) -> Dict[str, Any]:
     Returns:
         Dict with is_boosted, is_forever, boost_started_from_off, boost_expires_at, boost_brightness
     """
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     expires_at = area.get("boost_expires_at")
     return {
         "is_boosted": expires_at is not None,
@@ -646,7 +871,7 @@ def clear_motion_expires(area_id: str) -> None:
     Args:
         area_id: The area ID
     """
-    if get_area(area_id).get("motion_expires_at") is not None:
+    if get_area_record(area_id).get("motion_expires_at") is not None:
         update_area(area_id, {"motion_expires_at": None})
         logger.info(f"Motion on_off timer cleared for area {area_id}")
 
@@ -664,7 +889,7 @@ def extend_motion_expires(area_id: str, expires_at: str) -> None:
 
 def has_motion_timer(area_id: str) -> bool:
     """Check if an area has an active motion on_off timer."""
-    return get_area(area_id).get("motion_expires_at") is not None
+    return get_area_record(area_id).get("motion_expires_at") is not None
 
 
 def get_motion_expires(area_id: str) -> Optional[str]:
@@ -673,7 +898,7 @@ def get_motion_expires(area_id: str) -> Optional[str]:
     Returns:
         ISO timestamp string when motion timer expires, or None if not set
     """
-    return get_area(area_id).get("motion_expires_at")
+    return get_area_record(area_id).get("motion_expires_at")
 
 
 def get_expired_motion() -> List[str]:
@@ -724,7 +949,7 @@ def set_motion_warning(area_id: str, pre_warning_brightness: int, dim_factor: fl
 
 def clear_motion_warning(area_id: str) -> None:
     """Clear motion warning state for an area."""
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     if area.get("motion_warning_at") is not None:
         update_area(area_id, {
             "motion_warning_at": None,
@@ -735,12 +960,12 @@ def clear_motion_warning(area_id: str) -> None:
 
 def is_motion_warned(area_id: str) -> bool:
     """Check if area is in motion warning state."""
-    return get_area(area_id).get("motion_warning_at") is not None
+    return get_area_record(area_id).get("motion_warning_at") is not None
 
 
 def get_dim_factor(area_id: str) -> float:
     """Get the warning factor for an area (1.0 = no warning)."""
-    return get_area(area_id).get("dim_factor") or 1.0
+    return get_area_record(area_id).get("dim_factor") or 1.0
 
 
 def get_motion_warning_state(area_id: str) -> dict:
@@ -749,7 +974,7 @@ def get_motion_warning_state(area_id: str) -> dict:
     Returns:
         Dict with 'is_warned', 'warning_at', 'pre_warning_brightness'
     """
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     return {
         "is_warned": area.get("motion_warning_at") is not None,
         "warning_at": area.get("motion_warning_at"),
@@ -851,7 +1076,7 @@ def set_fade(area_id: str, direction: str, duration_seconds: int,
 
 def clear_fade(area_id: str) -> bool:
     """Clear fade state. Returns True if a fade was active."""
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     if area.get("fade_start") is None:
         return False
     update_area(area_id, {
@@ -867,14 +1092,14 @@ def clear_fade(area_id: str) -> bool:
 
 def is_fading(area_id: str) -> bool:
     """Check if an area has an active fade."""
-    return get_area(area_id).get("fade_start") is not None
+    return get_area_record(area_id).get("fade_start") is not None
 
 
 def get_fade_progress(area_id: str) -> Optional[float]:
     """Return fade progress 0.0-1.0, or None if not fading."""
     from datetime import datetime
 
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     fade_start = area.get("fade_start")
     if fade_start is None:
         return None
@@ -886,7 +1111,7 @@ def get_fade_progress(area_id: str) -> Optional[float]:
 
 def get_fade_state(area_id: str) -> Optional[Dict[str, Any]]:
     """Get active fade state, or None if no fade active."""
-    area = get_area(area_id)
+    area = get_area_record(area_id)
     if area.get("fade_start") is None:
         return None
     return {
@@ -912,7 +1137,7 @@ def mark_user_action(area_id: str) -> None:
 
 def get_last_user_action(area_id: str):
     """Get ISO timestamp of last user action, or None."""
-    return get_area(area_id).get("last_user_action_at")
+    return get_area_record(area_id).get("last_user_action_at")
 
 
 # ============================================================================
@@ -937,7 +1162,7 @@ def set_off_enforced(area_id: str, value: bool) -> None:
 
 def is_off_enforced(area_id: str) -> bool:
     """Check if off state has been verified/enforced for an area."""
-    return get_area(area_id).get("off_enforced", False)
+    return get_area_record(area_id).get("off_enforced", False)
 
 
 def increment_off_confirm_count(area_id: str) -> int:
@@ -949,7 +1174,7 @@ def increment_off_confirm_count(area_id: str) -> int:
     Returns:
         The new counter value after incrementing
     """
-    current = get_area(area_id).get("off_confirm_count", 0)
+    current = get_area_record(area_id).get("off_confirm_count", 0)
     new_count = current + 1
     update_area(area_id, {"off_confirm_count": new_count})
     return new_count
@@ -966,8 +1191,211 @@ def clear_all_off_enforced() -> None:
     Called at startup to force one enforcement pass after every reboot.
     """
     for area_id in list(_state.keys()):
-        if _state[area_id].get("off_enforced", False) or _state[area_id].get("off_confirm_count", 0) > 0:
-            _state[area_id]["off_enforced"] = False
-            _state[area_id]["off_confirm_count"] = 0
+        record = _state[area_id]
+        if record.off_enforced or record.off_confirm_count > 0:
+            record.off_enforced = False
+            record.off_confirm_count = 0
     _save()
     logger.debug("Cleared off_enforced and off_confirm_count for all areas")
+
+
+# ============================================================================
+# Deadline Scheduler (boost / motion / warning / fade expirations)
+# ============================================================================
+#
+# Timer fields stay ISO strings in the record (and on disk); alongside them we
+# keep min-heaps of monotonic deadlines so the runtime can sleep until the
+# next one is due instead of scanning every area every second. Entries are
+# invalidated lazily: each carries the field value ("token") it was computed
+# from, and is dropped on pop if the record no longer matches.
+
+# Fields whose change reschedules an area's deadlines
+_TIMER_FIELDS = frozenset({
+    "boost_expires_at",
+    "boost_started_from_off",
+    "motion_expires_at",
+    "motion_warning_at",
+    "fade_start",
+    "fade_duration",
+})
+
+# (monotonic deadline, seq, area_id, kind, token) - kind: boost, motion, fade
+_deadline_heap: List[Tuple[float, int, str, str, Any]] = []
+# Same shape, keyed by timer expiry; due warning_seconds before the deadline
+_warning_heap: List[Tuple[float, int, str, str, Any]] = []
+_deadline_seq = 0
+_fading_areas: set = set()
+_deadline_listener: Optional[Callable[[], None]] = None
+
+
+def set_deadline_listener(callback: Optional[Callable[[], None]]) -> None:
+    """Register a callback fired when a new deadline is scheduled.
+
+    The runtime uses this to wake its deadline loop early.
+    """
+    global _deadline_listener
+    _deadline_listener = callback
+
+
+def _iso_to_monotonic(iso: str, now_wall: datetime, now_mono: float) -> Optional[float]:
+    """Convert a local ISO timestamp to a monotonic deadline (None if invalid)."""
+    try:
+        return now_mono + (datetime.fromisoformat(iso) - now_wall).total_seconds()
+    except (ValueError, TypeError):
+        return None
+
+
+def _push_deadline(heap: list, deadline: float, area_id: str, kind: str, token: Any) -> None:
+    global _deadline_seq
+    _deadline_seq += 1
+    heapq.heappush(heap, (deadline, _deadline_seq, area_id, kind, token))
+
+
+def _schedule_area_deadlines(area_id: str) -> None:
+    """Push deadlines for an area's current timers (stale ones die lazily)."""
+    record = _state.get(area_id)
+    if record is None:
+        return
+
+    now_wall = datetime.now()
+    now_mono = time.monotonic()
+    pushed = False
+
+    boost = record.boost_expires_at
+    if boost and boost not in ("forever", "motion"):
+        deadline = _iso_to_monotonic(boost, now_wall, now_mono)
+        if deadline is not None:
+            _push_deadline(_deadline_heap, deadline, area_id, "boost", boost)
+            if record.boost_started_from_off and record.motion_warning_at is None:
+                _push_deadline(_warning_heap, deadline, area_id, "boost", boost)
+            pushed = True
+
+    motion = record.motion_expires_at
+    if motion and motion != "forever":
+        deadline = _iso_to_monotonic(motion, now_wall, now_mono)
+        if deadline is not None:
+            _push_deadline(_deadline_heap, deadline, area_id, "motion", motion)
+            if record.motion_warning_at is None:
+                _push_deadline(_warning_heap, deadline, area_id, "motion", motion)
+            pushed = True
+
+    if record.fade_start is not None:
+        _fading_areas.add(area_id)
+        start = _iso_to_monotonic(record.fade_start, now_wall, now_mono)
+        if start is not None:
+            deadline = start + (record.fade_duration or 1)
+            _push_deadline(_deadline_heap, deadline, area_id, "fade", record.fade_start)
+            pushed = True
+    else:
+        _fading_areas.discard(area_id)
+
+    if pushed and _deadline_listener is not None:
+        _deadline_listener()
+
+
+def _deadline_entry_valid(area_id: str, kind: str, token: Any) -> bool:
+    record = _state.get(area_id)
+    if record is None:
+        return False
+    if kind == "boost":
+        return record.boost_expires_at == token
+    if kind == "motion":
+        return record.motion_expires_at == token
+    if kind == "fade":
+        return record.fade_start == token
+    return False
+
+
+def _discard_stale(heap: list) -> None:
+    while heap and not _deadline_entry_valid(heap[0][2], heap[0][3], heap[0][4]):
+        heapq.heappop(heap)
+
+
+def seconds_until_next_deadline(warning_seconds: int = 0) -> Optional[float]:
+    """Seconds until the next boost/motion/fade/warning deadline is due.
+
+    Args:
+        warning_seconds: Motion warning lead time (0 = warnings disabled)
+
+    Returns:
+        Seconds (<= 0 means something is due now), or None if nothing is scheduled
+    """
+    _discard_stale(_deadline_heap)
+    _discard_stale(_warning_heap)
+    candidates = []
+    if _deadline_heap:
+        candidates.append(_deadline_heap[0][0])
+    if warning_seconds > 0 and _warning_heap:
+        candidates.append(_warning_heap[0][0] - warning_seconds)
+    if not candidates:
+        return None
+    return min(candidates) - time.monotonic()
+
+
+def pop_due_deadlines(warning_seconds: int = 0) -> Dict[str, List[str]]:
+    """Pop every due deadline and return the affected areas by kind.
+
+    Each entry is re-checked against the live record (and the wall-clock ISO
+    timestamp, like the old scanners) before it is reported, so a clock
+    adjustment or an edited timer never fires early.
+
+    Args:
+        warning_seconds: Motion warning lead time (0 = warnings disabled)
+
+    Returns:
+        Dict with "warning", "boost", "motion" and "fade" area lists
+    """
+    due: Dict[str, List[str]] = {"warning": [], "boost": [], "motion": [], "fade": []}
+    now_mono = time.monotonic()
+    now_wall = datetime.now()
+    now_iso = now_wall.isoformat()
+
+    if warning_seconds > 0:
+        while _warning_heap and _warning_heap[0][0] - warning_seconds <= now_mono:
+            _, _, area_id, kind, token = heapq.heappop(_warning_heap)
+            if not _deadline_entry_valid(area_id, kind, token):
+                continue
+            record = _state[area_id]
+            if record.motion_warning_at is not None:
+                continue
+            if kind == "boost" and not record.boost_started_from_off:
+                continue
+            if token <= now_iso:
+                continue  # Already expired - the expiry handler takes it from here
+            if area_id not in due["warning"]:
+                due["warning"].append(area_id)
+
+    while _deadline_heap and _deadline_heap[0][0] <= now_mono:
+        _, _, area_id, kind, token = heapq.heappop(_deadline_heap)
+        if not _deadline_entry_valid(area_id, kind, token):
+            continue
+        if kind in ("boost", "motion") and token > now_iso:
+            # Wall clock says not yet (clock moved) - reschedule from the ISO value
+            deadline = _iso_to_monotonic(token, now_wall, now_mono)
+            if deadline is not None:
+                _push_deadline(_deadline_heap, max(deadline, now_mono + 0.1), area_id, kind, token)
+            continue
+        if kind == "fade":
+            # Same for a fade whose end (by wall clock) hasn't come yet -
+            # check_fade_completions would skip it and nothing would re-fire
+            start = _iso_to_monotonic(token, now_wall, now_mono)
+            if start is not None:
+                deadline = start + (_state[area_id].fade_duration or 1)
+                if deadline > now_mono:
+                    _push_deadline(
+                        _deadline_heap, max(deadline, now_mono + 0.1), area_id, kind, token
+                    )
+                    continue
+        if area_id not in due[kind]:
+            due[kind].append(area_id)
+
+    return due
+
+
+def get_fading_areas() -> List[str]:
+    """Get areas with an active fade (without scanning every area)."""
+    for area_id in list(_fading_areas):
+        record = _state.get(area_id)
+        if record is None or record.fade_start is None:
+            _fading_areas.discard(area_id)
+    return list(_fading_areas)
@@ -0,0 +1,239 @@
+"""Targeted Home Assistant event subscriptions.
+
+By default the add-on subscribes to every event on the bus, so each
+state_changed for every entity (plus automations, recorder noise, ...)
+crosses the websocket and gets JSON-decoded, though almost all of it is
+irrelevant here. With targeted_subscriptions_enabled, SubscriptionPlanner
+instead subscribes to:
+
+- the event types handle_message() acts on (HANDLED_EVENT_TYPES)
+- call_service for the circadian domain only (an event trigger)
+- state changes of the entities we track (a state trigger): lights,
+  motion/contact sensors and the other entities of tracked sensor and
+  switch devices (battery, illuminance, sensitivity), the lux and weather
+  entities, and sun.sun
+
+Trigger subscriptions deliver their own envelope; translate() rewrites
+those into the plain event messages handle_message() already understands.
+The plan is recomputed when switches, sensors or areas change.
+"""
+
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+logger = logging.getLogger(__name__)
+
+CIRCADIAN_DOMAIN = "circadian"
+
+# Event types handle_message() handles (state_changed and call_service are
+# covered by trigger subscriptions instead)
+HANDLED_EVENT_TYPES = frozenset(
+    {
+        "zha_event",
+        "hue_event",
+        "circadian_light_refresh",
+        "circadian_light_outdoor_override",
+        "circadian_light_sync_devices",
+        "circadian_light_sync_reach_groups",
+        "circadian_light_sync_batch_groups",
+        "circadian_light_live_design",
+        "device_registry_updated",
+        "area_registry_updated",
+        "entity_registry_updated",
+    }
+)
+
+
+class SubscriptionPlan(NamedTuple):
+    """What to subscribe to."""
+
+    event_types: FrozenSet[str]
+    entity_ids: FrozenSet[str]
+
+
+def plan_subscriptions(
+    cached_states: Mapping[str, Any],
+    area_lights: Mapping[str, Iterable[str]],
+    sensor_entities: Iterable[str],
+    device_ids: Iterable[str],
+    entity_registry: Mapping[str, Mapping[str, Any]],
+    extra_entities: Iterable[Optional[str]] = (),
+) -> SubscriptionPlan:
+    """Build the subscription plan from the client's current caches.
+
+    Args:
+        cached_states: entity_id -> state (every light.* entity is tracked)
+        area_lights: area_id -> light entity_ids
+        sensor_entities: Motion/contact trigger entity_ids
+        device_ids: Sensor/switch devices whose entities are all tracked
+        entity_registry: entity_id -> registry entry (for device_id)
+        extra_entities: Other entity_ids (lux, weather); None entries skipped
+    """
+    entity_ids: Set[str] = {"sun.sun"}
+    entity_ids.update(eid for eid in cached_states if eid.startswith("light."))
+    for lights in area_lights.values():
+        entity_ids.update(lights)
+    entity_ids.update(sensor_entities)
+    entity_ids.update(eid for eid in extra_entities if eid)
+    devices = set(device_ids)
+    if devices:
+        entity_ids.update(
+            eid
+            for eid, entry in entity_registry.items()
+            if entry.get("device_id") in devices
+        )
+    return SubscriptionPlan(HANDLED_EVENT_TYPES, frozenset(entity_ids))
+
+
+SendFn = Callable[[Dict[str, Any]], Awaitable[int]]
+
+
+class SubscriptionPlanner:
+    """Keeps the live subscriptions in line with the latest plan.
+
+    `send` sends a websocket message (without id) and returns the id it was
+    sent with. Subscriptions die with the connection: call reset() on
+    disconnect.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._event_subs: Dict[str, int] = {}  # event_type -> subscription id
+        self._service_sub: Optional[int] = None
+        self._entity_sub: Optional[int] = None
+        self._entity_ids: FrozenSet[str] = frozenset()
+        self._trigger_subs: Set[int] = set()
+        self._last_updated: Dict[str, Any] = {}  # entity_id -> last_updated seen
+        self._replans = 0
+        self._events = 0
+        self._duplicates = 0
+
+    async def apply(self, plan: SubscriptionPlan, send: SendFn) -> bool:
+        """Subscribe/unsubscribe so the live subscriptions match the plan.
+
+        Returns:
+            True if anything changed
+        """
+        changed = False
+        for event_type in sorted(plan.event_types - set(self._event_subs)):
+            self._event_subs[event_type] = await send(
+                {"type": "subscribe_events", "event_type": event_type}
+            )
+            changed = True
+        for event_type in sorted(set(self._event_subs) - plan.event_types):
+            await _unsubscribe(send, self._event_subs.pop(event_type))
+            changed = True
+
+        if self._service_sub is None:
+            self._service_sub = await send(
+                _trigger(
+                    {
+                        "platform": "event",
+                        "event_type": "call_service",
+                        "event_data": {"domain": CIRCADIAN_DOMAIN},
+                    }
+                )
+            )
+            self._trigger_subs.add(self._service_sub)
+            changed = True
+
+        if plan.entity_ids != self._entity_ids or self._entity_sub is None:
+            # Subscribe the new set before dropping the old one so no change
+            # is missed; translate() drops the overlap's duplicates
+            old = self._entity_sub
+            self._entity_sub = await send(
+                _trigger({"platform": "state", "entity_id": sorted(plan.entity_ids)})
+            )
+            self._trigger_subs.add(self._entity_sub)
+            if old is not None:
+                await _unsubscribe(send, old)
+            self._entity_ids = plan.entity_ids
+            self._last_updated = {
+                eid: ts for eid, ts in self._last_updated.items() if eid in plan.entity_ids
+            }
+            changed = True
+
+        if changed:
+            self._replans += 1
+            logger.info(
+                f"Subscriptions planned: {len(self._event_subs)} event types, "
+                f"{len(self._entity_ids)} entities"
+            )
+        self.active = True
+        return changed
+
+    def translate(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Rewrite a trigger-subscription message as a plain event message.
+
+        Messages from other subscriptions are returned unchanged; duplicate
+        state changes (delivered by two entity subscriptions while
+        re-planning) return None.
+        """
+        if message.get("id") not in self._trigger_subs:
+            return message
+        if message.get("type") != "event":
+            return message  # The subscription's result frame
+        trigger = ((message.get("event") or {}).get("variables") or {}).get("trigger") or {}
+        platform = trigger.get("platform")
+
+        if platform == "event":
+            self._events += 1
+            return {"id": message.get("id"), "type": "event", "event": trigger.get("event") or {}}
+
+        if platform == "state":
+            entity_id = trigger.get("entity_id")
+            new_state = trigger.get("to_state")
+            stamp = (new_state or {}).get("last_updated")
+            if stamp is not None and self._last_updated.get(entity_id) == stamp:
+                self._duplicates += 1
+                return None
+            self._last_updated[entity_id] = stamp
+            self._events += 1
+            return {
+                "id": message.get("id"),
+                "type": "event",
+                "event": {
+                    "event_type": "state_changed",
+                    "data": {
+                        "entity_id": entity_id,
+                        "old_state": trigger.get("from_state"),
+                        "new_state": new_state,
+                    },
+                },
+            }
+
+        return message
+
+    def reset(self) -> None:
+        """Forget subscriptions (the connection that held them closed)."""
+        self.__init__()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Live subscription counts and translated event counters."""
+        return {
+            "active": self.active,
+            "event_types": len(self._event_subs),
+            "entities": len(self._entity_ids),
+            "replans": self._replans,
+            "trigger_events": self._events,
+            "duplicates_dropped": self._duplicates,
+        }
+
+
+def _trigger(trigger: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "subscribe_trigger", "trigger": trigger}
+
+
+async def _unsubscribe(send: SendFn, subscription_id: int) -> None:
+    await send({"type": "unsubscribe_events", "subscription": subscription_id})
@@ -280,7 +280,7 @@ def get_all_available_actions() -> list:
     try:
         import glozone
 
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         moments = raw_config.get("moments", {})
         for moment_id in moments.keys():
             action_name = f"set_{moment_id}"
@@ -419,7 +419,7 @@ def get_categorized_actions() -> Dict[str, List[Dict[str, Any]]]:
     try:
         import glozone
 
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         moments = raw_config.get("moments", {})
         if moments:
             moment_actions = []
@@ -829,6 +829,10 @@ class SwitchConfig:
             return self.scopes[scope_index].areas
         return []
 
+    def get_all_area_ids(self) -> List[str]:
+        """Get list of all area IDs across every scope."""
+        return [area_id for scope in self.scopes for area_id in scope.areas]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -1528,6 +1532,20 @@ def get_switch_by_device_id(device_id: str) -> Optional[SwitchConfig]:
     return None
 
 
+def get_controlled_areas(device_id: str) -> List[str]:
+    """Get the areas a configured switch or sensor acts on.
+
+    Matches switch IDs (IEEE) and HA device_ids. Reads the loaded configs
+    without reloading from disk - used to order incoming events, where a
+    config edit not yet picked up only affects ordering.
+    """
+    for configs in (_switches, _motion_sensors, _contact_sensors):
+        for config in configs.values():
+            if config.id == device_id or config.device_id == device_id:
+                return config.get_all_area_ids()
+    return []
+
+
 def get_all_switches() -> Dict[str, SwitchConfig]:
     """Get all configured switches.
 
@@ -1968,7 +1986,7 @@ def get_repeat_interval(switch_id: str) -> int:
     switch type default (700ms).
     """
     try:
-        raw_config = glozone.load_config_from_files()
+        raw_config = glozone.get_config_snapshot()
         tenths = raw_config.get("long_press_repeat_interval")
         if tenths is not None:
             return int(float(tenths) * 100)
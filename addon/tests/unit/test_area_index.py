@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the area index behind the glozone area accessors."""
+
+import pytest
+
+import glozone
+
+
+@pytest.fixture(autouse=True)
+def setup_glozone_config():
+    """Set up glozone with mixed string/dict area entries and restore after."""
+    config = {
+        "glozones": {
+            "Main": {
+                "areas": [
+                    "kitchen",
+                    {
+                        "id": "den",
+                        "name": "Den",
+                        "brightness_factor": 0.8,
+                        "natural_light_exposure": 0.5,
+                        "light_filters": {"light.den_lamp": "Lamp"},
+                        "feedback_target": "Lamp",
+                    },
+                ],
+                "is_default": True,
+            },
+            "Upstairs": {
+                "areas": [{"id": "bedroom", "name": "Bedroom"}],
+                "is_default": False,
+            },
+        },
+    }
+    old_config = glozone._config
+    glozone.set_config(config)
+    yield config
+    glozone.set_config(old_config)
+
+
+class TestAreaIndex:
+    """Accessors answer from the index."""
+
+    def test_zone_lookups(self):
+        assert glozone.get_zone_for_area("kitchen") == "Main"
+        assert glozone.get_zone_for_area("bedroom") == "Upstairs"
+        assert glozone.get_zone_for_area("garage") == "Main"  # default zone
+        assert glozone.is_area_in_any_zone("den")
+        assert not glozone.is_area_in_any_zone("garage")
+        assert glozone.get_areas_in_zone("Main") == ["kitchen", "den"]
+        assert glozone.get_areas_in_zone("Nowhere") == []
+
+    def test_area_settings(self):
+        assert glozone.get_area_brightness_factor("den") == 0.8
+        assert glozone.get_area_natural_light_exposure("den") == 0.5
+        assert glozone.get_area_light_filters("den") == {"light.den_lamp": "Lamp"}
+        assert glozone.get_area_feedback_target("den") == "Lamp"
+        assert glozone.get_area_entry("den")["name"] == "Den"
+
+    def test_defaults_for_string_and_unknown_areas(self):
+        for area_id in ("kitchen", "garage"):
+            assert glozone.get_area_entry(area_id) is None
+            assert glozone.get_area_brightness_factor(area_id) == 1.0
+            assert glozone.get_area_natural_light_exposure(area_id) == 0.0
+            assert glozone.get_area_light_filters(area_id) == {}
+            assert glozone.get_area_feedback_target(area_id) is None
+
+    def test_first_zone_wins(self, setup_glozone_config):
+        setup_glozone_config["glozones"]["Upstairs"]["areas"].append("kitchen")
+        glozone.set_config(setup_glozone_config)
+        assert glozone.get_zone_for_area("kitchen") == "Main"
+
+    def test_rebuilt_after_add_area_to_zone(self):
+        assert glozone.get_zone_for_area("den") == "Main"
+        glozone.add_area_to_zone("den", "Upstairs", "Den")
+        assert glozone.get_zone_for_area("den") == "Upstairs"
+        assert glozone.get_areas_in_zone("Main") == ["kitchen"]
+
+    def test_bad_factor_falls_back(self, setup_glozone_config):
+        setup_glozone_config["glozones"]["Upstairs"]["areas"][0]["brightness_factor"] = "x"
+        glozone.set_config(setup_glozone_config)
+        assert glozone.get_area_brightness_factor("bedroom") == 1.0
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Test the compiled auto-on/auto-off firing table in primitives.py."""
+
+from datetime import datetime
+
+import pytest
+
+import glozone
+from brain import SunTimes
+from primitives import CircadianLightPrimitives
+
+
+class _Client:
+    """Minimal client: only sun times are needed to resolve schedules."""
+
+    def __init__(self):
+        self.sun_times = SunTimes(sunrise=6.5, sunset=19.0)
+
+    def _get_sun_times(self):
+        return self.sun_times
+
+
+def _custom(prefix, time_1, days=(0, 1, 2, 3, 4, 5, 6)):
+    return {
+        f"{prefix}_enabled": True,
+        f"{prefix}_source": "custom",
+        f"{prefix}_days_1": list(days),
+        f"{prefix}_time_1": time_1,
+    }
+
+
+@pytest.fixture
+def prims(tmp_path, monkeypatch):
+    """Primitives with a temp fired-state file and recorded firings."""
+    monkeypatch.setenv("CIRCADIAN_DATA_DIR", str(tmp_path))
+    old_config = glozone._config
+    p = CircadianLightPrimitives(_Client())
+    p.fired_log = []
+
+    async def fire_on(entry, settings, current_hour, today_str):
+        p.fired_log.append((entry.kind, entry.area_id, entry.fire_time))
+        p._auto_fired.setdefault(entry.area_id, {})[entry.kind] = {
+            "date": today_str, "time": entry.fire_time,
+        }
+
+    async def fire_off(entry, settings, today_str):
+        await fire_on(entry, settings, None, today_str)
+
+    p._fire_auto_on = fire_on
+    p._fire_auto_off = fire_off
+    yield p
+    glozone.set_config(old_config)
+
+
+def _set_area_settings(area_settings):
+    glozone.set_config({"glozones": {}, "area_settings": area_settings})
+
+
+class TestFiringTable:
+    """The table is compiled once and fired in time order."""
+
+    @pytest.mark.asyncio
+    async def test_sorted_and_fired_in_order(self, prims):
+        _set_area_settings({
+            "kitchen": {**_custom("auto_on", 7.0), **_custom("auto_off", 22.0)},
+            "porch": {"auto_on_enabled": True, "auto_on_source": "sunset",
+                      "auto_on_offset": -30},
+        })
+        table = prims._get_auto_schedule(datetime(2026, 6, 1, 0, 0))
+        assert [(e.area_id, e.kind, e.fire_time) for e in table] == [
+            ("kitchen", "auto_on", 7.0),
+            ("porch", "auto_on", 18.5),
+            ("kitchen", "auto_off", 22.0),
+        ]
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 19, 0))
+        assert prims.fired_log == [("auto_on", "kitchen", 7.0), ("auto_on", "porch", 18.5)]
+
+    @pytest.mark.asyncio
+    async def test_idle_ticks_do_not_resolve(self, prims, monkeypatch):
+        _set_area_settings({"kitchen": _custom("auto_on", 7.0)})
+        calls = []
+        original = prims._resolve_auto_time
+        monkeypatch.setattr(
+            prims, "_resolve_auto_time",
+            lambda *a: calls.append(a) or original(*a),
+        )
+        for second in range(30):
+            await prims.check_auto_schedules(datetime(2026, 6, 1, 6, 0, second))
+        assert len(calls) == 1
+        assert prims.fired_log == []
+
+    @pytest.mark.asyncio
+    async def test_fires_once_per_day(self, prims):
+        _set_area_settings({"kitchen": _custom("auto_on", 7.0)})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 7, 0, 0))
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 7, 0, 1))
+        assert len(prims.fired_log) == 1
+        # Rebuilt for the next day and fires again
+        await prims.check_auto_schedules(datetime(2026, 6, 2, 7, 0, 0))
+        assert len(prims.fired_log) == 2
+
+    @pytest.mark.asyncio
+    async def test_not_today_left_out(self, prims):
+        # 2026-06-01 is a Monday (weekday 0)
+        _set_area_settings({"kitchen": _custom("auto_on", 7.0, days=[5, 6])})
+        assert prims._get_auto_schedule(datetime(2026, 6, 1, 0, 0)) == []
+
+
+class TestMidDayEdits:
+    """Config version bumps recompile the table."""
+
+    @pytest.mark.asyncio
+    async def test_edit_to_later_time(self, prims):
+        _set_area_settings({"kitchen": _custom("auto_on", 9.0)})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 8, 0))
+        _set_area_settings({"kitchen": _custom("auto_on", 8.5)})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 8, 29))
+        assert prims.fired_log == []
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 8, 30))
+        assert prims.fired_log == [("auto_on", "kitchen", 8.5)]
+
+    @pytest.mark.asyncio
+    async def test_disabled_schedule_dropped(self, prims):
+        _set_area_settings({"kitchen": _custom("auto_on", 9.0)})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 8, 0))
+        _set_area_settings({"kitchen": {**_custom("auto_on", 9.0), "auto_on_enabled": False}})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 9, 30))
+        assert prims.fired_log == []
+
+    @pytest.mark.asyncio
+    async def test_recompile_does_not_refire(self, prims):
+        _set_area_settings({"kitchen": _custom("auto_on", 7.0)})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 7, 0))
+        # Unrelated save bumps the version; already-fired entry is skipped
+        _set_area_settings({"kitchen": _custom("auto_on", 7.0), "den": {}})
+        await prims.check_auto_schedules(datetime(2026, 6, 1, 7, 1))
+        assert len(prims.fired_log) == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_sun_times_retried(self, prims):
+        prims.client.sun_times = SunTimes(is_fallback=True)
+        _set_area_settings({"porch": {"auto_on_enabled": True, "auto_on_source": "sunset"}})
+        assert prims._get_auto_schedule(datetime(2026, 6, 1, 12, 0)) == []
+        prims.client.sun_times = SunTimes(sunrise=6.5, sunset=19.0)
+        prims._auto_table_retry_at = 0.0  # Retry window elapsed
+        table = prims._get_auto_schedule(datetime(2026, 6, 1, 12, 0))
+        assert [e.fire_time for e in table] == [19.0]
+        assert prims._auto_table_retry_at is None
+
+
+class TestDaylightSaving:
+    """Fire times are local wall-clock hours across DST changes."""
+
+    @pytest.mark.asyncio
+    async def test_spring_forward_skipped_hour_fires_after_jump(self, prims):
+        # 2026-03-08 (US): clocks jump 02:00 -> 03:00; 02:30 never happens
+        _set_area_settings({"kitchen": _custom("auto_on", 2.5)})
+        await prims.check_auto_schedules(datetime(2026, 3, 8, 1, 59, 59))
+        assert prims.fired_log == []
+        await prims.check_auto_schedules(datetime(2026, 3, 8, 3, 0, 0))
+        assert prims.fired_log == [("auto_on", "kitchen", 2.5)]
+
+    @pytest.mark.asyncio
+    async def test_fall_back_repeated_hour_fires_once(self, prims):
+        # 2026-11-01 (US): 01:00-02:00 happens twice
+        _set_area_settings({"kitchen": _custom("auto_off", 1.5)})
+        await prims.check_auto_schedules(datetime(2026, 11, 1, 1, 30))
+        await prims.check_auto_schedules(datetime(2026, 11, 1, 1, 59))
+        # Clocks fall back to 01:00 and pass 01:30 again
+        await prims.check_auto_schedules(datetime(2026, 11, 1, 1, 0))
+        await prims.check_auto_schedules(datetime(2026, 11, 1, 1, 30))
+        assert prims.fired_log == [("auto_off", "kitchen", 1.5)]
+
+    @pytest.mark.asyncio
+    async def test_sun_times_follow_the_day(self, prims):
+        # Sunrise shifts by an hour across the DST change
+        _set_area_settings({"porch": {"auto_off_enabled": True, "auto_off_source": "sunrise"}})
+        prims.client.sun_times = SunTimes(sunrise=6.0, sunset=18.0)
+        assert prims._get_auto_schedule(datetime(2026, 3, 7, 0, 0))[0].fire_time == 6.0
+        prims.client.sun_times = SunTimes(sunrise=7.0, sunset=19.0)
+        assert prims._get_auto_schedule(datetime(2026, 3, 8, 0, 0))[0].fire_time == 7.0
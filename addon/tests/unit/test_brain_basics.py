@@ -266,6 +266,293 @@ class TestColorConversions:
         assert b >= r * 0.8, "Cool temp should have significant blue"
 
 
+class TestColorTables:
+    """Test the integer-kelvin xy/RGB lookup tables."""
+
+    # kelvin -> (xy, rgb) from the original inline formulas: every 100 K
+    # across the table range plus the values either side of each branch
+    BASELINE = {
+        500: ((0.675, 0.322), (255, 0, 0)),
+        600: ((0.6635142857142857, 0.33144285714285715), (255, 0, 0)),
+        700: ((0.6520285714285715, 0.3408857142857143), (255, 15, 0)),
+        800: ((0.6405428571428572, 0.35032857142857143), (255, 43, 0)),
+        900: ((0.6290571428571429, 0.3597714285714286), (255, 59, 0)),
+        1000: ((0.6175714285714285, 0.3692142857142857), (255, 73, 0)),
+        1100: ((0.6060857142857143, 0.37865714285714286), (255, 85, 0)),
+        1199: ((0.5947148571428572, 0.38800557142857145), (255, 95, 0)),
+        1200: ((0.5945668773148148, 0.38814862967620456), (255, 95, 0)),
+        1201: ((0.5946131604377478, 0.3881212750237749), (255, 95, 0)),
+        1300: ((0.5952559690487028, 0.387739885047092), (255, 95, 0)),
+        1400: ((0.5902806326530613, 0.3906203279136897), (255, 99, 0)),
+        1500: ((0.5820293629629629, 0.3950367989157444), (255, 105, 0)),
+        1600: ((0.5719516494140625, 0.3998253891792336), (255, 112, 0)),
+        1667: ((0.5646383046146513, 0.40288714347586374), (255, 116, 0)),
+        1700: ((0.5609411935680847, 0.4043036207558297), (255, 119, 0)),
+        1800: ((0.5495540027434842, 0.40811649925948823), (255, 126, 0)),
+        1900: ((0.5381364624580842, 0.41111360112489215), (255, 132, 0)),
+        2000: ((0.5269025875, 0.41326488475771883), (255, 139, 22)),
+        2100: ((0.5159816991685563, 0.4146068353946314), (255, 144, 36)),
+        2200: ((0.5054484320060105, 0.41520938803625207), (255, 150, 47)),
+        2222: ((0.5031875330377638, 0.4152509331138491), (255, 151, 49)),
+        2300: ((0.495341935070272, 0.41521613774003885), (255, 155, 57)),
+        2400: ((0.485678330150463, 0.414694671379217), (255, 160, 66)),
+        2500: ((0.4764588864, 0.41371563614631013), (255, 164, 74)),
+        2600: ((0.46767543104233045, 0.4123496958785189), (255, 169, 82)),
+        2700: ((0.4593139523446629, 0.41066024937841794), (255, 173, 89)),
+        2800: ((0.45135700637755105, 0.40870320019401596), (255, 177, 96)),
+        2900: ((0.4437853243675428, 0.40652725547321844), (255, 180, 103)),
+        3000: ((0.4365788814814815, 0.4041744895645527), (255, 184, 109)),
+        3100: ((0.42971760048336743, 0.40168101688773217), (255, 187, 116)),
+        3200: ((0.42318180676269535, 0.3990776851656569), (255, 190, 122)),
+        3300: ((0.41695251367671204, 0.3963907405041974), (255, 193, 128)),
+        3400: ((0.411011592102585, 0.3936424400405525), (255, 196, 134)),
+        3500: ((0.4053418612244898, 0.39085160216636283), (255, 199, 139)),
+        3600: ((0.39992712611454045, 0.38803409251885246), (255, 202, 145)),
+        3700: ((0.3947521798116597, 0.38520324840843256), (255, 204, 150)),
+        3800: ((0.3898027821839918, 0.3823702465921863), (255, 207, 155)),
+        3900: ((0.38506562410020395, 0.3795444202225341), (255, 209, 160)),
+        4000: ((0.38052828281249995, 0.3767335309611144), (255, 211, 165)),
+        4001: ((0.38041539591696727, 0.37665786852887717), (255, 211, 165)),
+        4100: ((0.37613233973680005, 0.3739571304994823), (255, 213, 170)),
+        4200: ((0.37200359988122234, 0.37127050391370453), (255, 216, 175)),
+        4300: ((0.36806343344611164, 0.36862921576443275), (255, 218, 179)),
+        4400: ((0.3643020920830203, 0.3660362522712848), (255, 220, 184)),
+        4500: ((0.36071017914951986, 0.3634939308089278), (255, 222, 188)),
+        4600: ((0.35727869166598175, 0.3610039886634774), (255, 223, 192)),
+        4700: ((0.35399904378605895, 0.3585676625031755), (255, 225, 196)),
+        4800: ((0.35086307678674766, 0.3561857590886318), (255, 227, 200)),
+        4900: ((0.34786305932902106, 0.3538587178541486), (255, 229, 204)),
+        5000: ((0.3449916808, 0.3515866660417546), (255, 230, 208)),
+        5100: ((0.3422420398413883, 0.3493694670805447), (255, 232, 211)),
+        5200: ((0.339607629637005, 0.34720676288850993), (255, 233, 215)),
+        5300: ((0.33708232113086645, 0.345098010741708), (255, 235, 219)),
+        5400: ((0.33466034504394654, 0.34304251531316854), (255, 236, 222)),
+        5500: ((0.33233627332832455, 0.3410394564362569), (255, 237, 225)),
+        5600: ((0.33010500052387026, 0.3390879130976743), (255, 239, 228)),
+        5700: ((0.3279617253513901, 0.33718688411618214), (255, 240, 232)),
+        5800: ((0.32590193277707163, 0.33533530591595107), (255, 241, 235)),
+        5900: ((0.32392137670842686, 0.3335320677590653), (255, 242, 238)),
+        6000: ((0.3220160634259259, 0.33177602476068535), (255, 243, 241)),
+        6100: ((0.3201822358126891, 0.3300660089728513), (255, 245, 243)),
+        6200: ((0.3184163584136148, 0.3284008387889532), (255, 246, 246)),
+        6300: ((0.31671510333257347, 0.326779326890385), (255, 247, 249)),
+        6400: ((0.31507533695983886, 0.32520028692964054), (255, 248, 252)),
+        6500: ((0.3134941075102412, 0.32366253911989207), (255, 249, 254)),
+        6600: ((0.3119686333444639, 0.3221649148796364), (253, 248, 255)),
+        6700: ((0.31049629204057677, 0.3207062606620791), (251, 246, 255)),
+        6800: ((0.30907461017962545, 0.31928544108226753), (249, 245, 255)),
+        6900: ((0.3077012538073538, 0.3179013414403554), (246, 244, 255)),
+        7000: ((0.30637401953352766, 0.31655286972657715), (244, 242, 255)),
+        7100: ((0.30509082623054334, 0.3152389581822732), (242, 241, 255)),
+        7200: ((0.30384970729381, 0.31395856448152937), (240, 240, 255)),
+        7300: ((0.3026488034276137, 0.3127106725894159), (238, 239, 255)),
+        7400: ((0.30148635592166306, 0.3114942933453607), (236, 237, 255)),
+        7500: ((0.3003607003851852, 0.310308464813683), (235, 236, 255)),
+        7600: ((0.2992702609072022, 0.30915225243765354), (233, 235, 255)),
+        7700: ((0.2982135446134233, 0.3080247490285112), (231, 234, 255)),
+        7800: ((0.2971891365919857, 0.30692507461658847), (230, 233, 255)),
+        7900: ((0.296195695162046, 0.30585237618795846), (228, 232, 255)),
+        8000: ((0.2952319474609375, 0.30480582732678796), (227, 231, 255)),
+        8100: ((0.29429668532725173, 0.3037846277807573), (225, 230, 255)),
+        8200: ((0.29338876145877163, 0.3027880029644684), (224, 230, 255)),
+        8300: ((0.29250708582566587, 0.30181520341363943), (223, 229, 255)),
+        8400: ((0.29165062232075367, 0.3008655042010465), (221, 228, 255)),
+        8500: ((0.2908183856299613, 0.29993820432357443), (220, 227, 255)),
+        8600: ((0.29000943830731885, 0.29903262606835157), (219, 226, 255)),
+        8700: ((0.28922288803999374, 0.29814811436475674), (218, 225, 255)),
+        8800: ((0.288457885089923, 0.2972840361280339), (216, 225, 255)),
+        8900: ((0.2877136198995984, 0.29643977959936385), (215, 224, 255)),
+        9000: ((0.2869893208504801, 0.29561475368645895), (214, 223, 255)),
+        9100: ((0.28628425216336617, 0.29480838730808057), (213, 223, 255)),
+        9200: ((0.2855977119308375, 0.2940201287452987), (212, 222, 255)),
+        9300: ((0.2849290302726277, 0.2932494450018114), (211, 221, 255)),
+        9400: ((0.28427756760544387, 0.292495821175219), (210, 221, 255)),
+        9500: ((0.2836427130193906, 0.29175875984077215), (209, 220, 255)),
+        9600: ((0.2830238827537254, 0.29103778044879913), (208, 219, 255)),
+        9700: ((0.28242051876520946, 0.29033241873674676), (207, 219, 255)),
+        9800: ((0.2818320873828082, 0.2896422261565358), (207, 218, 255)),
+        9900: ((0.2812580780429538, 0.28896676931773335), (206, 218, 255)),
+        10000: ((0.2806980021, 0.2883056294468803), (205, 217, 255)),
+        10100: ((0.2801513917068895, 0.2876584018631648), (204, 217, 255)),
+        10200: ((0.2796177987614115, 0.2870246954705161), (203, 216, 255)),
+        10300: ((0.27909679391375886, 0.2864041322660894), (203, 216, 255)),
+        10400: ((0.27858796563140076, 0.28579634686503197), (202, 215, 255)),
+        10500: ((0.2780909193175683, 0.2852009860413459), (201, 215, 255)),
+        10600: ((0.27760527647991295, 0.2846177082846112), (200, 214, 255)),
+        10700: ((0.277130673946139, 0.2840461833722798), (200, 214, 255)),
+        10800: ((0.2766667631236346, 0.2834860919572213), (199, 213, 255)),
+        10900: ((0.2762132093003323, 0.2829371251701619), (198, 213, 255)),
+        11000: ((0.2757696909842224, 0.28239898423664667), (198, 212, 255)),
+        11100: ((0.2753358992791184, 0.2818713801081276), (197, 212, 255)),
+        11200: ((0.27491153729443785, 0.28135403310677676), (197, 212, 255)),
+        11300: ((0.2744963195869144, 0.2808466725836045), (196, 211, 255)),
+        11400: ((0.2740899716322971, 0.2803490365894765), (195, 211, 255)),
+        11500: ((0.27369222932522397, 0.27986087155860084), (195, 210, 255)),
+        11600: ((0.2733028385055763, 0.27938193200407424), (194, 210, 255)),
+        11700: ((0.2729215545097349, 0.27891198022507113), (194, 210, 255)),
+        11800: ((0.2725481417452612, 0.27845078602526796), (193, 209, 255)),
+        11900: ((0.2721823732876245, 0.2779981264420984), (193, 209, 255)),
+        12000: ((0.27182403049768517, 0.27755378548644893), (192, 209, 255)),
+        12100: ((0.27147290265872864, 0.2771175538924028), (192, 208, 255)),
+        12200: ((0.27112878663192075, 0.27668922887666125), (191, 208, 255)),
+        12300: ((0.2707914865291286, 0.276268613907272), (191, 208, 255)),
+        12400: ((0.2704608134021181, 0.2758555184813082), (190, 207, 255)),
+        12500: ((0.2701365849472, 0.275449757911155), (190, 207, 255)),
+        12600: ((0.26981862522445776, 0.2750511531190637), (189, 207, 255)),
+        12700: ((0.2695067643907414, 0.2746595304396532), (189, 206, 255)),
+        12800: ((0.26920083844566345, 0.27427472143004283), (188, 206, 255)),
+        12900: ((0.2689006889898816, 0.2738965626873141), (188, 206, 255)),
+        13000: ((0.2686061629949932, 0.27352489567301097), (188, 205, 255)),
+        13100: ((0.2683171125844105, 0.27315956654439466), (187, 205, 255)),
+        13200: ((0.2680333948246236, 0.2728004259921831), (187, 205, 255)),
+        13300: ((0.26775487152629157, 0.2724473290845152), (186, 205, 255)),
+        13400: ((0.2674814090546377, 0.27210013511688647), (186, 204, 255)),
+        13500: ((0.2672128781486562, 0.27175870746781683), (186, 204, 255)),
+        13600: ((0.26694915374866424, 0.2714229134600187), (185, 204, 255)),
+        13700: ((0.26669011483176364, 0.2710926242268411), (185, 204, 255)),
+        13800: ((0.2664356442547997, 0.27076771458377635), (184, 203, 255)),
+        13900: ((0.26618562860442974, 0.27044806290482726), (184, 203, 255)),
+        14000: ((0.26593995805393583, 0.2701335510035323), (184, 203, 255)),
+        14100: ((0.26569852622643736, 0.2698240640184665), (183, 203, 255)),
+        14200: ((0.265461230064178, 0.2695194903030299), (183, 202, 255)),
+        14300: ((0.26522796970358115, 0.26921972131935645), (183, 202, 255)),
+        14400: ((0.2649986483557849, 0.26892465153617373), (182, 202, 255)),
+        14500: ((0.2647731721923818, 0.26863417833045145), (182, 202, 255)),
+        14600: ((0.26455145023610793, 0.2683482018926927), (182, 201, 255)),
+        14700: ((0.26433339425623553, 0.26806662513571433), (182, 201, 255)),
+        14800: ((0.2641189186684402, 0.2677893536067808), (181, 201, 255)),
+        14900: ((0.2639079404389245, 0.26751629540295463), (181, 201, 255)),
+        15000: ((0.2637003789925926, 0.2672473610895355), (181, 201, 255)),
+        15100: ((0.26349615612507993, 0.26698246362146427), (180, 200, 255)),
+        15200: ((0.2632951959184557, 0.2667215182675734), (180, 200, 255)),
+        15300: ((0.2630974246604219, 0.26646444253757295), (180, 200, 255)),
+        15400: ((0.2629027707668449, 0.2662111561116588), (180, 200, 255)),
+        15500: ((0.262711164707462, 0.2659615807726442), (179, 200, 255)),
+        15600: ((0.2625225389346162, 0.26571564034051176), (179, 199, 255)),
+        15700: ((0.26233682781487755, 0.2654732606092921), (179, 199, 255)),
+        15800: ((0.2621539675634179, 0.2652343692861774), (179, 199, 255)),
+        15900: ((0.26197389618101347, 0.2649988959327819), (178, 199, 255)),
+        16000: ((0.2617965533935547, 0.264766771908467), (178, 199, 255)),
+        16100: ((0.2616218805939499, 0.26453793031564776), (178, 199, 255)),
+        16200: ((0.26144982078631496, 0.2643123059470077), (178, 198, 255)),
+        16300: ((0.26128031853234557, 0.2640898352345443), (177, 198, 255)),
+        16400: ((0.26111331989977654, 0.2638704562003765), (177, 198, 255)),
+        16500: ((0.26094877241283354, 0.2636541084092482), (177, 198, 255)),
+        16600: ((0.2607866250045909, 0.26344073292265746), (177, 198, 255)),
+        16700: ((0.26062682797115083, 0.26323027225455564), (176, 198, 255)),
+        16800: ((0.26046933292756586, 0.263022670328552), (176, 197, 255)),
+        16900: ((0.26031409276542744, 0.2628178724365686), (176, 197, 255)),
+        17000: ((0.26016106161204966, 0.2626158251988914), (176, 197, 255)),
+        17100: ((0.2600101947911798, 0.262416476525562), (176, 197, 255)),
+        17200: ((0.25986144878516987, 0.26221977557906373), (175, 197, 255)),
+        17300: ((0.2597147811985475, 0.2620256727382496), (175, 197, 255)),
+        17400: ((0.2595701507229276, 0.26183411956346925), (175, 197, 255)),
+        17500: ((0.259427517103207, 0.26164506876284765), (175, 196, 255)),
+        17600: ((0.25928684110499034, 0.26145847415967427), (175, 196, 255)),
+        17700: ((0.2591480844831948, 0.26127429066086205), (174, 196, 255)),
+        17800: ((0.2590112099517851, 0.2610924742264359), (174, 196, 255)),
+        17900: ((0.2588761811545926, 0.2609129818400129), (174, 196, 255)),
+        18000: ((0.2587429626371742, 0.2607357714802395), (174, 196, 255)),
+        18100: ((0.25861151981966835, 0.26056080209314925), (174, 196, 255)),
+        18200: ((0.25848181897060796, 0.2603880335654081), (173, 196, 255)),
+        18300: ((0.25835382718165184, 0.2602174266984162), (173, 195, 255)),
+        18400: ((0.2582275123431978, 0.26004894318323435), (173, 195, 255)),
+        18500: ((0.2581028431208418, 0.2598825455763055), (173, 195, 255)),
+        18600: ((0.25797978893265056, 0.2597181972759436), (173, 195, 255)),
+        18700: ((0.25785831992721436, 0.259555862499563), (173, 195, 255)),
+        18800: ((0.2577384069624505, 0.2593955062616189), (172, 195, 255)),
+        18900: ((0.2576200215851272, 0.25923709435223985), (172, 195, 255)),
+        19000: ((0.2575031360110803, 0.25908059331652), (172, 195, 255)),
+        19100: ((0.25738772310609653, 0.25892597043445587), (172, 194, 255)),
+        19200: ((0.25727375636743616, 0.2587731937015004), (172, 194, 255)),
+        19300: ((0.25716120990597235, 0.2586222318097122), (172, 194, 255)),
+        19400: ((0.2570500584289225, 0.2584730541294836), (171, 194, 255)),
+        19500: ((0.2569402772231494, 0.2583256306918239), (171, 194, 255)),
+        19600: ((0.25683184213901095, 0.2581799321711794), (171, 194, 255)),
+        19700: ((0.2567247295747376, 0.25803592986877344), (171, 194, 255)),
+        19800: ((0.25661891646131757, 0.2578935956964462), (171, 194, 255)),
+        19900: ((0.256514380247872, 0.25775290216098), (171, 194, 255)),
+        20000: ((0.2564110988875, 0.2576138223488911), (171, 193, 255)),
+        20100: ((0.2563090508235782, 0.25747632991167324), (170, 193, 255)),
+        20200: ((0.25620821497649715, 0.25734039905147965), (170, 193, 255)),
+        20300: ((0.2561085707308186, 0.25720600450722475), (170, 193, 255)),
+        20400: ((0.25601009792283885, 0.25707312154109585), (170, 193, 255)),
+        20500: ((0.2559127768285428, 0.2569417259254576), (170, 193, 255)),
+        20600: ((0.2558165881519355, 0.2568117939301393), (170, 193, 255)),
+        20700: ((0.2557215130137367, 0.2566833023100894), (170, 193, 255)),
+        20800: ((0.25562753294042656, 0.2565562282933884), (170, 193, 255)),
+        20900: ((0.2555346298536289, 0.256430549569605), (169, 193, 255)),
+        21000: ((0.25544278605982074, 0.256306244278487), (169, 193, 255)),
+        21100: ((0.2553519842403569, 0.2561832909989755), (169, 192, 255)),
+        21200: ((0.25526220744179756, 0.25606166873852954), (169, 192, 255)),
+        21300: ((0.2551734390665298, 0.2559413569227549), (169, 192, 255)),
+        21400: ((0.2550856628636709, 0.2558223353853252), (169, 192, 255)),
+        21500: ((0.254998862920246, 0.25570458435818577), (169, 192, 255)),
+        21600: ((0.2549130236526285, 0.25558808446203163), (169, 192, 255)),
+        21700: ((0.25482812979823577, 0.2554728166970516), (168, 192, 255)),
+        21800: ((0.2547441664074704, 0.2553587624339285), (168, 192, 255)),
+        21900: ((0.25466111883589965, 0.25524590340509035), (168, 192, 255)),
+        22000: ((0.25457897273666413, 0.25513422169619926), (168, 192, 255)),
+        22100: ((0.2544977140531085, 0.2550236997378773), (168, 192, 255)),
+        22200: ((0.25441732901162667, 0.25491432029765715), (168, 192, 255)),
+        22300: ((0.2543378041147143, 0.25480606647215154), (168, 191, 255)),
+        22400: ((0.2542591261342218, 0.2546989216794362), (168, 191, 255)),
+        22500: ((0.25418128210480107, 0.2545928696516385), (168, 191, 255)),
+        22600: ((0.25410425931753966, 0.2544878944277251), (167, 191, 255)),
+        22700: ((0.2540280453137761, 0.254383980346483), (167, 191, 255)),
+        22800: ((0.253952627879091, 0.2542811120396897), (167, 191, 255)),
+        22900: ((0.25387799503746733, 0.25417927442546295), (167, 191, 255)),
+        23000: ((0.25380413504561516, 0.25407845270178875), (167, 191, 255)),
+        23100: ((0.25373103638745514, 0.253978632340219), (167, 191, 255)),
+        23200: ((0.2536586877687559, 0.25387979907973646), (167, 191, 255)),
+        23300: ((0.25358707811192, 0.2537819389207786), (167, 191, 255)),
+        23400: ((0.2535161965509146, 0.2536850381194199), (167, 191, 255)),
+        23500: ((0.25344603242634095, 0.25358908318170315), (167, 191, 255)),
+        23600: ((0.25337657528063967, 0.25349406085812054), (166, 190, 255)),
+        23700: ((0.2533078148534264, 0.25339995813823457), (166, 190, 255)),
+        23800: ((0.25323974107695474, 0.253306762245439), (166, 190, 255)),
+        23900: ((0.2531723440717016, 0.25321446063185415), (166, 190, 255)),
+        24000: ((0.2531056141420718, 0.25312304097335137), (166, 190, 255)),
+        24100: ((0.2530395417722181, 0.25303249116470605), (166, 190, 255)),
+        24200: ((0.2529741176219729, 0.25294279931487196), (166, 190, 255)),
+        24300: ((0.25290933252288833, 0.25285395374237574), (166, 190, 255)),
+        24400: ((0.2528451774743811, 0.2527659429708272), (166, 190, 255)),
+        24500: ((0.25278164363997996, 0.25267875572454235), (166, 190, 255)),
+        24600: ((0.252718722343671, 0.2525923809242755), (166, 190, 255)),
+        24700: ((0.2526564050663395, 0.2525068076830581), (165, 190, 255)),
+        24800: ((0.2525946834423043, 0.25242202530214086), (165, 190, 255)),
+        24900: ((0.2525335492559422, 0.25233802326703514), (165, 190, 255)),
+        25000: ((0.2524729944384, 0.2522547912436536), (165, 190, 255)),
+    }
+
+    def test_xy_table_matches_baseline(self):
+        """Table entries equal the original formula's results."""
+        for kelvin, (xy, _) in self.BASELINE.items():
+            assert CircadianLight.color_temperature_to_xy(kelvin) == pytest.approx(
+                xy, abs=1e-12
+            ), kelvin
+
+    def test_rgb_table_matches_baseline(self):
+        """Table entries equal the original formula's results."""
+        for kelvin, (_, rgb) in self.BASELINE.items():
+            assert CircadianLight.color_temperature_to_rgb(kelvin) == rgb, kelvin
+
+    def test_repeat_lookup_returns_cached_tuple(self):
+        """Second lookup returns the stored tuple."""
+        first = CircadianLight.color_temperature_to_xy(2700)
+        assert CircadianLight.color_temperature_to_xy(2700) is first
+
+    def test_non_table_inputs_use_formula(self):
+        """Floats and out-of-range kelvin bypass the tables."""
+        for cct in (2700.5, 400, 30000):
+            assert CircadianLight.color_temperature_to_xy(cct) == (
+                CircadianLight._compute_xy(cct)
+            )
+        assert CircadianLight.color_temperature_to_xy(2700.0) == (
+            CircadianLight.color_temperature_to_xy(2700)
+        )
+
+
 class TestPhaseInfo:
     """Test get_phase_info helper."""
 
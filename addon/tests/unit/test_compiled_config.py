@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test compiled per-zone configs in glozone.py."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+import glozone
+from brain import Config
+
+
+@pytest.fixture(autouse=True)
+def setup_glozone_config():
+    """Set up glozone with a two-zone config and restore after."""
+    config = {
+        "latitude": 40.0,
+        "glozones": {
+            "Main": {
+                "areas": ["kitchen", {"id": "den", "name": "Den"}],
+                "is_default": True,
+                "wake_time": 7.0,
+                "wake_alt_time": 9.0,
+                "wake_alt_days": [5, 6],
+                "schedule_override": None,
+            },
+            "Bedroom": {
+                "areas": ["bedroom"],
+                "is_default": False,
+                "wake_time": 6.0,
+            },
+        },
+    }
+    old_config = glozone._config
+    glozone._config = config
+    glozone.invalidate_compiled_configs()
+    yield config
+    glozone._config = old_config
+    glozone.invalidate_compiled_configs()
+
+
+class TestCompiledConfig:
+    """get_compiled_config_for_area() shares one frozen Config per zone."""
+
+    def test_shared_within_zone(self):
+        a = glozone.get_compiled_config_for_area("kitchen")
+        b = glozone.get_compiled_config_for_area("den")
+        c = glozone.get_compiled_config_for_area("bedroom")
+        assert a is b
+        assert a.config is b.config
+        assert c is not a
+        assert c.config.wake_time == 6.0
+
+    def test_matches_effective_config(self):
+        compiled = glozone.get_compiled_config_for_area("kitchen")
+        flat = glozone.get_effective_config_for_area("kitchen")
+        assert dict(compiled.flat) == flat
+        expected = Config.from_dict(flat)
+        for name in expected.__dataclass_fields__:
+            value = getattr(expected, name)
+            if isinstance(value, list):
+                value = tuple(value)
+            assert getattr(compiled.config, name) == value
+
+    def test_config_is_frozen(self):
+        compiled = glozone.get_compiled_config_for_area("kitchen")
+        with pytest.raises(FrozenInstanceError):
+            compiled.config.wake_time = 5.0
+        with pytest.raises(TypeError):
+            compiled.flat["wake_time"] = 5.0
+
+    def test_schedule_override_change_recompiles(self, setup_glozone_config):
+        before = glozone.get_compiled_config_for_area("kitchen")
+        # Mutated in place, the way the override API does before saving
+        setup_glozone_config["glozones"]["Main"]["schedule_override"] = {
+            "mode": "custom",
+            "custom_wake": 5.5,
+        }
+        after = glozone.get_compiled_config_for_area("kitchen")
+        assert after is not before
+        assert after.config.wake_time == 5.5
+        assert after.config.wake_alt_time is None
+
+    def test_set_config_recompiles(self, setup_glozone_config):
+        before = glozone.get_compiled_config_for_area("bedroom")
+        new_config = dict(setup_glozone_config)
+        new_config["glozones"] = dict(new_config["glozones"])
+        new_config["glozones"]["Bedroom"] = dict(
+            new_config["glozones"]["Bedroom"], wake_time=6.5
+        )
+        glozone.set_config(new_config)
+        after = glozone.get_compiled_config_for_area("bedroom")
+        assert after is not before
+        assert after.config.wake_time == 6.5
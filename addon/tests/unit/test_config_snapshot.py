@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Test the versioned config snapshot in glozone.py."""
+
+import json
+import os
+
+import pytest
+
+import glozone
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point glozone at a temp data directory with a migrated config."""
+    config = {
+        "glozones": {"Main": {"areas": ["kitchen"], "is_default": True}},
+        "circadian_refresh": 20,
+    }
+    (tmp_path / "designer_config.json").write_text(json.dumps(config))
+    monkeypatch.setattr(glozone, "_get_data_directory", lambda: str(tmp_path))
+    old_config = glozone._config
+    glozone._snapshot_data_dir = None
+    glozone._snapshot_sig = None
+    glozone._snapshot = None
+    yield tmp_path
+    glozone._config = old_config
+    glozone._snapshot_data_dir = None
+    glozone._snapshot_sig = None
+    glozone._snapshot = None
+
+
+def _touch_newer(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestConfigSnapshot:
+    """get_config_snapshot() re-reads disk only when needed."""
+
+    def test_unchanged_files_hit(self, data_dir):
+        before = glozone.get_config_stats()
+        first = glozone.get_config_snapshot()
+        for _ in range(5):
+            assert glozone.get_config_snapshot() is first
+        after = glozone.get_config_stats()
+        assert after["disk_reads"] - before["disk_reads"] == 1
+        assert after["hits"] - before["hits"] == 5
+        assert first.get("circadian_refresh") == 20
+        assert "glozones" in first
+
+    def test_snapshot_is_read_only(self, data_dir):
+        snap = glozone.get_config_snapshot()
+        with pytest.raises(TypeError):
+            snap.config["circadian_refresh"] = 5
+
+    def test_file_change_rereads_and_bumps_version(self, data_dir):
+        first = glozone.get_config_snapshot()
+        path = data_dir / "designer_config.json"
+        cfg = json.loads(path.read_text())
+        cfg["circadian_refresh"] = 45
+        path.write_text(json.dumps(cfg))
+        _touch_newer(path)
+
+        second = glozone.get_config_snapshot()
+        assert second.get("circadian_refresh") == 45
+        assert second.version > first.version
+
+    def test_set_config_bumps_version_without_disk_read(self, data_dir):
+        first = glozone.get_config_snapshot()
+        reads = glozone.get_config_stats()["disk_reads"]
+        new_config = dict(glozone.get_config())
+        new_config["circadian_refresh"] = 60
+        glozone.set_config(new_config)
+
+        second = glozone.get_config_snapshot()
+        assert second.version > first.version
+        assert second.get("circadian_refresh") == 60
+        assert glozone.get_config_stats()["disk_reads"] == reads
+
+    def test_reload_forces_disk_read(self, data_dir):
+        glozone.get_config_snapshot()
+        reads = glozone.get_config_stats()["disk_reads"]
+        glozone.reload()
+        glozone.get_config_snapshot()
+        assert glozone.get_config_stats()["disk_reads"] == reads + 1
+
+    def test_reload_unchanged_keeps_version(self, data_dir):
+        glozone.reload()
+        config, version = glozone.get_config(), glozone.get_config_version()
+        glozone.reload()
+        assert glozone.get_config_version() == version
+        assert glozone.get_config() is config
+
+        path = data_dir / "designer_config.json"
+        cfg = json.loads(path.read_text())
+        cfg["circadian_refresh"] = 45
+        path.write_text(json.dumps(cfg))
+        glozone.reload()
+        assert glozone.get_config_version() > version
+        assert glozone.get_config()["circadian_refresh"] == 45
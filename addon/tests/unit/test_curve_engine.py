@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Test curve_engine: NumPy day curve parity and the daily curve table."""
+
+from datetime import date
+
+import pytest
+
+import curve_engine
+import pipeline
+from brain import AreaState, CircadianLight, Config, SunTimes
+
+needs_numpy = pytest.mark.skipif(
+    not curve_engine.HAVE_NUMPY, reason="NumPy not installed"
+)
+
+HOURS = [i * 0.1 for i in range(240)] + [23.999, 6.5, 22.25]
+
+CONFIGS = {
+    "default": Config(),
+    "warm_night_all": Config(warm_night_enabled=True, warm_night_target=1800),
+    "warm_night_sunrise": Config(
+        warm_night_enabled=True, warm_night_mode="sunrise", warm_night_fade=0
+    ),
+    "warm_night_sunset": Config(
+        warm_night_enabled=True, warm_night_mode="sunset", warm_night_start=30
+    ),
+    "alt_days": Config(
+        wake_alt_time=9.0, wake_alt_days=[2], bed_alt_time=23.5, bed_alt_days=[1]
+    ),
+    "brightness_shift": Config(
+        wake_brightness=80, bed_brightness=20, min_brightness=10, max_brightness=90
+    ),
+    "cross_midnight": Config(
+        ascend_start=10.0, descend_start=2.0, wake_time=12.0, bed_time=1.0
+    ),
+    "steep": Config(wake_speed=12, bed_speed=1, min_color_temp=1000),
+}
+
+SUN = SunTimes(
+    sunrise=6.0, sunset=20.5, solar_noon=13.25, solar_mid=1.25, outdoor_normalized=0.6
+)
+
+
+def _scalar(config, state, weekday, sun_times=None, strength=1.0):
+    bri = [
+        CircadianLight.calculate_brightness_at_hour(h, config, state, weekday=weekday)
+        for h in HOURS
+    ]
+    cct = [
+        CircadianLight.calculate_color_at_hour(
+            h, config, state, sun_times=sun_times, weekday=weekday,
+            sun_cooling_strength=strength,
+        )
+        for h in HOURS
+    ]
+    return bri, cct
+
+
+@needs_numpy
+class TestParity:
+    """The NumPy path reproduces brain.py to the integer."""
+
+    @pytest.mark.parametrize("name", sorted(CONFIGS))
+    @pytest.mark.parametrize("weekday", [1, 2])
+    def test_configs(self, name, weekday):
+        config = CONFIGS[name]
+        state = AreaState()
+        expected = _scalar(config, state, weekday)
+        assert curve_engine.day_curve(config, HOURS, weekday, use_numpy=True) == expected
+
+    @pytest.mark.parametrize("name", ["default", "warm_night_all"])
+    def test_sun_cooling(self, name):
+        config = CONFIGS[name]
+        state = AreaState()
+        expected = _scalar(config, state, 3, SUN, 0.7)
+        actual = curve_engine.day_curve(
+            config, HOURS, 3, sun_times=SUN, sun_cooling_strength=0.7, use_numpy=True
+        )
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "state",
+        [
+            AreaState(brightness_mid=9.5, color_mid=20.0),
+            AreaState(color_override=400),
+            AreaState(color_override=-600),
+            AreaState(color_override=300, color_override_set_at=12.0),
+        ],
+    )
+    def test_area_state(self, state):
+        config = CONFIGS["warm_night_all"]
+        expected = _scalar(config, state, 4, SUN)
+        actual = curve_engine.day_curve(config, HOURS, 4, state=state, sun_times=SUN, use_numpy=True)
+        assert actual == expected
+
+    def test_scalar_fallback_matches(self):
+        config = CONFIGS["alt_days"]
+        assert curve_engine.day_curve(config, HOURS, 1, use_numpy=False) == (
+            curve_engine.day_curve(config, HOURS, 1, use_numpy=True)
+        )
+
+
+@needs_numpy
+class TestColorToXY:
+    """Array kelvin -> xy matches the scalar conversion."""
+
+    def test_matches_scalar(self):
+        ccts = [500, 800, 1199, 1200, 2000, 2222, 2223, 4000, 4001, 6500, 30000]
+        xs, ys = curve_engine.color_temperature_to_xy_array(ccts)
+        for cct, x, y in zip(ccts, xs, ys):
+            ex, ey = CircadianLight.color_temperature_to_xy(cct)
+            assert x == pytest.approx(ex, abs=1e-12)
+            assert y == pytest.approx(ey, abs=1e-12)
+
+
+def _ctx(config, hour, sun_times=SUN, state=None, weekday=None):
+    return pipeline.PipelineContext(
+        area_id="kitchen",
+        hour=hour,
+        config=config,
+        area_state=state or AreaState(is_circadian=True, is_on=True),
+        sun_times=sun_times,
+        weekday=weekday,
+    )
+
+
+class TestDailyCurveTable:
+    """Minute table lookups track the exact base curve."""
+
+    DAY = date(2026, 6, 2)  # Tuesday (weekday 1, an alt bed day)
+
+    @pytest.mark.parametrize("name", ["default", "warm_night_all", "alt_days"])
+    def test_exact_at_minute_marks(self, name):
+        config = CONFIGS[name]
+        night = SunTimes(sunrise=6.0, sunset=20.5, solar_noon=13.25, solar_mid=1.25)
+        table = curve_engine.DailyCurveTable(config, self.DAY, night)
+        for minute in range(0, 1440, 7):
+            hour = minute / 60.0
+            exact = pipeline.compute_base_curve(_ctx(config, hour, night, weekday=1))
+            assert table.lookup(hour) == exact
+
+    @pytest.mark.parametrize("name", sorted(CONFIGS))
+    def test_interpolates_between_minutes(self, name):
+        config = CONFIGS[name]
+        table = curve_engine.DailyCurveTable(config, self.DAY, SUN)
+        for second in range(0, 86400, 97):
+            hour = second / 3600.0
+            curve = table.lookup(hour, SUN.outdoor_normalized)
+            if curve is None:
+                continue  # jump minute, evaluated exactly by the caller
+            exact = pipeline.compute_base_curve(_ctx(config, hour, weekday=1))
+            assert abs(curve.brightness - exact.brightness) <= 1
+            assert abs(curve.kelvin - exact.kelvin) <= exact.kelvin * 0.01
+            assert curve.phase == exact.phase
+
+    def test_jump_minutes_defer_to_exact(self):
+        # Zero-fade warm night ends at sunrise + 60 min (7:00), snapping cool
+        config = CONFIGS["warm_night_sunrise"]
+        table = curve_engine.DailyCurveTable(config, self.DAY, SUN)
+        assert table.lookup(7.01) is None
+        assert table.lookup(7.0) is not None  # exact sample
+        cache = pipeline.BaseCurveCache(table=table)
+        ctx = _ctx(config, 7.01, weekday=1)
+        cache.apply(ctx)
+        assert cache.misses == 1 and cache.table_lookups == 0
+        assert ctx.base_curve == pipeline.compute_base_curve(ctx)
+
+    def test_covers_only_plain_curve(self):
+        config = CONFIGS["default"]
+        table = curve_engine.DailyCurveTable(config, self.DAY, SUN)
+        assert table.covers(_ctx(config, 9.0))
+        assert not table.covers(_ctx(config, 9.0, state=AreaState(brightness_mid=8.0)))
+        assert not table.covers(_ctx(config, 9.0, state=AreaState(color_override=300)))
+        assert not table.covers(_ctx(config, 9.0, state=AreaState(frozen_at=9.0)))
+        assert not table.covers(_ctx(Config(), 9.0))  # different config object
+        assert not table.covers(_ctx(config, 9.0, weekday=3))
+        assert not table.covers(_ctx(config, 9.0, SunTimes(sunrise=5.0)))
+
+    def test_base_curve_cache_uses_table(self):
+        config = CONFIGS["default"]
+        table = curve_engine.DailyCurveTable(config, self.DAY, SUN)
+        cache = pipeline.BaseCurveCache(table=table)
+        cache.apply(_ctx(config, 9.0))
+        cache.apply(_ctx(config, 9.0, state=AreaState(brightness_mid=8.0)))
+        assert cache.table_lookups == 1
+        assert cache.misses == 1
+
+
+class TestCurveTableStore:
+    """Tables are rebuilt on config/sun/day changes and evicted at rollover."""
+
+    def test_reuse_and_rebuild(self):
+        store = curve_engine.CurveTableStore()
+        config = Config()
+        day = date(2026, 6, 2)
+        table = store.get("Main", config, day, SUN)
+        assert store.get("Main", config, day, SUN) is table
+        # Outdoor level alone doesn't invalidate the table
+        brighter = SunTimes(sunrise=6.0, sunset=20.5, solar_noon=13.25,
+                            solar_mid=1.25, outdoor_normalized=0.9)
+        assert store.get("Main", config, day, brighter) is table
+        assert store.get("Main", Config(), day, SUN) is not table
+        assert store.get_stats()["builds"] == 2
+
+    def test_day_rollover_evicts(self):
+        store = curve_engine.CurveTableStore()
+        config = Config()
+        store.get("Main", config, date(2026, 6, 2), SUN)
+        store.get("Den", config, date(2026, 6, 2), SUN)
+        store.get("Main", config, date(2026, 6, 3), SUN)
+        assert store.get_stats()["tables"] == 1
+
+
+class TestStepSequence:
+    """step_sequence walks the same steps as repeated step button presses."""
+
+    @pytest.mark.parametrize("hour", [8.0, 14.5, 21.0, 2.0])
+    @pytest.mark.parametrize("action", ["brighten", "dim"])
+    def test_matches_repeated_set_position(self, hour, action):
+        config = Config()
+        steps = curve_engine.step_sequence(config, hour, action, 10, 2, SUN)
+        state = AreaState(is_circadian=True, is_on=True)
+        step_size = (config.max_brightness - config.min_brightness) / 10
+        sign = 1 if action == "brighten" else -1
+        for step in steps[1:]:
+            current = CircadianLight.calculate_brightness_at_hour(
+                hour, config, state, weekday=2
+            )
+            target = max(1, min(100, current + sign * step_size))
+            position = round((target - 1) / 99 * 100, 1)
+            result = CircadianLight.calculate_set_position(
+                hour, position, "step", config, state, sun_times=SUN, weekday=2
+            )
+            assert (step["brightness"], step["kelvin"]) == (
+                result.brightness,
+                result.color_temp,
+            )
+            for key, value in result.state_updates.items():
+                setattr(state, key, value)
+
+    def test_stops_at_limit(self):
+        steps = curve_engine.step_sequence(Config(), 14.5, "brighten", 10, 2, SUN)
+        assert len(steps) == 1
+        steps = curve_engine.step_sequence(Config(), 14.5, "dim", 10, 2, SUN)
+        assert len(steps) == 10
+        assert [s["brightness"] for s in steps] == sorted(
+            (s["brightness"] for s in steps), reverse=True
+        )
+
+    def test_step_hours_on_default_curve(self):
+        # Each step's hour is where the unstepped curve has that brightness
+        config = Config()
+        state = AreaState(is_circadian=True, is_on=True)
+        for step in curve_engine.step_sequence(config, 21.0, "dim", 10, 2, SUN):
+            curve = CircadianLight.calculate_brightness_at_hour(
+                step["hour"], config, state, weekday=2
+            )
+            assert abs(curve - step["brightness"]) <= 1
+
+
+class TestStepSequenceCache:
+    """Sequences are memoized per minute bucket with LRU eviction."""
+
+    def test_hit_within_minute(self):
+        cache = curve_engine.StepSequenceCache()
+        first = cache.get(Config(), 21.0, "dim", 10, 2, SUN)
+        first[0]["brightness"] = -1  # Callers can't corrupt the cache
+        again = cache.get(Config(), 21.0 + 10 / 3600, "dim", 10, 2, SUN)
+        assert again[0]["brightness"] != -1
+        assert again == curve_engine.step_sequence(Config(), 21.0, "dim", 10, 2, SUN)
+        assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_config_change_misses(self):
+        cache = curve_engine.StepSequenceCache()
+        cache.get(Config(), 21.0, "dim", 10, 2, SUN)
+        cache.get(Config(min_brightness=10), 21.0, "dim", 10, 2, SUN)
+        cache.get(Config(), 21.0, "brighten", 10, 2, SUN)
+        cache.get(Config(), 21.0, "dim", 5, 2, SUN)
+        assert cache.get_stats()["misses"] == 4
+
+    def test_lru_eviction(self):
+        cache = curve_engine.StepSequenceCache(size=2)
+        cache.get(Config(), 9.0, "dim", 10, 2, SUN)
+        cache.get(Config(), 10.0, "dim", 10, 2, SUN)
+        cache.get(Config(), 9.0, "dim", 10, 2, SUN)  # 9.0 now most recent
+        cache.get(Config(), 11.0, "dim", 10, 2, SUN)  # evicts 10.0
+        cache.get(Config(), 9.0, "dim", 10, 2, SUN)
+        assert cache.get_stats() == {"entries": 2, "hits": 2, "misses": 3}
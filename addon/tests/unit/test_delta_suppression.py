@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Test periodic delta suppression in delta_suppression.py."""
+
+import pytest
+
+from delta_suppression import DeltaSuppressor, SuppressionSettings, settings_from_config
+from pipeline import PurposeResult
+
+SETTINGS = SuppressionSettings(brightness_delta=2, mired_delta=2.0, max_stale_seconds=600)
+
+
+def _purpose(name, brightness, kelvin, should_off=False):
+    return PurposeResult(name, brightness, kelvin, (0.4, 0.4), should_off=should_off)
+
+
+def _sent(brightness, kelvin, is_off=False):
+    return {"brightness": brightness, "kelvin": kelvin, "is_off": is_off}
+
+
+def _primed(now=0.0):
+    """Suppressor whose first (always full) send for 'kitchen' is done."""
+    suppressor = DeltaSuppressor()
+    suppressor.unchanged_purposes("kitchen", [], {}, SETTINGS, now=now)
+    return suppressor
+
+
+class TestUnchangedPurposes:
+    """Purposes within the thresholds of the last send are skipped."""
+
+    def test_first_send_is_full(self):
+        suppressor = DeltaSuppressor()
+        purposes = [_purpose("Standard", 50, 3000)]
+        last = {"Standard": _sent(50, 3000)}
+        assert suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=0) == set()
+
+    def test_within_thresholds(self):
+        suppressor = _primed()
+        purposes = [
+            _purpose("Standard", 51, 3010),  # 1 point, ~1.1 mired
+            _purpose("Accent", 48, 3000),  # 2 points: sent
+            _purpose("Ambient", 30, 3100),  # ~10.8 mired: sent
+            _purpose("Task", 80, 3000),  # never sent
+        ]
+        last = {
+            "Standard": _sent(50, 3000),
+            "Accent": _sent(50, 3000),
+            "Ambient": _sent(30, 3000),
+        }
+        unchanged = suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=30)
+        assert unchanged == {"Standard"}
+
+    def test_mired_threshold_is_perceptual(self):
+        # The same 40K step is ~0.4 mired at 6500K but ~10 mired at 2000K
+        suppressor = _primed()
+        purposes = [_purpose("Cool", 50, 6540), _purpose("Warm", 50, 2040)]
+        last = {"Cool": _sent(50, 6500), "Warm": _sent(50, 2000)}
+        unchanged = suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=30)
+        assert unchanged == {"Cool"}
+
+    def test_off_state(self):
+        suppressor = _primed()
+        purposes = [
+            _purpose("Standard", 0, 3000, should_off=True),
+            _purpose("Accent", 40, 3000),
+            _purpose("Ambient", 0, 3000, should_off=True),
+        ]
+        last = {
+            "Standard": _sent(40, 3000, is_off=True),  # still off
+            "Accent": _sent(40, 3000, is_off=True),  # off -> on
+            "Ambient": _sent(40, 3000),  # on -> off
+        }
+        unchanged = suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=30)
+        assert unchanged == {"Standard"}
+
+    def test_compares_against_last_sent_not_last_computed(self):
+        # Drift of 1 point per tick goes out once it adds up to the threshold
+        suppressor = _primed()
+        last = {"Standard": _sent(50, 3000)}
+        assert suppressor.unchanged_purposes(
+            "kitchen", [_purpose("Standard", 51, 3000)], last, SETTINGS, now=30
+        ) == {"Standard"}
+        assert suppressor.unchanged_purposes(
+            "kitchen", [_purpose("Standard", 52, 3000)], last, SETTINGS, now=60
+        ) == set()
+
+
+class TestStaleness:
+    """A full resend is forced once max_stale_seconds has passed."""
+
+    def test_forced_resend(self):
+        suppressor = _primed(now=0)
+        purposes = [_purpose("Standard", 50, 3000)]
+        last = {"Standard": _sent(50, 3000)}
+        assert suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=599) == {"Standard"}
+        assert suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=600) == set()
+        # Timer restarts from the forced resend
+        assert suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=900) == {"Standard"}
+        assert suppressor.get_stats()["forced_resends"] == 1
+
+    def test_forget_forces_resend(self):
+        suppressor = _primed()
+        suppressor.forget("kitchen")
+        purposes = [_purpose("Standard", 50, 3000)]
+        last = {"Standard": _sent(50, 3000)}
+        assert suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=30) == set()
+
+    def test_stats(self):
+        suppressor = DeltaSuppressor()
+        purposes = [_purpose("Standard", 50, 3000), _purpose("Accent", 20, 3000)]
+        last = {"Standard": _sent(50, 3000), "Accent": _sent(10, 3000)}
+        suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=0)
+        suppressor.unchanged_purposes("kitchen", purposes, last, SETTINGS, now=30)
+        assert suppressor.get_stats() == {"suppressed": 1, "sent": 3, "forced_resends": 0}
+
+
+class TestSettings:
+    """Settings come from the global config and default to disabled."""
+
+    def test_disabled_by_default(self):
+        assert settings_from_config({}) is None
+
+    def test_from_config(self):
+        settings = settings_from_config(
+            {
+                "periodic_suppress_enabled": True,
+                "periodic_suppress_brightness": 3,
+                "periodic_suppress_mired": 5,
+                "periodic_suppress_max_stale": 2,
+            }
+        )
+        assert settings == SuppressionSettings(3.0, 5.0, 120.0)
+
+    def test_defaults_when_enabled(self):
+        assert settings_from_config({"periodic_suppress_enabled": True}) == SuppressionSettings()
+
+
+class TestOffPurposeCache:
+    """Purposes sent OFF are cached as off only when suppression is on."""
+
+    async def _send_off(self, monkeypatch, raw_config):
+        from unittest.mock import AsyncMock
+
+        import glozone
+        import state
+        from main import HomeAssistantWebSocketClient
+
+        monkeypatch.setattr(glozone, "get_config_snapshot", lambda: raw_config)
+        monkeypatch.setattr(state, "_purpose_cache", {})
+        state.set_last_sent_purpose("kitchen", "Accent", 40, 3000)
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        client.call_service = AsyncMock()
+        client.get_lights_by_capability = lambda area_id: (["light.a"], [], [], [])
+        await client._deliver_filtered(
+            "kitchen",
+            None,
+            3000,
+            (0.4, 0.4),
+            0.5,
+            True,
+            False,
+            {"light.a": "Accent"},
+            1.0,
+            skip_two_step=True,
+            precomputed_purposes=[_purpose("Accent", 0, 3000, should_off=True)],
+        )
+        assert client.call_service.await_args[0][1] == "turn_off"
+        return state.get_last_sent_purpose("kitchen", "Accent")
+
+    @pytest.mark.asyncio
+    async def test_cached_as_off_with_suppression(self, monkeypatch):
+        cached = await self._send_off(monkeypatch, {"periodic_suppress_enabled": True})
+        assert cached == {"brightness": 40, "kelvin": 3000, "is_off": True}
+
+    @pytest.mark.asyncio
+    async def test_cache_untouched_without_suppression(self, monkeypatch):
+        # 2-step and feedback cues keep their previous view of the purpose
+        cached = await self._send_off(monkeypatch, {})
+        assert cached == {"brightness": 40, "kelvin": 3000, "is_off": False}
+
+
+class TestForgetOnLightAction:
+    """User actions and turn-offs restart the area's staleness timer."""
+
+    def _client(self):
+        from unittest.mock import AsyncMock
+
+        from main import HomeAssistantWebSocketClient
+
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        client.call_service = AsyncMock()
+        client._deliver_filtered = AsyncMock()
+        client.determine_light_target = AsyncMock(return_value=("area_id", "kitchen"))
+        client.get_lights_by_capability = lambda area_id: ([], [], [], [])
+        client.delta_suppressor.unchanged_purposes("kitchen", [], {}, SETTINGS, now=0.0)
+        return client
+
+    def _is_primed(self, client):
+        """True if the timer survived (an unchanged purpose is still skipped)."""
+        unchanged = client.delta_suppressor.unchanged_purposes(
+            "kitchen",
+            [_purpose("Accent", 40, 3000)],
+            {"Accent": _sent(40, 3000)},
+            SETTINGS,
+            now=1.0,
+        )
+        return unchanged == {"Accent"}
+
+    @pytest.mark.asyncio
+    async def test_user_send_forgets(self, monkeypatch):
+        from types import SimpleNamespace
+
+        import glozone
+
+        monkeypatch.setattr(glozone, "get_area_light_filters", lambda area_id: {})
+        monkeypatch.setattr(glozone, "get_area_brightness_factor", lambda area_id: 1.0)
+        client = self._client()
+        result = SimpleNamespace(
+            area_brightness=40, area_kelvin=3000, area_xy=(0.4, 0.4), purposes=[]
+        )
+        await client.send_light("kitchen", pipeline_result=result)
+        assert not self._is_primed(client)
+
+    @pytest.mark.asyncio
+    async def test_periodic_send_keeps_timer(self, monkeypatch):
+        from types import SimpleNamespace
+
+        import glozone
+
+        monkeypatch.setattr(glozone, "get_area_light_filters", lambda area_id: {})
+        monkeypatch.setattr(glozone, "get_area_brightness_factor", lambda area_id: 1.0)
+        client = self._client()
+        client._in_periodic_tick = True
+        result = SimpleNamespace(
+            area_brightness=40, area_kelvin=3000, area_xy=(0.4, 0.4), purposes=[]
+        )
+        await client.send_light("kitchen", pipeline_result=result)
+        assert self._is_primed(client)
+
+    @pytest.mark.asyncio
+    async def test_turn_off_forgets(self):
+        client = self._client()
+        await client.turn_off_lights("kitchen")
+        assert not self._is_primed(client)
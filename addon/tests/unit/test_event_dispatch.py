@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Test per-key ordered event dispatch in event_dispatch.py."""
+
+import asyncio
+
+import pytest
+
+from event_dispatch import KeyedDispatcher
+
+
+async def _settle(dispatcher):
+    while dispatcher.get_stats()["active_keys"]:
+        await asyncio.sleep(0)
+
+
+class TestOrdering:
+    """Same key runs in order; different keys don't wait for each other."""
+
+    @pytest.mark.asyncio
+    async def test_in_order_per_key(self):
+        dispatcher = KeyedDispatcher()
+        log = []
+
+        async def handler(name, delay):
+            await asyncio.sleep(delay)
+            log.append(name)
+
+        dispatcher.submit("switch:a", lambda: handler("a1", 0.02))
+        dispatcher.submit("switch:a", lambda: handler("a2", 0))
+        dispatcher.submit("switch:b", lambda: handler("b1", 0))
+        await asyncio.sleep(0.05)
+        await _settle(dispatcher)
+
+        assert log.index("a1") < log.index("a2")
+        # b1 didn't queue behind the slow a1
+        assert log.index("b1") < log.index("a1")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        dispatcher = KeyedDispatcher(max_concurrency=2)
+        running = []
+        peak = []
+
+        async def handler():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        for i in range(5):
+            dispatcher.submit(f"area:{i}", handler)
+        assert dispatcher.get_stats()["pending"] == 5
+        await asyncio.sleep(0.05)
+        await _settle(dispatcher)
+
+        assert max(peak) == 2
+        assert dispatcher.get_stats()["dispatched"] == 5
+
+    @pytest.mark.asyncio
+    async def test_shared_key_orders_across_key_sets(self):
+        dispatcher = KeyedDispatcher()
+        log = []
+
+        async def handler(name, delay):
+            await asyncio.sleep(delay)
+            log.append(name)
+
+        dispatcher.submit(("sensor:a", "area:kitchen"), lambda: handler("motion", 0.02))
+        dispatcher.submit(("switch:s", "area:kitchen", "area:den"), lambda: handler("press", 0))
+        dispatcher.submit(("area:hall",), lambda: handler("hall", 0))
+        await asyncio.sleep(0.05)
+        await _settle(dispatcher)
+
+        assert log == ["hall", "motion", "press"]
+        assert dispatcher.get_stats()["max_key_depth"] == 2
+
+
+class TestErrorsAndCancel:
+    """A failing handler doesn't stop its key; cancel() drops queued work."""
+
+    @pytest.mark.asyncio
+    async def test_error_does_not_stop_key(self):
+        dispatcher = KeyedDispatcher()
+        log = []
+
+        async def boom():
+            raise ValueError("bad event")
+
+        async def ok():
+            log.append("ok")
+
+        dispatcher.submit("sensor:x", boom)
+        dispatcher.submit("sensor:x", ok)
+        await _settle(dispatcher)
+
+        assert log == ["ok"]
+        stats = dispatcher.get_stats()
+        assert stats["errors"] == 1
+        assert stats["dispatched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        dispatcher = KeyedDispatcher()
+        log = []
+
+        async def slow():
+            await asyncio.sleep(10)
+            log.append("slow")
+
+        async def after():
+            log.append("after")
+
+        dispatcher.submit("sync", slow)
+        dispatcher.submit("sync", after)
+        await asyncio.sleep(0)
+        await dispatcher.cancel()
+
+        assert log == []
+        stats = dispatcher.get_stats()
+        assert stats["pending"] == 0
+        assert stats["running"] == 0
+        assert stats["active_keys"] == 0
+
+
+def _event(event_type, **data):
+    return {"type": "event", "event": {"event_type": event_type, "data": data}}
+
+
+class TestClientKeys:
+    """The client keys switch and sensor events by the areas they act on."""
+
+    def test_dispatch_key_routing(self, monkeypatch):
+        import switches
+        from main import HomeAssistantWebSocketClient
+
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        monkeypatch.setattr(switches, "_switches", {
+            "00:11": switches.SwitchConfig(
+                id="00:11", name="Hall", type="hue_dimmer",
+                scopes=[switches.SwitchScope(areas=["kitchen"]),
+                        switches.SwitchScope(areas=["den"])],
+            ),
+        })
+        monkeypatch.setattr(switches, "_motion_sensors", {
+            "m1": switches.MotionSensorConfig(
+                id="m1", name="Kitchen motion", device_id="dev-m1",
+                scopes=[switches.MotionScope(areas=["kitchen"])],
+            ),
+        })
+        monkeypatch.setattr(switches, "_contact_sensors", {})
+        client.motion_sensor_ids = {"binary_sensor.kitchen_motion": "dev-m1"}
+        key = client._dispatch_key
+
+        assert key(_event("zha_event", device_ieee="00:11")) == (
+            "switch:00:11", "area:kitchen", "area:den"
+        )
+        assert key(_event(
+            "state_changed", entity_id="binary_sensor.kitchen_motion"
+        )) == ("sensor:binary_sensor.kitchen_motion", "area:kitchen")
+        assert key(_event(
+            "call_service", domain="circadian",
+            service_data={"area_id": ["kitchen", "den"]},
+        )) == ("area:kitchen", "area:den")
+        assert key(_event("hue_event", device_id="unknown")) == ("switch:unknown",)
+        assert key(_event("state_changed", entity_id="light.kitchen")) is None
+        assert key(_event("circadian_light_sync_devices")) == ("sync",)
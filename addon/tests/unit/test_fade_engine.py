@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Test fade trajectories and frame pacing in fade_engine.py."""
+
+import pytest
+
+import fade_engine
+from brain import CircadianLight
+from fade_engine import FadeEngine, FadeTrajectory
+from pipeline import PipelineResult, PurposeResult
+
+
+def _result(brightness, kelvin, purposes=None):
+    xy = CircadianLight.color_temperature_to_xy(kelvin)
+    purposes = purposes or {"Standard": brightness}
+    return PipelineResult(
+        purposes=[PurposeResult(name, bri, kelvin, xy) for name, bri in purposes.items()],
+        area_brightness=brightness,
+        area_kelvin=kelvin,
+        area_xy=xy,
+        rhythm_brightness=brightness,
+        rhythm_kelvin=kelvin,
+        phase="ascend",
+    )
+
+
+def _fade_state(duration, preset="circadian", start_bri=0, start_kelvin=2000):
+    return {
+        "fade_start": "2026-01-01T07:00:00",
+        "fade_duration": duration,
+        "fade_direction": "out" if preset == "off" else "in",
+        "fade_target_preset": preset,
+        "fade_start_brightness": start_bri,
+        "fade_start_kelvin": start_kelvin,
+    }
+
+
+class TestTrajectory:
+    """Frames lerp between the captured start and the precomputed target."""
+
+    def test_lerp_and_purpose_ratios(self):
+        target = _result(80, 3000, {"Standard": 80, "Accent": 40})
+        traj = FadeTrajectory(
+            "kitchen", _fade_state(600), 0.0, _result(50, 2700, {"Standard": 50, "Accent": 50}),
+            target, now=100.0,
+        )
+        frame = traj.render(traj.progress_at(400.0))  # halfway
+        assert frame.area_brightness == 40
+        assert frame.area_kelvin == 2500
+        by_name = {p.name: p.brightness for p in frame.purposes}
+        assert by_name == {"Standard": 40, "Accent": 20}
+        assert all(p.kelvin == 2500 for p in frame.purposes)
+        # The template is not modified
+        assert traj.template.area_brightness == 50
+
+    def test_fade_out_holds_kelvin(self):
+        traj = FadeTrajectory(
+            "kitchen", _fade_state(100, "off", 60, 2800), 0.5, _result(60, 2800), None, now=0.0
+        )
+        assert traj.values_at(traj.progress_at(0.0)) == (30, 2800)
+        assert traj.values_at(1.0) == (1, 2800)
+
+    def test_progress_resumes_mid_fade(self):
+        traj = FadeTrajectory("kitchen", _fade_state(200), 0.25, _result(1, 2000), _result(100, 2000), now=10.0)
+        assert traj.progress_at(10.0) == pytest.approx(0.25)
+        assert traj.progress_at(1000.0) == 1.0
+
+
+class TestFramePacing:
+    """Steep fades get frequent frames, flat ones rare frames."""
+
+    def test_steep_fade_frames_often(self):
+        # 0 -> 100% in 60s: 2% steps every 1.2s
+        traj = FadeTrajectory("a", _fade_state(60), 0.0, _result(1, 2000), _result(100, 2000), now=0.0)
+        assert traj.frame_interval(0.0) == pytest.approx(1.2)
+
+    def test_flat_fade_frames_rarely(self):
+        # 50 -> 52% over 30 min
+        traj = FadeTrajectory(
+            "a", _fade_state(1800, start_bri=50, start_kelvin=2700), 0.0,
+            _result(50, 2700), _result(52, 2700), now=0.0,
+        )
+        assert traj.frame_interval(0.0) == fade_engine.MAX_FRAME_INTERVAL
+
+    def test_kelvin_can_drive_pacing(self):
+        # Brightness flat, 2000K -> 6000K over 10 min: 100K steps every 15s
+        traj = FadeTrajectory(
+            "a", _fade_state(600, start_bri=50, start_kelvin=2000), 0.0,
+            _result(50, 2000), _result(50, 6000), now=0.0,
+        )
+        assert traj.frame_interval(0.0) == pytest.approx(15.0)
+
+    def test_interval_clamped_to_remaining(self):
+        traj = FadeTrajectory("a", _fade_state(600), 0.0, _result(1, 2000), _result(3, 2000), now=0.0)
+        assert traj.frame_interval(590.0) == pytest.approx(10.0)
+        assert traj.frame_interval(700.0) == 0.0
+
+
+class TestEngine:
+    """FadeEngine caches trajectories and schedules frames."""
+
+    def _traj(self, area_id="a", token="2026-01-01T07:00:00", now=0.0):
+        fs = _fade_state(600)
+        fs["fade_start"] = token
+        return FadeTrajectory(area_id, fs, 0.0, _result(1, 2000), _result(100, 2000), now=now)
+
+    def test_frames_scheduled_and_counted(self):
+        engine = FadeEngine()
+        engine.set_trajectory(self._traj())
+        assert engine.due_areas(["a"], now=0.0) == ["a"]
+        engine.record_frame("a", 12.0, now=0.0)
+        assert engine.due_areas(["a"], now=5.0) == []
+        assert engine.seconds_until_next_frame(now=5.0) == pytest.approx(7.0)
+        assert engine.due_areas(["a"], now=12.0) == ["a"]
+        assert engine.get_stats() == {
+            "active_fades": 1, "frames_sent": 1, "trajectories_built": 1,
+        }
+
+    def test_final_frame_does_not_spin(self):
+        engine = FadeEngine()
+        engine.set_trajectory(self._traj())
+        engine.record_frame("a", 0.0, now=0.0)
+        assert engine.due_areas(["a"], now=0.5) == []
+
+    def test_trajectory_reused_until_refresh_or_new_fade(self):
+        engine = FadeEngine()
+        traj = self._traj(now=0.0)
+        engine.set_trajectory(traj)
+        assert engine.get_trajectory("a", traj.token, now=10.0) is traj
+        assert engine.get_trajectory("a", "other", now=10.0) is None
+        assert engine.get_trajectory(
+            "a", traj.token, now=fade_engine.TARGET_REFRESH_INTERVAL
+        ) is None
+
+    def test_new_fade_is_framed_immediately(self):
+        engine = FadeEngine()
+        engine.set_trajectory(self._traj())
+        engine.record_frame("a", 30.0, now=0.0)
+        engine.set_trajectory(self._traj(token="2026-01-01T08:00:00"))
+        assert engine.due_areas(["a"], now=1.0) == ["a"]
+
+    def test_prune_drops_finished_fades(self):
+        engine = FadeEngine()
+        engine.set_trajectory(self._traj("a"))
+        engine.set_trajectory(self._traj("b"))
+        engine.record_frame("b", 5.0, now=0.0)
+        engine.prune(["a"])
+        assert not engine.is_active("b")
+        assert engine.get_stats()["active_fades"] == 1
+        assert engine.seconds_until_next_frame(now=0.0) is None
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Test the in-memory cache and debounced writes in glozone_state.py."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+import glozone_state
+
+
+@pytest.fixture
+def zone_file(tmp_path):
+    """Point glozone_state at a temp file and reset the cache."""
+    path = tmp_path / "glozone_runtime_state.json"
+    old_file = glozone_state._STATE_FILE
+    glozone_state._STATE_FILE = path
+    glozone_state.init()
+    yield path
+    glozone_state.flush()
+    glozone_state._STATE_FILE = old_file
+    glozone_state._state_cache = None
+    glozone_state._state_file_sig = None
+
+
+class TestCache:
+    """Reads come from memory unless the file changed underneath."""
+
+    def test_set_then_get(self, zone_file):
+        glozone_state.set_zone_state("Main", {"brightness_mid": 8.5})
+        assert glozone_state.get_zone_state("Main")["brightness_mid"] == 8.5
+        assert json.loads(zone_file.read_text())["Main"]["brightness_mid"] == 8.5
+
+    def test_unchanged_file_not_reparsed(self, zone_file, monkeypatch):
+        glozone_state.set_zone_state("Main", {"frozen_at": 12.0})
+        calls = []
+        real_load = json.load
+        monkeypatch.setattr(json, "load", lambda f: calls.append(1) or real_load(f))
+        for _ in range(10):
+            assert glozone_state.is_zone_frozen("Main")
+        assert calls == []
+
+    def test_external_write_is_picked_up(self, zone_file):
+        glozone_state.set_zone_state("Main", {"color_mid": 10.0})
+        zone_file.write_text(json.dumps({"Main": {"color_mid": 14.25}, "Other": {}}))
+        # Force a distinct mtime even on coarse filesystems
+        st = os.stat(zone_file)
+        os.utime(zone_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert glozone_state.get_zone_state("Main")["color_mid"] == 14.25
+        assert sorted(glozone_state.get_all_zone_names()) == ["Main", "Other"]
+
+    def test_returned_state_is_a_copy(self, zone_file):
+        glozone_state.set_zone_state("Main", {"brightness_mid": 9.0})
+        glozone_state.get_zone_state("Main")["brightness_mid"] = 1.0
+        assert glozone_state.get_zone_state("Main")["brightness_mid"] == 9.0
+
+
+class TestDebouncedWrites:
+    """Inside an event loop, writes are coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_burst_written_once(self, zone_file):
+        for i in range(20):
+            glozone_state.set_zone_state("Main", {"brightness_mid": float(i)})
+        assert not zone_file.exists()
+        assert glozone_state.get_zone_state("Main")["brightness_mid"] == 19.0
+
+        await asyncio.sleep(glozone_state.FLUSH_DELAY + 0.2)
+
+        assert json.loads(zone_file.read_text())["Main"]["brightness_mid"] == 19.0
+        assert glozone_state.flush() is False
+
+    @pytest.mark.asyncio
+    async def test_reset_all_zones_flushes_immediately(self, zone_file):
+        glozone_state.set_zone_state("Main", {"brightness_mid": 7.0})
+        glozone_state.reset_all_zones()
+        assert json.loads(zone_file.read_text())["Main"]["brightness_mid"] is None
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Test jsoncodec: same results with and without orjson."""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+import jsoncodec
+
+FRAME = {
+    "id": 12,
+    "type": "event",
+    "event": {
+        "event_type": "state_changed",
+        "data": {
+            "entity_id": "light.kitchen",
+            "new_state": {"state": "on", "attributes": {"brightness": 128, "xy_color": [0.45, 0.41]}},
+            "old_state": None,
+        },
+    },
+    "name": "Küche",
+}
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def codec(request, monkeypatch):
+    """jsoncodec as imported, and reloaded as if orjson were missing."""
+    if request.param == "default":
+        yield jsoncodec
+        return
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(jsoncodec)
+    monkeypatch.undo()
+    importlib.reload(jsoncodec)
+
+
+class TestCodec:
+    """dumps/loads match the stdlib json module."""
+
+    def test_round_trip(self, codec):
+        text = codec.dumps(FRAME)
+        assert isinstance(text, str)
+        assert json.loads(text) == FRAME
+        assert codec.loads(json.dumps(FRAME)) == FRAME
+        assert codec.loads(json.dumps(FRAME).encode("utf-8")) == FRAME
+
+    def test_int_keys(self, codec):
+        assert json.loads(codec.dumps({1: "a", "b": 2})) == {"1": "a", "b": 2}
+
+    def test_huge_int(self, codec):
+        assert json.loads(codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_decode_error(self, codec):
+        with pytest.raises(codec.DecodeError):
+            codec.loads("{not json")
+
+    def test_unserializable(self, codec):
+        with pytest.raises(TypeError):
+            codec.dumps({"s": {1, 2}})
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Test per-target light command coalescing in light_outbox.py."""
+
+import asyncio
+
+import pytest
+
+import rate_limiter
+from light_outbox import LightOutbox, entity_covers, merge_commands, target_key
+
+
+class FakeSender:
+    """Records (service, service_data, target) as sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, service, service_data, target):
+        self.sent.append((service, service_data, target))
+        return len(self.sent)
+
+
+GROUP = {"entity_id": "light.circadian_kitchen_standard_color"}
+KITCHEN = {"area_id": "kitchen"}
+
+
+class TestMerge:
+    """merge_commands() keeps what the newer command didn't set."""
+
+    def test_brightness_then_color(self):
+        merged = merge_commands(
+            ("turn_on", {"brightness_pct": 40, "transition": 1}),
+            ("turn_on", {"xy_color": [0.5, 0.4], "transition": 0.4}),
+        )
+        assert merged == (
+            "turn_on",
+            {"brightness_pct": 40, "xy_color": [0.5, 0.4], "transition": 0.4},
+        )
+
+    def test_color_mode_switch_drops_old_color(self):
+        merged = merge_commands(
+            ("turn_on", {"brightness": 100, "xy_color": [0.5, 0.4]}),
+            ("turn_on", {"brightness_pct": 60, "color_temp_kelvin": 2700}),
+        )
+        assert merged == ("turn_on", {"brightness_pct": 60, "color_temp_kelvin": 2700})
+
+    def test_transition_is_latest(self):
+        merged = merge_commands(
+            ("turn_on", {"brightness_pct": 40, "transition": 2}),
+            ("turn_on", {"brightness_pct": 50}),
+        )
+        assert merged == ("turn_on", {"brightness_pct": 50})
+
+    def test_off_and_on_replace(self):
+        assert merge_commands(
+            ("turn_on", {"brightness_pct": 40}), ("turn_off", {"transition": 0.3})
+        ) == ("turn_off", {"transition": 0.3})
+        assert merge_commands(
+            ("turn_off", {"transition": 0.3}), ("turn_on", {"brightness_pct": 40})
+        ) == ("turn_on", {"brightness_pct": 40})
+
+    def test_relative_not_merged(self):
+        assert merge_commands(
+            ("turn_on", {"brightness_pct": 40}), ("turn_on", {"brightness_step_pct": 10})
+        ) is None
+
+    def test_entity_covers(self):
+        assert entity_covers({"entity_id": "light.a"}) == {"light.a"}
+        assert entity_covers({"entity_id": ["light.a", "light.b"]}) == {"light.a", "light.b"}
+        assert entity_covers(KITCHEN) is None
+
+    def test_target_key_ignores_list_order(self):
+        assert target_key({"entity_id": ["light.a", "light.b"]}) == target_key(
+            {"entity_id": ["light.b", "light.a"]}
+        )
+
+
+class TestOutbox:
+    """Pending commands coalesce per target and flush on the interval."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_per_target(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=0.01)
+        await outbox.submit("turn_on", {"brightness_pct": 30}, GROUP)
+        await outbox.submit("turn_on", {"brightness_pct": 35}, GROUP)
+        await outbox.submit("turn_on", {"brightness_pct": 50}, {"entity_id": "light.den"})
+        await outbox.submit("turn_on", {"brightness_pct": 40, "transition": 0.4}, GROUP)
+        assert sender.sent == []
+
+        await asyncio.sleep(0.05)
+        assert sender.sent == [
+            ("turn_on", {"brightness_pct": 50}, {"entity_id": "light.den"}),
+            ("turn_on", {"brightness_pct": 40, "transition": 0.4}, GROUP),
+        ]
+        stats = outbox.get_stats()
+        assert (stats["submitted"], stats["sent"], stats["coalesced"]) == (4, 2, 2)
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_barrier_sends_pending_first(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=10)
+        await outbox.submit("turn_on", {"brightness_pct": 80, "xy_color": [0.4, 0.4]}, GROUP)
+        await outbox.submit("turn_on", {"brightness_pct": 20}, GROUP, barrier=True)
+        await outbox.submit("turn_on", {"xy_color": [0.5, 0.4]}, GROUP)
+        assert [data for _, data, _ in sender.sent] == [
+            {"brightness_pct": 80, "xy_color": [0.4, 0.4]},
+            {"brightness_pct": 20},
+        ]
+        await outbox.flush()
+        assert sender.sent[-1][1] == {"xy_color": [0.5, 0.4]}
+        outbox.clear()
+
+    @pytest.mark.asyncio
+    async def test_unmergeable_queues_behind_pending(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=10)
+        await outbox.submit("turn_on", {"brightness_pct": 40}, GROUP)
+        await outbox.submit("turn_on", {"brightness_step_pct": -10}, GROUP)
+        await outbox.submit("turn_on", {"xy_color": [0.5, 0.4]}, GROUP)
+        assert outbox.get_stats()["unmergeable"] == 1
+        await outbox.flush()
+        assert [data for _, data, _ in sender.sent] == [
+            {"brightness_pct": 40},
+            {"brightness_step_pct": -10},
+            {"xy_color": [0.5, 0.4]},
+        ]
+        await outbox.submit("turn_on", {"brightness_pct": 40}, GROUP)
+        outbox.clear()
+        assert outbox.get_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_send_error_counted(self):
+        async def failing(service, service_data, target):
+            raise ConnectionError("closed")
+
+        outbox = LightOutbox(failing, interval=10)
+        await outbox.submit("turn_off", {}, GROUP)
+        await outbox.flush()
+        assert outbox.get_stats()["errors"] == 1
+        outbox.clear()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_targets_keep_write_order(self):
+        sender = FakeSender()
+        outbox = LightOutbox(
+            sender.send,
+            interval=10,
+            covers=lambda t: frozenset({"light.a", "light.b"}) if "area_id" in t
+            else entity_covers(t),
+        )
+        await outbox.submit("turn_on", {"brightness_pct": 30}, {"entity_id": "light.a"})
+        await outbox.submit("turn_off", {"transition": 0}, KITCHEN)
+        await outbox.submit("turn_on", {"brightness_pct": 50}, {"entity_id": "light.a"})
+        await outbox.flush()
+        assert sender.sent == [
+            ("turn_on", {"brightness_pct": 30}, {"entity_id": "light.a"}),
+            ("turn_off", {"transition": 0}, KITCHEN),
+            ("turn_on", {"brightness_pct": 50}, {"entity_id": "light.a"}),
+        ]
+        assert outbox.get_stats()["coalesced"] == 0
+        outbox.clear()
+
+    @pytest.mark.asyncio
+    async def test_merged_command_moves_to_end(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=10)
+        await outbox.submit("turn_on", {"brightness_pct": 30}, {"entity_id": "light.a"})
+        await outbox.submit("turn_on", {"brightness_pct": 60}, {"entity_id": "light.b"})
+        await outbox.submit("turn_on", {"brightness_pct": 50}, {"entity_id": "light.a"})
+        await outbox.flush()
+        assert [t["entity_id"] for _, _, t in sender.sent] == ["light.b", "light.a"]
+        assert sender.sent[-1][1] == {"brightness_pct": 50}
+        outbox.clear()
+
+
+def _paced(rate=50.0, burst=1):
+    limiter = rate_limiter.RateLimiter(rate, burst)
+    limiter.enabled = True
+    return limiter
+
+
+class TestOutboxWithLimiter:
+    """With the rate limiter on, the most urgent pending command goes first."""
+
+    @pytest.mark.asyncio
+    async def test_user_barrier_overtakes_periodic(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=0.001, limiter=_paced())
+        with rate_limiter.priority("periodic"):
+            for i in range(4):
+                await outbox.submit("turn_on", {"brightness_pct": i}, {"entity_id": f"light.p{i}"})
+        await asyncio.sleep(0.005)  # Window over; first periodic command sent
+        await asyncio.wait_for(
+            outbox.submit("turn_on", {"brightness_pct": 1}, GROUP, barrier=True), 1
+        )
+        assert sender.sent[-1][2] == GROUP
+        assert len(sender.sent) <= 2
+        await asyncio.wait_for(outbox.flush(), 1)
+        assert len(sender.sent) == 5
+        assert outbox.get_stats()["preempted"] >= 1
+        outbox.clear()
+
+    @pytest.mark.asyncio
+    async def test_user_command_during_drain_goes_next(self):
+        sender = FakeSender()
+        outbox = LightOutbox(sender.send, interval=0.001, limiter=_paced())
+        with rate_limiter.priority("periodic"):
+            for i in range(4):
+                await outbox.submit("turn_on", {"brightness_pct": i}, {"entity_id": f"light.p{i}"})
+        await asyncio.sleep(0.005)
+        await outbox.submit("turn_on", {"brightness_pct": 70}, GROUP)
+        for _ in range(100):
+            if any(t == GROUP for _, _, t in sender.sent):
+                break
+            await asyncio.sleep(0.005)
+        assert [t for _, _, t in sender.sent].index(GROUP) <= 2
+        outbox.clear()
+
+    @pytest.mark.asyncio
+    async def test_overlapped_command_promoted(self):
+        sender = FakeSender()
+        outbox = LightOutbox(
+            sender.send,
+            interval=10,
+            covers=lambda t: frozenset({"light.a", "light.b"}) if "area_id" in t
+            else entity_covers(t),
+            limiter=_paced(burst=10),
+        )
+        with rate_limiter.priority("periodic"):
+            await outbox.submit("turn_on", {"brightness_pct": 5}, {"entity_id": "light.x"})
+            await outbox.submit("turn_on", {"brightness_pct": 30}, {"entity_id": "light.a"})
+        await outbox.submit("turn_off", {}, KITCHEN)
+        await outbox.flush()
+        assert [t for _, _, t in sender.sent] == [
+            {"entity_id": "light.a"},
+            KITCHEN,
+            {"entity_id": "light.x"},
+        ]
+        outbox.clear()
+
+
+class TestClientCovers:
+    """The client resolves areas and groups to the lights they reach."""
+
+    def test_area_group_and_light_targets(self):
+        from main import HomeAssistantWebSocketClient
+
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        client.area_lights = {"kitchen": ["light.a", "light.b"], "den": ["light.c"]}
+        client.light_color_modes = {"light.a": {"xy"}, "light.b": {"color_temp"}}
+        client.group_entity_info = {
+            "light.circadian_kitchen_standard_color": {
+                "type": "zha_group_standard_color",
+                "area_id": "kitchen",
+            },
+            "light.unplaced_group": {"type": "zha_group", "area_id": None},
+        }
+        covers = client._light_target_covers
+        assert covers(KITCHEN) == {"light.a", "light.b"}
+        assert covers(GROUP) == {"light.a"}
+        assert covers({"entity_id": ["light.c", "light.d"]}) == {"light.c", "light.d"}
+        assert covers({"area_id": "garage"}) is None
+        assert covers({"entity_id": "light.unplaced_group"}) is None
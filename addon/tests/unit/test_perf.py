@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Test optional stage timing in perf.py."""
+
+import pytest
+
+import perf
+import pipeline
+from brain import AreaState, Config, SunTimes
+
+
+def _ctx():
+    return pipeline.PipelineContext(
+        area_id="test_area",
+        hour=12.0,
+        config=Config(),
+        area_state=AreaState(is_circadian=True, is_on=True),
+        sun_times=SunTimes(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    perf.reset()
+    perf.set_enabled(False)
+    yield
+    perf.reset()
+    perf.set_enabled(False)
+
+
+class TestDisabled:
+    """Off by default: nothing is timed or stored."""
+
+    def test_no_timer(self):
+        assert perf.stage_timer("pipeline") is None
+
+    def test_pipeline_records_nothing(self):
+        pipeline.compute(_ctx())
+        assert perf.get_stats()["stages"] == {}
+
+
+class TestStageTimer:
+    """mark() charges elapsed time to a stage; done() records the run."""
+
+    def test_marks_accumulate(self, monkeypatch):
+        clock = iter([0.0, 1.0, 1.5, 3.0])
+        monkeypatch.setattr(perf.time, "perf_counter", lambda: next(clock))
+        timer = perf.StageTimer("pipeline")
+        timer.mark("purpose_filters")  # 1.0
+        timer.mark("ct_comp")  # 0.5
+        timer.mark("purpose_filters")  # 1.5
+        timer.done()
+        stages = perf.get_stats()["stages"]
+        assert stages["pipeline.purpose_filters"]["max_ms"] == 2500.0
+        assert stages["pipeline.ct_comp"]["max_ms"] == 500.0
+        assert stages["pipeline.ct_comp"]["count"] == 1
+
+    def test_pipeline_stages(self):
+        perf.set_enabled(True)
+        pipeline.compute(_ctx())
+        stages = perf.get_stats()["stages"]
+        assert {"pipeline.base_curve", "pipeline.sun_bright", "pipeline.area_factor"} <= set(stages)
+
+
+class TestStats:
+    """Rolling percentiles over the last WINDOW samples."""
+
+    def test_percentiles(self):
+        for ms in range(1, 101):
+            perf.record("tick", ms / 1000)
+        tick = perf.get_stats()["stages"]["tick"]
+        assert tick["count"] == 100
+        assert tick["p50_ms"] == pytest.approx(51.0)
+        assert tick["p95_ms"] == pytest.approx(95.0)
+        assert tick["max_ms"] == pytest.approx(100.0)
+
+    def test_window(self, monkeypatch):
+        monkeypatch.setattr(perf, "WINDOW", 10)
+        for ms in range(20):
+            perf.record("tick", ms / 1000)
+        tick = perf.get_stats()["stages"]["tick"]
+        assert tick["count"] == 20
+        assert tick["window"] == 10
+        assert tick["p50_ms"] >= 10.0
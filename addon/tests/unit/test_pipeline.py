@@ -10,8 +10,17 @@ import os
 # Ensure addon modules are importable
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+import pipeline as pipeline_mod
 from brain import AreaState, CircadianLight, Config, SunTimes
-from pipeline import PipelineContext, PipelineResult, apply_ct_compensation, compute
+from pipeline import (
+    BaseCurveCache,
+    PipelineContext,
+    PipelineResult,
+    apply_ct_compensation,
+    compute,
+    compute_base_curve,
+    compute_many,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -545,3 +554,151 @@ class TestPrecomputedCurve:
             )
         )
         assert with_comp.purposes[0].brightness > no_comp.purposes[0].brightness
+
+
+# ---------------------------------------------------------------------------
+# Shared base curve (batched tick)
+# ---------------------------------------------------------------------------
+
+
+class TestBaseCurveCache:
+    """Areas with identical curve inputs share one base-curve evaluation."""
+
+    def test_shared_curve_matches_unbatched(self):
+        """Per-area steps still apply on top of a shared curve."""
+        config = Config()
+        sun = SunTimes()
+        cache = BaseCurveCache()
+        contexts = [
+            _make_ctx(hour=15.0, area_id="a", config=config, sun_times=sun),
+            _make_ctx(hour=15.0, area_id="b", config=config, sun_times=sun,
+                      area_factor=0.5, boost_brightness=10),
+            _make_ctx(hour=15.0, area_id="c", config=config, sun_times=sun,
+                      brightness_override=-20, ct_comp_enabled=True),
+        ]
+        for ctx in contexts:
+            expected = compute(ctx)
+            cache.apply(ctx)
+            assert compute(ctx) == expected
+        assert cache.misses == 1
+        assert cache.hits == 2
+
+    def test_curve_state_not_shared(self):
+        """Midpoints, overrides, frozen_at and a different hour each get their own curve."""
+        config = Config()
+        sun = SunTimes()
+        cache = BaseCurveCache()
+        for ctx in (
+            _make_ctx(hour=15.0, config=config, sun_times=sun),
+            _make_ctx(hour=15.0, config=config, sun_times=sun,
+                      area_state=AreaState(is_circadian=True, is_on=True, brightness_mid=14.0)),
+            _make_ctx(hour=15.0, config=config, sun_times=sun,
+                      area_state=AreaState(is_circadian=True, is_on=True, color_override=-300)),
+            _make_ctx(hour=16.0, config=config, sun_times=sun),
+            # Same override from a step and from the slider
+            _make_ctx(hour=22.0, config=config, sun_times=sun,
+                      area_state=AreaState(is_circadian=True, is_on=True, color_override=500)),
+            _make_ctx(hour=22.0, config=config, sun_times=sun,
+                      area_state=AreaState(is_circadian=True, is_on=True, color_override=500,
+                                           color_override_set_at=21.0)),
+        ):
+            cache.apply(ctx)
+            assert ctx.base_curve == compute_base_curve(ctx)
+        assert cache.misses == 6
+
+    def test_other_zone_config_not_shared(self):
+        sun = SunTimes()
+        cache = BaseCurveCache()
+        cache.apply(_make_ctx(hour=15.0, config=Config(), sun_times=sun))
+        cache.apply(_make_ctx(hour=15.0, config=Config(wake_time=9.0), sun_times=sun))
+        assert cache.misses == 2
+
+
+class TestComputeMany:
+    """compute_many matches per-area compute() while sharing work."""
+
+    PRESETS = {
+        "Standard": {"at_bright": 100, "at_dim": 100, "off_threshold": 0},
+        "Overhead": {"at_bright": 100, "at_dim": 0, "off_threshold": 3},
+        "accent_light": {"at_bright": 50, "at_dim": 50},
+    }
+
+    def _contexts(self, config, sun):
+        stepped = AreaState(is_circadian=True, is_on=True, brightness_mid=14.0)
+        filters = {"light.a": "Overhead", "light.b": "Accent Light", "light.c": "Unknown"}
+        return [
+            _make_ctx(hour=15.0, area_id="a", config=config, sun_times=sun),
+            _make_ctx(hour=15.0, area_id="b", config=config, sun_times=sun,
+                      area_filters=filters, filter_presets=self.PRESETS,
+                      area_factor=0.6, ct_comp_enabled=True),
+            _make_ctx(hour=15.0, area_id="c", config=config, sun_times=sun,
+                      area_state=stepped, area_filters=filters,
+                      filter_presets=self.PRESETS, off_threshold=5),
+            _make_ctx(hour=15.0, area_id="d", config=config, sun_times=sun,
+                      area_state=AreaState(is_circadian=True, is_on=True,
+                                           brightness_mid=14.0, color_mid=12.0)),
+            _make_ctx(hour=21.5, area_id="e", config=config, sun_times=sun,
+                      brightness_override=-10, boost_brightness=5),
+            _make_ctx(hour=15.0, area_id="f", config=config, sun_times=sun,
+                      precomputed_brightness=40, precomputed_kelvin=2700),
+        ]
+
+    def test_matches_compute(self):
+        config = Config(warm_night_enabled=True, daylight_enabled=True)
+        sun = SunTimes(outdoor_normalized=0.5)
+        expected = [compute(ctx) for ctx in self._contexts(config, sun)]
+        assert compute_many(self._contexts(config, sun)) == expected
+
+    def test_slider_and_step_override_not_shared(self):
+        config = Config()
+        sun = SunTimes()
+
+        def contexts():
+            return [
+                _make_ctx(hour=22.0, area_id="step", config=config, sun_times=sun,
+                          area_state=AreaState(is_circadian=True, is_on=True,
+                                               color_override=500)),
+                _make_ctx(hour=22.0, area_id="slider", config=config, sun_times=sun,
+                          area_state=AreaState(is_circadian=True, is_on=True,
+                                               color_override=500,
+                                               color_override_set_at=21.0)),
+            ]
+
+        results = compute_many(contexts())
+        assert results == [compute(ctx) for ctx in contexts()]
+        assert results[0].area_kelvin != results[1].area_kelvin
+
+    def test_shares_curve_and_natural_brightness(self):
+        config = Config()
+        cache = BaseCurveCache()
+        compute_many(self._contexts(config, SunTimes()), curve_cache=cache)
+        # a+b share, c and d have their own curve state, e is another hour,
+        # f is precomputed
+        assert cache.misses == 4
+        assert cache.hits == 1
+        # c and d are both stepped at 15:00: one natural-curve evaluation
+        assert len(cache._natural) == 1
+
+    def test_preset_version(self):
+        config = Config()
+        sun = SunTimes()
+        first = compute_many(self._contexts(config, sun), preset_version=7)
+        second = compute_many(self._contexts(config, sun), preset_version=7)
+        assert first == second == [compute(c) for c in self._contexts(config, sun)]
+        # A new version with changed presets isn't served stale entries
+        presets = dict(self.PRESETS, Overhead={"at_bright": 20, "at_dim": 20})
+        ctx = _make_ctx(hour=15.0, config=config, sun_times=sun,
+                        area_filters={"light.a": "Overhead"}, filter_presets=presets)
+        assert compute_many([ctx], preset_version=8) == [compute(ctx)]
+
+    def test_fresh_presets_dicts_share_entries(self):
+        # glozone hands out a new presets dict per call; the shared resolver
+        # must not keep one entry per dict
+        config = Config()
+        sun = SunTimes()
+        for _ in range(50):
+            ctx = _make_ctx(hour=15.0, config=config, sun_times=sun,
+                            area_filters={"light.a": "Overhead"},
+                            filter_presets=dict(self.PRESETS))
+            compute_many([ctx], preset_version=9)
+        assert len(pipeline_mod._shared_resolver._resolved) == 2  # Overhead, Standard
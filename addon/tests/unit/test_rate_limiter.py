@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test the priority-aware token bucket in rate_limiter.py."""
+
+import asyncio
+
+import pytest
+
+import rate_limiter
+from rate_limiter import RateLimiter
+
+
+def _limiter(rate=50.0, burst=2):
+    limiter = RateLimiter(rate, burst)
+    limiter.enabled = True
+    return limiter
+
+
+class TestPriorityContext:
+    """priority() marks the running context and tasks spawned from it."""
+
+    @pytest.mark.asyncio
+    async def test_default_and_nested(self):
+        assert rate_limiter.current_priority() == "user"
+        with rate_limiter.priority("periodic"):
+            assert rate_limiter.current_priority() == "periodic"
+            inherited = asyncio.create_task(_current())
+            with rate_limiter.priority("fade"):
+                assert rate_limiter.current_priority() == "fade"
+            assert await inherited == "periodic"
+        assert rate_limiter.current_priority() == "user"
+
+    def test_unknown_class(self):
+        with pytest.raises(ValueError):
+            rate_limiter.set_priority("urgent")
+
+    def test_more_urgent(self):
+        assert rate_limiter.more_urgent("periodic", "motion") == "motion"
+        assert rate_limiter.more_urgent("user", "fade") == "user"
+
+
+async def _current():
+    return rate_limiter.current_priority()
+
+
+class TestRateLimiter:
+    """Burst goes out at once; the rest is paced, most urgent first."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_passes_through(self):
+        limiter = RateLimiter(1, 1)
+        for _ in range(5):
+            await limiter.acquire("periodic")
+        assert limiter.get_stats()["classes"]["periodic"]["sent"] == 0
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        limiter = _limiter(rate=50.0, burst=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        third = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not third.done()
+        await asyncio.wait_for(third, 1)
+        stats = limiter.get_stats()["classes"]["user"]
+        assert (stats["sent"], stats["delayed"]) == (3, 1)
+        assert stats["max_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        limiter = _limiter(rate=100.0, burst=1)
+        await limiter.acquire("user")  # Empty the bucket
+        order = []
+
+        async def send(name):
+            await limiter.acquire(name)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(send(name))
+            for name in ("periodic", "fade", "periodic", "motion", "user")
+        ]
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        assert order == ["user", "motion", "fade", "periodic", "periodic"]
+        assert limiter.get_stats()["classes"]["periodic"]["max_depth"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_skipped(self):
+        limiter = _limiter(rate=50.0, burst=1)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire("periodic"))
+        waiting = asyncio.create_task(limiter.acquire("periodic"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.get_stats()["classes"]["periodic"]["sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_releases_waiters(self):
+        limiter = _limiter(rate=1.0, burst=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire("fade"))
+        await asyncio.sleep(0)
+        limiter.clear()
+        await asyncio.wait_for(waiter, 0.5)
+
+    def test_configure_rejects_garbage(self):
+        limiter = RateLimiter(10, 10)
+        limiter.configure("fast", 3)
+        assert (limiter.rate, limiter.burst) == (10.0, 10)
+        limiter.configure(0, 0)
+        assert (limiter.rate, limiter.burst) == (1.0, 1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Test the boost/motion/warning/fade deadline scheduler in state.py."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import state
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(tmp_path):
+    """Point the state module at a temp file and restore after."""
+    old_path = state._state_file_path
+    old_state = state._state
+    state.init(str(tmp_path / "circadian_state.json"))
+    yield
+    state.flush()
+    state._state_file_path = old_path
+    state._state = old_state
+    state._deadline_heap.clear()
+    state._warning_heap.clear()
+    state._fading_areas.clear()
+
+
+def _iso(seconds: float) -> str:
+    return (datetime.now() + timedelta(seconds=seconds)).isoformat()
+
+
+class TestDeadlines:
+    """pop_due_deadlines() reports only areas whose timers are due."""
+
+    def test_nothing_scheduled(self):
+        assert state.seconds_until_next_deadline(20) is None
+        assert state.pop_due_deadlines(20) == {
+            "warning": [], "boost": [], "motion": [], "fade": []
+        }
+
+    def test_expired_timers_are_due(self):
+        state.set_boost("kitchen", started_from_off=True, expires_at=_iso(-1), brightness=30)
+        state.set_motion_expires("hall", _iso(-1))
+        state.set_motion_expires("den", _iso(600))
+        assert state.seconds_until_next_deadline() <= 0
+        due = state.pop_due_deadlines()
+        assert due["boost"] == ["kitchen"]
+        assert due["motion"] == ["hall"]
+        # Popped once - not reported again
+        assert state.pop_due_deadlines()["boost"] == []
+
+    def test_future_timer_not_due(self):
+        state.set_motion_expires("hall", _iso(600))
+        wait = state.seconds_until_next_deadline()
+        assert 590 < wait <= 600
+        assert state.pop_due_deadlines()["motion"] == []
+
+    def test_forever_and_motion_coupled_never_scheduled(self):
+        state.set_boost("a", started_from_off=True, expires_at="forever", brightness=30)
+        state.set_boost("b", started_from_off=True, expires_at="motion", brightness=30)
+        state.set_motion_expires("c", "forever")
+        assert state.seconds_until_next_deadline(20) is None
+
+    def test_extended_timer_invalidates_old_deadline(self):
+        state.set_motion_expires("hall", _iso(-1))
+        state.extend_motion_expires("hall", _iso(600))
+        assert state.pop_due_deadlines()["motion"] == []
+        assert state.seconds_until_next_deadline() > 590
+
+    def test_cleared_boost_is_dropped(self):
+        state.set_boost("kitchen", started_from_off=False, expires_at=_iso(-1), brightness=30)
+        state.clear_boost("kitchen")
+        assert state.pop_due_deadlines()["boost"] == []
+
+
+class TestWarnings:
+    """Warnings come due warning_seconds before the timer."""
+
+    def test_motion_warning_due_inside_window(self):
+        state.set_motion_expires("hall", _iso(10))
+        assert state.pop_due_deadlines(0)["warning"] == []
+        assert state.pop_due_deadlines(20)["warning"] == ["hall"]
+
+    def test_already_warned_is_skipped(self):
+        state.set_motion_expires("hall", _iso(10))
+        state.set_motion_warning("hall", 50)
+        assert state.pop_due_deadlines(20)["warning"] == []
+
+    def test_cleared_warning_rearms(self):
+        state.set_motion_expires("hall", _iso(10))
+        state.set_motion_warning("hall", 50)
+        state.clear_motion_warning("hall")
+        assert state.pop_due_deadlines(20)["warning"] == ["hall"]
+
+    def test_boost_warning_only_when_started_from_off(self):
+        state.set_boost("a", started_from_off=False, expires_at=_iso(10), brightness=30)
+        state.set_boost("b", started_from_off=True, expires_at=_iso(10), brightness=30)
+        assert state.pop_due_deadlines(20)["warning"] == ["b"]
+
+
+class TestFades:
+    """Fades are tracked without scanning and come due at start + duration."""
+
+    def test_fading_areas_tracked(self):
+        state.set_fade("kitchen", "in", 600)
+        assert state.get_fading_areas() == ["kitchen"]
+        state.clear_fade("kitchen")
+        assert state.get_fading_areas() == []
+
+    def test_fade_completion_due(self):
+        state.set_fade("kitchen", "out", 30)
+        assert state.pop_due_deadlines()["fade"] == []
+        state.update_area("kitchen", {"fade_start": _iso(-31)})
+        assert state.pop_due_deadlines()["fade"] == ["kitchen"]
+
+    def test_early_pop_reschedules(self, monkeypatch):
+        # Monotonic clock runs ahead of the wall clock: the deadline fires
+        # before the fade has ended by wall-clock time
+        state.set_fade("a", "out", 2)
+        mono = state.time.monotonic()
+        monkeypatch.setattr(state.time, "monotonic", lambda: mono + 2)
+        assert state.pop_due_deadlines()["fade"] == []
+        # Re-pushed for when the wall clock reaches the end of the fade
+        assert 1 < state.seconds_until_next_deadline() <= 2
+        assert state.get_fading_areas() == ["a"]
+
+    def test_reset_drops_fading_area(self):
+        state.set_fade("kitchen", "in", 600)
+        state.reset_area("kitchen")
+        assert state.get_fading_areas() == []
+
+    def test_deadlines_rebuilt_on_init(self, tmp_path):
+        state.set_motion_expires("hall", _iso(-1))
+        state.flush()
+        state.init(str(tmp_path / "circadian_state.json"))
+        assert state.pop_due_deadlines()["motion"] == ["hall"]
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Test write-behind persistence in state.py."""
+
+import asyncio
+import json
+
+import pytest
+
+import state
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    """Point the state module at a temp file and restore after."""
+    path = tmp_path / "circadian_state.json"
+    old_path = state._state_file_path
+    old_state = state._state
+    old_delay = state._flush_delay
+    state.init(str(path))
+    yield path
+    state.flush()
+    state._state_file_path = old_path
+    state._state = old_state
+    state._flush_delay = old_delay
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["areas"]
+
+
+class TestSyncFallback:
+    """Outside an event loop every mutation is written immediately."""
+
+    def test_update_written_immediately(self, state_file):
+        state.update_area("kitchen", {"is_on": True})
+        assert _read(state_file)["kitchen"]["is_on"] is True
+        assert state.get_persistence_stats()["pending"] is False
+
+    def test_init_reloads_flushed_state(self, state_file):
+        state.set_is_circadian("kitchen", True)
+        state.init(str(state_file))
+        assert state.is_circadian("kitchen") is True
+
+
+class TestWriteBehind:
+    """Inside an event loop mutations coalesce into one write per window."""
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesces_to_one_write(self, state_file):
+        state.set_flush_delay(0.25)
+        before = state.get_persistence_stats()
+        for i in range(40):
+            state.set_last_sent_kelvin(f"area_{i}", 2700 + i)
+            state.set_last_sent_brightness(f"area_{i}", 50)
+        assert not state_file.exists()
+        # Reads see the new values before anything hits disk
+        assert state.get_last_sent_kelvin("area_7") == 2707
+
+        await asyncio.sleep(0.4)
+
+        after = state.get_persistence_stats()
+        assert after["writes"] - before["writes"] == 1
+        assert after["writes_avoided"] - before["writes_avoided"] == 79
+        assert _read(state_file)["area_39"]["last_sent_kelvin"] == 2739
+
+    @pytest.mark.asyncio
+    async def test_explicit_flush_writes_pending(self, state_file):
+        state.set_flush_delay(2.0)
+        state.update_area("kitchen", {"is_on": True})
+        assert state.get_persistence_stats()["pending"] is True
+        assert state.flush() is True
+        assert _read(state_file)["kitchen"]["is_on"] is True
+        # Nothing left to write, and the cancelled timer does not write again
+        assert state.flush() is False
+
+    @pytest.mark.asyncio
+    async def test_reset_all_areas_flushes_immediately(self, state_file):
+        state.set_flush_delay(2.0)
+        state.update_area("kitchen", {"is_circadian": True, "brightness_mid": 9.0})
+        state.reset_all_areas()
+        assert state.get_persistence_stats()["pending"] is False
+        saved = _read(state_file)["kitchen"]
+        assert saved["brightness_mid"] is None
+        assert saved["is_circadian"] is True
+
+
+class TestFlushDelay:
+    """set_flush_delay() clamps to the supported window."""
+
+    def test_clamped(self):
+        old = state._flush_delay
+        try:
+            state.set_flush_delay(0.01)
+            assert state.get_persistence_stats()["flush_delay"] == state.MIN_FLUSH_DELAY
+            state.set_flush_delay(30)
+            assert state.get_persistence_stats()["flush_delay"] == state.MAX_FLUSH_DELAY
+            state.set_flush_delay("bogus")
+            assert state.get_persistence_stats()["flush_delay"] == state.DEFAULT_FLUSH_DELAY
+        finally:
+            state._flush_delay = old
+
+
+class TestAreaRecords:
+    """Per-area AreaRuntime records and the dict compatibility view."""
+
+    def test_record_returned_by_reference(self, state_file):
+        state.set_is_on("kitchen", True)
+        record = state.get_area_record("kitchen")
+        assert record is state.get_area_record("kitchen")
+        assert record.is_on is True
+        state.set_last_sent_kelvin("kitchen", 3000)
+        assert record.last_sent_kelvin == 3000
+
+    def test_unknown_area_reads_defaults(self, state_file):
+        record = state.get_area_record("nowhere")
+        assert record.is_circadian is False
+        assert record.get("dim_factor", 1.0) == 1.0
+        assert state.get_area("nowhere") == state._get_default_area_state()
+        assert "nowhere" not in state.get_all_area_ids()
+
+    def test_dict_view_is_a_copy(self, state_file):
+        state.update_area("kitchen", {"brightness_mid": 8.0})
+        view = state.get_area("kitchen")
+        view["brightness_mid"] = 1.0
+        assert state.get_area_record("kitchen").brightness_mid == 8.0
+
+    def test_extra_keys_round_trip(self, state_file):
+        state.set_motion_warning("kitchen", 40, dim_factor=0.25)
+        assert state.get_dim_factor("kitchen") == 0.25
+        assert _read(state_file)["kitchen"]["dim_factor"] == 0.25
+        state.init(str(state_file))
+        assert state.get_area("kitchen")["dim_factor"] == 0.25
+
+    def test_legacy_file_gets_defaults(self, state_file):
+        state_file.write_text(json.dumps({"areas": {"den": {"is_circadian": True}}}))
+        state.init(str(state_file))
+        assert state.is_circadian("den") is True
+        view = state.get_area("den")
+        assert view["off_confirm_count"] == 0
+        assert set(state._get_default_area_state()) <= set(view)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Test targeted event subscriptions in subscriptions.py."""
+
+import pytest
+
+from subscriptions import (
+    HANDLED_EVENT_TYPES,
+    SubscriptionPlan,
+    SubscriptionPlanner,
+    plan_subscriptions,
+)
+
+
+class FakeSocket:
+    """Records sent messages and hands out ids."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        message["id"] = len(self.sent) + 1
+        self.sent.append(message)
+        return message["id"]
+
+    def of_type(self, msg_type):
+        return [m for m in self.sent if m["type"] == msg_type]
+
+
+def _plan(*entity_ids):
+    return SubscriptionPlan(HANDLED_EVENT_TYPES, frozenset(entity_ids))
+
+
+def _state_trigger(sub_id, entity_id, old, new, stamp):
+    return {
+        "id": sub_id,
+        "type": "event",
+        "event": {
+            "variables": {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": entity_id,
+                    "from_state": {"entity_id": entity_id, "state": old},
+                    "to_state": {
+                        "entity_id": entity_id,
+                        "state": new,
+                        "last_updated": stamp,
+                    },
+                }
+            }
+        },
+    }
+
+
+class TestPlan:
+    """The plan covers lights, sensors, tracked devices and sun.sun."""
+
+    def test_entities(self):
+        plan = plan_subscriptions(
+            cached_states={"light.kitchen": {}, "sensor.power": {}, "light.den": {}},
+            area_lights={"kitchen": ["light.kitchen", "light.kitchen_2"]},
+            sensor_entities=["binary_sensor.hall_motion"],
+            device_ids=["dev_motion"],
+            entity_registry={
+                "sensor.hall_motion_battery": {"device_id": "dev_motion"},
+                "sensor.other_battery": {"device_id": "dev_other"},
+            },
+            extra_entities=["sensor.outdoor_lux", None],
+        )
+        assert plan.entity_ids == {
+            "sun.sun",
+            "light.kitchen",
+            "light.kitchen_2",
+            "light.den",
+            "binary_sensor.hall_motion",
+            "sensor.hall_motion_battery",
+            "sensor.outdoor_lux",
+        }
+        assert plan.event_types == HANDLED_EVENT_TYPES
+        assert "state_changed" not in plan.event_types
+
+
+class TestPlanner:
+    """apply() subscribes once and re-plans only what changed."""
+
+    @pytest.mark.asyncio
+    async def test_initial_apply(self):
+        socket = FakeSocket()
+        planner = SubscriptionPlanner()
+        assert await planner.apply(_plan("light.a", "sun.sun"), socket.send)
+        assert len(socket.of_type("subscribe_events")) == len(HANDLED_EVENT_TYPES)
+        triggers = [m["trigger"] for m in socket.of_type("subscribe_trigger")]
+        assert {"platform": "event", "event_type": "call_service",
+                "event_data": {"domain": "circadian"}} in triggers
+        assert {"platform": "state", "entity_id": ["light.a", "sun.sun"]} in triggers
+        assert planner.active
+
+    @pytest.mark.asyncio
+    async def test_unchanged_plan_sends_nothing(self):
+        socket = FakeSocket()
+        planner = SubscriptionPlanner()
+        await planner.apply(_plan("light.a"), socket.send)
+        sent = len(socket.sent)
+        assert not await planner.apply(_plan("light.a"), socket.send)
+        assert len(socket.sent) == sent
+
+    @pytest.mark.asyncio
+    async def test_entity_change_resubscribes(self):
+        socket = FakeSocket()
+        planner = SubscriptionPlanner()
+        await planner.apply(_plan("light.a"), socket.send)
+        old_sub = socket.sent[-1]["id"]
+        sent = len(socket.sent)
+        assert await planner.apply(_plan("light.a", "light.b"), socket.send)
+        new = socket.sent[sent:]
+        assert [m["type"] for m in new] == ["subscribe_trigger", "unsubscribe_events"]
+        assert new[1]["subscription"] == old_sub
+        assert planner.get_stats()["replans"] == 2
+
+
+class TestTranslate:
+    """Trigger envelopes become the plain events handle_message() expects."""
+
+    @pytest.mark.asyncio
+    async def test_state_and_service_events(self):
+        socket = FakeSocket()
+        planner = SubscriptionPlanner()
+        await planner.apply(_plan("light.a"), socket.send)
+        service_sub, entity_sub = [m["id"] for m in socket.of_type("subscribe_trigger")]
+
+        msg = planner.translate(_state_trigger(entity_sub, "light.a", "off", "on", "t1"))
+        assert msg["event"]["event_type"] == "state_changed"
+        data = msg["event"]["data"]
+        assert data["entity_id"] == "light.a"
+        assert (data["old_state"]["state"], data["new_state"]["state"]) == ("off", "on")
+
+        call = {"event_type": "call_service", "data": {"domain": "circadian", "service": "step_up"}}
+        msg = planner.translate(
+            {"id": service_sub, "type": "event",
+             "event": {"variables": {"trigger": {"platform": "event", "event": call}}}}
+        )
+        assert msg["event"] == call
+
+    @pytest.mark.asyncio
+    async def test_other_messages_untouched(self):
+        planner = SubscriptionPlanner()
+        await planner.apply(_plan("light.a"), FakeSocket().send)
+        msg = {"id": 1, "type": "event", "event": {"event_type": "zha_event"}}
+        assert planner.translate(msg) is msg
+
+    @pytest.mark.asyncio
+    async def test_overlap_duplicates_dropped(self):
+        socket = FakeSocket()
+        planner = SubscriptionPlanner()
+        await planner.apply(_plan("light.a"), socket.send)
+        old_sub = socket.sent[-1]["id"]
+        await planner.apply(_plan("light.a", "light.b"), socket.send)
+        new_sub = socket.of_type("subscribe_trigger")[-1]["id"]
+
+        assert planner.translate(_state_trigger(new_sub, "light.a", "off", "on", "t1"))
+        assert planner.translate(_state_trigger(old_sub, "light.a", "off", "on", "t1")) is None
+        assert planner.get_stats()["duplicates_dropped"] == 1
+
+    def test_reset(self):
+        planner = SubscriptionPlanner()
+        planner.active = True
+        planner.reset()
+        assert planner.get_stats()["active"] is False
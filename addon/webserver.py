@@ -8,28 +8,31 @@ import math
 import os
 import tempfile
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from aiohttp import web, ClientSession
 from aiohttp.web import Request, Response
 import websockets
 import aiofiles
 from pathlib import Path
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from astral import LocationInfo
 from astral.sun import sun, elevation as solar_elevation
 
 import state
 import switches
+import curve_engine
 import glozone
 import glozone_state
+import jsoncodec
 import lux_tracker
+import perf
 from brain import (
     CircadianLight,
     Config,
     AreaState,
     DEFAULT_MAX_DIM_STEPS,
-    calculate_dimming_step,
+    SunTimes,
     get_circadian_lighting,
     get_current_hour,
     ACTIVITY_PRESETS,
@@ -46,6 +49,11 @@ logger = logging.getLogger(__name__)
 HOMEGLO_REPORT_WEBHOOK_URL = "https://homeglo-device-reports.rweisbein.workers.dev"
 
 
+def json_response(data: Any, **kwargs) -> Response:
+    """web.json_response() serialized with jsoncodec (orjson when installed)."""
+    return web.json_response(data, dumps=jsoncodec.dumps, **kwargs)
+
+
 def _iso_to_hour(iso_str, default, tzinfo=None):
     """Parse ISO timestamp → decimal hour (with optional tz conversion).
 
@@ -115,8 +123,47 @@ def _get_channel() -> str:
 _CHANNEL_CACHE: Optional[str] = None
 
 
+def step_day(config: dict) -> Optional[Tuple[SunTimes, int]]:
+    """Today's sun times and weekday at the config's location (None if it has none)."""
+    latitude = config.get("latitude")
+    longitude = config.get("longitude")
+    timezone = config.get("timezone")
+    if not latitude or not longitude or not timezone:
+        return None
+
+    try:
+        tzinfo = ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        tzinfo = ZoneInfo("UTC")
+
+    now = datetime.now(tzinfo)
+    today = now.date()
+    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo)
+    solar_events = sun(loc.observer, date=today, tzinfo=tzinfo)
+
+    def clock_hour(dt):
+        return dt.hour + dt.minute / 60.0 + dt.second / 3600.0
+
+    solar_noon = clock_hour(solar_events["noon"])
+    sun_times = SunTimes(
+        sunrise=clock_hour(solar_events["sunrise"]),
+        sunset=clock_hour(solar_events["sunset"]),
+        solar_noon=solar_noon,
+        solar_mid=(solar_noon + 12) % 24,
+    )
+    return sun_times, now.weekday()
+
+
+# Step sequences for /api/steps, memoized per config/minute/action/max_steps
+_step_sequences = curve_engine.StepSequenceCache()
+
+
 def calculate_step_sequence(
-    current_hour: float, action: str, max_steps: int, config: dict
+    current_hour: float,
+    action: str,
+    max_steps: int,
+    config: dict,
+    day: Optional[Tuple[SunTimes, int]] = None,
 ) -> list:
     """Calculate a sequence of step positions for visualization.
 
@@ -125,94 +172,39 @@ def calculate_step_sequence(
         action: 'brighten' or 'dim'
         max_steps: Maximum number of steps to calculate
         config: Configuration dict with curve parameters
+        day: Today's (sun times, weekday) from step_day() (None = computed
+            from config location)
 
     Returns:
         List of dicts with hour, brightness, kelvin, rgb for each step
     """
     steps = []
 
-    # Get location from config
-    latitude = config.get("latitude")
-    longitude = config.get("longitude")
-    timezone = config.get("timezone")
-
-    if not latitude or not longitude or not timezone:
+    if not config.get("latitude") or not config.get("longitude") or not config.get("timezone"):
         logger.error("Missing location data in config")
         return steps
 
-    # Use the current date but calculate proper solar times
-    try:
-        tzinfo = ZoneInfo(timezone)
-    except:
-        tzinfo = ZoneInfo("UTC")
-
-    today = datetime.now(tzinfo).date()
-    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo)
-    solar_events = sun(loc.observer, date=today, tzinfo=tzinfo)
-    solar_noon = solar_events["noon"]
-    solar_midnight = solar_events["noon"] - timedelta(hours=12)
-
-    # Convert clock hour (0-24) to actual datetime
-    # current_hour is now clock time (0 = midnight, 12 = noon, etc.)
-    base_time = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
-    adjusted_time = base_time + timedelta(hours=current_hour)
+    # Same bounds-only config generate_curve_data() plots, so the steps
+    # land on the displayed curve
+    bounds = {
+        "min_color_temp": config.get("min_color_temp", 500),
+        "max_color_temp": config.get("max_color_temp", 6500),
+        "min_brightness": config.get("min_brightness", 1),
+        "max_brightness": config.get("max_brightness", 100),
+    }
 
     try:
-        for step_num in range(max_steps):
-            if step_num == 0:
-                # First "step" is the current position
-                lighting_values = get_circadian_lighting(
-                    latitude=config.get("latitude"),
-                    longitude=config.get("longitude"),
-                    timezone=config.get("timezone"),
-                    current_time=adjusted_time,
-                    config=config,
-                )
-                steps.append(
-                    {
-                        "hour": current_hour,
-                        "brightness": lighting_values["brightness"],
-                        "kelvin": lighting_values["kelvin"],
-                        "rgb": lighting_values.get("rgb", [255, 255, 255]),
-                    }
-                )
-            else:
-                # Calculate the next step
-                result = calculate_dimming_step(
-                    current_time=adjusted_time,
-                    action=action,
-                    latitude=config.get("latitude"),
-                    longitude=config.get("longitude"),
-                    timezone=config.get("timezone"),
-                    max_steps=max_steps,
-                    min_color_temp=config.get("min_color_temp", 500),
-                    max_color_temp=config.get("max_color_temp", 6500),
-                    min_brightness=config.get("min_brightness", 1),
-                    max_brightness=config.get("max_brightness", 100),
-                    config=config,
-                )
-
-                # Check if we've reached a boundary (no change)
-                if abs(result["time_offset_minutes"]) < 0.1:
-                    break
-
-                # Apply the time offset
-                adjusted_time += timedelta(minutes=result["time_offset_minutes"])
-
-                # Convert back to clock hour (0-24 scale)
-                new_hour = adjusted_time.hour + adjusted_time.minute / 60.0
-
-                steps.append(
-                    {
-                        "hour": new_hour,
-                        "brightness": result["brightness"],
-                        "kelvin": result["kelvin"],
-                        "rgb": result.get("rgb", [255, 255, 255]),
-                    }
-                )
-
-                # Update for next iteration
-                current_hour = new_hour
+        if day is None:
+            day = step_day(config)
+        sun_times, weekday = day
+        steps = _step_sequences.get(
+            Config.from_dict(bounds),
+            current_hour,
+            action,
+            max_steps,
+            weekday,
+            sun_times,
+        )
 
     except Exception as e:
         logger.error(f"Error calculating step sequence: {e}")
@@ -221,26 +213,21 @@ def calculate_step_sequence(
             f"Current hour: {current_hour}, action: {action}, max_steps: {max_steps}"
         )
         # Return at least the first step if possible
-        if not steps:
-            try:
-                # Try to get just the current position without stepping
-                lighting_values = get_circadian_lighting(
-                    latitude=config.get("latitude"),
-                    longitude=config.get("longitude"),
-                    timezone=config.get("timezone"),
-                    current_time=adjusted_time,
-                    config=config,
-                )
-                steps.append(
-                    {
-                        "hour": current_hour,
-                        "brightness": lighting_values["brightness"],
-                        "kelvin": lighting_values["kelvin"],
-                        "rgb": lighting_values.get("rgb", [255, 255, 255]),
-                    }
-                )
-            except Exception as e2:
-                logger.error(f"Error getting current position: {e2}")
+        try:
+            # Try to get just the current position without stepping
+            lighting_values = get_circadian_lighting(
+                current_time=current_hour, **bounds
+            )
+            steps.append(
+                {
+                    "hour": current_hour,
+                    "brightness": lighting_values["brightness"],
+                    "kelvin": lighting_values["kelvin"],
+                    "rgb": lighting_values.get("rgb", [255, 255, 255]),
+                }
+            )
+        except Exception as e2:
+            logger.error(f"Error getting current position: {e2}")
 
     return steps
 
@@ -277,27 +264,11 @@ def generate_curve_data(config: dict) -> dict:
         solar_noon = solar_events["noon"]
         solar_midnight = solar_events["noon"] - timedelta(hours=12)
 
-        # Use the get_circadian_lighting function to get values at each time point
-        # We'll call it for each sample point
-
         # Sample at 0.1 hour intervals (matching JavaScript)
         sample_step = 0.1
         hours = []
-        brightness_values = []
-        cct_values = []
-        rgb_values = []
         sun_power_values = []
 
-        # Morning segment (solar midnight to solar noon)
-        morning_hours = []
-        morning_brightness = []
-        morning_cct = []
-
-        # Evening segment (solar noon to solar midnight)
-        evening_hours = []
-        evening_brightness = []
-        evening_cct = []
-
         # Sample the full 24-hour curve using actual clock time
         # Start from midnight of today and sample every 0.1 hours
         base_time = datetime.now(tzinfo).replace(
@@ -309,42 +280,37 @@ def generate_curve_data(config: dict) -> dict:
 
             # Calculate hour of day (0-24 scale) for plotting
             clock_hour = current_time.hour + current_time.minute / 60.0
-
-            # Get circadian lighting values using the main function
-            lighting_values = get_circadian_lighting(
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone,
-                current_time=current_time,
-                min_color_temp=config.get("min_color_temp", 500),
-                max_color_temp=config.get("max_color_temp", 6500),
-                min_brightness=config.get("min_brightness", 1),
-                max_brightness=config.get("max_brightness", 100),
-                config=config,
-            )
-
-            brightness = lighting_values["brightness"]
-            cct = lighting_values["kelvin"]
-            rgb = lighting_values.get("rgb", [255, 255, 255])
+            hours.append(clock_hour)
 
             # Calculate sun power (simple approximation based on time)
             # This is just for visualization - using a simple sine wave approximation
-            hour_of_day = current_time.hour + current_time.minute / 60
-            if 6 <= hour_of_day <= 18:  # Daytime hours
-                sun_power = max(0, 300 * math.sin(math.pi * (hour_of_day - 6) / 12))
+            if 6 <= clock_hour <= 18:  # Daytime hours
+                sun_power = max(0, 300 * math.sin(math.pi * (clock_hour - 6) / 12))
             else:
                 sun_power = 0
-
-            # Add to main arrays
-            hours.append(clock_hour)
-            brightness_values.append(brightness)
-            cct_values.append(cct)
-            rgb_values.append(list(rgb))
             sun_power_values.append(sun_power)
 
-            # Add to appropriate segment (split at solar noon, not clock noon)
-            # Convert solar noon to clock time for proper segmentation
-            solar_noon_clock = solar_noon.hour + solar_noon.minute / 60.0
+        # Evaluate the whole day in one pass with a single Config (same
+        # bounds-only config get_circadian_lighting() builds per call)
+        curve_config = Config.from_dict({
+            "min_color_temp": config.get("min_color_temp", 500),
+            "max_color_temp": config.get("max_color_temp", 6500),
+            "min_brightness": config.get("min_brightness", 1),
+            "max_brightness": config.get("max_brightness", 100),
+        })
+        brightness_values, cct_values = curve_engine.day_curve(
+            curve_config, hours, weekday=datetime.now().weekday()
+        )
+
+        # Split into segments at solar noon (not clock noon)
+        solar_noon_clock = solar_noon.hour + solar_noon.minute / 60.0
+        morning_hours = []
+        morning_brightness = []
+        morning_cct = []
+        evening_hours = []
+        evening_brightness = []
+        evening_cct = []
+        for clock_hour, brightness, cct in zip(hours, brightness_values, cct_values):
             if clock_hour < solar_noon_clock:
                 morning_hours.append(clock_hour)
                 morning_brightness.append(brightness)
@@ -354,9 +320,6 @@ def generate_curve_data(config: dict) -> dict:
                 evening_brightness.append(brightness)
                 evening_cct.append(cct)
 
-            # Move to next sample point
-            current_time += timedelta(hours=sample_step)
-
         # Convert solar times to clock hours (0-24 scale)
         solar_noon_hour = solar_noon.hour + solar_noon.minute / 60.0
         solar_midnight_hour = (solar_noon_hour + 12) % 24
@@ -834,6 +797,10 @@ class LightDesignerServer:
             "GET", "/{path:.*}/api/outdoor-status", self.get_outdoor_status
         )
 
+        # Performance counters (timings need perf_instrumentation_enabled)
+        self.app.router.add_get("/api/perf", self.get_perf_stats)
+        self.app.router.add_route("GET", "/{path:.*}/api/perf", self.get_perf_stats)
+
         # Per-zone schedule override API routes
         self.app.router.add_put(
             "/api/glozones/{name}/schedule-override",
@@ -1161,7 +1128,7 @@ class LightDesignerServer:
                         area_lights[a_id].append({"entity_id": eid, "name": name})
 
             raw_config = glozone.get_config()
-            return web.json_response(
+            return json_response(
                 {
                     "outdoor_normalized": lux_tracker.get_outdoor_normalized() or 0.0,
                     "ct_comp_enabled": raw_config.get("ct_comp_enabled", True),
@@ -1176,7 +1143,7 @@ class LightDesignerServer:
             )
         except Exception as e:
             logger.error(f"Error getting light filters: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_area_brightness(self, request: Request) -> Response:
         """Save brightness factor and/or natural light exposure for an area."""
@@ -1185,7 +1152,7 @@ class LightDesignerServer:
             area_id = data.get("area_id")
 
             if not area_id:
-                return web.json_response({"error": "area_id required"}, status=400)
+                return json_response({"error": "area_id required"}, status=400)
 
             # Load raw config and find the area entry
             config = await self.load_raw_config()
@@ -1214,7 +1181,7 @@ class LightDesignerServer:
                     break
 
             if not found:
-                return web.json_response(
+                return json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
 
@@ -1226,10 +1193,10 @@ class LightDesignerServer:
                 # Re-sync batch groups — area_factor change affects group membership
                 await self.client.sync_batch_groups()
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error saving area brightness: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_light_filter(self, request: Request) -> Response:
         """Save filter assignment for a light entity."""
@@ -1240,7 +1207,7 @@ class LightDesignerServer:
             filter_name = data.get("filter", "Standard")
 
             if not area_id or not entity_id:
-                return web.json_response(
+                return json_response(
                     {"error": "area_id and entity_id required"}, status=400
                 )
 
@@ -1265,7 +1232,7 @@ class LightDesignerServer:
                     break
 
             if not found:
-                return web.json_response(
+                return json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
 
@@ -1278,10 +1245,10 @@ class LightDesignerServer:
                 await self.client.run_manual_sync()
                 logger.info("Device sync triggered after purpose change")
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error saving light filter: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_light_filters_bulk(self, request: Request) -> Response:
         """Save filter assignments for multiple lights in one area.
@@ -1295,7 +1262,7 @@ class LightDesignerServer:
             filters = data.get("filters", [])
 
             if not area_id or not filters:
-                return web.json_response(
+                return json_response(
                     {"error": "area_id and filters required"}, status=400
                 )
 
@@ -1311,7 +1278,7 @@ class LightDesignerServer:
                     break
 
             if not area_cfg:
-                return web.json_response(
+                return json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
 
@@ -1342,10 +1309,10 @@ class LightDesignerServer:
                     f"({len(filters)} lights in {area_id})"
                 )
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error saving bulk light filters: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def reassign_preset(self, request: Request) -> Response:
         """Reassign all lights from one filter preset to another."""
@@ -1355,7 +1322,7 @@ class LightDesignerServer:
             to_preset = data.get("to_preset", "Standard")
 
             if not from_preset:
-                return web.json_response({"error": "from_preset required"}, status=400)
+                return json_response({"error": "from_preset required"}, status=400)
 
             config = await self.load_raw_config()
             glozones = config.get("glozones", {})
@@ -1386,10 +1353,10 @@ class LightDesignerServer:
             if reassigned > 0 and self.client:
                 await self.client.handle_config_refresh()
 
-            return web.json_response({"status": "ok", "reassigned": reassigned})
+            return json_response({"status": "ok", "reassigned": reassigned})
         except Exception as e:
             logger.error(f"Error reassigning preset: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def serve_moments(self, request: Request) -> Response:
         """Serve the Moments page."""
@@ -1413,10 +1380,10 @@ class LightDesignerServer:
         """Get current curve configuration."""
         try:
             config = await self.load_config()
-            return web.json_response(config)
+            return json_response(config)
         except Exception as e:
             logger.error(f"Error getting config: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_config(self, request: Request) -> Response:
         """Save curve configuration.
@@ -1480,7 +1447,7 @@ class LightDesignerServer:
 
             # Return effective config for backward compatibility
             effective_config = self._get_effective_config(config)
-            return web.json_response(
+            return json_response(
                 {
                     "status": "success",
                     "config": effective_config,
@@ -1489,11 +1456,11 @@ class LightDesignerServer:
             )
         except Exception as e:
             logger.error(f"Error saving config: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def health_check(self, request: Request) -> Response:
         """Health check endpoint."""
-        return web.json_response({"status": "healthy"})
+        return json_response({"status": "healthy"})
 
     async def get_presets(self, request: Request) -> Response:
         """Get available activity presets."""
@@ -1507,10 +1474,10 @@ class LightDesignerServer:
                     "ascend_start": preset.get("ascend_start", 3.0),
                     "descend_start": preset.get("descend_start", 12.0),
                 }
-            return web.json_response({"presets": presets, "names": get_preset_names()})
+            return json_response({"presets": presets, "names": get_preset_names()})
         except Exception as e:
             logger.error(f"Error getting presets: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_sun_times(self, request: Request) -> Response:
         """Get sun times for a specific date (for date slider preview)."""
@@ -1545,7 +1512,7 @@ class LightDesignerServer:
             noon_hour = _iso_to_hour(sun_times.get("noon"), 12.0, tzinfo)
             midnight_hour = (noon_hour + 12.0) % 24.0
 
-            return web.json_response(
+            return json_response(
                 {
                     "date": date_str,
                     "latitude": lat,
@@ -1564,11 +1531,11 @@ class LightDesignerServer:
             )
         except Exception as e:
             logger.error(f"Error getting sun times: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_channel(self, request: Request) -> Response:
         """Return the release channel — 'dev' / 'beta' / 'main'."""
-        return web.json_response({"channel": _get_channel()})
+        return json_response({"channel": _get_channel()})
 
     async def get_time(self, request: Request) -> Response:
         """Get current server time in Home Assistant timezone."""
@@ -1609,7 +1576,7 @@ class LightDesignerServer:
                 config=config,
             )
 
-            return web.json_response(
+            return json_response(
                 {
                     "current_time": now.isoformat(),
                     "current_hour": current_hour,
@@ -1626,7 +1593,7 @@ class LightDesignerServer:
 
         except Exception as e:
             logger.error(f"Error getting time info: {e}")
-            return web.json_response(
+            return json_response(
                 {"error": f"Failed to get time info: {e}"}, status=500
             )
 
@@ -1770,11 +1737,11 @@ class LightDesignerServer:
                 )
 
             logger.debug(f"[ZoneStates] Returning {len(zone_states)} zone states")
-            return web.json_response({"zone_states": zone_states})
+            return json_response({"zone_states": zone_states})
 
         except Exception as e:
             logger.error(f"Error getting zone states: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     def apply_query_overrides(self, config: dict, query) -> dict:
         """Apply UI query parameters to a config dict for live previews."""
@@ -1857,15 +1824,17 @@ class LightDesignerServer:
             # Apply overrides from UI for live preview
             config = self.apply_query_overrides(config, request.query)
 
-            # Calculate step sequences in both directions
+            # Calculate step sequences in both directions (one sun
+            # calculation for both)
+            day = step_day(config)
             step_up_sequence = calculate_step_sequence(
-                current_hour, "brighten", max_steps, config
+                current_hour, "brighten", max_steps, config, day
             )
             step_down_sequence = calculate_step_sequence(
-                current_hour, "dim", max_steps, config
+                current_hour, "dim", max_steps, config, day
             )
 
-            return web.json_response(
+            return json_response(
                 {
                     "step_up": {"steps": step_up_sequence},
                     "step_down": {"steps": step_down_sequence},
@@ -1874,7 +1843,7 @@ class LightDesignerServer:
 
         except Exception as e:
             logger.error(f"Error calculating step sequences: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_curve_data(self, request: Request) -> Response:
         """Generate and return curve data for visualization."""
@@ -1888,11 +1857,11 @@ class LightDesignerServer:
             # Generate curve data using the merged configuration
             curve_data = generate_curve_data(config)
 
-            return web.json_response(curve_data)
+            return json_response(curve_data)
 
         except Exception as e:
             logger.error(f"Error generating curve data: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     # Settings that are per-rhythm (not global)
     RHYTHM_SETTINGS = {
@@ -1947,6 +1916,17 @@ class LightDesignerServer:
         "multi_click_speed",  # Multi-click window in tenths of seconds
         "circadian_refresh",  # How often to refresh circadian lighting (seconds)
         "log_periodic",  # Whether to log periodic update details (default false)
+        "curve_table_enabled",  # Interpolate plain-curve areas from a daily minute table (default false)
+        "periodic_suppress_enabled",  # Skip periodic sends for purposes unchanged since last send (default false)
+        "periodic_suppress_brightness",  # Suppress when brightness moved less than this many points (default 1)
+        "periodic_suppress_mired",  # Suppress when color moved less than this many mireds (default 2)
+        "periodic_suppress_max_stale",  # Force a full resend after this many minutes (default 10)
+        "perf_instrumentation_enabled",  # Record per-stage timings for /api/perf (default false)
+        "targeted_subscriptions_enabled",  # Subscribe only to handled events/tracked entities; applies on reconnect (default false)
+        "light_outbox_enabled",  # Coalesce light commands per target over a 30ms window (default false)
+        "rate_limit_enabled",  # Pace light commands with a priority token bucket (default false)
+        "rate_limit_per_second",  # Light commands per second when rate limiting (default 10)
+        "rate_limit_burst",  # Light commands sent back-to-back before pacing starts (default 10)
         "home_refresh_interval",  # How often to refresh home page cards (seconds, default 10)
         "motion_warning_time",  # Seconds before motion timer expires to trigger warning dim
         "motion_blink_threshold",  # Brightness % below which motion warning blinks instead of dims
@@ -2528,10 +2508,10 @@ class LightDesignerServer:
         # Return cached areas if available
         if self.cached_areas_list is not None:
             logger.debug(f"Returning {len(self.cached_areas_list)} cached areas")
-            return web.json_response(self.cached_areas_list)
+            return json_response(self.cached_areas_list)
 
         if not self.client:
-            return web.json_response(
+            return json_response(
                 {"error": "Home Assistant client not ready"}, status=503
             )
 
@@ -2543,10 +2523,10 @@ class LightDesignerServer:
             areas.sort(key=lambda x: x["name"].lower())
             self.cached_areas_list = areas
             logger.info(f"Cached {len(areas)} areas from client")
-            return web.json_response(areas)
+            return json_response(areas)
         except Exception as e:
             logger.error(f"Error fetching areas: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     _sun_hours_cache = {}  # "YYYY-MM-DD" -> (sunrise_h, sunset_h)
 
@@ -3301,11 +3281,11 @@ class LightDesignerServer:
                         ),
                     }
 
-            return web.json_response(area_status)
+            return json_response(area_status)
 
         except Exception as e:
             logger.error(f"[Area Status] Error: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def _get_area_status_lite(self, request: Request) -> Response:
         """Lightweight area status: reads stored state, no computation.
@@ -3462,11 +3442,11 @@ class LightDesignerServer:
                     except Exception:
                         pass
 
-            return web.json_response(area_status)
+            return json_response(area_status)
 
         except Exception as e:
             logger.error(f"[Area Status Lite] Error: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def refresh_outdoor(self, request: Request) -> Response:
         """Force HA to re-poll the outdoor brightness source entity."""
@@ -3481,10 +3461,10 @@ class LightDesignerServer:
                 entity = lux_tracker.get_weather_entity()
 
             if not entity:
-                return web.json_response({"status": "no_entity", "source": source})
+                return json_response({"status": "no_entity", "source": source})
 
             if not self.client:
-                return web.json_response({"error": "Client not ready"}, status=500)
+                return json_response({"error": "Client not ready"}, status=500)
 
             await self.client.call_service(
                 "homeassistant",
@@ -3493,10 +3473,10 @@ class LightDesignerServer:
                 {"entity_id": entity},
             )
             logger.info(f"[RefreshOutdoor] Triggered update_entity for {entity}")
-            return web.json_response({"status": "ok", "entity": entity})
+            return json_response({"status": "ok", "entity": entity})
         except Exception as e:
             logger.error(f"[RefreshOutdoor] Error: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_area_settings(self, request: Request) -> Response:
         """Get settings for a specific area.
@@ -3505,7 +3485,7 @@ class LightDesignerServer:
         """
         area_id = request.match_info.get("area_id")
         if not area_id:
-            return web.json_response({"error": "area_id required"}, status=400)
+            return json_response({"error": "area_id required"}, status=400)
 
         try:
             config = await self.load_config()
@@ -3545,11 +3525,11 @@ class LightDesignerServer:
             if "wake_alarm" in area_data:
                 self._migrate_wake_alarm(area_data)
             settings = {**defaults, **area_settings.get(area_id, {})}
-            return web.json_response(settings)
+            return json_response(settings)
 
         except Exception as e:
             logger.error(f"[Area Settings] Error getting settings for {area_id}: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_area_settings(self, request: Request) -> Response:
         """Save settings for a specific area.
@@ -3558,7 +3538,7 @@ class LightDesignerServer:
         """
         area_id = request.match_info.get("area_id")
         if not area_id:
-            return web.json_response({"error": "area_id required"}, status=400)
+            return json_response({"error": "area_id required"}, status=400)
 
         try:
             data = await request.json()
@@ -3569,7 +3549,7 @@ class LightDesignerServer:
                 "motion_function" in data
                 and data["motion_function"] not in valid_functions
             ):
-                return web.json_response(
+                return json_response(
                     {
                         "error": f"Invalid motion_function. Must be one of: {valid_functions}"
                     },
@@ -3648,13 +3628,13 @@ class LightDesignerServer:
             logger.info(
                 f"[Area Settings] Saved settings for {area_id}: {config['area_settings'][area_id]}"
             )
-            return web.json_response(
+            return json_response(
                 {"success": True, "settings": config["area_settings"][area_id]}
             )
 
         except Exception as e:
             logger.error(f"[Area Settings] Error saving settings for {area_id}: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     @staticmethod
     def _migrate_wake_alarm(settings: dict) -> None:
@@ -3689,7 +3669,7 @@ class LightDesignerServer:
     def _ct_compensate(self, brightness: int, color_temp: int) -> int:
         """Apply CT brightness compensation for warm color temperatures."""
         try:
-            raw_config = glozone.load_config_from_files()
+            raw_config = glozone.get_config_snapshot()
             if not raw_config.get("ct_comp_enabled", False):
                 return brightness
             handover_begin = raw_config.get("ct_comp_begin", 1650)
@@ -3726,7 +3706,7 @@ class LightDesignerServer:
           (Hue bridge batches via Hue API, etc.).
         """
         if not self.client:
-            return web.json_response(
+            return json_response(
                 {"error": "Home Assistant client not ready"}, status=503
             )
 
@@ -3738,7 +3718,7 @@ class LightDesignerServer:
             transition = float(data.get("transition", 0.1))
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             client = self.client
             bri = max(1, min(100, int(bri_in))) if bri_in is not None else None
@@ -3755,7 +3735,7 @@ class LightDesignerServer:
             if bri is not None and kelvin is not None:
                 from pipeline import apply_ct_compensation
 
-                raw_cfg = glozone.load_config_from_files()
+                raw_cfg = glozone.get_config_snapshot()
                 bri = apply_ct_compensation(
                     bri,
                     kelvin,
@@ -3898,12 +3878,12 @@ class LightDesignerServer:
                 f"{len(non_zha_color)} non-ZHA color, "
                 f"{len(non_zha_ct)} non-ZHA CT)"
             )
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error applying light (raw): {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def set_circadian_mode(self, request: Request) -> Response:
         """Enable or disable Circadian mode for an area.
@@ -3920,7 +3900,7 @@ class LightDesignerServer:
             is_circadian = data.get("is_circadian", data.get("enabled", True))
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             state.set_is_circadian(area_id, is_circadian)
 
@@ -4037,12 +4017,12 @@ class LightDesignerServer:
                 f"[Live Design] Circadian mode {'enabled' if is_circadian else 'disabled'} for area {area_id}"
             )
 
-            return web.json_response({"status": "ok", "is_circadian": is_circadian})
+            return json_response({"status": "ok", "is_circadian": is_circadian})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error setting circadian mode: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def live_design_heartbeat(self, request: Request) -> Response:
         """Browser pings this per active broadcast area while the page is open.
@@ -4056,17 +4036,17 @@ class LightDesignerServer:
             data = await request.json()
             area_id = data.get("area_id")
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
             entry = self.live_design_areas.get(area_id)
             if entry:
                 entry["last_heartbeat"] = time.time()
-                return web.json_response({"status": "ok", "active": True})
-            return web.json_response({"status": "ok", "active": False})
+                return json_response({"status": "ok", "active": True})
+            return json_response({"status": "ok", "active": False})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error processing live design heartbeat: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def _live_design_watcher(self):
         """Background loop that ends Live Design for any area whose heartbeat
@@ -4153,10 +4133,10 @@ class LightDesignerServer:
                     "next_times": glozone.get_next_active_times(zone_name),
                 }
 
-            return web.json_response({"zones": result})
+            return json_response({"zones": result})
         except Exception as e:
             logger.error(f"Error getting glozones: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def _migrate_unassigned_areas_to_default(self, config: dict) -> None:
         """One-time migration: add any HA areas not in any zone to the default zone.
@@ -4253,12 +4233,12 @@ class LightDesignerServer:
             copy_from = data.get("copy_from")
 
             if not name:
-                return web.json_response({"error": "name is required"}, status=400)
+                return json_response({"error": "name is required"}, status=400)
 
             config = await self.load_raw_config()
 
             if name in config.get("glozones", {}):
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' already exists"}, status=409
                 )
 
@@ -4281,12 +4261,12 @@ class LightDesignerServer:
                 logger.info("Config refresh signaled after zone create")
 
             logger.info(f"Created Rhythm Zone: {name}")
-            return web.json_response({"status": "created", "name": name})
+            return json_response({"status": "created", "name": name})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error creating zone: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def update_glozone(self, request: Request) -> Response:
         """Update a Rhythm Zone (areas, rename, or set as default)."""
@@ -4297,7 +4277,7 @@ class LightDesignerServer:
             config = await self.load_raw_config()
 
             if name not in config.get("glozones", {}):
-                return web.json_response(
+                return json_response(
                     {"error": f"Rhythm Zone '{name}' not found"}, status=404
                 )
 
@@ -4308,7 +4288,7 @@ class LightDesignerServer:
             new_name = data.pop("name", None)
             if new_name and new_name != name:
                 if new_name in config.get("glozones", {}):
-                    return web.json_response(
+                    return json_response(
                         {"error": f"Rhythm Zone '{new_name}' already exists"},
                         status=400,
                     )
@@ -4344,12 +4324,12 @@ class LightDesignerServer:
                 logger.info("Config refresh signaled after zone update")
 
             logger.info(f"Updated Rhythm Zone: {name}")
-            return web.json_response({"status": "updated", "name": name})
+            return json_response({"status": "updated", "name": name})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error updating zone: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def update_glozone_settings(self, request: Request) -> Response:
         """Update only the rhythm settings of a Rhythm Zone."""
@@ -4360,7 +4340,7 @@ class LightDesignerServer:
             config = await self.load_raw_config()
 
             if name not in config.get("glozones", {}):
-                return web.json_response(
+                return json_response(
                     {"error": f"Rhythm Zone '{name}' not found"}, status=404
                 )
 
@@ -4368,7 +4348,7 @@ class LightDesignerServer:
             new_name = data.pop("name", None)
             if new_name and new_name != name:
                 if new_name in config.get("glozones", {}):
-                    return web.json_response(
+                    return json_response(
                         {"error": f"Rhythm Zone '{new_name}' already exists"},
                         status=400,
                     )
@@ -4393,12 +4373,12 @@ class LightDesignerServer:
                 )
 
             logger.info(f"Updated Rhythm Zone settings: {name} ({updated_keys})")
-            return web.json_response({"status": "updated", "name": name})
+            return json_response({"status": "updated", "name": name})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error updating zone settings: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def delete_glozone(self, request: Request) -> Response:
         """Delete a GloZone (moves areas to default zone)."""
@@ -4409,13 +4389,13 @@ class LightDesignerServer:
             zones = config.get("glozones", {})
 
             if name not in zones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
 
             # Cannot delete the last zone
             if len(zones) <= 1:
-                return web.json_response(
+                return json_response(
                     {"error": "Cannot delete the last zone"}, status=400
                 )
 
@@ -4453,10 +4433,10 @@ class LightDesignerServer:
                 logger.info("Config refresh signaled after zone delete")
 
             logger.info(f"Deleted GloZone: {name}")
-            return web.json_response({"status": "deleted", "name": name})
+            return json_response({"status": "deleted", "name": name})
         except Exception as e:
             logger.error(f"Error deleting zone: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def reorder_glozones(self, request: Request) -> Response:
         """Reorder GloZones by rebuilding the dict in the specified key order."""
@@ -4465,7 +4445,7 @@ class LightDesignerServer:
             order = data.get("order")
 
             if not order or not isinstance(order, list):
-                return web.json_response(
+                return json_response(
                     {"error": "order must be a list of zone names"}, status=400
                 )
 
@@ -4474,7 +4454,7 @@ class LightDesignerServer:
 
             # Validate all names match existing zones
             if set(order) != set(zones.keys()):
-                return web.json_response(
+                return json_response(
                     {"error": "order must contain exactly the existing zone names"},
                     status=400,
                 )
@@ -4486,12 +4466,12 @@ class LightDesignerServer:
             glozone.set_config(config)
 
             logger.info(f"Reordered GloZones: {order}")
-            return web.json_response({"status": "reordered"})
+            return json_response({"status": "reordered"})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error reordering zones: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def reorder_zone_areas(self, request: Request) -> Response:
         """Reorder areas within a GloZone."""
@@ -4501,7 +4481,7 @@ class LightDesignerServer:
             area_ids = data.get("area_ids")
 
             if not area_ids or not isinstance(area_ids, list):
-                return web.json_response(
+                return json_response(
                     {"error": "area_ids must be a list"}, status=400
                 )
 
@@ -4509,7 +4489,7 @@ class LightDesignerServer:
             zones = config.get("glozones", {})
 
             if name not in zones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
 
@@ -4524,7 +4504,7 @@ class LightDesignerServer:
             # Validate submitted IDs exist in this zone
             unknown = set(area_ids) - set(area_lookup.keys())
             if unknown:
-                return web.json_response(
+                return json_response(
                     {"error": f"Unknown area IDs: {unknown}"}, status=400
                 )
 
@@ -4544,12 +4524,12 @@ class LightDesignerServer:
             glozone.set_config(config)
 
             logger.info(f"Reordered areas in zone '{name}': {area_ids}")
-            return web.json_response({"status": "reordered"})
+            return json_response({"status": "reordered"})
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error reordering zone areas: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def add_area_to_zone(self, request: Request) -> Response:
         """Add an area to a GloZone (removes from any other zone first)."""
@@ -4560,12 +4540,12 @@ class LightDesignerServer:
             area_name = data.get("area_name", area_id)  # Optional friendly name
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             config = await self.load_raw_config()
 
             if zone_name not in config.get("glozones", {}):
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{zone_name}' not found"}, status=404
                 )
 
@@ -4610,14 +4590,14 @@ class LightDesignerServer:
                 )
 
             logger.info(f"Added area {area_id} to zone {zone_name}")
-            return web.json_response(
+            return json_response(
                 {"status": "added", "area_id": area_id, "zone": zone_name}
             )
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error adding area to zone: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def remove_area_from_zone(self, request: Request) -> Response:
         """Remove an area from a GloZone (moves to default zone)."""
@@ -4629,7 +4609,7 @@ class LightDesignerServer:
             zones = config.get("glozones", {})
 
             if zone_name not in zones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{zone_name}' not found"}, status=404
                 )
 
@@ -4641,7 +4621,7 @@ class LightDesignerServer:
 
             # Can't remove from default zone (areas must always be in a zone)
             if zone_name == default_zone:
-                return web.json_response(
+                return json_response(
                     {
                         "error": "Cannot remove area from default zone. Move it to another zone instead."
                     },
@@ -4661,7 +4641,7 @@ class LightDesignerServer:
                     new_areas.append(a)
 
             if area_entry is None:
-                return web.json_response(
+                return json_response(
                     {"error": f"Area '{area_id}' not found in zone '{zone_name}'"},
                     status=404,
                 )
@@ -4678,10 +4658,10 @@ class LightDesignerServer:
             logger.info(
                 f"Removed area {area_id} from zone {zone_name}, moved to {default_zone}"
             )
-            return web.json_response({"status": "removed", "area_id": area_id})
+            return json_response({"status": "removed", "area_id": area_id})
         except Exception as e:
             logger.error(f"Error removing area from zone: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def purge_area_from_config(self, request: Request) -> Response:
         """Remove an area from all zones in config (for areas deleted from HA)."""
@@ -4728,12 +4708,12 @@ class LightDesignerServer:
             if self.client:
                 await self.client.handle_service_event("purge_area", area_id)
 
-            return web.json_response(
+            return json_response(
                 {"status": "purged", "area_id": area_id, "removed_from": removed_from}
             )
         except Exception as e:
             logger.error(f"Error purging area from config: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     # -------------------------------------------------------------------------
     # Moments API - CRUD for whole-home presets
@@ -4771,10 +4751,10 @@ class LightDesignerServer:
             config = await self.load_raw_config()
             moments = config.get("moments", {})
             moments = {k: self._normalize_moment(v) for k, v in moments.items()}
-            return web.json_response({"moments": moments})
+            return json_response({"moments": moments})
         except Exception as e:
             logger.error(f"Error getting moments: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_moment(self, request: Request) -> Response:
         """Get a single moment by ID."""
@@ -4784,16 +4764,16 @@ class LightDesignerServer:
             moments = config.get("moments", {})
 
             if moment_id not in moments:
-                return web.json_response(
+                return json_response(
                     {"error": f"Moment '{moment_id}' not found"}, status=404
                 )
 
-            return web.json_response(
+            return json_response(
                 {"moment": self._normalize_moment(moments[moment_id]), "id": moment_id}
             )
         except Exception as e:
             logger.error(f"Error getting moment: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def create_moment(self, request: Request) -> Response:
         """Create a new moment."""
@@ -4802,7 +4782,7 @@ class LightDesignerServer:
             name = data.get("name", "").strip()
 
             if not name:
-                return web.json_response(
+                return json_response(
                     {"error": "Moment name is required"}, status=400
                 )
 
@@ -4834,14 +4814,14 @@ class LightDesignerServer:
             await self.save_config_to_file(config)
 
             logger.info(f"Created moment: {name} (id: {moment_id})")
-            return web.json_response(
+            return json_response(
                 {"status": "created", "id": moment_id, "moment": moments[moment_id]}
             )
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error creating moment: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def update_moment(self, request: Request) -> Response:
         """Update a moment."""
@@ -4853,7 +4833,7 @@ class LightDesignerServer:
             moments = config.get("moments", {})
 
             if moment_id not in moments:
-                return web.json_response(
+                return json_response(
                     {"error": f"Moment '{moment_id}' not found"}, status=404
                 )
 
@@ -4877,14 +4857,14 @@ class LightDesignerServer:
             await self.save_config_to_file(config)
 
             logger.info(f"Updated moment: {moment_id}")
-            return web.json_response(
+            return json_response(
                 {"status": "updated", "id": moment_id, "moment": moment}
             )
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error updating moment: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def delete_moment(self, request: Request) -> Response:
         """Delete a moment."""
@@ -4895,7 +4875,7 @@ class LightDesignerServer:
             moments = config.get("moments", {})
 
             if moment_id not in moments:
-                return web.json_response(
+                return json_response(
                     {"error": f"Moment '{moment_id}' not found"}, status=404
                 )
 
@@ -4919,10 +4899,10 @@ class LightDesignerServer:
                 )
 
             logger.info(f"Deleted moment: {moment_id}")
-            return web.json_response({"status": "deleted", "id": moment_id})
+            return json_response({"status": "deleted", "id": moment_id})
         except Exception as e:
             logger.error(f"Error deleting moment: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def run_moment(self, request: Request) -> Response:
         """Run a moment – apply set_<moment_id> via direct client call."""
@@ -4931,18 +4911,18 @@ class LightDesignerServer:
             config = await self.load_raw_config()
             moments = config.get("moments", {})
             if moment_id not in moments:
-                return web.json_response(
+                return json_response(
                     {"error": f"Moment '{moment_id}' not found"}, status=404
                 )
 
             if self.client:
                 await self.client.handle_service_event(f"set_{moment_id}", "__moment__")
                 logger.info(f"Applied moment '{moment_id}'")
-                return web.json_response({"status": "ok", "moment_id": moment_id})
-            return web.json_response({"error": "Client not connected"}, status=503)
+                return json_response({"status": "ok", "moment_id": moment_id})
+            return json_response({"error": "Client not connected"}, status=503)
         except Exception as e:
             logger.error(f"Error running moment: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     # -------------------------------------------------------------------------
     # GloZone API - Actions (glo_up, glo_down, glo_reset)
@@ -4955,20 +4935,20 @@ class LightDesignerServer:
             area_id = data.get("area_id")
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             if self.client:
                 await self.client.handle_service_event("glo_up", area_id)
-                return web.json_response(
+                return json_response(
                     {"status": "ok", "action": "glo_up", "area_id": area_id}
                 )
-            return web.json_response({"error": "Client not connected"}, status=503)
+            return json_response({"error": "Client not connected"}, status=503)
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error handling glo_up: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def handle_glo_down(self, request: Request) -> Response:
         """Handle glo_down action - pull zone state to area."""
@@ -4977,20 +4957,20 @@ class LightDesignerServer:
             area_id = data.get("area_id")
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             if self.client:
                 await self.client.handle_service_event("glo_down", area_id)
-                return web.json_response(
+                return json_response(
                     {"status": "ok", "action": "glo_down", "area_id": area_id}
                 )
-            return web.json_response({"error": "Client not connected"}, status=503)
+            return json_response({"error": "Client not connected"}, status=503)
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error handling glo_down: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def handle_glo_reset(self, request: Request) -> Response:
         """Handle glo_reset action - reset zone and all member areas."""
@@ -4999,20 +4979,20 @@ class LightDesignerServer:
             area_id = data.get("area_id")
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
 
             if self.client:
                 await self.client.handle_service_event("glo_reset", area_id)
-                return web.json_response(
+                return json_response(
                     {"status": "ok", "action": "glo_reset", "area_id": area_id}
                 )
-            return web.json_response({"error": "Client not connected"}, status=503)
+            return json_response({"error": "Client not connected"}, status=503)
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error handling glo_reset: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     # -------------------------------------------------------------------------
     # Area Action API endpoint
@@ -5065,11 +5045,11 @@ class LightDesignerServer:
             action = data.get("action")
 
             if not area_id:
-                return web.json_response({"error": "area_id is required"}, status=400)
+                return json_response({"error": "area_id is required"}, status=400)
             if not action:
-                return web.json_response({"error": "action is required"}, status=400)
+                return json_response({"error": "action is required"}, status=400)
             if action not in VALID_ACTIONS:
-                return web.json_response(
+                return json_response(
                     {
                         "error": f"Invalid action: {action}. Valid actions: {sorted(VALID_ACTIONS)}"
                     },
@@ -5088,7 +5068,7 @@ class LightDesignerServer:
                     action = "boost_off"
                 else:
                     # Start boost: set state, apply lighting
-                    raw_config = glozone.load_config_from_files()
+                    raw_config = glozone.get_config_snapshot()
                     boost_amount = raw_config.get("boost_default", 30)
                     is_on = state.is_circadian(area_id) and state.get_is_on(area_id)
                     state.set_boost(
@@ -5110,7 +5090,7 @@ class LightDesignerServer:
             if action == "set_position":
                 value = data.get("value")
                 if value is None:
-                    return web.json_response(
+                    return json_response(
                         {"error": "value required for set_position"}, status=400
                     )
                 extra_kwargs["value"] = float(value)
@@ -5118,14 +5098,14 @@ class LightDesignerServer:
             elif action == "set_phase_time":
                 target_time = data.get("target_time")
                 if target_time is None:
-                    return web.json_response(
+                    return json_response(
                         {"error": "target_time required for set_phase_time"}, status=400
                     )
                 extra_kwargs["target_time"] = float(target_time)
             elif action == "circadian_adjust":
                 value = data.get("value")
                 if value is None:
-                    return web.json_response(
+                    return json_response(
                         {"error": "value required for circadian_adjust"},
                         status=400,
                     )
@@ -5152,14 +5132,14 @@ class LightDesignerServer:
                     resp["hint"] = (
                         "Circadian curve at max — use bright up to override sun dimming"
                     )
-                return web.json_response(resp)
-            return web.json_response({"error": "Client not connected"}, status=503)
+                return json_response(resp)
+            return json_response({"error": "Client not connected"}, status=503)
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error handling area action: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_slider_preview(self, request: Request) -> Response:
         """Return kelvin values at 10 brightness sample points for slider gradient.
@@ -5172,7 +5152,7 @@ class LightDesignerServer:
         """
         area_id = request.query.get("area_id")
         if not area_id:
-            return web.json_response({"error": "area_id is required"}, status=400)
+            return json_response({"error": "area_id is required"}, status=400)
 
         num_points = int(request.query.get("points", 10))
         num_points = max(3, min(20, num_points))
@@ -5291,11 +5271,11 @@ class LightDesignerServer:
                     }
                 )
 
-            return web.json_response({"points": points})
+            return json_response({"points": points})
 
         except Exception as e:
             logger.error(f"[SliderPreview] Error: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def handle_zone_action(self, request: Request) -> Response:
         """Handle zone-level action (modifies zone state only, no light control).
@@ -5321,11 +5301,11 @@ class LightDesignerServer:
             action = data.get("action")
 
             if not zone_name:
-                return web.json_response({"error": "zone_name is required"}, status=400)
+                return json_response({"error": "zone_name is required"}, status=400)
             if not action:
-                return web.json_response({"error": "action is required"}, status=400)
+                return json_response({"error": "action is required"}, status=400)
             if action not in VALID_ZONE_ACTIONS:
-                return web.json_response(
+                return json_response(
                     {
                         "error": f"Invalid zone action: {action}. Valid: {sorted(VALID_ZONE_ACTIONS)}"
                     },
@@ -5337,7 +5317,7 @@ class LightDesignerServer:
             if action == "set_position":
                 value = data.get("value")
                 if value is None:
-                    return web.json_response(
+                    return json_response(
                         {"error": "value required for set_position"}, status=400
                     )
                 extra_kwargs["value"] = float(value)
@@ -5346,16 +5326,16 @@ class LightDesignerServer:
             if self.client:
                 await self.client.handle_zone_action(action, zone_name, **extra_kwargs)
                 logger.info(f"Executed zone {action} for zone '{zone_name}'")
-                return web.json_response(
+                return json_response(
                     {"status": "ok", "action": action, "zone_name": zone_name}
                 )
-            return web.json_response({"error": "Client not connected"}, status=503)
+            return json_response({"error": "Client not connected"}, status=503)
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error handling zone action: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     # -------------------------------------------------------------------------
     # Manual Sync
@@ -5375,14 +5355,14 @@ class LightDesignerServer:
             if self.client:
                 await self.client.run_manual_sync()
             else:
-                return web.json_response({"error": "Client not connected"}, status=503)
+                return json_response({"error": "Client not connected"}, status=503)
 
-            return web.json_response(
+            return json_response(
                 {"success": True, "message": "Device sync triggered"}
             )
         except Exception as e:
             logger.error(f"Error triggering device sync: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     def _auto_create_controls(self, ha_controls, configured_switches) -> int:
         """Auto-create inactive control configs for unconfigured HA devices.
@@ -5514,7 +5494,7 @@ class LightDesignerServer:
                     "has_custom": switch_type in custom,
                 }
 
-            return web.json_response(
+            return json_response(
                 {
                     "mappings": mappings,
                     "custom_mappings": custom,
@@ -5522,7 +5502,7 @@ class LightDesignerServer:
             )
         except Exception as e:
             logger.error(f"Error getting switchmap: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def save_switchmap(self, request: Request) -> Response:
         """Save switch button mappings.
@@ -5534,23 +5514,23 @@ class LightDesignerServer:
 
             # Validate the data structure
             if not isinstance(data, dict):
-                return web.json_response(
+                return json_response(
                     {"error": "Expected object with switch_type keys"}, status=400
                 )
 
             # Save the mappings
             if switches.save_custom_mappings(data):
-                return web.json_response({"status": "success"})
+                return json_response({"status": "success"})
             else:
-                return web.json_response(
+                return json_response(
                     {"error": "Failed to save mappings"}, status=500
                 )
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error saving switchmap: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_switchmap_actions(self, request: Request) -> Response:
         """Get available actions for switchmap, organized by category."""
@@ -5558,7 +5538,7 @@ class LightDesignerServer:
             categories = switches.get_categorized_actions()
             when_off_options = switches.get_when_off_options()
 
-            return web.json_response(
+            return json_response(
                 {
                     "categories": categories,
                     "when_off_options": when_off_options,
@@ -5566,7 +5546,7 @@ class LightDesignerServer:
             )
         except Exception as e:
             logger.error(f"Error getting switchmap actions: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_switches(self, request: Request) -> Response:
         """Get all configured switches with area names looked up from HA."""
@@ -5586,10 +5566,10 @@ class LightDesignerServer:
             except Exception as e:
                 logger.warning(f"Could not fetch device areas: {e}")
 
-            return web.json_response({"switches": switches_data})
+            return json_response({"switches": switches_data})
         except Exception as e:
             logger.error(f"Error getting switches: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def _fetch_device_areas(self):
         """Get device_id -> area_name mapping and all device IDs from client cache."""
@@ -5617,12 +5597,12 @@ class LightDesignerServer:
             data = await request.json()
             entity_id = data.get("entity_id")
             if not entity_id or not entity_id.startswith("light."):
-                return web.json_response(
+                return json_response(
                     {"error": "Valid light entity_id required"}, status=400
                 )
 
             if not self.client:
-                return web.json_response({"error": "Client not ready"}, status=500)
+                return json_response({"error": "Client not ready"}, status=500)
 
             # Get current state from cache
             current_state = self.client.cached_states.get(entity_id, {})
@@ -5663,10 +5643,10 @@ class LightDesignerServer:
                     {"entity_id": entity_id},
                 )
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error flashing light: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_area_lights(self, request: Request) -> Response:
         """Get light entities for a given area, or all lights.
@@ -5681,10 +5661,10 @@ class LightDesignerServer:
         show_all = request.query.get("all") == "true"
 
         if not area_id and not show_all:
-            return web.json_response({"lights": []})
+            return json_response({"lights": []})
 
         if not self.client:
-            return web.json_response({"lights": []})
+            return json_response({"lights": []})
 
         try:
             lights = []
@@ -5748,10 +5728,10 @@ class LightDesignerServer:
 
             entire_area_lights.sort(key=lambda x: x["name"].lower())
             lights.sort(key=lambda x: x["name"].lower())
-            return web.json_response({"lights": entire_area_lights + lights})
+            return json_response({"lights": entire_area_lights + lights})
         except Exception as e:
             logger.error(f"Error fetching area lights: {e}", exc_info=True)
-            return web.json_response({"lights": []})
+            return json_response({"lights": []})
 
     async def get_sensors(self, request: Request) -> Response:
         """Get sensor entities from HA, optionally filtered by device_class.
@@ -5764,7 +5744,7 @@ class LightDesignerServer:
         device_class_filter = request.query.get("device_class")
 
         if not self.client:
-            return web.json_response({"sensors": []})
+            return json_response({"sensors": []})
 
         try:
             sensors = []
@@ -5791,10 +5771,10 @@ class LightDesignerServer:
                 )
 
             sensors.sort(key=lambda x: x["name"].lower())
-            return web.json_response({"sensors": sensors})
+            return json_response({"sensors": sensors})
         except Exception as e:
             logger.error(f"Error fetching sensors: {e}", exc_info=True)
-            return web.json_response({"sensors": []})
+            return json_response({"sensors": []})
 
     async def set_outdoor_override(self, request: Request) -> Response:
         """Set a temporary outdoor brightness override."""
@@ -5803,16 +5783,16 @@ class LightDesignerServer:
             condition = data.get("condition")
             duration = data.get("duration_minutes", 60)
             if not condition:
-                return web.json_response({"error": "condition required"}, status=400)
+                return json_response({"error": "condition required"}, status=400)
             lux_tracker.set_override(condition, int(duration))
 
             if self.client:
                 self.client.handle_outdoor_override(condition, int(duration))
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error setting outdoor override: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def clear_outdoor_override(self, request: Request) -> Response:
         """Clear the outdoor brightness override."""
@@ -5821,7 +5801,7 @@ class LightDesignerServer:
         if self.client:
             self.client.handle_outdoor_override()
 
-        return web.json_response({"status": "ok"})
+        return json_response({"status": "ok"})
 
     async def set_schedule_override(self, request: Request) -> Response:
         """Set a per-zone schedule override."""
@@ -5830,7 +5810,7 @@ class LightDesignerServer:
             data = await request.json()
             mode = data.get("mode")
             if mode not in ("main", "alt", "custom", "off"):
-                return web.json_response(
+                return json_response(
                     {"error": "mode must be main, alt, custom, or off"}, status=400
                 )
             override = {
@@ -5842,15 +5822,15 @@ class LightDesignerServer:
             }
             glozones = glozone.get_glozones()
             if name not in glozones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
             glozones[name]["schedule_override"] = override
             glozone.save_config()
-            return web.json_response({"status": "ok", "override": override})
+            return json_response({"status": "ok", "override": override})
         except Exception as e:
             logger.error(f"Error setting schedule override: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def clear_schedule_override(self, request: Request) -> Response:
         """Clear a zone's schedule override."""
@@ -5858,15 +5838,15 @@ class LightDesignerServer:
             name = request.match_info.get("name", "")
             glozones = glozone.get_glozones()
             if name not in glozones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
             glozones[name]["schedule_override"] = None
             glozone.save_config()
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error clearing schedule override: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_schedule_override(self, request: Request) -> Response:
         """Get a zone's current schedule override and resolved times."""
@@ -5875,15 +5855,15 @@ class LightDesignerServer:
             config = await self.load_config()
             glozones = config.get("glozones", {})
             if name not in glozones:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
             override = glozones[name].get("schedule_override")
             next_times = glozone.get_next_active_times(name)
-            return web.json_response({"override": override, "next_times": next_times})
+            return json_response({"override": override, "next_times": next_times})
         except Exception as e:
             logger.error(f"Error getting schedule override: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_zone_next_times(self, request: Request) -> Response:
         """Get next effective wake/bed times for a zone."""
@@ -5891,13 +5871,33 @@ class LightDesignerServer:
             name = request.match_info.get("name", "")
             next_times = glozone.get_next_active_times(name)
             if next_times is None:
-                return web.json_response(
+                return json_response(
                     {"error": f"Zone '{name}' not found"}, status=404
                 )
-            return web.json_response(next_times)
+            return json_response(next_times)
         except Exception as e:
             logger.error(f"Error getting next times: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
+
+    async def get_perf_stats(self, request: Request) -> Response:
+        """Stage timings (p50/p95/max) plus the runtime caches' counters."""
+        try:
+            result = {"timings": perf.get_stats()}
+            result["state_persistence"] = state.get_persistence_stats()
+            result["config"] = glozone.get_config_stats()
+            result["step_sequences"] = _step_sequences.get_stats()
+            if self.client:
+                result["fades"] = self.client.fade_engine.get_stats()
+                result["curve_tables"] = self.client.curve_tables.get_stats()
+                result["delta_suppression"] = self.client.delta_suppressor.get_stats()
+                result["event_dispatch"] = self.client.event_dispatcher.get_stats()
+                result["subscriptions"] = self.client.subscription_planner.get_stats()
+                result["light_outbox"] = self.client.light_outbox.get_stats()
+                result["rate_limit"] = self.client.rate_limiter.get_stats()
+            return json_response(result)
+        except Exception as e:
+            logger.error(f"Error getting perf stats: {e}")
+            return json_response({"error": str(e)}, status=500)
 
     async def get_outdoor_status(self, request: Request) -> Response:
         """Get current outdoor brightness state for settings page."""
@@ -5960,7 +5960,7 @@ class LightDesignerServer:
             {"label": "Dark", "key": "dark", "multiplier": 0.0},
         ]
 
-        return web.json_response(
+        return json_response(
             {
                 "outdoor_normalized": round(
                     outdoor_norm if outdoor_norm is not None else 0, 3
@@ -6008,18 +6008,18 @@ class LightDesignerServer:
             lux_tracker.init(config)
             sensor_entity = lux_tracker.get_sensor_entity()
             if not sensor_entity:
-                return web.json_response(
+                return json_response(
                     {"error": "No lux sensor configured"}, status=400
                 )
 
             # Get location from client cache
             if not self.client:
-                return web.json_response({"error": "Client not ready"}, status=500)
+                return json_response({"error": "Client not ready"}, status=500)
             lat = self.client.latitude
             lon = self.client.longitude
             tz_name = self.client.timezone
             if not lat or not lon or not tz_name:
-                return web.json_response(
+                return json_response(
                     {"error": "No location data in HA"}, status=500
                 )
 
@@ -6041,16 +6041,16 @@ class LightDesignerServer:
             # Query recorder statistics via throwaway WS (needs request-response)
             rest_url, ws_url, token = self._get_ha_api_config()
             if not token or not ws_url:
-                return web.json_response({"error": "No HA connection"}, status=500)
+                return json_response({"error": "No HA connection"}, status=500)
 
             async with websockets.connect(ws_url, max_size=16 * 1024 * 1024) as ws:
                 msg = json.loads(await ws.recv())
                 if msg.get("type") != "auth_required":
-                    return web.json_response({"error": "WS auth failed"}, status=500)
+                    return json_response({"error": "WS auth failed"}, status=500)
                 await ws.send(json.dumps({"type": "auth", "access_token": token}))
                 msg = json.loads(await ws.recv())
                 if msg.get("type") != "auth_ok":
-                    return web.json_response({"error": "WS auth failed"}, status=500)
+                    return json_response({"error": "WS auth failed"}, status=500)
 
                 await ws.send(
                     json.dumps(
@@ -6068,7 +6068,7 @@ class LightDesignerServer:
                 stats_msg = json.loads(await ws.recv())
 
                 if not stats_msg.get("success"):
-                    return web.json_response(
+                    return json_response(
                         {
                             "error": f"Recorder returned no data for {sensor_entity}. "
                             "Ensure the sensor has state_class: measurement."
@@ -6078,7 +6078,7 @@ class LightDesignerServer:
 
                 result = stats_msg.get("result", {})
                 if sensor_entity not in result:
-                    return web.json_response(
+                    return json_response(
                         {
                             "error": f"No statistics found for {sensor_entity}. "
                             "The sensor may not have state_class: measurement."
@@ -6154,7 +6154,7 @@ class LightDesignerServer:
                     daytime_means.append(mean_val)
 
                 if len(daytime_means) < 10:
-                    return web.json_response(
+                    return json_response(
                         {
                             "error": f"Only {len(daytime_means)} daytime samples found (need 10+). "
                             "The sensor may not have enough history yet.",
@@ -6181,7 +6181,7 @@ class LightDesignerServer:
                 ceiling_val = daytime_means[min(n - 1, int(n * 0.85))]
 
                 if ceiling_val <= floor_val or ceiling_val <= 0:
-                    return web.json_response(
+                    return json_response(
                         {
                             "error": f"Bad percentiles (floor={floor_val}, ceiling={ceiling_val})"
                         },
@@ -6203,7 +6203,7 @@ class LightDesignerServer:
                     f"(sensor={sensor_entity}): "
                     f"ceiling={ceiling_val:.0f}, floor={floor_val:.0f}"
                 )
-                return web.json_response(
+                return json_response(
                     {
                         "ceiling": ceiling_val,
                         "floor": floor_val,
@@ -6214,7 +6214,7 @@ class LightDesignerServer:
 
         except Exception as e:
             logger.error(f"Learn baselines failed: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_controls(self, request: Request) -> Response:
         """Get all controls from HA, merged with our configuration.
@@ -6447,10 +6447,10 @@ class LightDesignerServer:
                         }
                     )
 
-            return web.json_response({"controls": controls})
+            return json_response({"controls": controls})
         except Exception as e:
             logger.error(f"Error getting controls: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def _fetch_ha_controls(self) -> List[Dict[str, Any]]:
         """Fetch potential control devices from client caches.
@@ -6652,7 +6652,7 @@ class LightDesignerServer:
         Query: ?q=search_term (optional, filters by device name)
         """
         if not self.client:
-            return web.json_response([])
+            return json_response([])
 
         query = (request.query.get("q") or "").lower()
 
@@ -6722,10 +6722,10 @@ class LightDesignerServer:
                     }
                 )
 
-            return web.json_response(results)
+            return json_response(results)
         except Exception as e:
             logger.error(f"Error searching devices: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def add_control_source(self, request: Request) -> Response:
         """Manually add a device as a control source (motion trigger).
@@ -6740,12 +6740,12 @@ class LightDesignerServer:
             trigger_entities = data.get("trigger_entities", [])
 
             if not device_id:
-                return web.json_response({"error": "device_id required"}, status=400)
+                return json_response({"error": "device_id required"}, status=400)
 
             # Check if already exists
             existing = switches.get_motion_sensor_by_device_id(device_id)
             if existing:
-                return web.json_response(
+                return json_response(
                     {"error": "Device already configured", "id": existing.id},
                     status=409,
                 )
@@ -6772,10 +6772,10 @@ class LightDesignerServer:
                 )
 
             logger.info(f"[Controls] Added control source: {name} ({device_id})")
-            return web.json_response({"status": "ok", "id": device_id})
+            return json_response({"status": "ok", "id": device_id})
         except Exception as e:
             logger.error(f"Error adding control source: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def report_device(self, request: Request) -> Response:
         """Submit an unsupported-device report to the homeglo webhook.
@@ -6788,17 +6788,17 @@ class LightDesignerServer:
         Expects JSON: {"device_id": "..."}
         """
         if not self.client:
-            return web.json_response({"error": "Client not connected"}, status=503)
+            return json_response({"error": "Client not connected"}, status=503)
 
         try:
             data = await request.json()
             device_id = data.get("device_id")
             if not device_id:
-                return web.json_response({"error": "device_id required"}, status=400)
+                return json_response({"error": "device_id required"}, status=400)
 
             device = self.client.device_registry.get(device_id)
             if not device:
-                return web.json_response({"error": "Device not found"}, status=404)
+                return json_response({"error": "Device not found"}, status=404)
 
             # Pick the first identifier's integration name (zha, hue,
             # matter, eufy_security, reolink, etc.)
@@ -6856,7 +6856,7 @@ class LightDesignerServer:
                                 f"[Report] Submitted {payload['manufacturer']} "
                                 f"{payload['model']}: {result.get('issue_url')}"
                             )
-                            return web.json_response(
+                            return json_response(
                                 {
                                     "ok": True,
                                     "issue_url": result.get("issue_url"),
@@ -6864,7 +6864,7 @@ class LightDesignerServer:
                             )
                         err_text = await resp.text()
                         logger.error(f"[Report] Webhook {resp.status}: {err_text}")
-                        return web.json_response(
+                        return json_response(
                             {
                                 "error": "Webhook returned error",
                                 "status": resp.status,
@@ -6873,10 +6873,10 @@ class LightDesignerServer:
                         )
             except asyncio.TimeoutError:
                 logger.error("[Report] Webhook timed out")
-                return web.json_response({"error": "Webhook timeout"}, status=504)
+                return json_response({"error": "Webhook timeout"}, status=504)
         except Exception as e:
             logger.error(f"Error reporting device: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_controls_refresh(self, request: Request) -> Response:
         """Lightweight refresh endpoint for controls page polling.
@@ -6887,21 +6887,21 @@ class LightDesignerServer:
         try:
             all_actions = switches.get_all_last_actions()
             pause_states = switches.get_all_pause_states()
-            return web.json_response(
+            return json_response(
                 {
                     "last_actions": all_actions,
                     "pause_states": pause_states,
                 }
             )
         except Exception:
-            return web.json_response({"last_actions": {}, "pause_states": {}})
+            return json_response({"last_actions": {}, "pause_states": {}})
 
     async def configure_control(self, request: Request) -> Response:
         """Configure a control (add/update scopes for switches, areas for motion sensors)."""
         try:
             control_id = request.match_info.get("control_id")
             if not control_id:
-                return web.json_response(
+                return json_response(
                     {"error": "Control ID is required"}, status=400
                 )
 
@@ -7014,17 +7014,17 @@ class LightDesignerServer:
 
                 switches.add_switch(switch_config)
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error configuring control: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def remove_control_config(self, request: Request) -> Response:
         """Remove configuration from a control (keeps it in list as 'not_configured')."""
         try:
             control_id = request.match_info.get("control_id")
             if not control_id:
-                return web.json_response(
+                return json_response(
                     {"error": "Control ID is required"}, status=400
                 )
 
@@ -7035,10 +7035,10 @@ class LightDesignerServer:
             if not removed:
                 switches.remove_contact_sensor(control_id)
 
-            return web.json_response({"status": "ok"})
+            return json_response({"status": "ok"})
         except Exception as e:
             logger.error(f"Error removing control config: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_zha_motion_settings(self, request: Request) -> Response:
         """Get ZHA motion sensor settings (sensitivity and timeout).
@@ -7050,16 +7050,16 @@ class LightDesignerServer:
         """
         device_id = request.match_info.get("device_id")
         if not device_id:
-            return web.json_response({"error": "Device ID is required"}, status=400)
+            return json_response({"error": "Device ID is required"}, status=400)
 
         if not self.client:
-            return web.json_response({"error": "Client not ready"}, status=500)
+            return json_response({"error": "Client not ready"}, status=500)
 
         try:
             # Look up device IEEE from client cache
             device_info = self.client.device_registry.get(device_id)
             if not device_info:
-                return web.json_response({"error": "Device not found"}, status=404)
+                return json_response({"error": "Device not found"}, status=404)
 
             device_ieee = None
             is_zha = False
@@ -7071,7 +7071,7 @@ class LightDesignerServer:
                         break
 
             if not is_zha:
-                return web.json_response(
+                return json_response(
                     {"is_zha": False, "sensitivity": None, "timeout": None}
                 )
 
@@ -7138,7 +7138,7 @@ class LightDesignerServer:
                         f"[ZHA Settings] Could not read timeout for {device_ieee}: {e}"
                     )
 
-            return web.json_response(
+            return json_response(
                 {
                     "is_zha": True,
                     "ieee": device_ieee,
@@ -7149,7 +7149,7 @@ class LightDesignerServer:
 
         except Exception as e:
             logger.error(f"Error getting ZHA motion settings: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def set_zha_motion_settings(self, request: Request) -> Response:
         """Set ZHA motion sensor settings (sensitivity and/or timeout).
@@ -7160,27 +7160,27 @@ class LightDesignerServer:
         """
         device_id = request.match_info.get("device_id")
         if not device_id:
-            return web.json_response({"error": "Device ID is required"}, status=400)
+            return json_response({"error": "Device ID is required"}, status=400)
 
         try:
             data = await request.json()
         except Exception:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
 
         new_sensitivity = data.get("sensitivity")
         new_timeout = data.get("timeout")
 
         if new_sensitivity is None and new_timeout is None:
-            return web.json_response({"error": "No settings provided"}, status=400)
+            return json_response({"error": "No settings provided"}, status=400)
 
         if not self.client:
-            return web.json_response({"error": "Client not ready"}, status=500)
+            return json_response({"error": "Client not ready"}, status=500)
 
         try:
             # Look up device IEEE from client cache
             device_info = self.client.device_registry.get(device_id)
             if not device_info:
-                return web.json_response({"error": "Device not found"}, status=404)
+                return json_response({"error": "Device not found"}, status=404)
 
             device_ieee = None
             for identifier in device_info.get("identifiers", []):
@@ -7190,7 +7190,7 @@ class LightDesignerServer:
                         break
 
             if not device_ieee:
-                return web.json_response({"error": "Not a ZHA device"}, status=400)
+                return json_response({"error": "Not a ZHA device"}, status=400)
 
             results = {}
 
@@ -7253,11 +7253,11 @@ class LightDesignerServer:
                     results["timeout"] = False
                     results["timeout_error"] = f"Invalid timeout value: {e}"
 
-            return web.json_response({"status": "ok", "results": results})
+            return json_response({"status": "ok", "results": results})
 
         except Exception as e:
             logger.error(f"Error setting ZHA motion settings: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def create_switch(self, request: Request) -> Response:
         """Create a new switch configuration."""
@@ -7266,14 +7266,14 @@ class LightDesignerServer:
 
             switch_id = data.get("id")
             if not switch_id:
-                return web.json_response({"error": "Switch ID is required"}, status=400)
+                return json_response({"error": "Switch ID is required"}, status=400)
 
             name = data.get("name", f"Switch ({switch_id[-8:]})")
             switch_type = data.get("type", "hue_dimmer")
 
             # Validate switch type
             if switch_type not in switches.SWITCH_TYPES:
-                return web.json_response(
+                return json_response(
                     {"error": f"Invalid switch type: {switch_type}"}, status=400
                 )
 
@@ -7303,26 +7303,26 @@ class LightDesignerServer:
             # Trigger reach group sync if any scope has multiple areas
             await self._trigger_batch_group_sync_if_needed(switch_config.scopes)
 
-            return web.json_response(
+            return json_response(
                 {"status": "ok", "switch": switch_config.to_dict()}
             )
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error creating switch: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def update_switch(self, request: Request) -> Response:
         """Update an existing switch configuration."""
         try:
             switch_id = request.match_info.get("switch_id")
             if not switch_id:
-                return web.json_response({"error": "Switch ID is required"}, status=400)
+                return json_response({"error": "Switch ID is required"}, status=400)
 
             existing = switches.get_switch(switch_id)
             if not existing:
-                return web.json_response({"error": "Switch not found"}, status=404)
+                return json_response({"error": "Switch not found"}, status=404)
 
             data = await request.json()
 
@@ -7332,7 +7332,7 @@ class LightDesignerServer:
 
             # Validate switch type
             if switch_type not in switches.SWITCH_TYPES:
-                return web.json_response(
+                return json_response(
                     {"error": f"Invalid switch type: {switch_type}"}, status=400
                 )
 
@@ -7371,33 +7371,33 @@ class LightDesignerServer:
             if "scopes" in data:
                 await self._trigger_batch_group_sync_if_needed(scopes)
 
-            return web.json_response(
+            return json_response(
                 {"status": "ok", "switch": switch_config.to_dict()}
             )
 
         except json.JSONDecodeError:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
         except Exception as e:
             logger.error(f"Error updating switch: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def delete_switch(self, request: Request) -> Response:
         """Delete a switch configuration."""
         try:
             switch_id = request.match_info.get("switch_id")
             if not switch_id:
-                return web.json_response({"error": "Switch ID is required"}, status=400)
+                return json_response({"error": "Switch ID is required"}, status=400)
 
             if switches.remove_switch(switch_id):
                 # Trigger reach group sync to clean up any orphaned reach groups
                 await self._trigger_batch_group_sync()
-                return web.json_response({"status": "ok", "deleted": switch_id})
+                return json_response({"status": "ok", "deleted": switch_id})
             else:
-                return web.json_response({"error": "Switch not found"}, status=404)
+                return json_response({"error": "Switch not found"}, status=404)
 
         except Exception as e:
             logger.error(f"Error deleting switch: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def get_switch_types(self, request: Request) -> Response:
         """Get all available switch type definitions."""
@@ -7414,10 +7414,10 @@ class LightDesignerServer:
                     "action_types": type_info.get("action_types", []),
                     "default_mapping": type_info.get("default_mapping", {}),
                 }
-            return web.json_response({"types": result})
+            return json_response({"types": result})
         except Exception as e:
             logger.error(f"Error getting switch types: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=500)
 
     async def start_serving(self):
         """Start the web server without blocking.